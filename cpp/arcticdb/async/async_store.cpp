@@ -10,6 +10,12 @@
 #include <arcticdb/codec/segment.hpp>
 #include <arcticdb/storage/key_segment_pair.hpp>
 #include <arcticdb/version/de_dup_map.hpp>
+#include <arcticdb/util/configs_map.hpp>
+
+#include <folly/futures/SharedPromise.h>
+
+#include <mutex>
+#include <unordered_map>
 
 namespace arcticdb::async {
 std::pair<entity::VariantKey, std::optional<Segment>> lookup_match_in_dedup_map(
@@ -29,4 +35,129 @@ std::pair<entity::VariantKey, std::optional<Segment>> lookup_match_in_dedup_map(
         return std::make_pair(*de_dup_key, std::nullopt);
     }
 }
+
+struct SingleFlightReads::InFlightRead {
+    explicit InFlightRead(bool sync) : sync_(sync) {}
+
+    // Whether the reader making the storage request is blocked on it, rather than waiting on an IO task
+    const bool sync_;
+    // Each reader takes the segment at its position in the result
+    size_t readers_ = 1;
+    folly::SharedPromise<std::shared_ptr<std::vector<storage::KeySegmentPair>>> promise_;
+};
+
+struct SingleFlightReads::State {
+    const bool enabled_ = ConfigsMap::instance()->get_int("VersionStore.SingleFlightReads", 1) != 0;
+    std::mutex mutex_;
+    std::unordered_map<entity::VariantKey, std::shared_ptr<InFlightRead>> in_flight_;
+};
+
+namespace {
+
+struct JoinedRead {
+    std::shared_ptr<SingleFlightReads::InFlightRead> read_;
+    size_t position_;
+    bool first_;
+};
+
+bool is_shareable(const SingleFlightReads::State& state, const storage::ReadKeyOpts& opts) {
+    // A read of some of the columns may leave the rest of the segment unread
+    return state.enabled_ && !opts.columns_to_decode_;
 }
+
+// Joins the read of the key in flight if there is one that can be joined, otherwise starts one
+JoinedRead join_read(SingleFlightReads::State& state, const entity::VariantKey& key, bool sync) {
+    std::lock_guard lock{state.mutex_};
+    if (auto it = state.in_flight_.find(key); it != state.in_flight_.end() && (it->second->sync_ || !sync)) {
+        ARCTICDB_DEBUG(log::storage(), "Joining read in flight of key {}", variant_key_view(key));
+        return {it->second, it->second->readers_++, false};
+    }
+
+    auto read = std::make_shared<SingleFlightReads::InFlightRead>(sync);
+    state.in_flight_.insert_or_assign(key, read);
+    return {std::move(read), 0, true};
+}
+
+// Removes the read from those in flight, so that no more readers join it, and gives each of its readers a segment
+void complete_read(
+    SingleFlightReads::State& state,
+    const entity::VariantKey& key,
+    SingleFlightReads::InFlightRead& read,
+    folly::Try<storage::KeySegmentPair>&& result) {
+    size_t readers;
+    {
+        std::lock_guard lock{state.mutex_};
+        if (auto it = state.in_flight_.find(key); it != state.in_flight_.end() && it->second.get() == &read)
+            state.in_flight_.erase(it);
+
+        readers = read.readers_;
+    }
+
+    if (result.hasException()) {
+        read.promise_.setException(std::move(result.exception()));
+        return;
+    }
+
+    auto key_segs = std::make_shared<std::vector<storage::KeySegmentPair>>();
+    key_segs->reserve(readers);
+    key_segs->emplace_back(std::move(result.value()));
+    auto& key_seg = key_segs->front();
+    for (size_t i = 1; i < readers; ++i)
+        key_segs->emplace_back(VariantKey{key_seg.variant_key()}, Segment{key_seg.segment()});
+
+    read.promise_.setValue(std::move(key_segs));
+}
+
+folly::Future<storage::KeySegmentPair> joined_result(const JoinedRead& joined) {
+    return joined.read_->promise_.getFuture().thenValue([position = joined.position_](auto&& key_segs) {
+        return std::move((*key_segs)[position]);
+    });
+}
+
+} // namespace
+
+SingleFlightReads::SingleFlightReads() :
+    state_(std::make_shared<State>()) {
+}
+
+folly::Future<storage::KeySegmentPair> SingleFlightReads::read(
+    const entity::VariantKey& key,
+    const std::shared_ptr<storage::Library>& library,
+    const storage::ReadKeyOpts& opts) const {
+    if (!is_shareable(*state_, opts)) {
+        return async::submit_io_task(ReadCompressedTask{key, library, opts, PassThroughTask{}})
+            .thenValue([](auto&& result) { return std::move(result.key_seg_); });
+    }
+
+    auto joined = join_read(*state_, key, false);
+    if (joined.first_) {
+        async::submit_io_task(ReadCompressedTask{key, library, opts, PassThroughTask{}})
+            .thenTry([state = state_, key, read = joined.read_](auto&& result) {
+                complete_read(*state, key, *read, result.hasException() ?
+                    folly::Try<storage::KeySegmentPair>(std::move(result.exception())) :
+                    folly::Try<storage::KeySegmentPair>(std::move(result.value().key_seg_)));
+            });
+    }
+    return joined_result(joined);
+}
+
+storage::KeySegmentPair SingleFlightReads::read_sync(
+    const entity::VariantKey& key,
+    const std::shared_ptr<storage::Library>& library,
+    const storage::ReadKeyOpts& opts) const {
+    if (!is_shareable(*state_, opts))
+        return read_dispatch(key, library, opts);
+
+    auto joined = join_read(*state_, key, true);
+    if (joined.first_)
+        complete_read(*state_, key, *joined.read_, folly::makeTryWith([&]() { return read_dispatch(key, library, opts); }));
+
+    return joined_result(joined).get();
+}
+
+void SingleFlightReads::forget(const entity::VariantKey& key) const {
+    std::lock_guard lock{state_->mutex_};
+    state_->in_flight_.erase(key);
+}
+
+} // namespace arcticdb::async
@@ -13,10 +13,12 @@
 #include <arcticdb/entity/performance_tracing.hpp>
 #include <arcticdb/storage/library.hpp>
 #include <folly/futures/Future.h>
+#include <folly/futures/FutureSplitter.h>
 #include <arcticdb/async/tasks.hpp>
 #include <arcticdb/stream/stream_utils.hpp>
 #include <arcticdb/processing/clause.hpp>
 #include <arcticdb/storage/key_segment_pair.hpp>
+#include <arcticdb/storage/coalesced/packed_segment.hpp>
 
 namespace arcticdb::async {
 
@@ -24,12 +26,45 @@ std::pair<VariantKey, std::optional<Segment>> lookup_match_in_dedup_map(
     const std::shared_ptr<DeDupMap> &de_dup_map,
     storage::KeySegmentPair&& key_seg);
 
+/*
+ * Shares the storage reads of keys in flight: while a key is being read, later reads of it wait for the same result
+ * rather than making another request, so that many concurrent reads of a popular symbol cost one request per key.
+ * Each reader gets its own copy of the segment, as readers consume them. Reads of some of the columns of a segment are
+ * not shared, and all sharing is disabled with VersionStore.SingleFlightReads=0.
+ *
+ * Synchronous reads only join reads being made by other synchronous readers, so that a blocked thread never waits on
+ * a task queued behind it on the same threadpool.
+ */
+class SingleFlightReads {
+public:
+    SingleFlightReads();
+
+    folly::Future<storage::KeySegmentPair> read(
+        const entity::VariantKey& key,
+        const std::shared_ptr<storage::Library>& library,
+        const storage::ReadKeyOpts& opts) const;
+
+    storage::KeySegmentPair read_sync(
+        const entity::VariantKey& key,
+        const std::shared_ptr<storage::Library>& library,
+        const storage::ReadKeyOpts& opts) const;
+
+    // Called once a key has been written or removed, so that later reads fetch it again rather than joining a read
+    // that began before the change
+    void forget(const entity::VariantKey& key) const;
+
+    struct InFlightRead;
+    struct State;
+
+private:
+    std::shared_ptr<State> state_;
+};
+
 template <typename Callable>
-auto read_and_continue(const VariantKey& key, std::shared_ptr<storage::Library> library, const storage::ReadKeyOpts& opts, Callable&& c) {
-    return async::submit_io_task(ReadCompressedTask{key, library, opts, std::forward<decltype(c)>(c)})
+auto read_and_continue(const SingleFlightReads& reads, const VariantKey& key, const std::shared_ptr<storage::Library>& library, const storage::ReadKeyOpts& opts, Callable&& c) {
+    return reads.read(key, library, opts)
         .via(&async::cpu_executor())
-        .thenValue([](auto &&result) mutable {
-            auto&& [key_seg, continuation] = std::forward<decltype(result)>(result);
+        .thenValue([continuation = std::forward<Callable>(c)](storage::KeySegmentPair&& key_seg) mutable {
             return continuation(std::move(key_seg));
         }
     );
@@ -111,7 +146,8 @@ folly::Future<entity::VariantKey> write(
         key_type, stream_id, std::move(segment), codec_, encoding_version_
     })
         .via(&async::io_executor())
-        .thenValue(WriteSegmentTask{library_});
+        .thenValue(WriteSegmentTask{library_})
+        .thenValue(forget_key());
 }
 
 entity::VariantKey write_sync(
@@ -144,7 +180,9 @@ entity::VariantKey write_sync(
     SegmentInMemory &&segment) override {
     util::check(is_ref_key_class(key_type), "Expected ref key type got  {}", key_type);
     auto encoded = EncodeRefTask{key_type, stream_id, std::move(segment), codec_, encoding_version_}();
-    return WriteSegmentTask{library_}(std::move(encoded));
+    auto key = WriteSegmentTask{library_}(std::move(encoded));
+    single_flight_reads_.forget(key);
+    return key;
 }
 
 bool is_path_valid(const std::string_view path) const override {
@@ -152,11 +190,17 @@ bool is_path_valid(const std::string_view path) const override {
 }
 
 folly::Future<folly::Unit> write_compressed(storage::KeySegmentPair &&ks) override {
-    return async::submit_io_task(WriteCompressedTask{std::move(ks), library_});
+    auto key = ks.variant_key();
+    return async::submit_io_task(WriteCompressedTask{std::move(ks), library_})
+        .thenValue([single_flight_reads = single_flight_reads_, key = std::move(key)](auto&&) {
+            single_flight_reads.forget(key);
+        });
 }
 
 void write_compressed_sync(storage::KeySegmentPair &&ks) override {
+    auto key = ks.variant_key();
     library_->write(Composite<storage::KeySegmentPair>(std::move(ks)));
+    single_flight_reads_.forget(key);
 }
 
 folly::Future<entity::VariantKey> update(const entity::VariantKey &key,
@@ -172,7 +216,8 @@ folly::Future<entity::VariantKey> update(const entity::VariantKey &key,
         key, std::move(segment), codec_, encoding_version_
     })
         .via(&async::io_executor())
-        .thenValue(UpdateSegmentTask{library_, opts});
+        .thenValue(UpdateSegmentTask{library_, opts})
+        .thenValue(forget_key());
 }
 
 folly::Future<VariantKey> copy(
@@ -205,41 +250,41 @@ void iterate_type(
 folly::Future<std::pair<entity::VariantKey, SegmentInMemory>> read(
         const entity::VariantKey &key,
         storage::ReadKeyOpts opts) override {
-    return read_and_continue(key, library_, opts, DecodeSegmentTask{});
+    return read_and_continue(single_flight_reads_, key, library_, opts, DecodeSegmentTask{});
 }
 
 std::pair<entity::VariantKey, SegmentInMemory> read_sync(const entity::VariantKey &key,
                                                          storage::ReadKeyOpts opts) override {
-    return DecodeSegmentTask{}(read_dispatch(key, library_, opts));
+    return DecodeSegmentTask{}(single_flight_reads_.read_sync(key, library_, opts));
 }
 
 folly::Future<storage::KeySegmentPair> read_compressed(
         const entity::VariantKey &key,
         storage::ReadKeyOpts opts) override {
-    return read_and_continue(key, library_, opts, PassThroughTask{});
+    return read_and_continue(single_flight_reads_, key, library_, opts, PassThroughTask{});
 }
 
 storage::KeySegmentPair read_compressed_sync(
         const entity::VariantKey& key,
         storage::ReadKeyOpts opts
         ) override {
-        return read_dispatch( key, library_, opts );
+        return single_flight_reads_.read_sync(key, library_, opts);
 }
 
 folly::Future<std::pair<std::optional<VariantKey>, std::optional<google::protobuf::Any>>> read_metadata(const entity::VariantKey &key, storage::ReadKeyOpts opts) override {
-    return read_and_continue(key, library_, opts, DecodeMetadataTask{});
+    return read_and_continue(single_flight_reads_, key, library_, opts, DecodeMetadataTask{});
 }
 
 folly::Future<std::tuple<VariantKey, std::optional<google::protobuf::Any>, StreamDescriptor>> read_metadata_and_descriptor(
         const entity::VariantKey &key,
         storage::ReadKeyOpts opts) override {
-    return read_and_continue(key, library_, opts, DecodeMetadataAndDescriptorTask{});
+    return read_and_continue(single_flight_reads_, key, library_, opts, DecodeMetadataAndDescriptorTask{});
 }
 
 folly::Future<std::pair<VariantKey, TimeseriesDescriptor>> read_timeseries_descriptor(
         const entity::VariantKey &key,
         storage::ReadKeyOpts opts = storage::ReadKeyOpts{}) override {
-    return read_and_continue(key, library_, opts, DecodeTimeseriesDescriptorTask{});
+    return read_and_continue(single_flight_reads_, key, library_, opts, DecodeTimeseriesDescriptorTask{});
 }
 
 folly::Future<bool> key_exists(const entity::VariantKey &key) override {
@@ -271,39 +316,49 @@ folly::Future<folly::Unit> batch_write_compressed(std::vector<storage::KeySegmen
 }
 
 folly::Future<RemoveKeyResultType> remove_key(const entity::VariantKey &key, storage::RemoveOpts opts) override {
-    return async::submit_io_task(RemoveTask{key, library_, opts});
+    return async::submit_io_task(RemoveTask{key, library_, opts})
+        .thenValue([single_flight_reads = single_flight_reads_, key](auto&& result) {
+            single_flight_reads.forget(key);
+            return std::forward<decltype(result)>(result);
+        });
 }
 
 RemoveKeyResultType remove_key_sync(const entity::VariantKey &key, storage::RemoveOpts opts) override {
-    return RemoveTask{key, library_, opts}();
+    auto result = RemoveTask{key, library_, opts}();
+    single_flight_reads_.forget(key);
+    return result;
 }
 
 folly::Future<std::vector<RemoveKeyResultType>> remove_keys(const std::vector<entity::VariantKey> &keys,
                                                             storage::RemoveOpts opts) override {
     return keys.empty() ?
            std::vector<RemoveKeyResultType>() :
-           async::submit_io_task(RemoveBatchTask{keys, library_, opts});
+           async::submit_io_task(RemoveBatchTask{keys, library_, opts}).thenValue(forget_keys(keys));
 }
 
 folly::Future<std::vector<RemoveKeyResultType>> remove_keys(std::vector<entity::VariantKey> &&keys,
                                                             storage::RemoveOpts opts) override {
-    return keys.empty() ?
-           std::vector<RemoveKeyResultType>() :
-           async::submit_io_task(RemoveBatchTask{std::move(keys), library_, opts});
+    if (keys.empty())
+        return std::vector<RemoveKeyResultType>();
+
+    auto forget = forget_keys(keys);
+    return async::submit_io_task(RemoveBatchTask{std::move(keys), library_, opts}).thenValue(std::move(forget));
 }
 
 std::vector<RemoveKeyResultType> remove_keys_sync(const std::vector<entity::VariantKey> &keys,
                                                   storage::RemoveOpts opts) override {
     return keys.empty() ?
            std::vector<RemoveKeyResultType>() :
-           RemoveBatchTask{keys, library_, opts}();
+           forget_keys(keys)(RemoveBatchTask{keys, library_, opts}());
 }
 
 std::vector<RemoveKeyResultType> remove_keys_sync(std::vector<entity::VariantKey> &&keys,
                                                   storage::RemoveOpts opts) override {
-    return keys.empty() ?
-           std::vector<RemoveKeyResultType>() :
-           RemoveBatchTask{std::move(keys), library_, opts}();
+    if (keys.empty())
+        return std::vector<RemoveKeyResultType>();
+
+    auto forget = forget_keys(keys);
+    return forget(RemoveBatchTask{std::move(keys), library_, opts}());
 }
 
 folly::Future<std::vector<VariantKey>> batch_read_compressed(
@@ -312,19 +367,80 @@ folly::Future<std::vector<VariantKey>> batch_read_compressed(
     util::check(!keys_and_continuations.empty(), "Unexpected empty keys/continuation vector in batch_read_compressed");
     return folly::collect(folly::window(std::move(keys_and_continuations), [this] (auto&& key_and_continuation) {
         auto [key, continuation] = std::forward<decltype(key_and_continuation)>(key_and_continuation);
-        return read_and_continue(key, library_, storage::ReadKeyOpts{}, std::move(continuation));
+        return read_and_continue(single_flight_reads_, key, library_, storage::ReadKeyOpts{}, std::move(continuation));
     }, args.batch_size_)).via(&async::io_executor());
 }
 
 std::vector<folly::Future<pipelines::SegmentAndSlice>> batch_read_uncompressed(
         std::vector<pipelines::RangesAndKey>&& ranges_and_keys,
-        std::shared_ptr<std::unordered_set<std::string>> columns_to_decode) override {
+        std::shared_ptr<std::unordered_set<std::string>> columns_to_decode,
+        std::shared_ptr<QueryProfile> query_profile) override {
+    if (std::any_of(ranges_and_keys.begin(), ranges_and_keys.end(), [](const auto& ranges_and_key) {
+        return storage::is_packed_segment_key(ranges_and_key.key_);
+    }))
+        return batch_read_packed_uncompressed(std::move(ranges_and_keys), std::move(columns_to_decode), std::move(query_profile));
+
     return folly::window(
         std::move(ranges_and_keys),
-        [this, columns_to_decode](auto&& ranges_and_key) {
+        [this, columns_to_decode, query_profile](auto&& ranges_and_key) {
             const auto key = ranges_and_key.key_;
-            return read_and_continue(key, library_, storage::ReadKeyOpts{}, DecodeSliceTask{std::move(ranges_and_key), columns_to_decode});
+            // Storages may then read only the parts of the segment needed to decode the columns
+            storage::ReadKeyOpts opts;
+            if (ranges_and_key.decodes_some_columns_)
+                opts.columns_to_decode_ = columns_to_decode;
+            return read_and_continue(single_flight_reads_, key, library_, opts, DecodeSliceTask{std::move(ranges_and_key), columns_to_decode, query_profile});
+        }, async::TaskScheduler::instance()->io_thread_count() * 2);
+}
+
+// Consecutive keys of segments packed into the same object are read by one IO task, which fetches them with one ranged
+// read of the object, and each segment is then decoded separately
+std::vector<folly::Future<pipelines::SegmentAndSlice>> batch_read_packed_uncompressed(
+        std::vector<pipelines::RangesAndKey>&& ranges_and_keys,
+        std::shared_ptr<std::unordered_set<std::string>> columns_to_decode,
+        std::shared_ptr<QueryProfile> query_profile) {
+    std::vector<std::vector<entity::VariantKey>> key_groups;
+    std::vector<std::pair<size_t, size_t>> group_positions;
+    group_positions.reserve(ranges_and_keys.size());
+    std::optional<AtomKey> current_object;
+    for (const auto& ranges_and_key : ranges_and_keys) {
+        const auto& key = ranges_and_key.key_;
+        std::optional<AtomKey> object;
+        if (storage::is_packed_segment_key(key))
+            object = storage::coalesced_object_key(std::get<AtomKey>(key));
+
+        if (key_groups.empty() || !object || object != current_object)
+            key_groups.emplace_back();
+
+        current_object = object;
+        group_positions.emplace_back(key_groups.size() - 1, key_groups.back().size());
+        key_groups.back().emplace_back(key);
+    }
+
+    auto group_futures = folly::window(
+        std::move(key_groups),
+        [this](auto&& keys) {
+            return async::submit_io_task(ReadPackedSegmentsTask{std::move(keys), library_})
+                .thenValue([](std::vector<storage::KeySegmentPair>&& key_segments) {
+                    return std::make_shared<std::vector<storage::KeySegmentPair>>(std::move(key_segments));
+                });
         }, async::TaskScheduler::instance()->io_thread_count() * 2);
+
+    std::vector<folly::FutureSplitter<std::shared_ptr<std::vector<storage::KeySegmentPair>>>> groups;
+    groups.reserve(group_futures.size());
+    for (auto& group_future : group_futures)
+        groups.emplace_back(std::move(group_future));
+
+    std::vector<folly::Future<pipelines::SegmentAndSlice>> output;
+    output.reserve(ranges_and_keys.size());
+    for (size_t i = 0; i < ranges_and_keys.size(); ++i) {
+        const auto position = group_positions[i].second;
+        output.emplace_back(groups[group_positions[i].first].getFuture()
+            .via(&async::cpu_executor())
+            .thenValue([position, task = DecodeSliceTask{std::move(ranges_and_keys[i]), columns_to_decode, query_profile}](auto&& key_segments) mutable {
+                return task(std::move((*key_segments)[position]));
+            }));
+    }
+    return output;
 }
 
 std::vector<folly::Future<bool>> batch_key_exists(
@@ -372,9 +488,26 @@ std::vector<folly::Future<bool>> batch_key_exists(
     }
 
 private:
+    // Continues a write of a key, so that later reads of the key do not join reads begun before it was written
+    auto forget_key() const {
+        return [single_flight_reads = single_flight_reads_](VariantKey&& key) {
+            single_flight_reads.forget(key);
+            return std::move(key);
+        };
+    }
+
+    auto forget_keys(const std::vector<entity::VariantKey>& keys) const {
+        return [single_flight_reads = single_flight_reads_, keys](std::vector<RemoveKeyResultType>&& results) {
+            for (const auto& key : keys)
+                single_flight_reads.forget(key);
+            return std::move(results);
+        };
+    }
+
     std::shared_ptr<storage::Library> library_;
     std::shared_ptr<arcticdb::proto::encoding::VariantCodec> codec_;
     const EncodingVersion encoding_version_;
+    SingleFlightReads single_flight_reads_;
 };
 
 } // namespace arcticdb::async
@@ -0,0 +1,120 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/async/io_concurrency_controller.hpp>
+#include <arcticdb/entity/metrics.hpp>
+#include <arcticdb/log/log.hpp>
+#include <arcticdb/util/configs_map.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+#include <algorithm>
+
+namespace arcticdb::async {
+
+namespace {
+
+// The fewest completed tasks the concurrency limit is adjusted after
+constexpr size_t MIN_WINDOW = 4;
+// The fraction of the difference between the latest and baseline latencies that the baseline moves up by each window
+constexpr double BASELINE_DRIFT = 1.0 / 16;
+
+} // namespace
+
+IOConcurrencyController::IOConcurrencyController(size_t initial_concurrency, size_t min_concurrency, size_t max_concurrency) :
+    min_concurrency_(min_concurrency),
+    max_concurrency_(max_concurrency),
+    latency_tolerance_percent_(ConfigsMap::instance()->get_int("VersionStore.IOConcurrencyLatencyTolerancePercent", 150)),
+    decrease_percent_(ConfigsMap::instance()->get_int("VersionStore.IOConcurrencyDecreasePercent", 25)),
+    concurrency_(std::clamp(initial_concurrency, min_concurrency, max_concurrency)) {
+    util::check(min_concurrency_ > 0 && min_concurrency_ <= max_concurrency_,
+                "Invalid IO concurrency bounds: min {} max {}", min_concurrency_, max_concurrency_);
+    util::check(decrease_percent_ > 0 && decrease_percent_ < 100,
+                "VersionStore.IOConcurrencyDecreasePercent must be between 0 and 100, got {}", decrease_percent_);
+}
+
+void IOConcurrencyController::submit(folly::Function<void()>&& dispatch) {
+    {
+        std::lock_guard lock{mutex_};
+        if (in_flight_ >= concurrency_) {
+            waiting_.emplace_back(std::move(dispatch));
+            window_saturated_ = true;
+            return;
+        }
+        ++in_flight_;
+    }
+    dispatch();
+}
+
+void IOConcurrencyController::on_complete(std::chrono::nanoseconds latency, Clock::time_point now) {
+    std::vector<folly::Function<void()>> to_dispatch;
+    {
+        std::lock_guard lock{mutex_};
+        if (in_flight_ > 0)
+            --in_flight_;
+
+        ++window_completions_;
+        window_latency_ns_ += latency.count();
+        if (window_completions_ >= std::max(concurrency_, MIN_WINDOW))
+            end_window(now);
+
+        while (in_flight_ < concurrency_ && !waiting_.empty()) {
+            to_dispatch.emplace_back(std::move(waiting_.front()));
+            waiting_.pop_front();
+            ++in_flight_;
+        }
+    }
+    for (auto& dispatch : to_dispatch)
+        dispatch();
+}
+
+void IOConcurrencyController::end_window(Clock::time_point now) {
+    const auto elapsed_secs = std::chrono::duration<double>(now - window_start_).count();
+    const auto mean_latency_ns = static_cast<double>(window_latency_ns_) / static_cast<double>(window_completions_);
+    const auto throughput = elapsed_secs > 0 ? static_cast<double>(window_completions_) / elapsed_secs : last_throughput_;
+    if (baseline_latency_ns_ == 0.0 || mean_latency_ns < baseline_latency_ns_)
+        baseline_latency_ns_ = mean_latency_ns;
+    else
+        baseline_latency_ns_ += (mean_latency_ns - baseline_latency_ns_) * BASELINE_DRIFT;
+
+    const auto previous = concurrency_;
+    const auto latency_grown = mean_latency_ns * 100 > baseline_latency_ns_ * static_cast<double>(latency_tolerance_percent_);
+    if (latency_grown && throughput <= last_throughput_) {
+        const auto decreased = concurrency_ * static_cast<size_t>(100 - decrease_percent_) / 100;
+        concurrency_ = std::max(min_concurrency_, std::min(decreased, concurrency_ - 1));
+    } else if (window_saturated_) {
+        concurrency_ = std::min(max_concurrency_, concurrency_ + 1);
+    }
+
+    if (concurrency_ != previous) {
+        ARCTICDB_DEBUG(log::schedule(), "IO concurrency {} -> {}: mean latency {}ns, baseline {}ns, throughput {}/s",
+                       previous, concurrency_, mean_latency_ns, baseline_latency_ns_, throughput);
+        log_prometheus_gauge(IO_CONCURRENCY, "The most IO tasks that may run at once", concurrency_);
+    }
+
+    last_throughput_ = throughput;
+    window_start_ = now;
+    window_completions_ = 0;
+    window_latency_ns_ = 0;
+    window_saturated_ = !waiting_.empty();
+}
+
+void IOConcurrencyController::reset() {
+    std::lock_guard lock{mutex_};
+    in_flight_ = 0;
+    waiting_.clear();
+    window_start_ = Clock::now();
+    window_completions_ = 0;
+    window_latency_ns_ = 0;
+    window_saturated_ = false;
+}
+
+IOConcurrencyStats IOConcurrencyController::stats() const {
+    std::lock_guard lock{mutex_};
+    return {true, concurrency_, min_concurrency_, max_concurrency_, in_flight_, waiting_.size()};
+}
+
+} // namespace arcticdb::async
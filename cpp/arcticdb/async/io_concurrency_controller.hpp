@@ -0,0 +1,89 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/util/constructors.hpp>
+
+#include <folly/Function.h>
+
+#include <chrono>
+#include <deque>
+#include <mutex>
+#include <vector>
+
+namespace arcticdb::async {
+
+struct IOConcurrencyStats {
+    bool adaptive_ = false;
+    // The most IO tasks that may run at once
+    size_t concurrency_ = 0;
+    size_t min_concurrency_ = 0;
+    size_t max_concurrency_ = 0;
+    size_t in_flight_ = 0;
+    // IO tasks submitted but not yet running
+    size_t queue_depth_ = 0;
+};
+
+/*
+ * Limits the number of IO tasks running at once, adapting the limit to the storage: after each window of completed
+ * tasks, the limit is increased by one if tasks were kept waiting for it (additive increase), and is cut by a
+ * percentage if the mean latency of the tasks has grown well above the lowest seen without the throughput improving
+ * (multiplicative decrease). This finds a concurrency that keeps a high-latency storage such as S3 busy, without
+ * contention on a local storage such as LMDB.
+ *
+ * Configured with VersionStore.IOConcurrencyLatencyTolerancePercent and VersionStore.IOConcurrencyDecreasePercent.
+ */
+class IOConcurrencyController {
+public:
+    using Clock = std::chrono::steady_clock;
+
+    IOConcurrencyController(size_t initial_concurrency, size_t min_concurrency, size_t max_concurrency);
+
+    ARCTICDB_NO_MOVE_OR_COPY(IOConcurrencyController)
+
+    // Calls dispatch, which should start an IO task, now if below the concurrency limit, otherwise when a running
+    // task completes
+    void submit(folly::Function<void()>&& dispatch);
+
+    // Records the completion of a task started by submit, which took the given time to run
+    void on_complete(std::chrono::nanoseconds latency, Clock::time_point now = Clock::now());
+
+    // Forgets running and waiting tasks, e.g. after a fork in which they were lost
+    void reset();
+
+    [[nodiscard]] IOConcurrencyStats stats() const;
+
+    [[nodiscard]] size_t max_concurrency() const {
+        return max_concurrency_;
+    }
+
+private:
+    // Adjusts the concurrency limit at the end of a window of completed tasks
+    void end_window(Clock::time_point now);
+
+    const size_t min_concurrency_;
+    const size_t max_concurrency_;
+    const int64_t latency_tolerance_percent_;
+    const int64_t decrease_percent_;
+
+    mutable std::mutex mutex_;
+    size_t concurrency_;
+    size_t in_flight_ = 0;
+    std::deque<folly::Function<void()>> waiting_;
+
+    Clock::time_point window_start_ = Clock::now();
+    size_t window_completions_ = 0;
+    int64_t window_latency_ns_ = 0;
+    // Whether any task had to wait for the concurrency limit during the window
+    bool window_saturated_ = false;
+    // The lowest mean latency of a window, which drifts up towards recent latencies to follow changes in the storage
+    double baseline_latency_ns_ = 0.0;
+    double last_throughput_ = 0.0;
+};
+
+} // namespace arcticdb::async
@@ -23,6 +23,18 @@ void register_bindings(py::module &m) {
         }), "Number of threads used to execute tasks");
 
     async.def("print_scheduler_stats", &print_scheduler_stats);
+
+    py::class_<IOConcurrencyStats>(async, "IOConcurrencyStats")
+        .def_readonly("adaptive", &IOConcurrencyStats::adaptive_)
+        .def_readonly("concurrency", &IOConcurrencyStats::concurrency_)
+        .def_readonly("min_concurrency", &IOConcurrencyStats::min_concurrency_)
+        .def_readonly("max_concurrency", &IOConcurrencyStats::max_concurrency_)
+        .def_readonly("in_flight", &IOConcurrencyStats::in_flight_)
+        .def_readonly("queue_depth", &IOConcurrencyStats::queue_depth_);
+
+    async.def("io_concurrency_stats", []() {
+        return TaskScheduler::instance()->io_concurrency_stats();
+    }, "The current limit on IO tasks running at once, and how many are running and waiting");
 }
 
 } // namespace arcticdb::async
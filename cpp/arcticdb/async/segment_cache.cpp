@@ -0,0 +1,110 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/async/segment_cache.hpp>
+#include <arcticdb/entity/metrics.hpp>
+#include <arcticdb/util/configs_map.hpp>
+
+namespace arcticdb::async {
+
+std::shared_ptr<SegmentCache> SegmentCache::instance() {
+    std::call_once(SegmentCache::init_flag_, &SegmentCache::init);
+    return SegmentCache::instance_;
+}
+
+void SegmentCache::destroy_instance() {
+    if(instance_)
+        instance_->clear();
+    instance_.reset();
+}
+
+void SegmentCache::init() {
+    instance_ = std::make_shared<SegmentCache>();
+}
+
+bool SegmentCache::is_cacheable(const entity::VariantKey& key) {
+    if(!std::holds_alternative<entity::AtomKey>(key))
+        return false;
+
+    const auto key_type = variant_key_type(key);
+    return key_type == entity::KeyType::TABLE_DATA || key_type == entity::KeyType::MULTI_SEGMENT;
+}
+
+bool SegmentCache::enabled() const {
+    return ConfigsMap::instance()->get_int(MAX_BYTES_CONFIG, 0) > 0;
+}
+
+std::optional<Segment> SegmentCache::get(const std::string& library, const entity::AtomKey& key) {
+    std::optional<Segment> output;
+    {
+        std::lock_guard lock{mutex_};
+        if(auto it = index_.find(CacheKey{library, key}); it != index_.end()) {
+            entries_.splice(entries_.begin(), entries_, it->second);
+            output.emplace(it->second->segment_);
+        }
+    }
+    if(output) {
+        ++hits_;
+        log_prometheus_counter(SEGMENT_CACHE_HITS, "Segment cache hits", 1);
+    } else {
+        ++misses_;
+        log_prometheus_counter(SEGMENT_CACHE_MISSES, "Segment cache misses", 1);
+    }
+    ARCTICDB_DEBUG(log::storage(), "Segment cache {} for key {}", output ? "hit" : "miss", key);
+    return output;
+}
+
+void SegmentCache::put(const std::string& library, const entity::AtomKey& key, const Segment& segment) {
+    const auto max_bytes = static_cast<size_t>(std::max(ConfigsMap::instance()->get_int(MAX_BYTES_CONFIG, 0), int64_t{0}));
+    const auto segment_bytes = segment.total_segment_size();
+    std::lock_guard lock{mutex_};
+    if(segment_bytes > max_bytes) {
+        // Either the cache has been disabled, or this segment would evict everything else
+        evict_to(max_bytes);
+        return;
+    }
+    CacheKey cache_key{library, key};
+    if(index_.find(cache_key) != index_.end())
+        return;
+
+    evict_to(max_bytes - segment_bytes);
+    entries_.push_front(Entry{cache_key, segment, segment_bytes});
+    index_.try_emplace(std::move(cache_key), entries_.begin());
+    bytes_ += segment_bytes;
+    log_prometheus_gauge(SEGMENT_CACHE_BYTES, "Bytes held in the segment cache", bytes_);
+}
+
+void SegmentCache::evict_to(size_t max_bytes) {
+    while(bytes_ > max_bytes && !entries_.empty()) {
+        auto& entry = entries_.back();
+        bytes_ -= entry.bytes_;
+        index_.erase(entry.key_);
+        entries_.pop_back();
+    }
+}
+
+void SegmentCache::clear() {
+    std::lock_guard lock{mutex_};
+    index_.clear();
+    entries_.clear();
+    bytes_ = 0;
+}
+
+size_t SegmentCache::size() const {
+    std::lock_guard lock{mutex_};
+    return entries_.size();
+}
+
+size_t SegmentCache::bytes() const {
+    std::lock_guard lock{mutex_};
+    return bytes_;
+}
+
+std::shared_ptr<SegmentCache> SegmentCache::instance_;
+std::once_flag SegmentCache::init_flag_;
+
+} // namespace arcticdb::async
@@ -0,0 +1,86 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/codec/segment.hpp>
+#include <arcticdb/entity/atom_key.hpp>
+#include <arcticdb/entity/variant_key.hpp>
+
+#include <folly/hash/Hash.h>
+
+#include <atomic>
+#include <list>
+#include <mutex>
+#include <optional>
+#include <unordered_map>
+
+namespace arcticdb::async {
+
+/*
+ * Process-wide LRU cache of the segments read for data keys, shared by all libraries. Data keys are immutable once
+ * written, so a cached segment never needs invalidating. Segments are held in their compressed form: decoding
+ * depends on the columns requested and the decoded segment is mutated by the processing pipeline, whereas a
+ * compressed segment can be handed out by copy to any number of readers.
+ *
+ * Disabled unless SegmentCache.MaxBytes is set to a positive value in the ConfigsMap. The budget is re-read on every
+ * access, so it can be changed (or set to zero to disable the cache and release its memory) at runtime.
+ */
+class SegmentCache {
+public:
+    static constexpr const char* MAX_BYTES_CONFIG = "SegmentCache.MaxBytes";
+
+    static std::shared_ptr<SegmentCache> instance();
+    static void destroy_instance();
+
+    static bool is_cacheable(const entity::VariantKey& key);
+
+    [[nodiscard]] bool enabled() const;
+
+    std::optional<Segment> get(const std::string& library, const entity::AtomKey& key);
+
+    void put(const std::string& library, const entity::AtomKey& key, const Segment& segment);
+
+    void clear();
+
+    [[nodiscard]] size_t size() const;
+    [[nodiscard]] size_t bytes() const;
+    [[nodiscard]] size_t hits() const { return hits_; }
+    [[nodiscard]] size_t misses() const { return misses_; }
+
+private:
+    static std::shared_ptr<SegmentCache> instance_;
+    static std::once_flag init_flag_;
+
+    static void init();
+
+    using CacheKey = std::pair<std::string, entity::AtomKey>;
+
+    struct CacheKeyHash {
+        size_t operator()(const CacheKey& key) const {
+            return folly::hash::hash_combine(key.first, key.second);
+        }
+    };
+
+    struct Entry {
+        CacheKey key_;
+        Segment segment_;
+        size_t bytes_;
+    };
+
+    void evict_to(size_t max_bytes);
+
+    mutable std::mutex mutex_;
+    // Most recently used at the front
+    std::list<Entry> entries_;
+    std::unordered_map<CacheKey, std::list<Entry>::iterator, CacheKeyHash> index_;
+    size_t bytes_ = 0;
+    std::atomic<size_t> hits_ = 0;
+    std::atomic<size_t> misses_ = 0;
+};
+
+} // namespace arcticdb::async
@@ -14,11 +14,13 @@
 #include <arcticdb/util/configs_map.hpp>
 #include <arcticdb/util/home_directory.hpp>
 #include <arcticdb/async/base_task.hpp>
+#include <arcticdb/async/io_concurrency_controller.hpp>
 #include <arcticdb/entity/performance_tracing.hpp>
 
 #include <folly/executors/FutureExecutor.h>
 #include <folly/executors/CPUThreadPoolExecutor.h>
 #include <folly/executors/IOThreadPoolExecutor.h>
+#include <folly/futures/Promise.h>
 
 #include <thread>
 #include <algorithm>
@@ -145,6 +147,18 @@ inline int64_t default_io_thread_count(uint64_t cpu_count) {
     return std::min(int64_t(100L), static_cast<int64_t>(static_cast<double>(cpu_count) * 1.5));
 }
 
+// Returns a controller adapting the number of IO tasks run at once if VersionStore.AdaptiveIOConcurrency is set, in
+// which case the IO thread pool has a thread for the most tasks that may run at once
+inline std::unique_ptr<IOConcurrencyController> make_io_concurrency_controller(size_t io_thread_count) {
+    if (ConfigsMap::instance()->get_int("VersionStore.AdaptiveIOConcurrency", 0) == 0)
+        return nullptr;
+
+    const auto min_concurrency = ConfigsMap::instance()->get_int("VersionStore.MinIOConcurrency", 2);
+    const auto max_concurrency = ConfigsMap::instance()->get_int("VersionStore.MaxIOConcurrency", std::max(int64_t(100L), static_cast<int64_t>(io_thread_count)));
+    util::check(min_concurrency > 0 && max_concurrency > 0, "Zero IO concurrency bounds: {} {}", min_concurrency, max_concurrency);
+    return std::make_unique<IOConcurrencyController>(io_thread_count, static_cast<size_t>(min_concurrency), static_cast<size_t>(max_concurrency));
+}
+
 class TaskScheduler {
   public:
     using CPUSchedulerType = folly::FutureExecutor<folly::CPUThreadPoolExecutor>;
@@ -153,8 +167,9 @@ class TaskScheduler {
      explicit TaskScheduler(const std::optional<size_t>& cpu_thread_count = std::nullopt, const std::optional<size_t>& io_thread_count = std::nullopt) :
         cpu_thread_count_(cpu_thread_count ? *cpu_thread_count : ConfigsMap::instance()->get_int("VersionStore.NumCPUThreads", get_default_num_cpus())),
         io_thread_count_(io_thread_count ? *io_thread_count : ConfigsMap::instance()->get_int("VersionStore.NumIOThreads", std::min(100, (int) (cpu_thread_count_ * 1.5)))),
+        io_controller_(make_io_concurrency_controller(io_thread_count_)),
         cpu_exec_(cpu_thread_count_, std::make_shared<InstrumentedNamedFactory>("CPUPool")) ,
-        io_exec_(io_thread_count_,  std::make_shared<InstrumentedNamedFactory>("IOPool")){
+        io_exec_(io_pool_thread_count(),  std::make_shared<InstrumentedNamedFactory>("IOPool")){
         util::check(cpu_thread_count_ > 0 && io_thread_count_ > 0, "Zero IO or CPU threads: {} {}", io_thread_count_, cpu_thread_count_);
         ARCTICDB_RUNTIME_DEBUG(log::schedule(), "Task scheduler created with {:d} {:d}", cpu_thread_count_, io_thread_count_);
     }
@@ -175,10 +190,20 @@ class TaskScheduler {
         auto task = std::forward<decltype(t)>(t);
         static_assert(std::is_base_of_v<BaseTask, std::decay_t<Task>>, "Only support Tasks derived from BaseTask");
         ARCTICDB_DEBUG(log::schedule(), "{} Submitting IO task {}: {}", uintptr_t(this), typeid(task).name(), io_exec_.getPendingTaskCount());
+        if (io_controller_)
+            return submit_controlled_io_task(std::move(task));
+
         std::lock_guard lock{io_mutex_};
         return io_exec_.addFuture(std::move(task));
     }
 
+    IOConcurrencyStats io_concurrency_stats() {
+        auto stats = io_controller_ ? io_controller_->stats() : IOConcurrencyStats{
+            false, io_thread_count_, io_thread_count_, io_thread_count_, io_exec_.getPoolStats().activeThreadCount, 0};
+        stats.queue_depth_ += io_exec_.getPendingTaskCount();
+        return stats;
+    }
+
     static std::shared_ptr<TaskSchedulerPtrWrapper> instance_;
     static std::once_flag init_flag_;
     static std::once_flag shutdown_flag_;
@@ -235,8 +260,10 @@ class TaskScheduler {
         set_max_threads(0);
         io_exec_.set_thread_factory(std::make_shared<InstrumentedNamedFactory>("IOPool"));
         cpu_exec_.set_thread_factory(std::make_shared<InstrumentedNamedFactory>("CPUPool"));
-        io_exec_.setNumThreads(io_thread_count_);
+        io_exec_.setNumThreads(io_pool_thread_count());
         cpu_exec_.setNumThreads(cpu_thread_count_);
+        if (io_controller_)
+            io_controller_->reset();
     }
 
     size_t cpu_thread_count() const {
@@ -248,8 +275,32 @@ class TaskScheduler {
     }
 
 private:
+    size_t io_pool_thread_count() const {
+        return io_controller_ ? io_controller_->max_concurrency() : io_thread_count_;
+    }
+
+    // Runs the task once the IO concurrency controller allows, timing it to adapt the concurrency
+    template<class Task>
+    auto submit_controlled_io_task(Task&& task) {
+        using ResultType = folly::lift_unit_t<std::invoke_result_t<Task&>>;
+        folly::Promise<ResultType> promise;
+        auto future = promise.getFuture();
+        io_controller_->submit([this, task = std::forward<Task>(task), promise = std::move(promise)]() mutable {
+            std::lock_guard lock{io_mutex_};
+            io_exec_.add([this, task = std::move(task), promise = std::move(promise)]() mutable {
+                const auto start = std::chrono::steady_clock::now();
+                auto result = folly::Try<ResultType>(folly::makeTryWith(std::move(task)));
+                io_controller_->on_complete(std::chrono::steady_clock::now() - start);
+                promise.setTry(std::move(result));
+            });
+        });
+        return future;
+    }
+
     size_t cpu_thread_count_;
     size_t io_thread_count_;
+    // Set in adaptive mode, limits the number of IO tasks running at once
+    std::unique_ptr<IOConcurrencyController> io_controller_;
     SchedulerWrapper<CPUSchedulerType> cpu_exec_;
     SchedulerWrapper<IOSchedulerType> io_exec_;
     std::mutex cpu_mutex_;
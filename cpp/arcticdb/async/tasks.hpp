@@ -19,8 +19,10 @@
 #include <arcticdb/entity/variant_key.hpp>
 #include <arcticdb/stream/stream_sink.hpp>
 #include <arcticdb/async/base_task.hpp>
+#include <arcticdb/async/segment_cache.hpp>
 #include <arcticdb/pipeline/frame_slice.hpp>
 #include <arcticdb/processing/processing_unit.hpp>
+#include <arcticdb/processing/query_profile.hpp>
 #include <arcticdb/util/constructors.hpp>
 #include <arcticdb/codec/codec.hpp>
 
@@ -207,7 +209,20 @@ struct KeySegmentContinuation {
 };
 
 inline storage::KeySegmentPair read_dispatch(const entity::VariantKey& variant_key, const std::shared_ptr<storage::Library>& lib, const storage::ReadKeyOpts& opts) {
-    return util::variant_match(variant_key, [&lib, &opts](const auto &key) { return lib->read(key, opts); });
+    auto segment_cache = SegmentCache::instance();
+    if(!SegmentCache::is_cacheable(variant_key) || !segment_cache->enabled())
+        return util::variant_match(variant_key, [&lib, &opts](const auto &key) { return lib->read(key, opts); });
+
+    const auto& key = std::get<entity::AtomKey>(variant_key);
+    const auto library = lib->library_path().to_delim_path();
+    if(auto segment = segment_cache->get(library, key))
+        return {entity::VariantKey{key}, std::move(*segment)};
+
+    auto key_seg = lib->read(key, opts);
+    // Segments read for some of their columns only cannot be used by other reads
+    if(key_seg.has_segment() && !opts.columns_to_decode_)
+        segment_cache->put(library, key, key_seg.segment());
+    return key_seg;
 }
 
 template <typename Callable>
@@ -237,6 +252,35 @@ struct ReadCompressedTask : BaseTask {
     }
 };
 
+// Reads keys together, so that segments packed into the same multi-segment object are fetched with one ranged read of
+// the object, see storage/coalesced/packed_segment.hpp
+struct ReadPackedSegmentsTask : BaseTask {
+    std::vector<entity::VariantKey> keys_;
+    std::shared_ptr<storage::Library> lib_;
+
+    ReadPackedSegmentsTask(std::vector<entity::VariantKey>&& keys, std::shared_ptr<storage::Library> lib) :
+        keys_(std::move(keys)),
+        lib_(std::move(lib)) {
+    }
+
+    ARCTICDB_MOVE_ONLY_DEFAULT(ReadPackedSegmentsTask)
+
+    std::vector<storage::KeySegmentPair> operator()() {
+        ARCTICDB_SAMPLE(ReadPackedSegments, 0)
+        if (keys_.size() == 1)
+            return {read_dispatch(keys_[0], lib_, storage::ReadKeyOpts{})};
+
+        const auto num_keys = keys_.size();
+        std::vector<storage::KeySegmentPair> output;
+        output.reserve(num_keys);
+        lib_->read(Composite<entity::VariantKey>{std::move(keys_)}, [&output](const entity::VariantKey& key, Segment&& segment) {
+            output.emplace_back(entity::VariantKey{key}, std::move(segment));
+        }, storage::ReadKeyOpts{});
+        util::check(output.size() == num_keys, "Expected {} packed segments to be read, got {}", num_keys, output.size());
+        return output;
+    }
+};
+
 struct PassThroughTask : BaseTask {
     PassThroughTask() = default;
 
@@ -261,7 +305,7 @@ struct ReadCompressedSlicesTask : BaseTask {
      Composite<std::pair<Segment, pipelines::SliceAndKey>> read() {
         return slice_and_keys_.transform([that=this](const auto &sk){
             ARCTICDB_DEBUG(log::version(), "Reading key {}", sk.key());
-            return std::make_pair(that->lib_->read(sk.key()).release_segment(), sk);
+            return std::make_pair(read_dispatch(sk.key(), that->lib_, storage::ReadKeyOpts{}).release_segment(), sk);
         });
      }
 
@@ -334,17 +378,34 @@ struct DecodeSliceTask : BaseTask {
 
     pipelines::RangesAndKey ranges_and_key_;
     std::shared_ptr<std::unordered_set<std::string>> columns_to_decode_;
+    std::shared_ptr<QueryProfile> query_profile_;
+    // Started when the read of the segment is scheduled, if profiling
+    interval fetch_timer_;
 
     explicit DecodeSliceTask(
             pipelines::RangesAndKey&& ranges_and_key,
-            std::shared_ptr<std::unordered_set<std::string>> columns_to_decode):
+            std::shared_ptr<std::unordered_set<std::string>> columns_to_decode,
+            std::shared_ptr<QueryProfile> query_profile = nullptr):
             ranges_and_key_(std::move(ranges_and_key)),
-            columns_to_decode_(columns_to_decode) {
+            columns_to_decode_(columns_to_decode),
+            query_profile_(std::move(query_profile)) {
+        if (query_profile_)
+            fetch_timer_ = QueryProfile::start_timer();
     }
 
     pipelines::SegmentAndSlice operator()(storage::KeySegmentPair&& key_segment_pair) {
         ARCTICDB_SAMPLE(DecodeSliceTask, 0)
-        return decode_into_slice(std::move(key_segment_pair));
+        if (!query_profile_)
+            return decode_into_slice(std::move(key_segment_pair));
+
+        QueryProfile::add_time(query_profile_->fetch_time_ns_, fetch_timer_);
+        query_profile_->bytes_fetched_ += key_segment_pair.segment().total_segment_size();
+        auto decode_timer = QueryProfile::start_timer();
+        auto segment_and_slice = decode_into_slice(std::move(key_segment_pair));
+        QueryProfile::add_time(query_profile_->decode_time_ns_, decode_timer);
+        query_profile_->bytes_decoded_ += segment_and_slice.segment_in_memory_.num_bytes();
+        ++query_profile_->segments_read_;
+        return segment_and_slice;
     }
 
 private:
@@ -394,19 +455,44 @@ struct SegmentFunctionTask : BaseTask {
 struct MemSegmentProcessingTask : BaseTask {
     std::vector<std::shared_ptr<Clause>> clauses_;
     Composite<EntityIds> entity_ids_;
+    std::shared_ptr<QueryProfile> query_profile_;
+    // The index of clauses_[0] among the clauses of the query, used to attribute statistics to the right clause
+    size_t first_clause_idx_;
+    // Started when the task is submitted, if profiling
+    interval queue_timer_;
 
     explicit MemSegmentProcessingTask(
            std::vector<std::shared_ptr<Clause>> clauses,
-           Composite<EntityIds>&& entity_ids) :
+           Composite<EntityIds>&& entity_ids,
+           std::shared_ptr<QueryProfile> query_profile = nullptr,
+           size_t first_clause_idx = 0) :
         clauses_(std::move(clauses)),
-        entity_ids_(std::move(entity_ids)) {
+        entity_ids_(std::move(entity_ids)),
+        query_profile_(std::move(query_profile)),
+        first_clause_idx_(first_clause_idx) {
+        if (query_profile_)
+            queue_timer_ = QueryProfile::start_timer();
     }
 
     ARCTICDB_MOVE_ONLY_DEFAULT(MemSegmentProcessingTask)
 
     Composite<EntityIds> operator()() {
-        for(const auto& clause : clauses_) {
-            entity_ids_ = clause->process(std::move(entity_ids_));
+        if (query_profile_)
+            QueryProfile::add_time(query_profile_->queue_wait_ns_, queue_timer_);
+
+        for(size_t idx = 0; idx < clauses_.size(); ++idx) {
+            const auto& clause = clauses_[idx];
+            if (query_profile_) {
+                auto& clause_profile = query_profile_->clauses_.at(first_clause_idx_ + idx);
+                clause_profile.rows_in_ += query_profile_->row_count(entity_ids_);
+                auto timer = QueryProfile::start_timer();
+                entity_ids_ = clause->process(std::move(entity_ids_));
+                QueryProfile::add_time(clause_profile.time_ns_, timer);
+                clause_profile.rows_out_ += query_profile_->row_count(entity_ids_);
+                ++clause_profile.processing_units_;
+            } else {
+                entity_ids_ = clause->process(std::move(entity_ids_));
+            }
 
             if(clause->clause_info().requires_repartition_)
                 break;
@@ -0,0 +1,91 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+#include <arcticdb/async/io_concurrency_controller.hpp>
+
+using namespace arcticdb::async;
+using namespace std::chrono_literals;
+
+namespace {
+
+// Simulates a storage on which each request takes the given latency, however many run at once, so that throughput
+// grows with concurrency
+struct SimulatedStorage {
+    SimulatedStorage(size_t initial, size_t min, size_t max, size_t num_tasks) :
+        controller_(initial, min, max) {
+        for (size_t i = 0; i < num_tasks; ++i)
+            controller_.submit([this]() { ++dispatched_; });
+    }
+
+    void complete(std::chrono::milliseconds latency, size_t num_tasks) {
+        for (size_t i = 0; i < num_tasks; ++i) {
+            now_ += std::chrono::duration_cast<std::chrono::nanoseconds>(latency) / static_cast<int64_t>(controller_.stats().concurrency_);
+            controller_.on_complete(latency, now_);
+        }
+    }
+
+    IOConcurrencyController controller_;
+    IOConcurrencyController::Clock::time_point now_ = IOConcurrencyController::Clock::now();
+    size_t dispatched_ = 0;
+};
+
+} // namespace
+
+TEST(IOConcurrencyController, LimitsTasksInFlight) {
+    IOConcurrencyController controller{2, 1, 10};
+    size_t dispatched = 0;
+    for (auto i = 0; i < 5; ++i)
+        controller.submit([&dispatched]() { ++dispatched; });
+
+    ASSERT_EQ(dispatched, 2u);
+    auto stats = controller.stats();
+    ASSERT_TRUE(stats.adaptive_);
+    ASSERT_EQ(stats.in_flight_, 2u);
+    ASSERT_EQ(stats.queue_depth_, 3u);
+
+    controller.on_complete(1ms);
+    ASSERT_EQ(dispatched, 3u);
+    stats = controller.stats();
+    ASSERT_EQ(stats.in_flight_, 2u);
+    ASSERT_EQ(stats.queue_depth_, 2u);
+}
+
+TEST(IOConcurrencyController, IncreasesWhileThroughputGrows) {
+    SimulatedStorage storage{2, 1, 10, 1000};
+    storage.complete(10ms, 20);
+    const auto concurrency = storage.controller_.stats().concurrency_;
+    ASSERT_GT(concurrency, 2u);
+
+    storage.complete(10ms, 200);
+    const auto stats = storage.controller_.stats();
+    ASSERT_EQ(stats.concurrency_, 10u);
+    ASSERT_EQ(stats.in_flight_, 10u);
+    ASSERT_EQ(storage.dispatched_, 220u + 10u);
+}
+
+TEST(IOConcurrencyController, DecreasesWhenLatencyGrows) {
+    SimulatedStorage storage{8, 2, 8, 1000};
+    storage.complete(10ms, 40);
+    ASSERT_EQ(storage.controller_.stats().concurrency_, 8u);
+
+    storage.complete(50ms, 8);
+    const auto concurrency = storage.controller_.stats().concurrency_;
+    ASSERT_LT(concurrency, 8u);
+
+    storage.complete(50ms, 40);
+    ASSERT_EQ(storage.controller_.stats().concurrency_, 2u);
+}
+
+TEST(IOConcurrencyController, DoesNotIncreaseWithoutWaitingTasks) {
+    SimulatedStorage storage{2, 1, 10, 2};
+    for (auto i = 0; i < 20; ++i) {
+        storage.complete(10ms, 1);
+        storage.controller_.submit([]() {});
+    }
+    ASSERT_EQ(storage.controller_.stats().concurrency_, 2u);
+}
@@ -0,0 +1,81 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+#include <arcticdb/async/segment_cache.hpp>
+#include <arcticdb/codec/codec.hpp>
+#include <arcticdb/util/configs_map.hpp>
+#include <arcticdb/util/test/generators.hpp>
+
+using namespace arcticdb;
+
+namespace {
+
+Segment encoded_test_segment(const std::string& name) {
+    arcticdb::proto::encoding::VariantCodec opt;
+    opt.mutable_lz4()->set_acceleration(1);
+    return encode_dispatch(get_standard_timeseries_segment(name), opt, EncodingVersion::V1);
+}
+
+entity::AtomKey test_data_key(size_t id) {
+    return entity::atom_key_builder().gen_id(id).start_index(0).end_index(1).creation_ts(999)
+        .build("sym", entity::KeyType::TABLE_DATA);
+}
+
+} // namespace
+
+TEST(SegmentCache, DisabledByDefault) {
+    async::SegmentCache cache;
+    ASSERT_FALSE(cache.enabled());
+    cache.put("lib", test_data_key(0), encoded_test_segment("sym"));
+    ASSERT_EQ(cache.size(), 0);
+    ASSERT_FALSE(cache.get("lib", test_data_key(0)).has_value());
+    ASSERT_EQ(cache.misses(), 1);
+}
+
+TEST(SegmentCache, HitAndMiss) {
+    ScopedConfig max_bytes(async::SegmentCache::MAX_BYTES_CONFIG, 1 << 20);
+    async::SegmentCache cache;
+    auto segment = encoded_test_segment("sym");
+    cache.put("lib", test_data_key(0), segment);
+    ASSERT_EQ(cache.bytes(), segment.total_segment_size());
+
+    auto cached = cache.get("lib", test_data_key(0));
+    ASSERT_TRUE(cached.has_value());
+    ASSERT_EQ(cached->total_segment_size(), segment.total_segment_size());
+    ASSERT_EQ(decode_segment(std::move(*cached)).row_count(), 10);
+
+    // Same key in a different library, and a different key in the same library
+    ASSERT_FALSE(cache.get("other_lib", test_data_key(0)).has_value());
+    ASSERT_FALSE(cache.get("lib", test_data_key(1)).has_value());
+    ASSERT_EQ(cache.hits(), 1);
+    ASSERT_EQ(cache.misses(), 2);
+}
+
+TEST(SegmentCache, EvictsLeastRecentlyUsed) {
+    const auto segment_size = encoded_test_segment("sym").total_segment_size();
+    ScopedConfig max_bytes(async::SegmentCache::MAX_BYTES_CONFIG, static_cast<int64_t>(2 * segment_size));
+    async::SegmentCache cache;
+    cache.put("lib", test_data_key(0), encoded_test_segment("sym"));
+    cache.put("lib", test_data_key(1), encoded_test_segment("sym"));
+    // Touch key 0 so that key 1 is the least recently used
+    ASSERT_TRUE(cache.get("lib", test_data_key(0)).has_value());
+    cache.put("lib", test_data_key(2), encoded_test_segment("sym"));
+
+    ASSERT_EQ(cache.size(), 2);
+    ASSERT_LE(cache.bytes(), 2 * segment_size);
+    ASSERT_TRUE(cache.get("lib", test_data_key(0)).has_value());
+    ASSERT_FALSE(cache.get("lib", test_data_key(1)).has_value());
+    ASSERT_TRUE(cache.get("lib", test_data_key(2)).has_value());
+}
+
+TEST(SegmentCache, OnlyDataKeysAreCacheable) {
+    ASSERT_TRUE(async::SegmentCache::is_cacheable(test_data_key(0)));
+    auto index_key = entity::atom_key_builder().gen_id(0).build("sym", entity::KeyType::TABLE_INDEX);
+    ASSERT_FALSE(async::SegmentCache::is_cacheable(index_key));
+    ASSERT_FALSE(async::SegmentCache::is_cacheable(entity::RefKey{"sym", entity::KeyType::VERSION_REF}));
+}
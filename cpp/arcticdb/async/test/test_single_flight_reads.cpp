@@ -0,0 +1,167 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+#include <arcticdb/async/async_store.hpp>
+#include <arcticdb/storage/memory/memory_storage.hpp>
+#include <arcticdb/storage/storages.hpp>
+#include <arcticdb/util/configs_map.hpp>
+#include <arcticdb/util/test/generators.hpp>
+
+#include <thread>
+
+using namespace arcticdb;
+using namespace arcticdb::storage;
+using namespace std::chrono_literals;
+
+namespace {
+
+// A memory storage which counts its reads, and can be made slow so that reads overlap
+class SlowCountingStorage final : public Storage {
+public:
+    explicit SlowCountingStorage(const LibraryPath& path) :
+        Storage(path, OpenMode::DELETE),
+        storage_(path, OpenMode::DELETE, memory::MemoryStorage::Config{}) {
+    }
+
+    std::atomic<size_t> reads_ = 0;
+    std::atomic<int64_t> read_delay_ms_ = 0;
+
+private:
+    void do_write(Composite<KeySegmentPair>&& kvs) final {
+        storage_.write(std::move(kvs));
+    }
+
+    void do_update(Composite<KeySegmentPair>&& kvs, UpdateOpts opts) final {
+        storage_.update(std::move(kvs), opts);
+    }
+
+    void do_read(Composite<VariantKey>&& ks, const ReadVisitor& visitor, ReadKeyOpts opts) final {
+        ++reads_;
+        std::this_thread::sleep_for(std::chrono::milliseconds(read_delay_ms_.load()));
+        storage_.read(std::move(ks), visitor, opts);
+    }
+
+    void do_remove(Composite<VariantKey>&& ks, RemoveOpts opts) final {
+        storage_.remove(std::move(ks), opts);
+    }
+
+    bool do_key_exists(const VariantKey& key) final {
+        return storage_.key_exists(key);
+    }
+
+    bool do_supports_prefix_matching() const final {
+        return false;
+    }
+
+    bool do_fast_delete() final {
+        return false;
+    }
+
+    void do_iterate_type(KeyType key_type, const IterateTypeVisitor& visitor, const std::string& prefix) final {
+        storage_.iterate_type(key_type, visitor, prefix);
+    }
+
+    std::string do_key_path(const VariantKey&) const final {
+        return {};
+    }
+
+    memory::MemoryStorage storage_;
+};
+
+class SingleFlightReadsFixture : public testing::Test {
+protected:
+    SingleFlightReadsFixture() :
+        storage_(std::make_shared<SlowCountingStorage>(LibraryPath{"a", "b"})) {
+        Storages::StorageVector storages{storage_};
+        auto library = std::make_shared<Library>(LibraryPath{"a", "b"}, std::make_shared<Storages>(std::move(storages), OpenMode::DELETE));
+        store_ = std::make_shared<async::AsyncStore<>>(library, arcticdb::proto::encoding::VariantCodec{}, EncodingVersion::V1);
+        store_->write_sync(KeyType::VERSION_REF, "sym", get_standard_timeseries_segment("sym", 10));
+    }
+
+    std::vector<folly::Future<std::pair<VariantKey, SegmentInMemory>>> read_ref_key(size_t num_reads) {
+        std::vector<folly::Future<std::pair<VariantKey, SegmentInMemory>>> futures;
+        for (size_t i = 0; i < num_reads; ++i)
+            futures.emplace_back(store_->read(ref_key_, ReadKeyOpts{}));
+        return futures;
+    }
+
+    std::shared_ptr<SlowCountingStorage> storage_;
+    std::shared_ptr<async::AsyncStore<>> store_;
+    const RefKey ref_key_{"sym", KeyType::VERSION_REF};
+};
+
+} // namespace
+
+TEST_F(SingleFlightReadsFixture, ConcurrentReadsShareRequest) {
+    storage_->read_delay_ms_ = 200;
+    auto results = folly::collect(read_ref_key(10)).get();
+    ASSERT_EQ(storage_->reads_, 1u);
+    for (auto& [key, segment] : results) {
+        ASSERT_EQ(key, VariantKey{ref_key_});
+        ASSERT_EQ(segment.row_count(), 10u);
+    }
+
+    // The read is no longer in flight, so is made again
+    storage_->read_delay_ms_ = 0;
+    store_->read_sync(ref_key_, ReadKeyOpts{});
+    ASSERT_EQ(storage_->reads_, 2u);
+}
+
+TEST_F(SingleFlightReadsFixture, ConcurrentSyncReadsShareRequest) {
+    storage_->read_delay_ms_ = 200;
+    std::vector<std::thread> threads;
+    std::atomic<size_t> rows = 0;
+    for (auto i = 0; i < 8; ++i)
+        threads.emplace_back([this, &rows]() { rows += store_->read_sync(ref_key_, ReadKeyOpts{}).second.row_count(); });
+
+    for (auto& thread : threads)
+        thread.join();
+
+    ASSERT_EQ(rows, 80u);
+    ASSERT_LT(storage_->reads_, 8u);
+}
+
+TEST_F(SingleFlightReadsFixture, ReadAfterWriteNotShared) {
+    storage_->read_delay_ms_ = 200;
+    auto before_write = read_ref_key(1);
+    store_->write_sync(KeyType::VERSION_REF, "sym", get_standard_timeseries_segment("sym", 20));
+    auto after_write = read_ref_key(1);
+
+    ASSERT_EQ(std::move(after_write[0]).get().second.row_count(), 20u);
+    std::move(before_write[0]).get();
+    ASSERT_EQ(storage_->reads_, 2u);
+}
+
+TEST_F(SingleFlightReadsFixture, MissingKeyThrowsForAllReaders) {
+    storage_->read_delay_ms_ = 100;
+    std::vector<folly::Future<std::pair<VariantKey, SegmentInMemory>>> futures;
+    for (auto i = 0; i < 3; ++i)
+        futures.emplace_back(store_->read(RefKey{"missing", KeyType::VERSION_REF}, ReadKeyOpts{}));
+
+    for (auto& future : futures)
+        ASSERT_THROW(std::move(future).get(), KeyNotFoundException);
+
+    ASSERT_EQ(storage_->reads_, 1u);
+}
+
+TEST(SingleFlightReads, Disabled) {
+    ScopedConfig single_flight("VersionStore.SingleFlightReads", 0);
+    auto storage = std::make_shared<SlowCountingStorage>(LibraryPath{"a", "b"});
+    Storages::StorageVector storages{storage};
+    auto library = std::make_shared<Library>(LibraryPath{"a", "b"}, std::make_shared<Storages>(std::move(storages), OpenMode::DELETE));
+    async::AsyncStore<> store(library, arcticdb::proto::encoding::VariantCodec{}, EncodingVersion::V1);
+    store.write_sync(KeyType::VERSION_REF, "sym", get_standard_timeseries_segment("sym", 10));
+
+    storage->read_delay_ms_ = 50;
+    std::vector<folly::Future<std::pair<VariantKey, SegmentInMemory>>> futures;
+    for (auto i = 0; i < 4; ++i)
+        futures.emplace_back(store.read(RefKey{"sym", KeyType::VERSION_REF}, ReadKeyOpts{}));
+
+    folly::collect(futures).get();
+    ASSERT_EQ(storage->reads_, 4u);
+}
@@ -11,6 +11,7 @@
 #include <arcticdb/codec/default_codecs.hpp>
 #include <arcticdb/codec/encoded_field.hpp>
 #include <arcticdb/codec/encoded_field_collection.hpp>
+#include <arcticdb/entity/types_proto.hpp>
 
 
 #include <string>
@@ -482,6 +483,71 @@ HashedValue hash_segment_header(const arcticdb::proto::encoding::SegmentHeader &
     return accum.digest();
 }
 
+std::optional<EncodedColumnRanges> encoded_column_ranges(
+    const uint8_t* data,
+    size_t available_bytes,
+    const std::unordered_set<std::string>& columns) {
+    if (available_bytes < Segment::FIXED_HEADER_SIZE)
+        return std::nullopt;
+
+    const auto* fixed_hdr = reinterpret_cast<const Segment::FixedHeader*>(data);
+    util::check_arg(fixed_hdr->magic_number == Segment::MAGIC_NUMBER, "expected first 2 bytes: {}, actual {}",
+                    Segment::MAGIC_NUMBER, fixed_hdr->magic_number);
+    const uint64_t header_bytes = Segment::FIXED_HEADER_SIZE + fixed_hdr->header_bytes;
+    if (available_bytes < header_bytes)
+        return std::nullopt;
+
+    arcticdb::proto::encoding::SegmentHeader hdr;
+    google::protobuf::io::ArrayInputStream ais(data + Segment::FIXED_HEADER_SIZE, static_cast<int>(fixed_hdr->header_bytes));
+    util::check(hdr.ParseFromZeroCopyStream(&ais), "Failed to parse segment header");
+    const auto buffer_bytes = std::get<1>(segment_size::compressed(hdr));
+
+    EncodedColumnRanges result{header_bytes + buffer_bytes, {}};
+    auto add_range = [&result] (uint64_t offset, uint64_t bytes) {
+        if (bytes == 0)
+            return;
+
+        if (!result.ranges_.empty() && result.ranges_.back().first + result.ranges_.back().second == offset)
+            result.ranges_.back().second += bytes;
+        else
+            result.ranges_.emplace_back(offset, bytes);
+    };
+
+    if (EncodingVersion(hdr.encoding_version()) != EncodingVersion::V1) {
+        add_range(0, result.segment_bytes_);
+        return result;
+    }
+
+    // The body holds the metadata, each field in turn and then the string pool, as read by decode_v1
+    add_range(0, header_bytes);
+    auto offset = header_bytes;
+    if (hdr.has_metadata_field()) {
+        const auto bytes = encoding_sizes::ndarray_field_compressed_size(hdr.metadata_field().ndarray());
+        add_range(offset, bytes);
+        offset += bytes;
+    }
+
+    const auto& desc = hdr.stream_descriptor();
+    util::check(desc.fields_size() == hdr.fields_size(), "Mismatch between descriptor and header field size: {} != {}",
+                desc.fields_size(), hdr.fields_size());
+    const auto index_field_count = static_cast<int>(desc.index().field_count());
+    bool needs_string_pool = false;
+    for (int i = 0; i < hdr.fields_size(); ++i) {
+        const auto bytes = encoding_sizes::field_compressed_size(hdr.fields(i));
+        const auto& field = desc.fields(i);
+        if (i < index_field_count || columns.contains(field.name())) {
+            add_range(offset, bytes);
+            needs_string_pool |= is_sequence_type(type_desc_from_proto(field.type_desc()).data_type());
+        }
+        offset += bytes;
+    }
+
+    if (needs_string_pool && hdr.has_string_pool_field())
+        add_range(offset, encoding_sizes::ndarray_field_compressed_size(hdr.string_pool_field().ndarray()));
+
+    return result;
+}
+
 void add_bitmagic_compressed_size(
     const ColumnData& column_data,
     size_t& max_compressed_bytes,
@@ -13,6 +13,12 @@
 #include <arcticdb/entity/types.hpp>
 #include <arcticdb/codec/encode_common.hpp>
 
+#include <optional>
+#include <string>
+#include <unordered_set>
+#include <utility>
+#include <vector>
+
 namespace arcticdb {
 
 using ShapesBlockTDT = TypeDescriptorTag<DataTypeTag<DataType::INT64>, DimensionTag<Dimension::Dim0>>;
@@ -60,6 +66,25 @@ std::optional<std::tuple<google::protobuf::Any, arcticdb::proto::descriptors::Ti
     Segment& segment);
 
 HashedValue hash_segment_header(const arcticdb::proto::encoding::SegmentHeader &hdr);
+
+struct EncodedColumnRanges {
+    // The size of the whole serialized segment
+    uint64_t segment_bytes_;
+    // Offsets and sizes in bytes from the start of the serialized segment, ascending and not adjacent to each other
+    std::vector<std::pair<uint64_t, uint64_t>> ranges_;
+};
+
+/*
+ * The parts of a serialized segment read when decoding only the given columns and the index: its headers, metadata,
+ * the encoded fields of those columns and the string pool if any of them hold strings. A buffer of the size of the
+ * segment holding just these parts can be decoded like the whole segment, with the same columns to decode. data holds
+ * the first available_bytes of the serialized segment, and std::nullopt is returned if they do not cover its headers.
+ * Segments encoded with V2 locate their fields in the body rather than the header, so are read whole.
+ */
+std::optional<EncodedColumnRanges> encoded_column_ranges(
+    const uint8_t* data,
+    size_t available_bytes,
+    const std::unordered_set<std::string>& columns);
 } // namespace arcticdb
 
 #define ARCTICDB_SEGMENT_ENCODER_H_
@@ -497,3 +497,33 @@ TEST(Segment, KeepAlive) {
     }
     ASSERT_EQ(TransactionalThing::destroyed, true);
 }
+
+TEST(Segment, EncodedColumnRanges) {
+    arcticdb::proto::encoding::VariantCodec codec_opts;
+    codec_opts.mutable_lz4()->set_acceleration(1);
+    auto segment = encode_dispatch(get_standard_timeseries_segment("sym", 1000), codec_opts, EncodingVersion::V1);
+    const auto hdr_size = segment.segment_header_bytes_size();
+    const auto segment_bytes = segment.total_segment_size(hdr_size);
+    std::vector<uint8_t> bytes(segment_bytes);
+    segment.write_to(bytes.data(), hdr_size);
+
+    ASSERT_FALSE(encoded_column_ranges(bytes.data(), Segment::FIXED_HEADER_SIZE, {"uint64"}));
+
+    // The headers and the index, then the uint64 column after the int8 column
+    auto numeric = encoded_column_ranges(bytes.data(), bytes.size(), {"uint64"});
+    ASSERT_TRUE(numeric);
+    ASSERT_EQ(numeric->segment_bytes_, segment_bytes);
+    ASSERT_EQ(numeric->ranges_.size(), 2u);
+    ASSERT_EQ(numeric->ranges_[0].first, 0u);
+    ASSERT_LT(numeric->ranges_[1].first + numeric->ranges_[1].second, segment_bytes);
+
+    // String columns also need the string pool at the end of the segment
+    auto strings = encoded_column_ranges(bytes.data(), bytes.size(), {"strings"});
+    ASSERT_TRUE(strings);
+    ASSERT_EQ(strings->ranges_.size(), 2u);
+    ASSERT_EQ(strings->ranges_[1].first + strings->ranges_[1].second, segment_bytes);
+
+    auto all = encoded_column_ranges(bytes.data(), bytes.size(), {"int8", "uint64", "strings"});
+    ASSERT_TRUE(all);
+    ASSERT_EQ(all->ranges_, (std::vector<std::pair<uint64_t, uint64_t>>{{0, segment_bytes}}));
+}
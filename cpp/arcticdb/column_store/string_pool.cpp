@@ -204,36 +204,69 @@ py::buffer_info StringPool::as_buffer_info() const {
     };
 }
 
-std::optional<position_t> StringPool::get_offset_for_column(std::string_view string, const Column& column) {
-    auto unique_values = unique_values_for_string_column(column);
-    remove_nones_and_nans(unique_values);
-    ankerl::unordered_dense::map<std::string_view, offset_t> col_values;
-    col_values.reserve(unique_values.size());
-    for(auto pos : unique_values) {
-        col_values.emplace(block_.const_at(pos), pos);
-    }
+namespace {
+/*
+ * Calls on_string with each distinct offset of a string (rather than None or NaN) in the string column, in order of
+ * first appearance, until it returns false. Runs of equal offsets, which are common in sorted or low cardinality
+ * columns, are skipped without a hash lookup.
+ */
+template<typename Func>
+void for_each_distinct_string_offset(const Column& column, Func&& on_string) {
+    details::visit_type(column.type().data_type(), [&](auto col_desc_tag) {
+        using type_info = ScalarTypeInfo<decltype(col_desc_tag)>;
+        if constexpr(is_sequence_type(type_info::data_type)) {
+            ankerl::unordered_dense::set<position_t> seen;
+            auto previous = not_a_string();
+            auto input_data = column.data();
+            const auto end = input_data.cend<typename type_info::TDT>();
+            for (auto it = input_data.cbegin<typename type_info::TDT>(); it != end; ++it) {
+                const auto offset = static_cast<position_t>(*it);
+                if (offset == previous)
+                    continue;
+
+                previous = offset;
+                if (!is_a_string(offset) || !seen.insert(offset).second)
+                    continue;
+
+                if (!on_string(offset))
+                    return;
+            }
+        } else {
+            util::raise_rte("Column {} is not a string type column", column.type());
+        }
+    });
+}
+}
 
+std::optional<position_t> StringPool::get_offset_for_column(std::string_view string, const Column& column) {
     std::optional<position_t> output;
-    if(auto loc = col_values.find(string); loc != col_values.end())
-        output = loc->second;
+    for_each_distinct_string_offset(column, [this, string, &output](position_t offset) {
+        if (block_.const_at(offset) == string) {
+            output = offset;
+            return false;
+        }
+        return true;
+    });
     return output;
 }
 
 ankerl::unordered_dense::set<position_t> StringPool::get_offsets_for_column(const std::shared_ptr<std::unordered_set<std::string>>& strings, const Column& column) {
-    auto unique_values = unique_values_for_string_column(column);
-    remove_nones_and_nans(unique_values);
-    ankerl::unordered_dense::map<std::string_view, offset_t> col_values;
-    col_values.reserve(unique_values.size());
-    for(auto pos : unique_values) {
-        col_values.emplace(block_.const_at(pos), pos);
-    }
+    ankerl::unordered_dense::set<std::string_view> targets;
+    targets.reserve(strings->size());
+    for (const auto& string : *strings)
+        targets.insert(string);
 
     ankerl::unordered_dense::set<position_t> output;
-    for(const auto& string : *strings) {
-        auto loc = col_values.find(string);
-        if(loc != col_values.end())
-            output.insert(loc->second);
-    }
+    if (targets.empty())
+        return output;
+
+    for_each_distinct_string_offset(column, [this, &targets, &output](position_t offset) {
+        if (targets.contains(block_.const_at(offset))) {
+            output.insert(offset);
+            return output.size() < targets.size();
+        }
+        return true;
+    });
     return output;
 }
 }
@@ -62,6 +62,7 @@ KeyData get_key_data(KeyType key_type) {
     STRING_REF(KeyType::LOCK, lref, 'x')
     STRING_REF(KeyType::SNAPSHOT_TOMBSTONE, ttomb, 'X')
     STRING_KEY(KeyType::APPEND_DATA, app, 'b')
+    STRING_KEY(KeyType::MULTI_SEGMENT, mseg, 'c')
     // Unused
     STRING_KEY(KeyType::PARTITION, pref, 'p')
     STRING_REF(KeyType::STORAGE_INFO, sref, 'h')
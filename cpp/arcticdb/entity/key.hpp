@@ -178,6 +178,12 @@ enum class KeyType : int {
      * Contains column stats about the index key with the same stream ID and version number
      */
     COLUMN_STATS = 25,
+    /*
+     * A storage object packing many data segments of a symbol, headed by a MultiSegmentHeader locating each of them.
+     * Index segments reference the segments packed in one with MULTI_SEGMENT keys in place of TABLE_DATA keys, see
+     * storage/coalesced/packed_segment.hpp. Clients that predate this key type cannot read versions referencing them
+     */
+    MULTI_SEGMENT = 26,
     UNDEFINED
 };
 
@@ -187,6 +193,7 @@ inline std::vector<KeyType> key_types_write_precedence() {
     return {
         KeyType::LIBRARY_CONFIG,
         KeyType::TABLE_DATA,
+        KeyType::MULTI_SEGMENT,
         KeyType::TABLE_INDEX,
         KeyType::MULTI_KEY,
         KeyType::VERSION,
@@ -35,6 +35,15 @@ const std::string PROMETHEUS_ENV_LABEL = "env";
 const int SUMMARY_MAX_AGE = 30;
 const int SUMMARY_AGE_BUCKETS = 5;
 
+const std::string SEGMENT_CACHE_HITS = "arcticdb_segment_cache_hits";
+const std::string SEGMENT_CACHE_MISSES = "arcticdb_segment_cache_misses";
+const std::string SEGMENT_CACHE_BYTES = "arcticdb_segment_cache_bytes";
+const std::string COLUMN_STATS_PRUNED_ROW_SLICES = "arcticdb_column_stats_pruned_row_slices";
+const std::string LATE_MATERIALISATION_SKIPPED_SEGMENTS = "arcticdb_late_materialisation_skipped_segments";
+const std::string STORAGE_HEDGES_FIRED = "arcticdb_storage_hedges_fired";
+const std::string STORAGE_HEDGES_WON = "arcticdb_storage_hedges_won";
+const std::string IO_CONCURRENCY = "arcticdb_io_concurrency";
+
 class MetricsConfig {
 public:
     enum class Model {
@@ -2,12 +2,15 @@
 
 #include <arcticdb/processing/aggregation_interface.hpp>
 #include <arcticdb/processing/aggregation.hpp>
+#include <arcticdb/entity/type_conversion.hpp>
 #include <arcticdb/entity/type_utils.hpp>
 #include <arcticdb/util/preconditions.hpp>
 
 #include <third_party/semimap/semimap.h>
 
 #include <charconv>
+#include <cmath>
+#include <limits>
 
 namespace arcticdb {
 
@@ -47,43 +50,73 @@ SegmentInMemory merge_column_stats_segments(const std::vector<SegmentInMemory>&
     return merged;
 }
 
-// Needed as MINMAX maps to 2 columns in the column stats object
+// Needed as MINMAX maps to 2 columns in the column stats object, and BLOOM and DISTINCT map to one column per word
 enum class ColumnStatTypeInternal {
     MIN,
-    MAX
+    MAX,
+    BLOOM,
+    DISTINCT
 };
 
-std::string type_to_operator_string(ColumnStatTypeInternal type) {
+// The internal types and word indexes making up each column stat type
+std::vector<std::pair<ColumnStatTypeInternal, std::optional<size_t>>> to_internal_types(ColumnStatType type) {
+    std::vector<std::pair<ColumnStatTypeInternal, std::optional<size_t>>> res;
+    switch (type) {
+        case ColumnStatType::MINMAX:
+            res.emplace_back(ColumnStatTypeInternal::MIN, std::nullopt);
+            res.emplace_back(ColumnStatTypeInternal::MAX, std::nullopt);
+            break;
+        case ColumnStatType::BLOOM:
+            for (size_t word = 0; word < BLOOM_FILTER_WORDS; ++word) {
+                res.emplace_back(ColumnStatTypeInternal::BLOOM, word);
+            }
+            break;
+        case ColumnStatType::DISTINCT:
+            for (size_t word = 0; word < DISTINCT_SET_MAX_VALUES; ++word) {
+                res.emplace_back(ColumnStatTypeInternal::DISTINCT, word);
+            }
+            break;
+        default:
+            internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unrecognised ColumnStatType");
+    }
+    return res;
+}
+
+std::string type_to_operator_string(ColumnStatTypeInternal type, std::optional<size_t> word) {
     struct Tag{};
     using TypeToOperatorStringMap = semi::static_map<ColumnStatTypeInternal, std::string, Tag>;
     TypeToOperatorStringMap::get(ColumnStatTypeInternal::MIN) = "MIN";
     TypeToOperatorStringMap::get(ColumnStatTypeInternal::MAX) = "MAX";
+    TypeToOperatorStringMap::get(ColumnStatTypeInternal::BLOOM) = "BLOOM";
+    TypeToOperatorStringMap::get(ColumnStatTypeInternal::DISTINCT) = "DISTINCT";
     internal::check<ErrorCode::E_ASSERTION_FAILURE>(TypeToOperatorStringMap::contains(type), "Unknown column stat type requested");
-    return TypeToOperatorStringMap::get(type);
+    return word.has_value() ? fmt::format("{}{}", TypeToOperatorStringMap::get(type), *word) : TypeToOperatorStringMap::get(type);
 }
 
 std::string to_segment_column_name_v1(const std::string& column,
                                       ColumnStatTypeInternal column_stat_type,
+                                      std::optional<size_t> word,
                                       std::optional<uint64_t> minor_version=std::nullopt) {
     // Increment when modifying
     const uint64_t latest_minor_version = 0;
     return fmt::format("v1.{}_{}({})",
                        minor_version.value_or(latest_minor_version),
-                       type_to_operator_string(column_stat_type),
+                       type_to_operator_string(column_stat_type, word),
                        column);
 }
 
 std::string to_segment_column_name(const std::string& column,
                                    ColumnStatTypeInternal column_stat_type,
+                                   std::optional<size_t> word=std::nullopt,
                                    std::optional<std::pair<uint64_t, uint64_t>> version=std::nullopt) {
     if (!version.has_value()) {
         // Use latest version
-        return to_segment_column_name_v1(column, column_stat_type);
+        return to_segment_column_name_v1(column, column_stat_type, word);
     } else {
         // Use version specified
         switch(version->first) {
             case 1:
-                return to_segment_column_name_v1(column, column_stat_type, version->second);
+                return to_segment_column_name_v1(column, column_stat_type, word, version->second);
             default:
                 compatibility::raise<ErrorCode::E_UNRECOGNISED_COLUMN_STATS_VERSION>(
                         "Unrecognised major version number in column stats column name: {}",
@@ -98,7 +131,9 @@ std::pair<std::string, ColumnStatType> from_segment_column_name_v1(std::string_v
     const semi::map<std::string, ColumnStatType> name_to_type_map;
     const ankerl::unordered_dense::map<std::string, ColumnStatTypeInternal> operator_string_to_type {
         {"MIN", ColumnStatTypeInternal::MIN},
-        {"MAX", ColumnStatTypeInternal::MAX}
+        {"MAX", ColumnStatTypeInternal::MAX},
+        {"BLOOM", ColumnStatTypeInternal::BLOOM},
+        {"DISTINCT", ColumnStatTypeInternal::DISTINCT}
     };
     std::optional<ColumnStatTypeInternal> type;
     for (const auto& [name, type_candidate]: operator_string_to_type) {
@@ -108,6 +143,8 @@ std::pair<std::string, ColumnStatType> from_segment_column_name_v1(std::string_v
             break;
         }
     }
+    // Skip the word index of stats stored over several columns
+    pattern = pattern.substr(std::min(pattern.find_first_not_of("0123456789"), pattern.size()));
     internal::check<ErrorCode::E_ASSERTION_FAILURE>(type.has_value(), "Unexpected column stat column prefix {}", pattern);
     internal::check<ErrorCode::E_ASSERTION_FAILURE>(
             pattern.find('(') == 0 && pattern.rfind(')') == pattern.size() - 1,
@@ -116,6 +153,8 @@ std::pair<std::string, ColumnStatType> from_segment_column_name_v1(std::string_v
     using InternalToExternalColumnStatType = semi::static_map<ColumnStatTypeInternal, ColumnStatType, Tag>;
     InternalToExternalColumnStatType::get(ColumnStatTypeInternal::MIN) = ColumnStatType::MINMAX;
     InternalToExternalColumnStatType::get(ColumnStatTypeInternal::MAX) = ColumnStatType::MINMAX;
+    InternalToExternalColumnStatType::get(ColumnStatTypeInternal::BLOOM) = ColumnStatType::BLOOM;
+    InternalToExternalColumnStatType::get(ColumnStatTypeInternal::DISTINCT) = ColumnStatType::DISTINCT;
     return std::make_pair(std::string(pattern.substr(1, pattern.size() - 2)), InternalToExternalColumnStatType::get(*type));
 }
 
@@ -123,6 +162,8 @@ std::string type_to_name(ColumnStatType type) {
     struct Tag{};
     using TypeToNameMap = semi::static_map<ColumnStatType, std::string, Tag>;
     TypeToNameMap::get(ColumnStatType::MINMAX) = "MINMAX";
+    TypeToNameMap::get(ColumnStatType::BLOOM) = "BLOOM";
+    TypeToNameMap::get(ColumnStatType::DISTINCT) = "DISTINCT";
     internal::check<ErrorCode::E_ASSERTION_FAILURE>(TypeToNameMap::contains(type), "Unknown column stat type requested");
     return TypeToNameMap::get(type);
 }
@@ -131,6 +172,8 @@ std::optional<ColumnStatType> name_to_type(const std::string& name) {
     // Cannot use static_map here as keys come from user input
     semi::map<std::string, ColumnStatType> name_to_type_map;
     name_to_type_map.get("MINMAX") = ColumnStatType::MINMAX;
+    name_to_type_map.get("BLOOM") = ColumnStatType::BLOOM;
+    name_to_type_map.get("DISTINCT") = ColumnStatType::DISTINCT;
     return name_to_type_map.contains(name) ? std::make_optional<ColumnStatType>(name_to_type_map.get(name)) : std::nullopt;
 }
 
@@ -193,20 +236,28 @@ void ColumnStats::drop(const ColumnStats& to_drop, bool warn_if_missing) {
 
 ankerl::unordered_dense::set<std::string> ColumnStats::segment_column_names() const {
     internal::check<ErrorCode::E_ASSERTION_FAILURE>(version_.has_value(), "Cannot construct column stat column names without specified versions");
-    struct Tag{};
-    using ExternalToInternalColumnStatType = semi::static_map<ColumnStatType, std::unordered_set<ColumnStatTypeInternal>, Tag>;
-    ExternalToInternalColumnStatType::get(ColumnStatType::MINMAX) = std::unordered_set<ColumnStatTypeInternal>{ColumnStatTypeInternal::MIN, ColumnStatTypeInternal::MAX};
     ankerl::unordered_dense::set<std::string> res;
     for (const auto& [column, column_stat_types]: column_stats_) {
         for (const auto& column_stat_type: column_stat_types) {
-            for (const auto& column_stat_type_internal: ExternalToInternalColumnStatType::get(column_stat_type)) {
-                res.emplace(to_segment_column_name(column, column_stat_type_internal, version_));
+            for (const auto& [column_stat_type_internal, word]: to_internal_types(column_stat_type)) {
+                res.emplace(to_segment_column_name(column, column_stat_type_internal, word, version_));
             }
         }
     }
     return res;
 }
 
+std::vector<std::string> ColumnStats::segment_column_names(const std::string& column, ColumnStatType column_stat_type) const {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(version_.has_value(), "Cannot construct column stat column names without specified versions");
+    std::vector<std::string> res;
+    if (auto it = column_stats_.find(column); it != column_stats_.end() && it->second.contains(column_stat_type)) {
+        for (const auto& [column_stat_type_internal, word]: to_internal_types(column_stat_type)) {
+            res.emplace_back(to_segment_column_name(column, column_stat_type_internal, word, version_));
+        }
+    }
+    return res;
+}
+
 std::unordered_map<std::string, std::unordered_set<std::string>> ColumnStats::to_map() const {
     std::unordered_map<std::string, std::unordered_set<std::string>> res;
     for (const auto& [column, types]: column_stats_) {
@@ -218,6 +269,14 @@ std::unordered_map<std::string, std::unordered_set<std::string>> ColumnStats::to
     return res;
 }
 
+std::vector<ColumnName> output_column_names(const std::string& column, ColumnStatType column_stat_type) {
+    std::vector<ColumnName> res;
+    for (const auto& [column_stat_type_internal, word]: to_internal_types(column_stat_type)) {
+        res.emplace_back(to_segment_column_name(column, column_stat_type_internal, word));
+    }
+    return res;
+}
+
 std::optional<Clause> ColumnStats::clause() const {
     if (column_stats_.empty()) {
         return std::nullopt;
@@ -236,6 +295,14 @@ std::optional<Clause> ColumnStats::clause() const {
                                              ColumnName(to_segment_column_name(column, ColumnStatTypeInternal::MAX)))
                                              );
                     break;
+                case ColumnStatType::BLOOM:
+                    index_generation_aggregators->emplace_back(
+                            BloomFilterAggregator(ColumnName(column), output_column_names(column, column_stat_type)));
+                    break;
+                case ColumnStatType::DISTINCT:
+                    index_generation_aggregators->emplace_back(
+                            DistinctSetAggregator(ColumnName(column), output_column_names(column, column_stat_type)));
+                    break;
                 default:
                     internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unrecognised ColumnStatType");
             }
@@ -291,4 +358,397 @@ std::pair<std::string, ColumnStatType> ColumnStats::from_segment_column_name(
     }
 }
 
-}
\ No newline at end of file
+namespace {
+
+// Literals of a numeric filter are compared to a column in a common type (see Comparable), which can be lossy. Returns
+// false for literals where that could make the comparison disagree with one on the exact values recorded by the stats.
+// With dynamic schema each row slice may hold the column as a narrower type than the one in the descriptor.
+template<typename RawType>
+bool compares_exactly(RawType value, DataType column_type, bool dynamic_schema) {
+    const bool any_float = std::is_floating_point_v<RawType> || is_floating_point_type(column_type);
+    if (any_float) {
+        const bool any_float32 = std::is_same_v<RawType, float> || column_type == DataType::FLOAT32 ||
+                                 (dynamic_schema && is_floating_point_type(column_type));
+        const double max_exact = any_float32 ? 0x1p24 : 0x1p53;
+        return std::fabs(static_cast<double>(value)) < max_exact;
+    }
+    // Mixing int64 and uint64 compares as uint64, which wraps negative values
+    if constexpr (std::is_signed_v<RawType>) {
+        const bool may_be_uint64 = column_type == DataType::UINT64 || (dynamic_schema && is_integer_type(column_type));
+        return value >= 0 || !may_be_uint64;
+    } else {
+        const bool may_be_int64 = is_signed_type(column_type) || is_time_type(column_type);
+        return static_cast<uint64_t>(value) <= static_cast<uint64_t>(std::numeric_limits<int64_t>::max()) || !may_be_int64;
+    }
+}
+
+template<typename RawType>
+std::optional<uint64_t> filter_value_hash(RawType value, DataType column_type, bool dynamic_schema) {
+    if (!compares_exactly(value, column_type, dynamic_schema))
+        return std::nullopt;
+    return column_stats_hash_numeric(value);
+}
+
+std::optional<std::vector<uint64_t>> filter_value_hashes(const Value& value, DataType column_type, bool dynamic_schema) {
+    if (is_sequence_type(value.data_type_)) {
+        if (!is_dynamic_string_type(column_type))
+            return std::nullopt;
+        return std::vector<uint64_t>{column_stats_hash_string(std::string_view(*value.str_data(), value.len()))};
+    }
+    std::optional<std::vector<uint64_t>> res;
+    details::visit_type(value.data_type_, [&value, column_type, dynamic_schema, &res](auto val_tag) {
+        using type_info = ScalarTypeInfo<decltype(val_tag)>;
+        if constexpr(is_numeric_type(type_info::data_type) || is_bool_type(type_info::data_type)) {
+            if (is_numeric_type(column_type) || is_bool_type(column_type)) {
+                if (auto hash = filter_value_hash(value.get<typename type_info::RawType>(), column_type, dynamic_schema); hash.has_value())
+                    res = std::vector<uint64_t>{*hash};
+            }
+        }
+    });
+    return res;
+}
+
+std::optional<std::vector<uint64_t>> filter_value_hashes(ValueSet& value_set, DataType column_type, bool dynamic_schema) {
+    std::vector<uint64_t> res;
+    if (value_set.empty())
+        return res;
+
+    if (is_sequence_type(value_set.base_type().data_type())) {
+        if (!is_dynamic_string_type(column_type))
+            return std::nullopt;
+        for (const auto& value: *value_set.get_set<std::string>()) {
+            res.emplace_back(column_stats_hash_string(value));
+        }
+        return res;
+    }
+    if (!is_numeric_type(column_type) && !is_bool_type(column_type))
+        return std::nullopt;
+
+    bool hashable = true;
+    details::visit_type(value_set.base_type().data_type(), [&value_set, column_type, dynamic_schema, &res, &hashable](auto val_tag) {
+        using type_info = ScalarTypeInfo<decltype(val_tag)>;
+        if constexpr(is_numeric_type(type_info::data_type)) {
+            for (auto value: *value_set.template get_set<typename type_info::RawType>()) {
+                if (auto hash = filter_value_hash(value, column_type, dynamic_schema); hash.has_value())
+                    res.emplace_back(*hash);
+                else
+                    hashable = false;
+            }
+        } else {
+            hashable = false;
+        }
+    });
+    return hashable ? std::make_optional(std::move(res)) : std::nullopt;
+}
+
+// Flips a comparison so that it reads <column> <operation> <value> when the value is on the left
+OperationType column_on_left(OperationType operation_type) {
+    switch (operation_type) {
+        case OperationType::LT:
+            return OperationType::GT;
+        case OperationType::LE:
+            return OperationType::GE;
+        case OperationType::GT:
+            return OperationType::LT;
+        case OperationType::GE:
+            return OperationType::LE;
+        default:
+            return operation_type;
+    }
+}
+
+// True if no value in [min, max] can satisfy <column> <operation> <value>. The comparison is made in the same types
+// as the filter (see binary_comparator), so that conversions to the common type cannot change the answer.
+bool outside_range(
+        OperationType operation_type,
+        const Value& value,
+        const Column& min_column,
+        const Column& max_column,
+        size_t row,
+        DataType column_type,
+        bool dynamic_schema) {
+    bool res = false;
+    details::visit_type(min_column.type().data_type(), [&](auto col_tag) {
+        using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr(is_numeric_type(col_type_info::data_type)) {
+            details::visit_type(value.data_type_, [&](auto val_tag) {
+                using val_type_info = ScalarTypeInfo<decltype(val_tag)>;
+                if constexpr(is_numeric_type(val_type_info::data_type)) {
+                    using comp = Comparable<typename val_type_info::RawType, typename col_type_info::RawType>;
+                    using left_type = typename comp::left_type;
+                    using right_type = typename comp::right_type;
+                    // Converting signed column values to unsigned does not preserve their order
+                    if constexpr(std::is_signed_v<right_type> && std::is_same_v<left_type, uint64_t>) {
+                        return;
+                    } else {
+                        const auto raw_value = value.get<typename val_type_info::RawType>();
+                        if (dynamic_schema && !compares_exactly(raw_value, column_type, dynamic_schema))
+                            return;
+
+                        auto min = min_column.scalar_at<typename col_type_info::RawType>(row);
+                        auto max = max_column.scalar_at<typename col_type_info::RawType>(row);
+                        if (!min.has_value() || !max.has_value())
+                            return;
+
+                        // Both sides end up in the common type once the comparison operator is applied
+                        using common_type = std::common_type_t<left_type, right_type>;
+                        const auto val = static_cast<common_type>(static_cast<left_type>(raw_value));
+                        const auto lo = static_cast<common_type>(static_cast<right_type>(*min));
+                        const auto hi = static_cast<common_type>(static_cast<right_type>(*max));
+                        if constexpr(std::is_floating_point_v<common_type>) {
+                            // A NaN min or max means the stats were built over NaN values, so say nothing
+                            if (std::isnan(val) || std::isnan(lo) || std::isnan(hi))
+                                return;
+                        }
+                        switch (operation_type) {
+                            case OperationType::EQ:
+                                res = val < lo || hi < val;
+                                break;
+                            case OperationType::LT:
+                                res = !(lo < val);
+                                break;
+                            case OperationType::LE:
+                                res = val < lo;
+                                break;
+                            case OperationType::GT:
+                                res = !(val < hi);
+                                break;
+                            case OperationType::GE:
+                                res = hi < val;
+                                break;
+                            default:
+                                break;
+                        }
+                    }
+                }
+            });
+        }
+    });
+    return res;
+}
+
+/*
+ * Evaluates filter expressions against the rows of a column stats segment, each of which describes one row slice.
+ * Every answer errs on the side of the row slice containing matching rows.
+ */
+class ColumnStatsPruner {
+public:
+    ColumnStatsPruner(const SegmentInMemory& column_stats_segment, const StreamDescriptor& descriptor, bool dynamic_schema) :
+        segment_(column_stats_segment),
+        column_stats_(column_stats_segment.fields()),
+        descriptor_(descriptor),
+        dynamic_schema_(dynamic_schema) {
+    }
+
+    // True if no row in the row slice described by the given row of the column stats segment can match the expression
+    bool can_prune(ExpressionContext& expression_context, const VariantNode& node, size_t row) {
+        return util::variant_match(node,
+            [this, &expression_context, row](const ExpressionName& expression_name) {
+                auto expression_node = expression_context.expression_nodes_.get_value(expression_name.value);
+                switch (expression_node->operation_type_) {
+                    case OperationType::AND:
+                        return can_prune(expression_context, expression_node->left_, row) ||
+                               can_prune(expression_context, expression_node->right_, row);
+                    case OperationType::OR:
+                        return can_prune(expression_context, expression_node->left_, row) &&
+                               can_prune(expression_context, expression_node->right_, row);
+                    case OperationType::EQ:
+                        return can_prune_range(expression_context, *expression_node, row) ||
+                               can_prune_membership(expression_context, expression_name, *expression_node, row);
+                    case OperationType::ISIN:
+                        return can_prune_membership(expression_context, expression_name, *expression_node, row);
+                    case OperationType::LT:
+                    case OperationType::LE:
+                    case OperationType::GT:
+                    case OperationType::GE:
+                        return can_prune_range(expression_context, *expression_node, row);
+                    default:
+                        return false;
+                }
+            },
+            [](const auto&) {
+                return false;
+            });
+    }
+
+private:
+    bool can_prune_range(ExpressionContext& expression_context, const ExpressionNode& expression_node, size_t row) {
+        auto operation_type = expression_node.operation_type_;
+        const auto* column_name = std::get_if<ColumnName>(&expression_node.left_);
+        const auto* value_name = std::get_if<ValueName>(&expression_node.right_);
+        if (column_name == nullptr) {
+            column_name = std::get_if<ColumnName>(&expression_node.right_);
+            value_name = std::get_if<ValueName>(&expression_node.left_);
+            operation_type = column_on_left(operation_type);
+        }
+        if (column_name == nullptr || value_name == nullptr)
+            return false;
+
+        auto field_index = descriptor_.find_field(column_name->value);
+        if (!field_index.has_value())
+            return false;
+
+        const auto column_type = descriptor_.field(*field_index).type().data_type();
+        const auto& columns = stat_columns(column_name->value, ColumnStatType::MINMAX);
+        if (columns.empty())
+            return false;
+
+        const auto& min_column = segment_.column(static_cast<position_t>(columns[0]));
+        const auto& max_column = segment_.column(static_cast<position_t>(columns[1]));
+        // The stats are only comparable in the filter's types if they were not promoted when merged
+        if (!dynamic_schema_ && min_column.type().data_type() != column_type)
+            return false;
+
+        const auto& value = *expression_context.values_.get_value(value_name->value);
+        return outside_range(operation_type, value, min_column, max_column, row, column_type, dynamic_schema_);
+    }
+
+    bool can_prune_membership(
+            ExpressionContext& expression_context,
+            const ExpressionName& expression_name,
+            const ExpressionNode& expression_node,
+            size_t row) {
+        const auto* column_name = std::get_if<ColumnName>(&expression_node.left_);
+        const auto* other = &expression_node.right_;
+        if (column_name == nullptr) {
+            column_name = std::get_if<ColumnName>(&expression_node.right_);
+            other = &expression_node.left_;
+        }
+        if (column_name == nullptr)
+            return false;
+
+        auto [it, inserted] = literal_hashes_.try_emplace(expression_name.value);
+        if (inserted)
+            it->second = literal_hashes(expression_context, column_name->value, *other);
+        if (!it->second.has_value())
+            return false;
+
+        for (auto hash: *it->second) {
+            if (may_contain(column_name->value, hash, row))
+                return false;
+        }
+        return true;
+    }
+
+    std::optional<std::vector<uint64_t>> literal_hashes(
+            ExpressionContext& expression_context,
+            const std::string& column_name,
+            const VariantNode& literal) const {
+        auto field_index = descriptor_.find_field(column_name);
+        if (!field_index.has_value())
+            return std::nullopt;
+
+        const auto column_type = descriptor_.field(*field_index).type().data_type();
+        return util::variant_match(literal,
+            [this, &expression_context, column_type](const ValueName& value_name) {
+                return filter_value_hashes(*expression_context.values_.get_value(value_name.value), column_type, dynamic_schema_);
+            },
+            [this, &expression_context, column_type](const ValueSetName& value_set_name) {
+                return filter_value_hashes(*expression_context.value_sets_.get_value(value_set_name.value), column_type, dynamic_schema_);
+            },
+            [](const auto&) -> std::optional<std::vector<uint64_t>> {
+                return std::nullopt;
+            });
+    }
+
+    bool may_contain(const std::string& column_name, uint64_t hash, size_t row) {
+        if (auto distinct_values = words(column_name, ColumnStatType::DISTINCT, row); distinct_values.has_value())
+            return std::find(distinct_values->begin(), distinct_values->end(), hash) != distinct_values->end();
+
+        if (auto bloom_filter = words(column_name, ColumnStatType::BLOOM, row); bloom_filter.has_value()) {
+            std::array<uint64_t, BLOOM_FILTER_WORDS> bloom_filter_words{};
+            std::copy(bloom_filter->begin(), bloom_filter->end(), bloom_filter_words.begin());
+            return bloom_filter_may_contain(bloom_filter_words, hash);
+        }
+        return true;
+    }
+
+    // Indexes of the columns in the column stats segment holding the given stat, empty if any are missing
+    const std::vector<size_t>& stat_columns(const std::string& column_name, ColumnStatType column_stat_type) {
+        auto [it, inserted] = stat_columns_.try_emplace(std::make_pair(column_name, column_stat_type));
+        if (inserted) {
+            for (const auto& segment_column_name: column_stats_.segment_column_names(column_name, column_stat_type)) {
+                auto column_index = segment_.column_index(segment_column_name);
+                if (!column_index.has_value()) {
+                    it->second.clear();
+                    break;
+                }
+                it->second.emplace_back(*column_index);
+            }
+        }
+        return it->second;
+    }
+
+    // The words of the given stat for the given row, if the stat was recorded for that row slice
+    std::optional<std::vector<uint64_t>> words(const std::string& column_name, ColumnStatType column_stat_type, size_t row) {
+        const auto& columns = stat_columns(column_name, column_stat_type);
+        if (columns.empty())
+            return std::nullopt;
+
+        std::vector<uint64_t> res;
+        res.reserve(columns.size());
+        for (auto column_index: columns) {
+            auto word = segment_.column(static_cast<position_t>(column_index)).scalar_at<uint64_t>(row);
+            if (!word.has_value())
+                return std::nullopt;
+            res.emplace_back(*word);
+        }
+        return res;
+    }
+
+    const SegmentInMemory& segment_;
+    ColumnStats column_stats_;
+    const StreamDescriptor& descriptor_;
+    bool dynamic_schema_;
+    std::map<std::pair<std::string, ColumnStatType>, std::vector<size_t>> stat_columns_;
+    // Keyed by the name of the expression node the literal belongs to
+    std::unordered_map<std::string, std::optional<std::vector<uint64_t>>> literal_hashes_;
+};
+
+} // anonymous namespace
+
+size_t prune_with_column_stats(
+        std::vector<pipelines::SliceAndKey>& slice_and_keys,
+        const SegmentInMemory& column_stats_segment,
+        const std::vector<std::shared_ptr<ExpressionContext>>& filters,
+        const StreamDescriptor& descriptor,
+        bool dynamic_schema) {
+    if (filters.empty() || slice_and_keys.empty() || column_stats_segment.row_count() == 0)
+        return 0;
+
+    ColumnStatsPruner pruner(column_stats_segment, descriptor, dynamic_schema);
+    // Several row slices can share the same index range, in which case all of their stats must agree
+    std::map<std::pair<timestamp, timestamp>, bool> prunable;
+    const auto& start_index_column = column_stats_segment.column(0);
+    const auto& end_index_column = column_stats_segment.column(1);
+    for (size_t row = 0; row < column_stats_segment.row_count(); ++row) {
+        auto start_index = start_index_column.scalar_at<timestamp>(row);
+        auto end_index = end_index_column.scalar_at<timestamp>(row);
+        if (!start_index.has_value() || !end_index.has_value())
+            continue;
+
+        const bool can_prune = std::any_of(filters.begin(), filters.end(), [&pruner, row](const auto& filter) {
+            return pruner.can_prune(*filter, filter->root_node_name_, row);
+        });
+        auto [it, inserted] = prunable.try_emplace(std::make_pair(*start_index, *end_index), can_prune);
+        if (!inserted)
+            it->second = it->second && can_prune;
+    }
+
+    std::set<size_t> pruned_row_slice_starts;
+    slice_and_keys.erase(std::remove_if(slice_and_keys.begin(), slice_and_keys.end(), [&prunable, &pruned_row_slice_starts](const auto& slice_and_key) {
+        const auto& key = slice_and_key.key();
+        if (!std::holds_alternative<NumericIndex>(key.start_index()) || !std::holds_alternative<NumericIndex>(key.end_index()))
+            return false;
+
+        auto it = prunable.find(std::make_pair(std::get<NumericIndex>(key.start_index()), std::get<NumericIndex>(key.end_index())));
+        if (it == prunable.end() || !it->second)
+            return false;
+
+        pruned_row_slice_starts.insert(slice_and_key.slice_.row_range.start());
+        return true;
+    }), slice_and_keys.end());
+    return pruned_row_slice_starts.size();
+}
+
+}
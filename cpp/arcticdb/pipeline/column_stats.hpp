@@ -15,7 +15,11 @@ namespace arcticdb {
 SegmentInMemory merge_column_stats_segments(const std::vector<SegmentInMemory>& segments);
 
 enum class ColumnStatType {
-    MINMAX
+    MINMAX,
+    // Bloom filter over the values in each row slice
+    BLOOM,
+    // Exact set of the values in each row slice, if there are few enough of them
+    DISTINCT
 };
 
 static const char* const start_index_column_name = "start_index";
@@ -28,6 +32,7 @@ public:
 
     void drop(const ColumnStats& to_drop, bool warn_if_missing=true);
     ankerl::unordered_dense::set<std::string> segment_column_names() const;
+    std::vector<std::string> segment_column_names(const std::string& column, ColumnStatType column_stat_type) const;
 
     std::unordered_map<std::string, std::unordered_set<std::string>> to_map() const;
     std::optional<Clause> clause() const;
@@ -44,4 +49,18 @@ private:
 
 };
 
+/*
+ * Removes the row slices that the stats in column_stats_segment show cannot contain any row matching all of the given
+ * filter expressions. MINMAX stats are used for comparisons with a value (==, <, <=, >, >=), and BLOOM and DISTINCT
+ * stats for equality and isin, combined with AND and OR. Anything else is assumed to match. Slices without a row in
+ * the column stats segment are kept.
+ * Returns the number of row slices removed.
+ */
+size_t prune_with_column_stats(
+    std::vector<pipelines::SliceAndKey>& slice_and_keys,
+    const SegmentInMemory& column_stats_segment,
+    const std::vector<std::shared_ptr<ExpressionContext>>& filters,
+    const StreamDescriptor& descriptor,
+    bool dynamic_schema);
+
 }
\ No newline at end of file
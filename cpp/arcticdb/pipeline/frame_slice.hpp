@@ -191,6 +191,8 @@ struct RangesAndKey {
     RowRange row_range_;
     ColRange col_range_;
     entity::AtomKey key_;
+    // Whether only some of the columns of the segment are decoded, so storages may read just the parts of it needed
+    bool decodes_some_columns_ = false;
 };
 
 /*
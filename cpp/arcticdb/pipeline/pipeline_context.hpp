@@ -128,6 +128,8 @@ struct PipelineContext : public std::enable_shared_from_this<PipelineContext> {
     std::optional<util::BitSet> overall_column_bitset_;
     std::vector<unsigned char> compacted_;
     std::optional<size_t> incompletes_after_;
+    // Number of row slices removed from slice_and_keys_ because the column stats show they cannot match the query
+    size_t pruned_row_slices_ = 0;
     bool bucketize_dynamic_ = false;
 
     PipelineContextRow operator[](size_t num) {
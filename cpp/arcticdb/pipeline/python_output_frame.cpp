@@ -71,6 +71,21 @@ std::shared_ptr<FrameDataWrapper> PythonOutputFrame::arrays(py::object &ref) {
     return generated;
 }
 
+py::dict PythonOutputFrame::string_dictionaries(py::object &ref) {
+    py::dict output;
+    if(!buffers_)
+        return output;
+
+    std::lock_guard lock(buffers_->mutex_);
+    for(const auto& [name, dictionary] : buffers_->string_dictionaries_) {
+        // The frame owns the dictionaries through its buffer holder, so anchoring the arrays to it avoids a copy
+        auto offsets = py::array_t<int64_t>(static_cast<py::ssize_t>(dictionary->offsets_.size()), dictionary->offsets_.data(), ref);
+        auto data = py::array_t<uint8_t>(static_cast<py::ssize_t>(dictionary->data_.size()), reinterpret_cast<const uint8_t*>(dictionary->data_.data()), ref);
+        output[py::str(name)] = py::make_tuple(offsets, data, dictionary->is_utf_);
+    }
+    return output;
+}
+
 py::array PythonOutputFrame::array_at(std::size_t col_pos, py::object &anchor) {
     return arcticdb::detail::array_at(frame_, col_pos, anchor);
 }
@@ -28,6 +28,9 @@ struct ARCTICDB_VISIBILITY_HIDDEN PythonOutputFrame {
 
     std::vector<std::string> &index_columns() { return index_columns_; }
 
+    // Dictionaries of the string columns read with OutputFormat::ARROW, keyed by column name
+    py::dict string_dictionaries(py::object &ref);
+
     SegmentInMemory frame() { return frame_; }
 
 private:
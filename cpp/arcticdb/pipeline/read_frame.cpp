@@ -1038,6 +1038,75 @@ public:
     }
 };
 
+// Writes int64 indices into a per-column dictionary of distinct values instead of creating a PyObject per row, so that
+// the column can be handed to Arrow as a dictionary array without the strings ever being materialised in Python
+class ArrowStringReducer : public StringReducer {
+    size_t column_index_;
+    int64_t* ptr_dest_;
+    std::shared_ptr<ArrowStringDictionary> dictionary_;
+    ankerl::unordered_dense::map<std::string_view, int64_t> codes_;
+
+public:
+    ArrowStringReducer(
+        Column& column,
+        std::shared_ptr<PipelineContext>& context,
+        SegmentInMemory frame,
+        const Field& frame_field,
+        size_t column_index,
+        std::shared_ptr<ArrowStringDictionary> dictionary) :
+        StringReducer(column, context, std::move(frame), frame_field, sizeof(int64_t)),
+        column_index_(column_index),
+        ptr_dest_(reinterpret_cast<int64_t*>(dst_)),
+        dictionary_(std::move(dictionary)) {
+        dictionary_->is_utf_ = is_utf_type(slice_value_type(frame_field_.type().data_type()));
+    }
+
+    void reduce(PipelineContextRow& context_row, size_t) override {
+        size_t end = context_row.slice_and_key().slice_.row_range.second - frame_.offset();
+        auto ptr_src = get_offset_ptr_at(row_, src_buffer_);
+        for (; row_ < end; ++row_, ++ptr_src, ++ptr_dest_) {
+            const auto offset = *ptr_src;
+            if (offset == not_a_string() || offset == nan_placeholder()) {
+                *ptr_dest_ = ArrowStringDictionary::null_code;
+            } else {
+                const auto sv = get_string_from_pool(offset, context_row.string_pool());
+                const auto [it, inserted] = codes_.try_emplace(sv, static_cast<int64_t>(dictionary_->size()));
+                if (inserted)
+                    dictionary_->append(sv);
+
+                *ptr_dest_ = it->second;
+            }
+        }
+    }
+
+    void finalize() override {
+        for (const auto total_rows = frame_.row_count(); row_ < total_rows; ++row_, ++ptr_dest_)
+            *ptr_dest_ = ArrowStringDictionary::null_code;
+
+        // The column now holds dictionary indices rather than PyObjects, so it must no longer be treated as a string
+        // column, in particular by the PythonOutputFrame destructor
+        const auto codes_type = make_scalar_type(DataType::INT64);
+        column_.set_type(codes_type);
+        frame_.descriptor().mutable_field(column_index_).mutable_type() = codes_type;
+    }
+};
+
+// Segments written with fixed-width strings store padded (and for unicode, UTF-32) values in the string pool, which
+// cannot be used as Arrow string data as they are
+bool has_fixed_width_segments(
+    const std::shared_ptr<PipelineContext>& context,
+    const Field& frame_field,
+    const FrameSliceMap& slice_map) {
+    const auto column_data = slice_map.columns_.find(frame_field.name());
+    if (column_data == slice_map.columns_.end())
+        return false;
+
+    return std::any_of(column_data->second.begin(), column_data->second.end(), [&context](const auto& row) {
+        PipelineContextRow context_row{context, row.second.context_index_};
+        return is_fixed_string_type(context_row.descriptor()[row.second.column_index_].type().data_type());
+    });
+}
+
 bool was_coerced_from_dynamic_to_fixed(DataType field_type, const Column& column) {
     return field_type == DataType::UTF_FIXED64
         && column.has_orig_type()
@@ -1082,6 +1151,8 @@ struct ReduceColumnTask : async::BaseTask {
     std::shared_ptr<LockType> lock_;
     bool dynamic_schema_;
     bool do_lock_;
+    OutputFormat output_format_;
+    std::shared_ptr<BufferHolder> buffers_;
 
     ReduceColumnTask(
         const SegmentInMemory& frame,
@@ -1092,7 +1163,9 @@ struct ReduceColumnTask : async::BaseTask {
         std::shared_ptr<PyObject> py_nan,
         std::shared_ptr<LockType> lock,
         bool dynamic_schema,
-        bool do_lock) :
+        bool do_lock,
+        OutputFormat output_format,
+        std::shared_ptr<BufferHolder> buffers) :
         frame_(frame),
         column_index_(c),
         slice_map_(std::move(slice_map)),
@@ -1101,7 +1174,15 @@ struct ReduceColumnTask : async::BaseTask {
         py_nan_(py_nan),
         lock_(std::move(lock)),
         dynamic_schema_(dynamic_schema),
-        do_lock_(do_lock) {
+        do_lock_(do_lock),
+        output_format_(output_format),
+        buffers_(std::move(buffers)) {
+    }
+
+    std::unique_ptr<ArrowStringReducer> get_arrow_string_reducer(Column& column, const Field& frame_field) {
+        util::check(static_cast<bool>(buffers_), "Reading strings in Arrow format requires a buffer holder");
+        auto dictionary = buffers_->get_string_dictionary(frame_field.name());
+        return std::make_unique<ArrowStringReducer>(column, context_, frame_, frame_field, column_index_, std::move(dictionary));
     }
 
     folly::Unit operator()() {
@@ -1113,7 +1194,9 @@ struct ReduceColumnTask : async::BaseTask {
         if(dynamic_schema_ && column_data == slice_map_->columns_.end()) {
             column.default_initialize_rows(0, frame_.row_count(), false);
             bool dynamic_type = is_dynamic_string_type(field_type);
-            if(dynamic_type) {
+            if(dynamic_type && output_format_ == OutputFormat::ARROW) {
+                get_arrow_string_reducer(column, frame_field)->finalize();
+            } else if(dynamic_type) {
                 EmptyDynamicStringReducer reducer(column, frame_, frame_field, sizeof(entity::position_t), lock_);
                 reducer.reduce(frame_.row_count());
             }
@@ -1127,7 +1210,12 @@ struct ReduceColumnTask : async::BaseTask {
                 null_reducer.finalize();
             }
             if (is_sequence_type(field_type)) {
-                auto string_reducer = get_string_reducer(column, context_, frame_, frame_field, *slice_map_, unique_string_map_, py_nan_, lock_, do_lock_);
+                std::unique_ptr<StringReducer> string_reducer;
+                if (output_format_ == OutputFormat::ARROW && is_dynamic_string_type(field_type) && !has_fixed_width_segments(context_, frame_field, *slice_map_))
+                    string_reducer = get_arrow_string_reducer(column, frame_field);
+                else
+                    string_reducer = get_string_reducer(column, context_, frame_, frame_field, *slice_map_, unique_string_map_, py_nan_, lock_, do_lock_);
+
                 for (const auto &row : column_data->second) {
                     PipelineContextRow context_row{context_, row.second.context_index_};
                     if(context_row.slice_and_key().slice().row_range.diff() > 0)
@@ -1143,7 +1231,8 @@ struct ReduceColumnTask : async::BaseTask {
 void reduce_and_fix_columns(
         std::shared_ptr<PipelineContext> &context,
         SegmentInMemory &frame,
-        const ReadOptions& read_options
+        const ReadOptions& read_options,
+        const std::shared_ptr<BufferHolder>& buffers
 ) {
     ARCTICDB_SAMPLE_DEFAULT(ReduceAndFixStringCol)
     ARCTICDB_DEBUG(log::version(), "Reduce and fix columns");
@@ -1172,7 +1261,7 @@ void reduce_and_fix_columns(
         std::vector<folly::Future<folly::Unit>> jobs;
         static const auto batch_size = ConfigsMap::instance()->get_int("StringAllocation.BatchSize", 50);
         for (size_t c = 0; c < static_cast<size_t>(frame.descriptor().fields().size()); ++c) {
-            jobs.emplace_back(async::submit_cpu_task(ReduceColumnTask(frame, c, slice_map, context, unique_string_map, py_nan, spinlock, dynamic_schema, true)));
+            jobs.emplace_back(async::submit_cpu_task(ReduceColumnTask(frame, c, slice_map, context, unique_string_map, py_nan, spinlock, dynamic_schema, true, read_options.output_format_, buffers)));
             if(jobs.size() == static_cast<size_t>(batch_size)) {
                 folly::collect(jobs).get();
                 jobs.clear();
@@ -1183,7 +1272,7 @@ void reduce_and_fix_columns(
             folly::collect(jobs).get();
     } else {
         for (size_t c = 0; c < static_cast<size_t>(frame.descriptor().fields().size()); ++c) {
-            ReduceColumnTask(frame, c, slice_map, context, unique_string_map, py_nan, spinlock, dynamic_schema, false)();
+            ReduceColumnTask(frame, c, slice_map, context, unique_string_map, py_nan, spinlock, dynamic_schema, false, read_options.output_format_, buffers)();
         }
     }
 
@@ -95,7 +95,8 @@ void decode_into_frame_dynamic(
 void reduce_and_fix_columns(
         std::shared_ptr<PipelineContext> &context,
         SegmentInMemory &frame,
-        const ReadOptions& read_options
+        const ReadOptions& read_options,
+        const std::shared_ptr<BufferHolder>& buffers = {}
 );
 
 size_t get_index_field_count(const SegmentInMemory& frame);
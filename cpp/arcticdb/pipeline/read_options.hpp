@@ -10,7 +10,17 @@
 #include <arcticdb/entity/protobufs.hpp>
 #include <arcticdb/util/optional_defaults.hpp>
 
+#include <memory>
+
 namespace arcticdb {
+
+struct QueryProfile;
+
+enum class OutputFormat : uint8_t {
+    PANDAS,
+    ARROW
+};
+
 struct ReadOptions {
     std::optional<bool> force_strings_to_fixed_;
     std::optional<bool> force_strings_to_object_;
@@ -20,6 +30,9 @@ struct ReadOptions {
     std::optional<bool> set_tz_;
     std::optional<bool> optimise_string_memory_;
     std::optional<bool> batch_throw_on_error_;
+    OutputFormat output_format_ = OutputFormat::PANDAS;
+    // If set, statistics about where the time of the read goes are gathered into it
+    std::shared_ptr<QueryProfile> query_profile_;
 
     void set_force_strings_to_fixed(const std::optional<bool>& force_strings_to_fixed) {
         force_strings_to_fixed_ = force_strings_to_fixed;
@@ -56,5 +69,13 @@ struct ReadOptions {
     void set_batch_throw_on_error(bool batch_throw_on_error) {
         batch_throw_on_error_ = batch_throw_on_error;
     }
+
+    void set_output_format(OutputFormat output_format) {
+        output_format_ = output_format;
+    }
+
+    void set_query_profile(std::shared_ptr<QueryProfile> query_profile) {
+        query_profile_ = std::move(query_profile);
+    }
 };
 } //namespace arcticdb
\ No newline at end of file
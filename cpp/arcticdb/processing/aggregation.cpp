@@ -8,6 +8,7 @@
 #include <arcticdb/processing/aggregation.hpp>
 
 #include <cmath>
+#include <cstring>
 
 namespace arcticdb
 {
@@ -56,6 +57,150 @@ SegmentInMemory MinMaxAggregatorData::finalize(const std::vector<ColumnName>& ou
     return seg;
 }
 
+namespace
+{
+    // Separate seeds for each class of value, so that e.g. the integer 1 and the string "1" hash differently
+    constexpr uint64_t INTEGER_HASH_SEED = 0x9e3779b97f4a7c15ULL;
+    constexpr uint64_t UNSIGNED_HASH_SEED = 0xc2b2ae3d27d4eb4fULL;
+    constexpr uint64_t FLOAT_HASH_SEED = 0x165667b19e3779f9ULL;
+    constexpr uint64_t STRING_HASH_SEED = 0x27d4eb2f165667c5ULL;
+
+    // splitmix64 finaliser
+    uint64_t mix64(uint64_t h) {
+        h = (h ^ (h >> 30)) * 0xbf58476d1ce4e5b9ULL;
+        h = (h ^ (h >> 27)) * 0x94d049bb133111ebULL;
+        return h ^ (h >> 31);
+    }
+
+    template<typename Func>
+    void for_each_value_hash(const ColumnWithStrings& input_column, std::string_view stat_name, Func&& func) {
+        details::visit_type(input_column.column_->type().data_type(), [&] (auto col_tag) {
+            using type_info = ScalarTypeInfo<decltype(col_tag)>;
+            using RawType = typename type_info::RawType;
+            if constexpr(is_dynamic_string_type(type_info::data_type)) {
+                Column::for_each<typename type_info::TDT>(*input_column.column_, [&input_column, &func](auto offset) {
+                    if (auto str = input_column.string_at_offset(offset); str.has_value())
+                        func(column_stats_hash_string(*str));
+                });
+            } else if constexpr(is_numeric_type(type_info::data_type) || is_bool_type(type_info::data_type)) {
+                Column::for_each<typename type_info::TDT>(*input_column.column_, [&func](auto value) {
+                    if (auto hash = column_stats_hash_numeric(static_cast<RawType>(value)); hash.has_value())
+                        func(*hash);
+                });
+            } else {
+                schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                        "{} column stat generation not supported with type {}", stat_name, type_info::data_type);
+            }
+        });
+    }
+
+    SegmentInMemory words_to_segment(const std::vector<ColumnName>& output_column_names, const std::vector<uint64_t>& words) {
+        SegmentInMemory seg;
+        for (size_t idx = 0; idx < words.size(); ++idx) {
+            auto col = std::make_shared<Column>(make_scalar_type(DataType::UINT64), true);
+            col->template push_back<uint64_t>(words[idx]);
+            seg.add_column(scalar_field(DataType::UINT64, output_column_names[idx].value), col);
+        }
+        return seg;
+    }
+}
+
+uint64_t column_stats_hash_integer(int64_t value) {
+    return mix64(static_cast<uint64_t>(value) ^ INTEGER_HASH_SEED);
+}
+
+uint64_t column_stats_hash_unsigned(uint64_t value) {
+    return mix64(value ^ UNSIGNED_HASH_SEED);
+}
+
+uint64_t column_stats_hash_float(double value) {
+    uint64_t bits;
+    memcpy(&bits, &value, sizeof(bits));
+    return mix64(bits ^ FLOAT_HASH_SEED);
+}
+
+uint64_t column_stats_hash_string(std::string_view value) {
+    // FNV-1a, then mixed to spread the bits used by the bloom filter
+    uint64_t h = 0xcbf29ce484222325ULL;
+    for (auto c: value) {
+        h ^= static_cast<uint8_t>(c);
+        h *= 0x100000001b3ULL;
+    }
+    return mix64(h ^ STRING_HASH_SEED);
+}
+
+namespace
+{
+    // Double hashing, as described by Kirsch and Mitzenmacher
+    template<typename Func>
+    void for_each_bloom_filter_bit(uint64_t hash, Func&& func) {
+        constexpr uint64_t num_bits = BLOOM_FILTER_WORDS * 64;
+        const uint64_t h1 = hash;
+        const uint64_t h2 = mix64(hash) | 1;
+        for (uint64_t i = 0; i < BLOOM_FILTER_HASHES; ++i) {
+            const auto bit = (h1 + i * h2) % num_bits;
+            func(bit / 64, uint64_t{1} << (bit % 64));
+        }
+    }
+}
+
+bool bloom_filter_may_contain(const std::array<uint64_t, BLOOM_FILTER_WORDS>& words, uint64_t hash) {
+    bool res = true;
+    for_each_bloom_filter_bit(hash, [&words, &res](size_t word, uint64_t mask) {
+        res &= (words[word] & mask) != 0;
+    });
+    return res;
+}
+
+void BloomFilterAggregatorData::aggregate(const ColumnWithStrings& input_column) {
+    for_each_value_hash(input_column, "Bloom filter", [this](uint64_t hash) {
+        has_values_ = true;
+        for_each_bloom_filter_bit(hash, [this](size_t word, uint64_t mask) {
+            words_[word] |= mask;
+        });
+    });
+}
+
+SegmentInMemory BloomFilterAggregatorData::finalize(const std::vector<ColumnName>& output_column_names) const {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            output_column_names.size() == BLOOM_FILTER_WORDS,
+            "Expected {} output column names in BloomFilterAggregatorData::finalize, but got {}",
+            BLOOM_FILTER_WORDS, output_column_names.size());
+    if (!has_values_) {
+        return {};
+    }
+    return words_to_segment(output_column_names, std::vector<uint64_t>(words_.begin(), words_.end()));
+}
+
+void DistinctSetAggregatorData::aggregate(const ColumnWithStrings& input_column) {
+    if (overflowed_) {
+        return;
+    }
+    for_each_value_hash(input_column, "Distinct set", [this](uint64_t hash) {
+        if (!overflowed_) {
+            hashes_.insert(hash);
+            if (hashes_.size() > DISTINCT_SET_MAX_VALUES) {
+                overflowed_ = true;
+                hashes_.clear();
+            }
+        }
+    });
+}
+
+SegmentInMemory DistinctSetAggregatorData::finalize(const std::vector<ColumnName>& output_column_names) const {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            output_column_names.size() == DISTINCT_SET_MAX_VALUES,
+            "Expected {} output column names in DistinctSetAggregatorData::finalize, but got {}",
+            DISTINCT_SET_MAX_VALUES, output_column_names.size());
+    if (overflowed_ || hashes_.empty()) {
+        return {};
+    }
+    // Pad by repeating a value, so that every column is populated and readers can treat the columns as a set
+    std::vector<uint64_t> words(hashes_.begin(), hashes_.end());
+    words.resize(DISTINCT_SET_MAX_VALUES, *hashes_.begin());
+    return words_to_segment(output_column_names, words);
+}
+
 namespace
 {
     void add_data_type_impl(DataType data_type, std::optional<DataType>& current_data_type) {
@@ -79,64 +224,6 @@ namespace
     inline std::size_t deref(std::size_t index) {
         return index;
     }
-
-    template<typename T, typename T2=void>
-    struct OutputType;
-
-    template <typename InputType>
-    struct OutputType <InputType, typename std::enable_if_t<is_floating_point_type(InputType::DataTypeTag::data_type)>> {
-        using type = ScalarTagType<DataTypeTag<DataType::FLOAT64>>;
-    };
-
-    template <typename InputType>
-    struct OutputType <InputType, typename std::enable_if_t<is_unsigned_type(InputType::DataTypeTag::data_type)>> {
-        using type = ScalarTagType<DataTypeTag<DataType::UINT64>>;
-    };
-
-    template <typename InputType>
-    struct OutputType<InputType, typename std::enable_if_t<is_signed_type(InputType::DataTypeTag::data_type) && is_integer_type(InputType::DataTypeTag::data_type)>> {
-        using type = ScalarTagType<DataTypeTag<DataType::INT64>>;
-    };
-
-    template<>
-    struct OutputType<DataTypeTag<DataType::BOOL8>, void> {
-        using type = ScalarTagType<DataTypeTag<DataType::BOOL8>>;
-    };
-
-    template<>
-    struct OutputType<DataTypeTag<DataType::NANOSECONDS_UTC64>, void> {
-        using type = ScalarTagType<DataTypeTag<DataType::NANOSECONDS_UTC64>>;
-    };
-
-    template<>
-    struct OutputType<DataTypeTag<DataType::EMPTYVAL>, void> {
-        using type = ScalarTagType<DataTypeTag<DataType::EMPTYVAL>>;
-    };
-
-    template<>
-    struct OutputType<DataTypeTag<DataType::ASCII_FIXED64>, void> {
-        using type = ScalarTagType<DataTypeTag<DataType::ASCII_FIXED64>>;
-    };
-
-    template<>
-    struct OutputType<DataTypeTag<DataType::UTF_DYNAMIC64>, void> {
-        using type = ScalarTagType<DataTypeTag<DataType::UTF_DYNAMIC64>>;
-    };
-
-    template<>
-    struct OutputType<DataTypeTag<DataType::ASCII_DYNAMIC64>, void> {
-        using type = ScalarTagType<DataTypeTag<DataType::ASCII_DYNAMIC64>>;
-    };
-
-    template<>
-    struct OutputType<DataTypeTag<DataType::UTF_FIXED64>, void> {
-        using type = ScalarTagType<DataTypeTag<DataType::UTF_FIXED64>>;
-    };
-
-    template<>
-    struct OutputType<DataTypeTag<DataType::BOOL_OBJECT8>, void> {
-        using type = ScalarTagType<DataTypeTag<DataType::BOOL_OBJECT8>>;
-    };
 }
 
 /**********************
@@ -461,6 +548,90 @@ SegmentInMemory CountAggregatorData::finalize(const ColumnName& output_column_na
     return res;
 }
 
+/*******************************
+ * CountDistinctAggregatorData *
+ *******************************/
+
+void CountDistinctAggregatorData::aggregate(const std::optional<ColumnWithStrings>& input_column, const std::vector<size_t>& groups, size_t unique_values) {
+    if(input_column.has_value()) {
+        counters_.resize(unique_values);
+        details::visit_type(input_column->column_->type().data_type(), [&input_column, &groups, this] (auto col_tag) {
+            using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
+            using RawType = typename col_type_info::RawType;
+            // Values are hashed as for column stats, so that equal values of different types after schema changes are
+            // counted once, and NaNs and missing strings are not counted, as in Pandas nunique
+            if constexpr(is_dynamic_string_type(col_type_info::data_type)) {
+                Column::for_each_enumerated<typename col_type_info::TDT>(*input_column->column_, [&input_column, &groups, this](auto enumerating_it) {
+                    if (auto str = input_column->string_at_offset(enumerating_it.value()); str.has_value()) {
+                        counters_[groups[enumerating_it.idx()]].add(column_stats_hash_string(*str));
+                    }
+                });
+            } else if constexpr(is_numeric_type(col_type_info::data_type) || is_bool_type(col_type_info::data_type)) {
+                Column::for_each_enumerated<typename col_type_info::TDT>(*input_column->column_, [&groups, this](auto enumerating_it) {
+                    if (auto hash = column_stats_hash_numeric(static_cast<RawType>(enumerating_it.value())); hash.has_value()) {
+                        counters_[groups[enumerating_it.idx()]].add(*hash);
+                    }
+                });
+            } else {
+                schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                        "Distinct count aggregation not supported with type {}", col_type_info::data_type);
+            }
+        });
+    }
+}
+
+SegmentInMemory CountDistinctAggregatorData::finalize(const ColumnName& output_column_name,  bool, size_t unique_values) {
+    SegmentInMemory res;
+    if(!counters_.empty()) {
+        counters_.resize(unique_values);
+        auto pos = res.add_column(scalar_field(DataType::UINT64, output_column_name.value), unique_values, true);
+        auto& column = res.column(pos);
+        auto ptr = reinterpret_cast<uint64_t*>(column.ptr());
+        column.set_row_data(unique_values - 1);
+        std::transform(counters_.cbegin(), counters_.cend(), ptr, [](const auto& counter) {
+            return counter.count();
+        });
+    }
+    return res;
+}
+
+/**************************
+ * QuantileAggregatorData *
+ **************************/
+
+void QuantileAggregatorData::aggregate(const std::optional<ColumnWithStrings>& input_column, const std::vector<size_t>& groups, size_t unique_values) {
+    if(input_column.has_value()) {
+        digests_.resize(unique_values);
+        details::visit_type(input_column->column_->type().data_type(), [&input_column, &groups, this] (auto col_tag) {
+            using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
+            if constexpr(is_numeric_type(col_type_info::data_type) && !is_time_type(col_type_info::data_type)) {
+                // NaNs are skipped by the digests
+                Column::for_each_enumerated<typename col_type_info::TDT>(*input_column->column_, [&groups, this](auto enumerating_it) {
+                    digests_[groups[enumerating_it.idx()]].add(static_cast<double>(enumerating_it.value()));
+                });
+            } else {
+                schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                        "Quantile aggregation not supported with type {}", col_type_info::data_type);
+            }
+        });
+    }
+}
+
+SegmentInMemory QuantileAggregatorData::finalize(const ColumnName& output_column_name,  bool, size_t unique_values) {
+    SegmentInMemory res;
+    if(!digests_.empty()) {
+        digests_.resize(unique_values);
+        auto col = std::make_shared<Column>(make_scalar_type(DataType::FLOAT64), digests_.size(), true, false);
+        auto column_data = col->data();
+        std::transform(digests_.begin(), digests_.end(), column_data.begin<ScalarTagType<DataTypeTag<DataType::FLOAT64>>>(), [this](auto& digest) {
+            return digest.quantile(quantile_);
+        });
+        col->set_row_data(digests_.size() - 1);
+        res.add_column(scalar_field(DataType::FLOAT64, output_column_name.value), col);
+    }
+    return res;
+}
+
 /***********************
  * FirstAggregatorData *
  ***********************/
@@ -472,9 +643,8 @@ void FirstAggregatorData::add_data_type(DataType data_type) {
 void FirstAggregatorData::aggregate(const std::optional<ColumnWithStrings>& input_column, const std::vector<size_t>& groups, size_t unique_values) {
     if(data_type_.has_value() && *data_type_ != DataType::EMPTYVAL && input_column.has_value()) {
         details::visit_type(*data_type_, [&input_column, unique_values, &groups, this] (auto global_tag) {
-            using GlobalInputType = decltype(global_tag);
-            using GlobalTypeDescriptorTag =  typename OutputType<GlobalInputType>::type;
-            using GlobalRawType = typename GlobalTypeDescriptorTag::DataTypeTag::raw_type;
+            // Must match the raw type used to interpret aggregated_ in finalize
+            using GlobalRawType = typename decltype(global_tag)::DataTypeTag::raw_type;
             aggregated_.resize(sizeof(GlobalRawType)* unique_values);
             auto col_data = input_column->column_->data();
             auto out_ptr = reinterpret_cast<GlobalRawType*>(aggregated_.data());
@@ -531,9 +701,8 @@ void LastAggregatorData::add_data_type(DataType data_type) {
 void LastAggregatorData::aggregate(const std::optional<ColumnWithStrings>& input_column, const std::vector<size_t>& groups, size_t unique_values) {
     if(data_type_.has_value() && *data_type_ != DataType::EMPTYVAL && input_column.has_value()) {
         details::visit_type(*data_type_, [&input_column, unique_values, &groups, this] (auto global_tag) {
-            using GlobalInputType = decltype(global_tag);
-            using GlobalTypeDescriptorTag =  typename OutputType<GlobalInputType>::type;
-            using GlobalRawType = typename GlobalTypeDescriptorTag::DataTypeTag::raw_type;
+            // Must match the raw type used to interpret aggregated_ in finalize
+            using GlobalRawType = typename decltype(global_tag)::DataTypeTag::raw_type;
             aggregated_.resize(sizeof(GlobalRawType)* unique_values);
             auto col_data = input_column->column_->data();
             auto out_ptr = reinterpret_cast<GlobalRawType*>(aggregated_.data());
@@ -11,6 +11,12 @@
 #include <arcticdb/entity/types.hpp>
 #include <arcticdb/entity/type_utils.hpp>
 #include <arcticdb/processing/expression_node.hpp>
+#include <arcticdb/processing/sketches.hpp>
+
+#include <array>
+#include <cmath>
+#include <limits>
+#include <set>
 
 namespace arcticdb {
 
@@ -52,6 +58,119 @@ private:
     ColumnName output_column_name_max_;
 };
 
+// BLOOM and DISTINCT column stats are stored as this many uint64 columns per input column
+constexpr size_t BLOOM_FILTER_WORDS = 16;
+constexpr size_t BLOOM_FILTER_HASHES = 3;
+constexpr size_t DISTINCT_SET_MAX_VALUES = 16;
+
+/*
+ * Hashes of column values as stored in BLOOM and DISTINCT column stats. These are persisted, so must never change.
+ * Numeric values are hashed by value rather than by representation, so that the hash of a value in a column of one
+ * type matches the hash of an equal value of another type in a filter expression.
+ */
+uint64_t column_stats_hash_integer(int64_t value);
+uint64_t column_stats_hash_unsigned(uint64_t value);
+uint64_t column_stats_hash_float(double value);
+uint64_t column_stats_hash_string(std::string_view value);
+
+template<typename RawType>
+std::optional<uint64_t> column_stats_hash_numeric(RawType value) {
+    if constexpr (std::is_floating_point_v<RawType>) {
+        const auto as_double = static_cast<double>(value);
+        if (std::isnan(as_double))
+            return std::nullopt;
+
+        if (std::trunc(as_double) == as_double) {
+            if (as_double >= -0x1p63 && as_double < 0x1p63)
+                return column_stats_hash_integer(static_cast<int64_t>(as_double));
+            if (as_double > 0 && as_double < 0x1p64)
+                return column_stats_hash_unsigned(static_cast<uint64_t>(as_double));
+        }
+        return column_stats_hash_float(as_double);
+    } else if constexpr (std::is_unsigned_v<RawType>) {
+        if (static_cast<uint64_t>(value) > static_cast<uint64_t>(std::numeric_limits<int64_t>::max()))
+            return column_stats_hash_unsigned(static_cast<uint64_t>(value));
+        return column_stats_hash_integer(static_cast<int64_t>(value));
+    } else {
+        return column_stats_hash_integer(static_cast<int64_t>(value));
+    }
+}
+
+bool bloom_filter_may_contain(const std::array<uint64_t, BLOOM_FILTER_WORDS>& words, uint64_t hash);
+
+class BloomFilterAggregatorData
+{
+public:
+
+    BloomFilterAggregatorData() = default;
+    ARCTICDB_MOVE_COPY_DEFAULT(BloomFilterAggregatorData)
+
+    void aggregate(const ColumnWithStrings& input_column);
+    SegmentInMemory finalize(const std::vector<ColumnName>& output_column_names) const;
+
+private:
+
+    std::array<uint64_t, BLOOM_FILTER_WORDS> words_{};
+    bool has_values_{false};
+};
+
+class BloomFilterAggregator
+{
+public:
+
+    explicit BloomFilterAggregator(ColumnName column_name, std::vector<ColumnName> output_column_names)
+        : column_name_(std::move(column_name))
+        , output_column_names_(std::move(output_column_names))
+    {}
+    ARCTICDB_MOVE_COPY_DEFAULT(BloomFilterAggregator)
+
+    [[nodiscard]] ColumnName get_input_column_name() const { return column_name_; }
+    [[nodiscard]] std::vector<ColumnName> get_output_column_names() const { return output_column_names_; }
+    [[nodiscard]] BloomFilterAggregatorData get_aggregator_data() const { return BloomFilterAggregatorData(); }
+
+private:
+
+    ColumnName column_name_;
+    std::vector<ColumnName> output_column_names_;
+};
+
+class DistinctSetAggregatorData
+{
+public:
+
+    DistinctSetAggregatorData() = default;
+    ARCTICDB_MOVE_COPY_DEFAULT(DistinctSetAggregatorData)
+
+    void aggregate(const ColumnWithStrings& input_column);
+    SegmentInMemory finalize(const std::vector<ColumnName>& output_column_names) const;
+
+private:
+
+    std::set<uint64_t> hashes_;
+    // Set once more than DISTINCT_SET_MAX_VALUES values have been seen, after which no stat is written
+    bool overflowed_{false};
+};
+
+class DistinctSetAggregator
+{
+public:
+
+    explicit DistinctSetAggregator(ColumnName column_name, std::vector<ColumnName> output_column_names)
+        : column_name_(std::move(column_name))
+        , output_column_names_(std::move(output_column_names))
+    {}
+    ARCTICDB_MOVE_COPY_DEFAULT(DistinctSetAggregator)
+
+    [[nodiscard]] ColumnName get_input_column_name() const { return column_name_; }
+    [[nodiscard]] std::vector<ColumnName> get_output_column_names() const { return output_column_names_; }
+    [[nodiscard]] DistinctSetAggregatorData get_aggregator_data() const { return DistinctSetAggregatorData(); }
+
+private:
+
+    ColumnName column_name_;
+    std::vector<ColumnName> output_column_names_;
+};
+
 class AggregatorDataBase
 {
 public:
@@ -142,6 +261,37 @@ private:
     std::vector<uint64_t> aggregated_;
 };
 
+class CountDistinctAggregatorData : private AggregatorDataBase
+{
+public:
+
+    // Distinct counts are always integers, and values are compared by value across types, so this is a no-op
+    void add_data_type(DataType) {}
+    void aggregate(const std::optional<ColumnWithStrings>& input_column, const std::vector<size_t>& groups, size_t unique_values);
+    SegmentInMemory finalize(const ColumnName& output_column_name,  bool dynamic_schema, size_t unique_values);
+
+private:
+
+    std::vector<DistinctCounter> counters_;
+};
+
+class QuantileAggregatorData : private AggregatorDataBase
+{
+public:
+
+    explicit QuantileAggregatorData(double quantile) : quantile_(quantile) {}
+
+    // Quantile values are always doubles so this is a no-op
+    void add_data_type(DataType) {}
+    void aggregate(const std::optional<ColumnWithStrings>& input_column, const std::vector<size_t>& groups, size_t unique_values);
+    SegmentInMemory finalize(const ColumnName& output_column_name,  bool dynamic_schema, size_t unique_values);
+
+private:
+
+    double quantile_;
+    std::vector<TDigest> digests_;
+};
+
 class FirstAggregatorData : private AggregatorDataBase
 {
 public:
@@ -197,11 +347,36 @@ private:
     ColumnName output_column_name_;
 };
 
+class QuantileAggregator
+{
+public:
+
+    explicit QuantileAggregator(ColumnName input_column_name, ColumnName output_column_name, double quantile)
+        : input_column_name_(std::move(input_column_name))
+        , output_column_name_(std::move(output_column_name))
+        , quantile_(quantile)
+    {
+    }
+
+    ARCTICDB_MOVE_COPY_DEFAULT(QuantileAggregator);
+
+    [[nodiscard]] ColumnName get_input_column_name() const { return input_column_name_; }
+    [[nodiscard]] ColumnName get_output_column_name() const { return output_column_name_; }
+    [[nodiscard]] QuantileAggregatorData get_aggregator_data() const { return QuantileAggregatorData(quantile_); }
+
+private:
+
+    ColumnName input_column_name_;
+    ColumnName output_column_name_;
+    double quantile_;
+};
+
 using SumAggregator = GroupingAggregatorImpl<SumAggregatorData>;
 using MinAggregator = GroupingAggregatorImpl<MinAggregatorData>;
 using MaxAggregator = GroupingAggregatorImpl<MaxAggregatorData>;
 using MeanAggregator = GroupingAggregatorImpl<MeanAggregatorData>;
 using CountAggregator = GroupingAggregatorImpl<CountAggregatorData>;
+using CountDistinctAggregator = GroupingAggregatorImpl<CountDistinctAggregatorData>;
 using FirstAggregator = GroupingAggregatorImpl<FirstAggregatorData>;
 using LastAggregator = GroupingAggregatorImpl<LastAggregatorData>;
 
@@ -7,6 +7,8 @@
 
 #include <vector>
 #include <variant>
+#include <map>
+#include <numeric>
 
 #include <folly/Poly.h>
 
@@ -16,10 +18,13 @@
 #include <arcticdb/util/offset_string.hpp>
 
 #include <arcticdb/processing/clause.hpp>
+#include <arcticdb/processing/fused_expression.hpp>
 #include <arcticdb/pipeline/column_stats.hpp>
 #include <arcticdb/pipeline/value_set.hpp>
 #include <arcticdb/pipeline/frame_slice.hpp>
 #include <arcticdb/stream/segment_aggregator.hpp>
+#include <arcticdb/stream/merge_utils.hpp>
+#include <arcticdb/util/movable_priority_queue.hpp>
 #include <ankerl/unordered_dense.h>
 
 namespace arcticdb {
@@ -264,8 +269,7 @@ Composite<EntityIds> FilterClause::process(
     auto procs = gather_entities(component_manager_, std::move(entity_ids));
     Composite<EntityIds> output;
     procs.broadcast([&output, this](auto&& proc) {
-        proc.set_expression_context(expression_context_);
-        auto variant_data = proc.get(expression_context_->root_node_name_);
+        auto variant_data = evaluate(proc);
         util::variant_match(variant_data,
                             [&proc, &output, this](util::BitSet& bitset) {
                                 if (bitset.count() > 0) {
@@ -288,23 +292,73 @@ Composite<EntityIds> FilterClause::process(
     return output;
 }
 
+VariantData FilterClause::evaluate(ProcessingUnit& proc) const {
+    proc.set_expression_context(expression_context_);
+    auto fused_expression = FusedExpression::compile(proc, expression_context_->root_node_name_);
+    return fused_expression.has_value() && fused_expression->is_filter() ?
+            fused_expression->evaluate() :
+            proc.get(expression_context_->root_node_name_);
+}
+
+bool FilterClause::has_matching_rows(ProcessingUnit& proc) const {
+    return util::variant_match(evaluate(proc),
+                               [](const util::BitSet& bitset) { return bitset.count() > 0; },
+                               [](EmptyResult) { return false; },
+                               // Including results process rejects, so that they are raised there
+                               [](const auto&) { return true; });
+}
+
 std::string FilterClause::to_string() const {
     return expression_context_ ? fmt::format("WHERE {}", expression_context_->root_node_name_.value) : "";
 }
 
+namespace {
+// Strings computed by an expression, such as by lower, are held in a string pool of their own, so are copied into the
+// string pool of the segment the projected column is added to
+std::shared_ptr<Column> copy_strings_to_pool(const ColumnWithStrings& col, StringPool& string_pool) {
+    auto output_column = std::make_shared<Column>(make_scalar_type(col.column_->type().data_type()), true);
+    ankerl::unordered_dense::map<entity::position_t, entity::position_t> offsets;
+    details::visit_type(col.column_->type().data_type(), [&](auto col_tag) {
+        using type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr (is_dynamic_string_type(type_info::data_type)) {
+            using RawType = typename type_info::RawType;
+            Column::transform<typename type_info::TDT, typename type_info::TDT>(*col.column_, *output_column, [&](RawType offset) -> RawType {
+                const auto position = static_cast<entity::position_t>(offset);
+                if (!is_a_string(position))
+                    return offset;
+
+                auto [it, inserted] = offsets.try_emplace(position);
+                if (inserted)
+                    it->second = string_pool.get(col.string_pool_->get_view(position)).offset();
+                return static_cast<RawType>(it->second);
+            });
+        }
+    });
+    return output_column;
+}
+} // namespace
+
 Composite<EntityIds> ProjectClause::process(Composite<EntityIds>&& entity_ids) const {
     auto procs = gather_entities(component_manager_, std::move(entity_ids));
     Composite<EntityIds> output;
     procs.broadcast([&output, this](auto&& proc) {
         proc.set_expression_context(expression_context_);
-        auto variant_data = proc.get(expression_context_->root_node_name_);
+        auto fused_expression = FusedExpression::compile(proc, expression_context_->root_node_name_);
+        auto variant_data = fused_expression.has_value() && !fused_expression->is_filter() ?
+                fused_expression->evaluate() :
+                proc.get(expression_context_->root_node_name_);
         util::variant_match(variant_data,
                             [&proc, &output, this](ColumnWithStrings &col) {
 
                                 const auto data_type = col.column_->type().data_type();
                                 const std::string_view name = output_column_;
 
-                                proc.segments_->back()->add_column(scalar_field(data_type, name), col.column_);
+                                auto& segment = *proc.segments_->back();
+                                auto column = col.column_;
+                                if (is_dynamic_string_type(data_type) && col.string_pool_ && col.string_pool_ != segment.string_pool_ptr()) {
+                                    column = copy_strings_to_pool(col, segment.string_pool());
+                                }
+                                segment.add_column(scalar_field(data_type, name), std::move(column));
                                 ++proc.col_ranges_->back()->second;
                                 output.push_back(push_entities(component_manager_, std::move(proc)));
                             },
@@ -325,9 +379,231 @@ Composite<EntityIds> ProjectClause::process(Composite<EntityIds>&& entity_ids) c
     return expression_context_ ? fmt::format("PROJECT Column[\"{}\"] = {}", output_column_, expression_context_->root_node_name_.value) : "";
 }
 
+namespace {
+/*
+ * Parses the quantile out of the "median" and "quantile(q)" aggregation operators, for q in [0, 1]. Returns
+ * std::nullopt for other operators.
+ */
+std::optional<double> quantile_from_operator(const std::string& aggregation_operator) {
+    if (aggregation_operator == "median") {
+        return 0.5;
+    }
+    const std::string prefix{"quantile("};
+    if (!aggregation_operator.starts_with(prefix) || !aggregation_operator.ends_with(")")) {
+        return std::nullopt;
+    }
+    const auto argument = aggregation_operator.substr(prefix.size(), aggregation_operator.size() - prefix.size() - 1);
+    std::optional<double> quantile;
+    try {
+        size_t parsed_chars{0};
+        quantile = std::stod(argument, &parsed_chars);
+        if (parsed_chars != argument.size()) {
+            quantile.reset();
+        }
+    } catch (const std::logic_error&) {
+        // std::invalid_argument and std::out_of_range
+    }
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            quantile.has_value() && *quantile >= 0.0 && *quantile <= 1.0,
+            "Quantile aggregations require a quantile between 0 and 1, received {}", aggregation_operator);
+    return quantile;
+}
+
+/*
+ * Maps the operators shared by all the aggregating clauses onto their GroupingAggregator implementations.
+ * Returns std::nullopt if the operator is not one of these, so that callers can support additional operators.
+ */
+std::optional<GroupingAggregator> to_grouping_aggregator(const NamedAggregator& named_aggregator) {
+    auto typed_input_column_name = ColumnName(named_aggregator.input_column_name_);
+    auto typed_output_column_name = ColumnName(named_aggregator.output_column_name_);
+    if (named_aggregator.aggregation_operator_ == "sum") {
+        return SumAggregator(typed_input_column_name, typed_output_column_name);
+    } else if (named_aggregator.aggregation_operator_ == "mean") {
+        return MeanAggregator(typed_input_column_name, typed_output_column_name);
+    } else if (named_aggregator.aggregation_operator_ == "max") {
+        return MaxAggregator(typed_input_column_name, typed_output_column_name);
+    } else if (named_aggregator.aggregation_operator_ == "min") {
+        return MinAggregator(typed_input_column_name, typed_output_column_name);
+    } else if (named_aggregator.aggregation_operator_ == "count") {
+        return CountAggregator(typed_input_column_name, typed_output_column_name);
+    } else if (named_aggregator.aggregation_operator_ == "count_distinct" || named_aggregator.aggregation_operator_ == "nunique") {
+        return CountDistinctAggregator(typed_input_column_name, typed_output_column_name);
+    } else if (auto quantile = quantile_from_operator(named_aggregator.aggregation_operator_); quantile.has_value()) {
+        return QuantileAggregator(typed_input_column_name, typed_output_column_name, *quantile);
+    } else {
+        return std::nullopt;
+    }
+}
+
+// Distinct counts and quantiles are not decomposable into partial aggregates that fit in a column per group
+bool has_partial_aggregates(const NamedAggregator& named_aggregator) {
+    static const std::unordered_set<std::string> operators{"sum", "min", "max", "count", "mean"};
+    return operators.contains(named_aggregator.aggregation_operator_);
+}
+
+// One of the partial aggregates an aggregation is split into, computed per row-slice and then merged
+struct PartialAggregate {
+    // From the input column to the partial aggregate column
+    GroupingAggregator partial_;
+    // Overrides the type the partial aggregate is accumulated in
+    std::optional<DataType> partial_data_type_;
+    // From the partial aggregate column to the merged column
+    GroupingAggregator merge_;
+};
+
+std::vector<PartialAggregate> partial_aggregates(size_t idx, const NamedAggregator& named_aggregator) {
+    const auto& aggregation_operator = named_aggregator.aggregation_operator_;
+    ColumnName input_column_name(named_aggregator.input_column_name_);
+    ColumnName output_column_name(named_aggregator.output_column_name_);
+    ColumnName partial_column_name(fmt::format("__partial_aggregate_{}", idx));
+    std::vector<PartialAggregate> res;
+    if (aggregation_operator == "sum") {
+        res.emplace_back(PartialAggregate{SumAggregator(input_column_name, partial_column_name), std::nullopt, SumAggregator(partial_column_name, output_column_name)});
+    } else if (aggregation_operator == "min") {
+        res.emplace_back(PartialAggregate{MinAggregator(input_column_name, partial_column_name), std::nullopt, MinAggregator(partial_column_name, output_column_name)});
+    } else if (aggregation_operator == "max") {
+        res.emplace_back(PartialAggregate{MaxAggregator(input_column_name, partial_column_name), std::nullopt, MaxAggregator(partial_column_name, output_column_name)});
+    } else if (aggregation_operator == "count") {
+        res.emplace_back(PartialAggregate{CountAggregator(input_column_name, partial_column_name), std::nullopt, SumAggregator(partial_column_name, output_column_name)});
+    } else if (aggregation_operator == "mean") {
+        // The sum and count of the non-NaN values, which the merged mean is the quotient of. The sum is accumulated as
+        // a double, as the mean of the values is
+        ColumnName numerator_column_name(fmt::format("__partial_aggregate_{}_numerator", idx));
+        ColumnName denominator_column_name(fmt::format("__partial_aggregate_{}_denominator", idx));
+        res.emplace_back(PartialAggregate{SumAggregator(input_column_name, numerator_column_name), DataType::FLOAT64, SumAggregator(numerator_column_name, numerator_column_name)});
+        res.emplace_back(PartialAggregate{CountAggregator(input_column_name, denominator_column_name), std::nullopt, SumAggregator(denominator_column_name, denominator_column_name)});
+    } else {
+        user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("Unknown aggregation operator provided: {}", aggregation_operator);
+    }
+    return res;
+}
+
+SegmentInMemory mean_from_partial_aggregates(SegmentInMemory&& numerator, SegmentInMemory&& denominator, const std::string& output_column_name, size_t unique_values) {
+    SegmentInMemory res;
+    if (numerator.descriptor().field_count() == 0 || denominator.descriptor().field_count() == 0) {
+        return res;
+    }
+    auto numerator_ptr = reinterpret_cast<const double*>(numerator.column(0).ptr());
+    auto denominator_ptr = reinterpret_cast<const uint64_t*>(denominator.column(0).ptr());
+    auto col = std::make_shared<Column>(make_scalar_type(DataType::FLOAT64), unique_values, true, false);
+    auto out_ptr = reinterpret_cast<double*>(col->ptr());
+    for (size_t idx = 0; idx < unique_values; ++idx) {
+        out_ptr[idx] = denominator_ptr[idx] == 0 ? std::numeric_limits<double>::quiet_NaN() : numerator_ptr[idx] / static_cast<double>(denominator_ptr[idx]);
+    }
+    col->set_row_data(unique_values - 1);
+    res.add_column(scalar_field(DataType::FLOAT64, output_column_name), col);
+    return res;
+}
+}
+
+std::optional<ProcessingUnit> partially_aggregate(ProcessingUnit&& proc,
+                                                  const std::string& grouping_column,
+                                                  const std::vector<NamedAggregator>& named_aggregators,
+                                                  bool dynamic_schema) {
+    auto input = std::move(proc);
+    auto grouping_result = input.get(ColumnName(grouping_column));
+    if (!std::holds_alternative<ColumnWithStrings>(grouping_result)) {
+        return input;
+    }
+    auto grouping_col = std::get<ColumnWithStrings>(grouping_result);
+    const auto grouping_data_type = grouping_col.column_->type().data_type();
+    const auto num_rows = input.segments_->front()->row_count();
+    if (is_empty_type(grouping_data_type) || num_rows == 0) {
+        return input;
+    }
+
+    // Groups are numbered in order of their first row, which are the rows the grouping values are taken from
+    constexpr size_t missing_group = std::numeric_limits<size_t>::max();
+    std::vector<size_t> row_to_group(num_rows, missing_group);
+    util::BitSet first_rows(num_rows);
+    size_t num_groups{0};
+    size_t num_grouped_rows{0};
+    details::visit_type(grouping_data_type, [&](auto data_type_tag) {
+        using col_type_info = ScalarTypeInfo<decltype(data_type_tag)>;
+        using RawType = typename col_type_info::RawType;
+        const auto assign_group = [&](auto& groups, const auto& key, size_t row) {
+            auto [it, inserted] = groups.try_emplace(key, num_groups);
+            if (inserted) {
+                ++num_groups;
+                first_rows.set_bit(row);
+            }
+            row_to_group[row] = it->second;
+            ++num_grouped_rows;
+        };
+        ankerl::unordered_dense::map<RawType, size_t> value_to_group;
+        // Equal strings are not guaranteed to share an offset in the string pool, so group on their values
+        ankerl::unordered_dense::map<std::string_view, size_t> string_to_group;
+        Column::for_each_enumerated<typename col_type_info::TDT>(*grouping_col.column_, [&](auto enumerating_it) {
+            const auto row = static_cast<size_t>(enumerating_it.idx());
+            if constexpr (is_sequence_type(col_type_info::data_type)) {
+                if (auto str = grouping_col.string_at_offset(enumerating_it.value()); str.has_value()) {
+                    assign_group(string_to_group, *str, row);
+                    return;
+                }
+            }
+            assign_group(value_to_group, enumerating_it.value(), row);
+        });
+    });
+    if (num_groups == 0) {
+        return std::nullopt;
+    }
+    // Rows with no grouping value, from sparse grouping columns, are aggregated into an extra group that is discarded
+    const bool has_missing_group = num_grouped_rows < num_rows;
+    const auto num_aggregated_groups = has_missing_group ? num_groups + 1 : num_groups;
+    if (has_missing_group) {
+        std::replace(row_to_group.begin(), row_to_group.end(), missing_group, num_groups);
+    }
+
+    SegmentInMemory grouping_seg;
+    grouping_seg.add_column(scalar_field(grouping_data_type, grouping_column), grouping_col.column_);
+    if (grouping_col.string_pool_) {
+        grouping_seg.set_string_pool(grouping_col.string_pool_);
+    }
+    grouping_seg.descriptor().set_index(IndexDescriptor(0, IndexDescriptor::ROWCOUNT));
+    grouping_seg.set_row_id(num_rows - 1);
+    auto output = grouping_seg.filter(std::move(first_rows), true);
+
+    std::optional<SegmentInMemory> aggregates;
+    for (auto&& [idx, named_aggregator]: folly::enumerate(named_aggregators)) {
+        auto input_column = input.get(ColumnName(named_aggregator.input_column_name_));
+        if (!std::holds_alternative<ColumnWithStrings>(input_column)) {
+            // Missing from this row-slice with dynamic schema, so does not contribute to the aggregation
+            continue;
+        }
+        std::optional<ColumnWithStrings> opt_input_column(std::get<ColumnWithStrings>(input_column));
+        const auto input_data_type = opt_input_column->column_->type().data_type();
+        // Empty columns don't contribute to aggregations
+        if (is_empty_type(input_data_type)) {
+            continue;
+        }
+        for (auto& partial_aggregate: partial_aggregates(idx, named_aggregator)) {
+            auto aggregator_data = partial_aggregate.partial_.get_aggregator_data();
+            aggregator_data.add_data_type(partial_aggregate.partial_data_type_.value_or(input_data_type));
+            aggregator_data.aggregate(opt_input_column, row_to_group, num_aggregated_groups);
+            auto partial_seg = aggregator_data.finalize(partial_aggregate.partial_.get_output_column_name(), dynamic_schema, num_aggregated_groups);
+            if (partial_seg.descriptor().field_count() == 0) {
+                continue;
+            }
+            if (aggregates.has_value()) {
+                aggregates->concatenate(std::move(partial_seg));
+            } else {
+                aggregates = std::move(partial_seg);
+            }
+        }
+    }
+    if (aggregates.has_value()) {
+        if (has_missing_group) {
+            aggregates = aggregates->truncate(0, num_groups, false);
+        }
+        output.concatenate(std::move(*aggregates));
+    }
+    return ProcessingUnit(std::move(output), RowRange{*input.row_ranges_->front()});
+}
+
 AggregationClause::AggregationClause(const std::string& grouping_column,
                                      const std::vector<NamedAggregator>& named_aggregators):
-        grouping_column_(grouping_column) {
+        grouping_column_(grouping_column),
+        named_aggregators_(named_aggregators) {
     clause_info_.can_combine_with_column_selection_ = false;
     clause_info_.new_index_ = grouping_column_;
     clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>({grouping_column_});
@@ -339,21 +615,11 @@ AggregationClause::AggregationClause(const std::string& grouping_column,
                                 named_aggregator.input_column_name_,
                                 named_aggregator.aggregation_operator_));
         clause_info_.input_columns_->insert(named_aggregator.input_column_name_);
-        auto typed_input_column_name = ColumnName(named_aggregator.input_column_name_);
-        auto typed_output_column_name = ColumnName(named_aggregator.output_column_name_);
-        if (named_aggregator.aggregation_operator_ == "sum") {
-            aggregators_.emplace_back(SumAggregator(typed_input_column_name, typed_output_column_name));
-        } else if (named_aggregator.aggregation_operator_ == "mean") {
-            aggregators_.emplace_back(MeanAggregator(typed_input_column_name, typed_output_column_name));
-        } else if (named_aggregator.aggregation_operator_ == "max") {
-            aggregators_.emplace_back(MaxAggregator(typed_input_column_name, typed_output_column_name));
-        } else if (named_aggregator.aggregation_operator_ == "min") {
-            aggregators_.emplace_back(MinAggregator(typed_input_column_name, typed_output_column_name));
-        } else if (named_aggregator.aggregation_operator_ == "count") {
-            aggregators_.emplace_back(CountAggregator(typed_input_column_name, typed_output_column_name));
-        } else {
-            user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("Unknown aggregation operator provided: {}", named_aggregator.aggregation_operator_);
-        }
+        auto aggregator = to_grouping_aggregator(named_aggregator);
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                aggregator.has_value(),
+                "Unknown aggregation operator provided: {}", named_aggregator.aggregation_operator_);
+        aggregators_.emplace_back(std::move(*aggregator));
     }
     str_.append("}");
 }
@@ -520,8 +786,26 @@ Composite<EntityIds> AggregationClause::process(Composite<EntityIds>&& entity_id
     });
     index_col->set_row_data(grouping_map.size() - 1);
 
-    for (auto agg_data: folly::enumerate(aggregators_data)) {
-        seg.concatenate(agg_data->finalize(aggregators_.at(agg_data.index).get_output_column_name(), processing_config_.dynamic_schema_, num_unique));
+    if (merge_partial_aggregates_) {
+        size_t agg_idx{0};
+        const auto finalize_next = [&]() {
+            auto res = aggregators_data.at(agg_idx).finalize(aggregators_.at(agg_idx).get_output_column_name(), processing_config_.dynamic_schema_, num_unique);
+            ++agg_idx;
+            return res;
+        };
+        for (const auto& named_aggregator: named_aggregators_) {
+            if (named_aggregator.aggregation_operator_ == "mean") {
+                auto numerator = finalize_next();
+                auto denominator = finalize_next();
+                seg.concatenate(mean_from_partial_aggregates(std::move(numerator), std::move(denominator), named_aggregator.output_column_name_, num_unique));
+            } else {
+                seg.concatenate(finalize_next());
+            }
+        }
+    } else {
+        for (auto agg_data: folly::enumerate(aggregators_data)) {
+            seg.concatenate(agg_data->finalize(aggregators_.at(agg_data.index).get_output_column_name(), processing_config_.dynamic_schema_, num_unique));
+        }
     }
 
     seg.set_string_pool(string_pool);
@@ -529,10 +813,697 @@ Composite<EntityIds> AggregationClause::process(Composite<EntityIds>&& entity_id
     return Composite<EntityIds>(push_entities(component_manager_, ProcessingUnit(std::move(seg))));
 }
 
+bool AggregationClause::supports_partial_aggregation() const {
+    return std::all_of(named_aggregators_.begin(), named_aggregators_.end(), has_partial_aggregates);
+}
+
+void AggregationClause::set_merge_partial_aggregates() {
+    aggregators_.clear();
+    for (auto&& [idx, named_aggregator]: folly::enumerate(named_aggregators_)) {
+        for (auto& partial_aggregate: partial_aggregates(idx, named_aggregator)) {
+            aggregators_.emplace_back(std::move(partial_aggregate.merge_));
+        }
+    }
+    merge_partial_aggregates_ = true;
+}
+
 [[nodiscard]] std::string AggregationClause::to_string() const {
     return str_;
 }
 
+ResampleClause::ResampleClause(std::string rule, timestamp bucket_size):
+        rule_(std::move(rule)),
+        bucket_size_(bucket_size) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            bucket_size_ > 0,
+            "Resampling rule must describe a positive duration, received {}", rule_);
+    clause_info_.can_combine_with_column_selection_ = false;
+    clause_info_.modifies_output_descriptor_ = true;
+    clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>();
+    str_ = fmt::format("RESAMPLE({}) AGGREGATE {{}}", rule_);
+}
+
+void ResampleClause::set_aggregations(const std::vector<NamedAggregator>& named_aggregators) {
+    aggregators_.clear();
+    clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>();
+    str_ = fmt::format("RESAMPLE({}) AGGREGATE {{", rule_);
+    for (const auto& named_aggregator: named_aggregators) {
+        str_.append(fmt::format("{}: ({}, {}), ",
+                                named_aggregator.output_column_name_,
+                                named_aggregator.input_column_name_,
+                                named_aggregator.aggregation_operator_));
+        clause_info_.input_columns_->insert(named_aggregator.input_column_name_);
+        if (auto aggregator = to_grouping_aggregator(named_aggregator); aggregator.has_value()) {
+            aggregators_.emplace_back(std::move(*aggregator));
+        } else if (named_aggregator.aggregation_operator_ == "first") {
+            aggregators_.emplace_back(FirstAggregator(ColumnName(named_aggregator.input_column_name_),
+                                                      ColumnName(named_aggregator.output_column_name_)));
+        } else if (named_aggregator.aggregation_operator_ == "last") {
+            aggregators_.emplace_back(LastAggregator(ColumnName(named_aggregator.input_column_name_),
+                                                     ColumnName(named_aggregator.output_column_name_)));
+        } else {
+            user_input::raise<ErrorCode::E_INVALID_USER_ARGUMENT>("Unknown aggregation operator provided: {}", named_aggregator.aggregation_operator_);
+        }
+    }
+    str_.append("}");
+}
+
+void ResampleClause::set_date_range(timestamp start, timestamp end) {
+    date_range_ = std::make_pair(start, end);
+}
+
+timestamp ResampleClause::bucket_start(timestamp ts) const {
+    // Round towards negative infinity so that timestamps before the epoch are bucketed consistently
+    return ts - (((ts % bucket_size_) + bucket_size_) % bucket_size_);
+}
+
+std::vector<std::vector<size_t>> ResampleClause::structure_for_processing(
+        std::vector<RangesAndKey>& ranges_and_keys,
+        size_t start_from) {
+    if (date_range_.has_value()) {
+        ranges_and_keys.erase(std::remove_if(ranges_and_keys.begin(), ranges_and_keys.end(), [this](const RangesAndKey& ranges_and_key) {
+            auto [start_index, end_index] = ranges_and_key.key_.time_range();
+            return start_index > date_range_->second || end_index <= date_range_->first;
+        }), ranges_and_keys.end());
+    }
+    auto row_slices = structure_by_row_slice(ranges_and_keys, start_from);
+    // The first and last bucket touched by each row-slice. The end time in the key is one greater than the last index value
+    std::vector<std::pair<timestamp, timestamp>> row_slice_buckets;
+    row_slice_buckets.reserve(row_slices.size());
+    for (const auto& row_slice: row_slices) {
+        auto [start_index, end_index] = ranges_and_keys.at(row_slice.front()).key_.time_range();
+        row_slice_buckets.emplace_back(bucket_start(start_index), bucket_start(end_index - 1));
+    }
+    continuing_row_slices_.clear();
+    std::vector<std::vector<size_t>> res;
+    for (size_t idx = 0; idx < row_slices.size(); ++idx) {
+        const auto& [first_bucket, last_bucket] = row_slice_buckets[idx];
+        if (idx > 0 && first_bucket == row_slice_buckets[idx - 1].second) {
+            continuing_row_slices_.insert(ranges_and_keys.at(row_slices[idx].front()).row_range_.start());
+            if (first_bucket == last_bucket) {
+                // Every row in this row-slice is in a bucket owned by an earlier processing unit
+                continue;
+            }
+        }
+        auto& processing_unit = res.emplace_back(row_slices[idx]);
+        for (auto next = idx + 1; next < row_slices.size() && row_slice_buckets[next].first == last_bucket; ++next) {
+            processing_unit.insert(processing_unit.end(), row_slices[next].begin(), row_slices[next].end());
+        }
+    }
+    return res;
+}
+
+namespace {
+// Splits a processing unit into one processing unit per row-slice, ordered by row-slice start
+std::vector<ProcessingUnit> split_by_row_slice(ProcessingUnit&& proc) {
+    auto input = std::move(proc);
+    std::map<size_t, ProcessingUnit> row_slices;
+    for (auto&& [idx, segment]: folly::enumerate(*input.segments_)) {
+        auto& row_slice = row_slices[input.row_ranges_->at(idx)->start()];
+        if (!row_slice.segments_.has_value()) {
+            row_slice.set_segments({});
+            row_slice.set_row_ranges({});
+            row_slice.set_col_ranges({});
+        }
+        row_slice.segments_->emplace_back(segment);
+        row_slice.row_ranges_->emplace_back(input.row_ranges_->at(idx));
+        row_slice.col_ranges_->emplace_back(input.col_ranges_->at(idx));
+    }
+    std::vector<ProcessingUnit> res;
+    res.reserve(row_slices.size());
+    for (auto&& [_, row_slice]: row_slices) {
+        res.emplace_back(std::move(row_slice));
+    }
+    return res;
+}
+}
+
+Composite<EntityIds> ResampleClause::process(Composite<EntityIds>&& entity_ids) const {
+    internal::check<ErrorCode::E_INVALID_ARGUMENT>(
+            !aggregators_.empty(),
+            "ResampleClause::process does not make sense with no aggregators");
+    auto procs = gather_entities(component_manager_, std::move(entity_ids));
+    Composite<EntityIds> output;
+    procs.broadcast([&output, this](ProcessingUnit& proc) {
+        // The first row-slice owns the buckets output by this processing unit, any others are only needed to complete
+        // the last of these buckets
+        auto row_slices = split_by_row_slice(std::move(proc));
+        const auto& owner = row_slices.front();
+        const auto owner_row_start = owner.row_ranges_->front()->start();
+        const bool continuing = continuing_row_slices_.contains(owner_row_start);
+        const auto& owner_descriptor = owner.segments_->front()->descriptor();
+        schema::check<ErrorCode::E_UNSUPPORTED_INDEX_TYPE>(
+                owner_descriptor.index().type() == IndexDescriptor::TIMESTAMP,
+                "Resampling is only supported on timestamp indexed data");
+        const std::string index_name{owner_descriptor.field(0).name()};
+
+        // Rows that should not contribute to this processing unit's output are assigned to the discarded group, which
+        // is removed from the output segment
+        constexpr size_t discarded_group{0};
+        std::vector<std::vector<size_t>> row_to_group(row_slices.size());
+        std::vector<timestamp> bucket_labels;
+        std::optional<timestamp> current_bucket;
+        std::optional<timestamp> owner_first_bucket;
+        timestamp owner_last_bucket{0};
+        for (auto&& [idx, row_slice]: folly::enumerate(row_slices)) {
+            const bool is_owner = idx == 0;
+            const auto& index_column = row_slice.segments_->front()->column(0);
+            auto& groups = row_to_group[idx];
+            groups.reserve(index_column.row_count());
+            Column::for_each<ScalarTagType<DataTypeTag<DataType::NANOSECONDS_UTC64>>>(index_column, [&](timestamp ts) {
+                const auto bucket = bucket_start(ts);
+                if (is_owner) {
+                    if (!owner_first_bucket.has_value()) {
+                        owner_first_bucket = bucket;
+                    }
+                    owner_last_bucket = bucket;
+                }
+                const bool in_date_range = !date_range_.has_value() || (ts >= date_range_->first && ts <= date_range_->second);
+                const bool owned = is_owner ? !(continuing && bucket == *owner_first_bucket) : bucket == owner_last_bucket;
+                if (!in_date_range || !owned) {
+                    groups.emplace_back(discarded_group);
+                    return;
+                }
+                if (bucket != current_bucket) {
+                    bucket_labels.emplace_back(bucket);
+                    current_bucket = bucket;
+                }
+                groups.emplace_back(bucket_labels.size());
+            });
+        }
+        if (bucket_labels.empty()) {
+            return;
+        }
+        const auto num_groups = bucket_labels.size() + 1;
+
+        std::vector<GroupingAggregatorData> aggregators_data;
+        for (const auto& agg: aggregators_) {
+            aggregators_data.emplace_back(agg.get_aggregator_data());
+        }
+        // Work out the common type between the row-slices for the columns being aggregated
+        for (auto& row_slice: row_slices) {
+            for (auto agg_data: folly::enumerate(aggregators_data)) {
+                auto input_column_name = aggregators_.at(agg_data.index).get_input_column_name();
+                auto input_column = row_slice.get(input_column_name);
+                if (std::holds_alternative<ColumnWithStrings>(input_column)) {
+                    auto data_type = std::get<ColumnWithStrings>(input_column).column_->type().data_type();
+                    schema::check<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                            !is_sequence_type(data_type),
+                            "Resampling is not supported on string column {}", input_column_name.value);
+                    agg_data->add_data_type(data_type);
+                }
+            }
+        }
+        for (auto&& [idx, row_slice]: folly::enumerate(row_slices)) {
+            for (auto agg_data: folly::enumerate(aggregators_data)) {
+                auto input_column = row_slice.get(aggregators_.at(agg_data.index).get_input_column_name());
+                std::optional<ColumnWithStrings> opt_input_column;
+                if (std::holds_alternative<ColumnWithStrings>(input_column)) {
+                    auto column_with_strings = std::get<ColumnWithStrings>(input_column);
+                    // Empty columns don't contribute to aggregations
+                    if (!is_empty_type(column_with_strings.column_->type().data_type())) {
+                        opt_input_column.emplace(std::move(column_with_strings));
+                    }
+                }
+                agg_data->aggregate(opt_input_column, row_to_group[idx], num_groups);
+            }
+        }
+
+        SegmentInMemory seg;
+        auto index_col = std::make_shared<Column>(make_scalar_type(DataType::NANOSECONDS_UTC64), num_groups, true, false);
+        auto index_ptr = reinterpret_cast<timestamp*>(index_col->ptr());
+        index_ptr[discarded_group] = 0;
+        std::copy(bucket_labels.cbegin(), bucket_labels.cend(), index_ptr + 1);
+        index_col->set_row_data(num_groups - 1);
+        seg.add_column(scalar_field(DataType::NANOSECONDS_UTC64, index_name), index_col);
+        seg.descriptor().set_index(IndexDescriptor(1, IndexDescriptor::TIMESTAMP));
+        for (auto agg_data: folly::enumerate(aggregators_data)) {
+            seg.concatenate(agg_data->finalize(aggregators_.at(agg_data.index).get_output_column_name(), processing_config_.dynamic_schema_, num_groups));
+        }
+        seg.set_row_id(num_groups - 1);
+        auto output_seg = seg.truncate(discarded_group + 1, num_groups, false);
+        output.push_back(push_entities(component_manager_, ProcessingUnit(std::move(output_seg),
+                                                                          RowRange{owner_row_start, owner_row_start + bucket_labels.size()})));
+    });
+    return output;
+}
+
+[[nodiscard]] std::string ResampleClause::to_string() const {
+    return str_;
+}
+
+WindowClause::WindowClause(std::string window, WindowSpec::Type type, int64_t size, size_t min_periods):
+        window_(std::move(window)),
+        window_spec_{type, size, min_periods} {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            type == WindowSpec::Type::EXPANDING || size > 0,
+            "Window must describe a positive number of rows or duration, received {}", window_);
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            type != WindowSpec::Type::ROWS || min_periods <= static_cast<size_t>(size),
+            "min_periods {} must not be greater than the window of {} rows", min_periods, size);
+    clause_info_.can_combine_with_column_selection_ = false;
+    clause_info_.modifies_output_descriptor_ = true;
+    clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>();
+    str_ = fmt::format("{} AGGREGATE {{}}", window_spec_.type_ == WindowSpec::Type::EXPANDING ? "EXPANDING" : fmt::format("ROLLING({})", window_));
+}
+
+void WindowClause::set_aggregations(const std::vector<NamedAggregator>& named_aggregators) {
+    aggregators_.clear();
+    clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>();
+    str_ = fmt::format("{} AGGREGATE {{", window_spec_.type_ == WindowSpec::Type::EXPANDING ? "EXPANDING" : fmt::format("ROLLING({})", window_));
+    for (const auto& named_aggregator: named_aggregators) {
+        str_.append(fmt::format("{}: ({}, {}), ",
+                                named_aggregator.output_column_name_,
+                                named_aggregator.input_column_name_,
+                                named_aggregator.aggregation_operator_));
+        clause_info_.input_columns_->insert(named_aggregator.input_column_name_);
+        auto window_operator = window_operator_from_string(named_aggregator.aggregation_operator_);
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                window_operator.has_value(),
+                "Unsupported window aggregation operator provided: {}", named_aggregator.aggregation_operator_);
+        aggregators_.emplace_back(named_aggregator, *window_operator);
+    }
+    str_.append("}");
+}
+
+void WindowClause::set_date_range(timestamp start, timestamp end) {
+    date_range_ = std::make_pair(start, end);
+}
+
+std::vector<std::vector<size_t>> WindowClause::structure_for_processing(
+        std::vector<RangesAndKey>& ranges_and_keys,
+        size_t start_from) {
+    if (date_range_.has_value()) {
+        ranges_and_keys.erase(std::remove_if(ranges_and_keys.begin(), ranges_and_keys.end(), [this](const RangesAndKey& ranges_and_key) {
+            auto [start_index, end_index] = ranges_and_key.key_.time_range();
+            return start_index > date_range_->second || end_index <= date_range_->first;
+        }), ranges_and_keys.end());
+    }
+    auto row_slices = structure_by_row_slice(ranges_and_keys, start_from);
+    std::vector<std::vector<size_t>> res;
+    if (window_spec_.type_ == WindowSpec::Type::EXPANDING) {
+        // The output for every row depends on all of the rows before it
+        if (!row_slices.empty()) {
+            auto& processing_unit = res.emplace_back();
+            for (const auto& row_slice: row_slices) {
+                processing_unit.insert(processing_unit.end(), row_slice.begin(), row_slice.end());
+            }
+        }
+        return res;
+    }
+    res.reserve(row_slices.size());
+    for (size_t idx = 0; idx < row_slices.size(); ++idx) {
+        // The first preceding row-slice needed to fill the windows of the first rows in this row-slice
+        auto first = idx;
+        if (window_spec_.type_ == WindowSpec::Type::ROWS) {
+            size_t preceding_rows{0};
+            while (first > 0 && preceding_rows + 1 < static_cast<size_t>(window_spec_.size_)) {
+                --first;
+                preceding_rows += ranges_and_keys.at(row_slices[first].front()).row_range_.diff();
+            }
+        } else {
+            // The end time in the key is one greater than the last index value
+            const auto start_index = ranges_and_keys.at(row_slices[idx].front()).key_.start_time();
+            while (first > 0 && ranges_and_keys.at(row_slices[first - 1].front()).key_.end_time() - 1 > start_index - window_spec_.size_) {
+                --first;
+            }
+        }
+        auto& processing_unit = res.emplace_back();
+        for (auto preceding = first; preceding <= idx; ++preceding) {
+            processing_unit.insert(processing_unit.end(), row_slices[preceding].begin(), row_slices[preceding].end());
+        }
+    }
+    return res;
+}
+
+namespace {
+// Appends the values in [begin, end) of the column to values, with NaN for rows missing from a sparse column
+void append_window_values(const Column& column, std::string_view column_name, size_t begin, size_t end, std::vector<double>& values) {
+    const auto offset = values.size();
+    values.resize(offset + end - begin, std::numeric_limits<double>::quiet_NaN());
+    details::visit_type(column.type().data_type(), [&](auto col_tag) {
+        using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr (is_bool_type(col_type_info::data_type) ||
+                      (is_numeric_type(col_type_info::data_type) && !is_time_type(col_type_info::data_type))) {
+            Column::for_each_enumerated<typename col_type_info::TDT>(column, [&](auto enumerating_it) {
+                const auto idx = static_cast<size_t>(enumerating_it.idx());
+                if (idx >= begin && idx < end) {
+                    values[offset + idx - begin] = static_cast<double>(enumerating_it.value());
+                }
+            });
+        } else if constexpr (!is_empty_type(col_type_info::data_type)) {
+            schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                    "Window aggregations are not supported on column {} of type {}", column_name, col_type_info::data_type);
+        }
+    });
+}
+}
+
+Composite<EntityIds> WindowClause::process(Composite<EntityIds>&& entity_ids) const {
+    internal::check<ErrorCode::E_INVALID_ARGUMENT>(
+            !aggregators_.empty(),
+            "WindowClause::process does not make sense with no aggregators");
+    auto procs = gather_entities(component_manager_, std::move(entity_ids));
+    Composite<EntityIds> output;
+    procs.broadcast([&output, this](ProcessingUnit& proc) {
+        // Rolling windows only output rows for the last row-slice, any others are only needed to fill its windows
+        auto row_slices = split_by_row_slice(std::move(proc));
+        const size_t first_owner = window_spec_.type_ == WindowSpec::Type::EXPANDING ? 0 : row_slices.size() - 1;
+        const auto owner_row_start = row_slices[first_owner].row_ranges_->front()->start();
+        const auto& owner_descriptor = row_slices[first_owner].segments_->front()->descriptor();
+        const bool timestamp_index = owner_descriptor.index().type() == IndexDescriptor::TIMESTAMP;
+        schema::check<ErrorCode::E_UNSUPPORTED_INDEX_TYPE>(
+                timestamp_index || owner_descriptor.index().type() == IndexDescriptor::ROWCOUNT,
+                "Window aggregations are only supported on timestamp or row-count indexed data");
+        schema::check<ErrorCode::E_UNSUPPORTED_INDEX_TYPE>(
+                timestamp_index || (window_spec_.type_ != WindowSpec::Type::TIME && !date_range_.has_value()),
+                "Time based windows and date ranges are only supported on timestamp indexed data");
+
+        // The rows of each row-slice within the date range, which are contiguous as the data is sorted
+        std::vector<std::pair<size_t, size_t>> row_slice_rows;
+        row_slice_rows.reserve(row_slices.size());
+        std::vector<timestamp> index;
+        size_t num_rows{0};
+        size_t output_start{0};
+        for (auto&& [idx, row_slice]: folly::enumerate(row_slices)) {
+            if (idx == first_owner) {
+                output_start = num_rows;
+            }
+            size_t begin{0};
+            size_t end{row_slice.row_ranges_->front()->diff()};
+            if (timestamp_index) {
+                std::vector<timestamp> row_slice_index;
+                row_slice_index.reserve(end);
+                Column::for_each<ScalarTagType<DataTypeTag<DataType::NANOSECONDS_UTC64>>>(row_slice.segments_->front()->column(0), [&row_slice_index](timestamp ts) {
+                    row_slice_index.emplace_back(ts);
+                });
+                if (date_range_.has_value()) {
+                    begin = std::lower_bound(row_slice_index.begin(), row_slice_index.end(), date_range_->first) - row_slice_index.begin();
+                    end = std::max(begin, static_cast<size_t>(std::upper_bound(row_slice_index.begin(), row_slice_index.end(), date_range_->second) - row_slice_index.begin()));
+                }
+                index.insert(index.end(), row_slice_index.begin() + begin, row_slice_index.begin() + end);
+            }
+            row_slice_rows.emplace_back(begin, end);
+            num_rows += end - begin;
+        }
+        if (num_rows == output_start) {
+            return;
+        }
+        const auto num_output = num_rows - output_start;
+
+        SegmentInMemory seg;
+        if (timestamp_index) {
+            auto index_col = std::make_shared<Column>(make_scalar_type(DataType::NANOSECONDS_UTC64), num_output, true, false);
+            std::copy(index.cbegin() + output_start, index.cend(), reinterpret_cast<timestamp*>(index_col->ptr()));
+            index_col->set_row_data(num_output - 1);
+            seg.add_column(scalar_field(DataType::NANOSECONDS_UTC64, owner_descriptor.field(0).name()), index_col);
+            seg.descriptor().set_index(IndexDescriptor(1, IndexDescriptor::TIMESTAMP));
+        } else {
+            seg.descriptor().set_index(IndexDescriptor(0, IndexDescriptor::ROWCOUNT));
+        }
+        for (const auto& [named_aggregator, window_operator]: aggregators_) {
+            std::vector<double> values;
+            values.reserve(num_rows);
+            bool found{false};
+            for (auto&& [idx, row_slice]: folly::enumerate(row_slices)) {
+                const auto [begin, end] = row_slice_rows[idx];
+                auto input_column = row_slice.get(ColumnName(named_aggregator.input_column_name_));
+                if (std::holds_alternative<ColumnWithStrings>(input_column)) {
+                    found = true;
+                    append_window_values(*std::get<ColumnWithStrings>(input_column).column_, named_aggregator.input_column_name_, begin, end, values);
+                } else {
+                    // Missing from this row-slice with dynamic schema, so treated as missing values
+                    values.resize(values.size() + end - begin, std::numeric_limits<double>::quiet_NaN());
+                }
+            }
+            schema::check<ErrorCode::E_COLUMN_DOESNT_EXIST>(
+                    found || processing_config_.dynamic_schema_,
+                    "Cannot aggregate column {} as it does not exist", named_aggregator.input_column_name_);
+            const auto results = window_aggregate(window_operator, window_spec_, index, values, output_start);
+            auto output_col = std::make_shared<Column>(make_scalar_type(DataType::FLOAT64), num_output, true, false);
+            std::copy(results.cbegin(), results.cend(), reinterpret_cast<double*>(output_col->ptr()));
+            output_col->set_row_data(num_output - 1);
+            seg.add_column(scalar_field(DataType::FLOAT64, named_aggregator.output_column_name_), output_col);
+        }
+        seg.set_row_id(num_output - 1);
+        output.push_back(push_entities(component_manager_, ProcessingUnit(std::move(seg),
+                                                                          RowRange{owner_row_start, owner_row_start + num_output})));
+    });
+    return output;
+}
+
+[[nodiscard]] std::string WindowClause::to_string() const {
+    return str_;
+}
+
+namespace {
+// Orders rows by the values of a column, with missing values and NaNs last, and rows with equal values in their input
+// order
+template<typename RawType>
+struct SortValuesComparator {
+    std::vector<std::optional<RawType>> values_;
+    bool ascending_;
+
+    bool operator()(size_t left, size_t right) const {
+        const auto& left_value = values_[left];
+        const auto& right_value = values_[right];
+        if (left_value.has_value() != right_value.has_value()) {
+            return left_value.has_value();
+        }
+        if (left_value.has_value() && *left_value != *right_value) {
+            return ascending_ ? *left_value < *right_value : *left_value > *right_value;
+        }
+        return left < right;
+    }
+};
+
+// Calls func with a SortValuesComparator over the rows of the processing unit, which must be a single row-slice
+template<typename Func>
+void with_sort_values_comparator(ProcessingUnit& proc, const std::string& column, bool ascending, bool dynamic_schema, Func&& func) {
+    const auto num_rows = proc.segments_->front()->row_count();
+    auto sort_column = proc.get(ColumnName(column));
+    if (!std::holds_alternative<ColumnWithStrings>(sort_column)) {
+        schema::check<ErrorCode::E_COLUMN_DOESNT_EXIST>(
+                dynamic_schema,
+                "Cannot sort by column {} as it does not exist", column);
+        // Missing from this row-slice with dynamic schema, so all of its values are missing
+        func(SortValuesComparator<uint8_t>{std::vector<std::optional<uint8_t>>(num_rows), ascending});
+        return;
+    }
+    const auto& col = *std::get<ColumnWithStrings>(sort_column).column_;
+    details::visit_type(col.type().data_type(), [&](auto data_type_tag) {
+        using col_type_info = ScalarTypeInfo<decltype(data_type_tag)>;
+        using RawType = typename col_type_info::RawType;
+        if constexpr (is_sequence_type(col_type_info::data_type)) {
+            schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>("Cannot sort by string column {}", column);
+        } else {
+            SortValuesComparator<RawType> comparator{std::vector<std::optional<RawType>>(num_rows), ascending};
+            if constexpr (!is_empty_type(col_type_info::data_type)) {
+                Column::for_each_enumerated<typename col_type_info::TDT>(col, [&comparator](auto enumerating_it) {
+                    if constexpr (is_floating_point_type(col_type_info::data_type)) {
+                        if (std::isnan(enumerating_it.value())) {
+                            return;
+                        }
+                    }
+                    comparator.values_[enumerating_it.idx()] = enumerating_it.value();
+                });
+            }
+            func(std::move(comparator));
+        }
+    });
+}
+
+// Copies the given rows of the segment, in the order given
+SegmentInMemory reorder_rows(const SegmentInMemory& segment, const std::vector<size_t>& rows) {
+    util::BitSet bitset(segment.row_count());
+    for (auto row: rows) {
+        bitset.set_bit(row);
+    }
+    auto res = segment.filter(std::move(bitset), true);
+    // The filtered segment has the rows in their input order, so find where each of them goes in the output
+    auto input_order = rows;
+    std::sort(input_order.begin(), input_order.end());
+    JiveTable jive_table(rows.size());
+    for (auto&& [output_pos, row]: folly::enumerate(rows)) {
+        const auto filtered_pos = std::lower_bound(input_order.begin(), input_order.end(), row) - input_order.begin();
+        jive_table.orig_pos_[output_pos] = static_cast<uint32_t>(filtered_pos);
+        jive_table.sorted_pos_[filtered_pos] = static_cast<uint32_t>(output_pos);
+    }
+    std::vector<uint32_t> pre_allocated_space(rows.size());
+    for (position_t idx = 0; idx < static_cast<position_t>(res.descriptor().field_count()); ++idx) {
+        res.column(idx).sort_external(jive_table, pre_allocated_space);
+    }
+    return res;
+}
+
+ProcessingUnit reorder_rows(ProcessingUnit&& proc, const std::vector<size_t>& rows) {
+    auto res = std::move(proc);
+    for (auto& segment: *res.segments_) {
+        segment = std::make_shared<SegmentInMemory>(reorder_rows(*segment, rows));
+    }
+    return res;
+}
+
+std::string sort_values_string(std::string_view name, const std::string& column, bool ascending, std::optional<size_t> limit) {
+    return limit.has_value() ?
+           fmt::format("{}({}, {}, LIMIT {})", name, column, ascending ? "ASCENDING" : "DESCENDING", *limit) :
+           fmt::format("{}({}, {})", name, column, ascending ? "ASCENDING" : "DESCENDING");
+}
+}
+
+SortValuesClause::SortValuesClause(std::string column, bool ascending, std::optional<size_t> limit):
+        column_(std::move(column)),
+        ascending_(ascending),
+        limit_(limit) {
+    clause_info_.requires_repartition_ = true;
+    clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>({column_});
+}
+
+Composite<EntityIds> SortValuesClause::process(Composite<EntityIds>&& entity_ids) const {
+    auto procs = gather_entities(component_manager_, std::move(entity_ids));
+    Composite<EntityIds> output;
+    procs.broadcast([&output, this](ProcessingUnit& proc) {
+        for (auto& row_slice: split_by_row_slice(std::move(proc))) {
+            const auto num_rows = row_slice.segments_->front()->row_count();
+            const auto num_output = std::min(num_rows, limit_.value_or(num_rows));
+            if (num_output == 0) {
+                continue;
+            }
+            std::vector<size_t> rows;
+            rows.reserve(num_output);
+            with_sort_values_comparator(row_slice, column_, ascending_, processing_config_.dynamic_schema_, [&](auto&& comes_before) {
+                if (num_output < num_rows) {
+                    // Bounded heap whose top is the row that sorts last of those kept so far
+                    movable_priority_queue<size_t, std::vector<size_t>, std::decay_t<decltype(comes_before)>> heap{comes_before};
+                    for (size_t row = 0; row < num_rows; ++row) {
+                        heap.push(row);
+                        if (heap.size() > num_output) {
+                            heap.pop();
+                        }
+                    }
+                    while (!heap.empty()) {
+                        rows.emplace_back(heap.pop_top());
+                    }
+                    std::reverse(rows.begin(), rows.end());
+                } else {
+                    rows.resize(num_rows);
+                    std::iota(rows.begin(), rows.end(), 0);
+                    std::sort(rows.begin(), rows.end(), comes_before);
+                }
+            });
+            output.push_back(push_entities(component_manager_, reorder_rows(std::move(row_slice), rows)));
+        }
+    });
+    return output;
+}
+
+std::optional<std::vector<Composite<EntityIds>>> SortValuesClause::repartition(
+        std::vector<Composite<EntityIds>>&& entity_ids) const {
+    return single_partition(std::move(entity_ids));
+}
+
+[[nodiscard]] std::string SortValuesClause::to_string() const {
+    return sort_values_string("SORT_VALUES", column_, ascending_, limit_);
+}
+
+MergeSortedValuesClause::MergeSortedValuesClause(std::string column, bool ascending, std::optional<size_t> limit):
+        column_(std::move(column)),
+        ascending_(ascending),
+        limit_(limit) {
+    clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>({column_});
+}
+
+Composite<EntityIds> MergeSortedValuesClause::process(Composite<EntityIds>&& entity_ids) const {
+    auto procs = gather_entities(component_manager_, std::move(entity_ids));
+    std::vector<ProcessingUnit> row_slices;
+    procs.broadcast([&row_slices](ProcessingUnit& proc) {
+        for (auto& row_slice: split_by_row_slice(std::move(proc))) {
+            if (row_slice.segments_->front()->row_count() > 0) {
+                row_slices.emplace_back(std::move(row_slice));
+            }
+        }
+    });
+    Composite<EntityIds> output;
+    if (row_slices.empty()) {
+        return output;
+    }
+    // Rows with equal values are output in the order of the row-slices they came from
+    std::sort(row_slices.begin(), row_slices.end(), [](const ProcessingUnit& left, const ProcessingUnit& right) {
+        return left.row_ranges_->front()->start() < right.row_ranges_->front()->start();
+    });
+    const auto num_col_slices = row_slices.front().segments_->size();
+
+    // Concatenate the sorted row-slices, one segment per column-slice, with each row-slice a sorted run of rows
+    std::vector<SegmentInMemory> col_slice_segments;
+    std::vector<std::shared_ptr<ColRange>> col_ranges;
+    for (size_t col_slice = 0; col_slice < num_col_slices; ++col_slice) {
+        std::vector<SegmentInMemory> segments;
+        segments.reserve(row_slices.size());
+        for (const auto& row_slice: row_slices) {
+            internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+                    row_slice.segments_->size() == num_col_slices,
+                    "Expected {} column-slices in each row-slice in MergeSortedValuesClause, received {}",
+                    num_col_slices, row_slice.segments_->size());
+            segments.emplace_back(*row_slice.segments_->at(col_slice));
+        }
+        SegmentInMemory merged;
+        merged.descriptor().set_index(segments.front().descriptor().index());
+        merged.init_column_map();
+        merge_segments(segments, merged, processing_config_.dynamic_schema_);
+        const auto col_start = row_slices.front().col_ranges_->at(col_slice)->start();
+        col_ranges.emplace_back(std::make_shared<ColRange>(
+                col_start,
+                col_start + merged.descriptor().field_count() - merged.descriptor().index().field_count()));
+        col_slice_segments.emplace_back(std::move(merged));
+    }
+    std::vector<std::pair<size_t, size_t>> runs;
+    size_t num_rows{0};
+    for (const auto& row_slice: row_slices) {
+        const auto run_rows = row_slice.segments_->front()->row_count();
+        runs.emplace_back(num_rows, num_rows + run_rows);
+        num_rows += run_rows;
+    }
+    const auto num_output = std::min(num_rows, limit_.value_or(num_rows));
+    if (num_output == 0) {
+        return output;
+    }
+
+    ProcessingUnit merged;
+    std::vector<std::shared_ptr<SegmentInMemory>> merged_segments;
+    for (auto& segment: col_slice_segments) {
+        merged_segments.emplace_back(std::make_shared<SegmentInMemory>(std::move(segment)));
+    }
+    merged.set_segments(std::move(merged_segments));
+    merged.set_row_ranges(std::vector<std::shared_ptr<RowRange>>(num_col_slices, std::make_shared<RowRange>(0, num_output)));
+    merged.set_col_ranges(std::move(col_ranges));
+
+    // K-way merge of the runs, taking the next row from the run whose next row sorts first
+    std::vector<size_t> rows;
+    rows.reserve(num_output);
+    with_sort_values_comparator(merged, column_, ascending_, processing_config_.dynamic_schema_, [&](auto&& comes_before) {
+        const auto sorts_after = [&comes_before](const std::pair<size_t, size_t>& left, const std::pair<size_t, size_t>& right) {
+            return comes_before(right.first, left.first);
+        };
+        movable_priority_queue<std::pair<size_t, size_t>, std::vector<std::pair<size_t, size_t>>, decltype(sorts_after)> cursors{sorts_after};
+        for (const auto& run: runs) {
+            cursors.emplace(run);
+        }
+        while (rows.size() < num_output) {
+            auto [next, end] = cursors.pop_top();
+            rows.emplace_back(next);
+            if (++next < end) {
+                cursors.emplace(next, end);
+            }
+        }
+    });
+    output.push_back(push_entities(component_manager_, reorder_rows(std::move(merged), rows)));
+    return output;
+}
+
+[[nodiscard]] std::string MergeSortedValuesClause::to_string() const {
+    return sort_values_string("MERGE_SORTED_VALUES", column_, ascending_, limit_);
+}
+
 [[nodiscard]] Composite<EntityIds> RemoveColumnPartitioningClause::process(Composite<EntityIds>&& entity_ids) const {
     auto procs = gather_entities(component_manager_, std::move(entity_ids));
     Composite<EntityIds> output;
@@ -761,7 +1732,7 @@ Composite<EntityIds> ColumnStatsGenerationClause::process(Composite<EntityIds>&&
 
 std::vector<std::vector<size_t>> RowRangeClause::structure_for_processing(
         std::vector<RangesAndKey>& ranges_and_keys,
-        ARCTICDB_UNUSED size_t start_from) const {
+        ARCTICDB_UNUSED size_t start_from) {
     ranges_and_keys.erase(std::remove_if(ranges_and_keys.begin(), ranges_and_keys.end(), [this](const RangesAndKey& ranges_and_key) {
         return ranges_and_key.row_range_.start() >= end_ || ranges_and_key.row_range_.end() <= start_;
     }), ranges_and_keys.end());
@@ -847,7 +1818,7 @@ std::string RowRangeClause::to_string() const {
 
 std::vector<std::vector<size_t>> DateRangeClause::structure_for_processing(
         std::vector<RangesAndKey>& ranges_and_keys,
-        size_t start_from) const {
+        size_t start_from) {
     ranges_and_keys.erase(std::remove_if(ranges_and_keys.begin(), ranges_and_keys.end(), [this](const RangesAndKey& ranges_and_key) {
         auto [start_index, end_index] = ranges_and_key.key_.time_range();
         return start_index > end_ || end_index <= start_;
@@ -882,4 +1853,376 @@ std::string DateRangeClause::to_string() const {
     return fmt::format("DATE RANGE {} - {}", start_, end_);
 }
 
+namespace {
+// The values of the by column of an as-of join as strings, so that they can be compared between the two symbols.
+// Missing values, which match no rows, are std::nullopt
+template<typename GetValue>
+std::vector<std::optional<std::string>> as_of_join_keys(DataType data_type, size_t num_rows, GetValue&& get_value) {
+    std::vector<std::optional<std::string>> keys;
+    keys.reserve(num_rows);
+    details::visit_type(data_type, [&](auto tag) {
+        using type_info = ScalarTypeInfo<decltype(tag)>;
+        if constexpr (is_dynamic_string_type(type_info::data_type) || is_integer_type(type_info::data_type)) {
+            for (size_t row = 0; row < num_rows; ++row) {
+                keys.emplace_back(get_value(row, tag));
+            }
+        } else {
+            schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                    "As-of joins are only supported by dynamic string and integer columns, not {}", data_type);
+        }
+    });
+    return keys;
+}
+}
+
+AsOfJoinRightData::AsOfJoinRightData(
+        std::vector<std::vector<SegmentInMemory>>&& row_slices,
+        const std::vector<std::string>& column_names,
+        const std::optional<std::string>& by) :
+    row_slices_(std::move(row_slices)) {
+    column_locations_.resize(column_names.size());
+    for (auto&& [slice_idx, row_slice]: folly::enumerate(row_slices_)) {
+        internal::check<ErrorCode::E_ASSERTION_FAILURE>(!row_slice.empty(), "Unexpected empty row-slice in as-of join");
+        // Every column slice has the index column
+        const auto& index_segment = row_slice.front();
+        const auto num_rows = index_segment.row_count();
+        const auto first_row = index_.size();
+        Column::for_each<ScalarTagType<DataTypeTag<DataType::NANOSECONDS_UTC64>>>(index_segment.column(0), [this](timestamp ts) {
+            index_.emplace_back(ts);
+        });
+        for (size_t row = 0; row < num_rows; ++row) {
+            row_locations_.emplace_back(static_cast<uint32_t>(slice_idx), static_cast<uint32_t>(row));
+        }
+        for (auto&& [column_idx, column_name]: folly::enumerate(column_names)) {
+            auto& locations = column_locations_[column_idx];
+            locations.emplace_back(std::nullopt);
+            for (const auto& segment: row_slice) {
+                if (auto position = segment.column_index(column_name); position.has_value()) {
+                    locations.back() = std::make_pair(&segment, static_cast<position_t>(*position));
+                    break;
+                }
+            }
+        }
+        if (by.has_value()) {
+            auto by_segment = std::find_if(row_slice.begin(), row_slice.end(), [&by](const SegmentInMemory& segment) {
+                return segment.column_index(*by).has_value();
+            });
+            if (by_segment == row_slice.end()) {
+                // Missing with dynamic schema, so these rows cannot be joined
+                continue;
+            }
+            const auto by_position = static_cast<position_t>(*by_segment->column_index(*by));
+            const auto& by_column = by_segment->column(by_position);
+            auto keys = as_of_join_keys(by_column.type().data_type(), num_rows, [&](size_t row, auto tag) -> std::optional<std::string> {
+                using type_info = ScalarTypeInfo<decltype(tag)>;
+                if constexpr (is_sequence_type(type_info::data_type)) {
+                    auto str = by_segment->string_at(static_cast<position_t>(row), by_position);
+                    return str.has_value() ? std::make_optional<std::string>(*str) : std::nullopt;
+                } else {
+                    auto value = by_column.scalar_at<typename type_info::RawType>(static_cast<position_t>(row));
+                    return value.has_value() ? std::make_optional(fmt::format("{}", *value)) : std::nullopt;
+                }
+            });
+            for (size_t row = 0; row < num_rows; ++row) {
+                if (keys[row].has_value()) {
+                    rows_by_key_[*keys[row]].emplace_back(first_row + row);
+                }
+            }
+        }
+    }
+    sorting::check<ErrorCode::E_UNSORTED_DATA>(
+            std::is_sorted(index_.begin(), index_.end()),
+            "As-of joins require the right hand symbol to be sorted by its index");
+}
+
+std::optional<size_t> AsOfJoinRightData::prevailing_row(
+        timestamp ts,
+        const std::optional<std::string>& key,
+        std::optional<timestamp> tolerance) const {
+    std::optional<size_t> position;
+    if (key.has_value()) {
+        auto it = rows_by_key_.find(*key);
+        if (it == rows_by_key_.end()) {
+            return std::nullopt;
+        }
+        const auto& rows = it->second;
+        auto row = std::upper_bound(rows.begin(), rows.end(), ts, [this](timestamp value, size_t position) {
+            return value < index_[position];
+        });
+        if (row != rows.begin()) {
+            position = *std::prev(row);
+        }
+    } else {
+        auto row = std::upper_bound(index_.begin(), index_.end(), ts);
+        if (row != index_.begin()) {
+            position = static_cast<size_t>(std::distance(index_.begin(), row)) - 1;
+        }
+    }
+    if (position.has_value() && tolerance.has_value() && ts - index_[*position] > *tolerance) {
+        return std::nullopt;
+    }
+    return position;
+}
+
+std::optional<std::tuple<const SegmentInMemory*, position_t, position_t>> AsOfJoinRightData::value_location(
+        size_t column_idx,
+        size_t position) const {
+    const auto [slice_idx, row] = row_locations_[position];
+    const auto& location = column_locations_[column_idx][slice_idx];
+    if (!location.has_value()) {
+        return std::nullopt;
+    }
+    return std::make_tuple(location->first, location->second, static_cast<position_t>(row));
+}
+
+AsOfJoinRightSlices::AsOfJoinRightSlices(std::optional<std::string> by, std::optional<timestamp> tolerance) :
+        by_(std::move(by)),
+        tolerance_(tolerance) {
+}
+
+void AsOfJoinRightSlices::set_right_slices(
+        const std::vector<TimestampRange>& index_ranges,
+        std::vector<std::string> column_names,
+        Loader loader) {
+    column_names_ = std::move(column_names);
+    loader_ = std::move(loader);
+    right_slices_.clear();
+    for (auto&& [idx, index_range]: folly::enumerate(index_ranges)) {
+        sorting::check<ErrorCode::E_UNSORTED_DATA>(
+                idx == 0 || index_range.first >= index_ranges[idx - 1].second,
+                "As-of joins require the right hand symbol to be sorted by its index");
+        auto& right_slice = right_slices_.emplace_back(std::make_unique<RightSlice>());
+        right_slice->index_range_ = index_range;
+    }
+}
+
+std::vector<size_t> AsOfJoinRightSlices::right_slices_for(const TimestampRange& index_range) const {
+    const auto [start, end] = index_range;
+    size_t first = 0;
+    std::optional<timestamp> lower_bound;
+    if (tolerance_.has_value()) {
+        lower_bound = start > std::numeric_limits<timestamp>::min() + *tolerance_ ? start - *tolerance_ : std::numeric_limits<timestamp>::min();
+    } else if (!by_.has_value()) {
+        // The prevailing row of the first row is in the last row-slice starting at or before it
+        for (size_t idx = 0; idx < right_slices_.size() && right_slices_[idx]->index_range_.first <= start; ++idx)
+            first = idx;
+    }
+    std::vector<size_t> res;
+    for (size_t idx = first; idx < right_slices_.size() && right_slices_[idx]->index_range_.first <= end; ++idx) {
+        if (!lower_bound.has_value() || right_slices_[idx]->index_range_.second >= *lower_bound)
+            res.emplace_back(idx);
+    }
+    return res;
+}
+
+void AsOfJoinRightSlices::add_left_slice(size_t left_row_start, const TimestampRange& index_range) {
+    std::lock_guard lock(mutex_);
+    // Each column slice of a row-slice is added
+    auto [it, inserted] = left_slices_.try_emplace(left_row_start);
+    if (!inserted)
+        return;
+    it->second.index_range_ = index_range;
+    it->second.right_slices_ = right_slices_for(index_range);
+    for (auto idx: it->second.right_slices_)
+        ++right_slices_[idx]->remaining_uses_;
+}
+
+std::vector<std::shared_ptr<const AsOfJoinRightData>> AsOfJoinRightSlices::acquire(
+        size_t left_row_start,
+        const TimestampRange& index_range) {
+    std::vector<size_t> indexes;
+    bool recorded = false;
+    {
+        std::lock_guard lock(mutex_);
+        if (auto it = left_slices_.find(left_row_start); it != left_slices_.end() && !it->second.acquired_ &&
+                it->second.index_range_.first <= index_range.first && index_range.second <= it->second.index_range_.second) {
+            it->second.acquired_ = true;
+            indexes = it->second.right_slices_;
+            recorded = true;
+        }
+    }
+    if (!recorded)
+        indexes = right_slices_for(index_range);
+
+    std::vector<std::shared_ptr<const AsOfJoinRightData>> res;
+    res.reserve(indexes.size());
+    for (auto idx: indexes) {
+        auto& right_slice = *right_slices_[idx];
+        std::lock_guard lock(right_slice.mutex_);
+        auto data = right_slice.data_;
+        if (!data) {
+            std::vector<std::vector<SegmentInMemory>> row_slices;
+            row_slices.emplace_back(loader_(idx));
+            data = std::make_shared<const AsOfJoinRightData>(std::move(row_slices), column_names_, by_);
+            if (recorded)
+                right_slice.data_ = data;
+        }
+        res.emplace_back(std::move(data));
+    }
+    return res;
+}
+
+void AsOfJoinRightSlices::release(size_t left_row_start) {
+    std::vector<size_t> unused;
+    {
+        std::lock_guard lock(mutex_);
+        auto it = left_slices_.find(left_row_start);
+        if (it == left_slices_.end())
+            return;
+        for (auto idx: it->second.right_slices_) {
+            if (--right_slices_[idx]->remaining_uses_ == 0)
+                unused.emplace_back(idx);
+        }
+        left_slices_.erase(it);
+    }
+    for (auto idx: unused) {
+        auto& right_slice = *right_slices_[idx];
+        std::lock_guard lock(right_slice.mutex_);
+        right_slice.data_.reset();
+    }
+}
+
+AsOfJoinClause::AsOfJoinClause(std::optional<std::string> by, std::optional<timestamp> tolerance) :
+        by_(std::move(by)),
+        tolerance_(tolerance),
+        right_slices_(std::make_shared<AsOfJoinRightSlices>(by_, tolerance_)) {
+    clause_info_.modifies_output_descriptor_ = true;
+    if (by_.has_value()) {
+        clause_info_.input_columns_ = std::make_optional<std::unordered_set<std::string>>({*by_});
+    }
+}
+
+Composite<EntityIds> AsOfJoinClause::process(Composite<EntityIds>&& entity_ids) const {
+    auto procs = gather_entities(component_manager_, std::move(entity_ids));
+    Composite<EntityIds> output;
+    procs.broadcast([&output, this](ProcessingUnit& proc) {
+        const auto& index_segment = *proc.segments_->front();
+        schema::check<ErrorCode::E_UNSUPPORTED_INDEX_TYPE>(
+                index_segment.descriptor().index().type() == IndexDescriptor::TIMESTAMP,
+                "As-of joins are only supported on timestamp indexed data");
+        const auto num_rows = static_cast<size_t>(index_segment.row_count());
+        const auto left_row_start = proc.row_ranges_->front()->start();
+        if (num_rows == 0) {
+            right_slices_->release(left_row_start);
+            output.push_back(push_entities(component_manager_, std::move(proc)));
+            return;
+        }
+
+        std::vector<std::optional<std::string>> keys;
+        if (by_.has_value()) {
+            auto by_data = proc.get(ColumnName(*by_));
+            if (std::holds_alternative<ColumnWithStrings>(by_data)) {
+                const auto& by_column = std::get<ColumnWithStrings>(by_data);
+                keys = as_of_join_keys(by_column.column_->type().data_type(), num_rows, [&by_column](size_t row, auto tag) -> std::optional<std::string> {
+                    using type_info = ScalarTypeInfo<decltype(tag)>;
+                    if (static_cast<ssize_t>(row) > by_column.column_->last_row()) {
+                        return std::nullopt;
+                    }
+                    auto value = by_column.column_->scalar_at<typename type_info::RawType>(static_cast<position_t>(row));
+                    if (!value.has_value()) {
+                        return std::nullopt;
+                    }
+                    if constexpr (is_sequence_type(type_info::data_type)) {
+                        auto str = by_column.string_at_offset(static_cast<entity::position_t>(*value));
+                        return str.has_value() ? std::make_optional<std::string>(*str) : std::nullopt;
+                    } else {
+                        return fmt::format("{}", *value);
+                    }
+                });
+            } else {
+                // Missing with dynamic schema, so no rows can be joined
+                keys.resize(num_rows, std::nullopt);
+            }
+        }
+
+        const auto& index_column = index_segment.column(0);
+        const auto right_slices = right_slices_->acquire(
+                left_row_start,
+                {*index_column.scalar_at<timestamp>(0), *index_column.scalar_at<timestamp>(num_rows - 1)});
+
+        // The row-slice of the right hand symbol, and the row within it, joined to each row, if any
+        std::vector<std::optional<std::pair<const AsOfJoinRightData*, size_t>>> matches;
+        matches.reserve(num_rows);
+        Column::for_each<ScalarTagType<DataTypeTag<DataType::NANOSECONDS_UTC64>>>(index_column, [&](timestamp ts) {
+            const auto row = matches.size();
+            auto& match = matches.emplace_back(std::nullopt);
+            if (by_.has_value() && !keys[row].has_value())
+                return;
+            // The row-slices are in index order, so the prevailing row is in the last one holding a row at or before ts
+            for (auto right_slice = right_slices.rbegin(); right_slice != right_slices.rend(); ++right_slice) {
+                if (auto position = (*right_slice)->prevailing_row(ts, by_.has_value() ? keys[row] : std::nullopt, std::nullopt); position.has_value()) {
+                    if (!tolerance_.has_value() || ts - (*right_slice)->index_value(*position) <= *tolerance_)
+                        match = std::make_pair(right_slice->get(), *position);
+                    break;
+                }
+            }
+        });
+
+        auto& output_segment = *proc.segments_->back();
+        for (size_t column_idx = 0; column_idx < right_columns_.size(); ++column_idx) {
+            const auto& name = right_columns_[column_idx].first;
+            const auto data_type = right_columns_[column_idx].second;
+            auto output_column = std::make_shared<Column>(make_scalar_type(data_type), num_rows, true, false);
+            details::visit_type(data_type, [&](auto output_tag) {
+                using output_type_info = ScalarTypeInfo<decltype(output_tag)>;
+                using OutputType = typename output_type_info::RawType;
+                auto out = reinterpret_cast<OutputType*>(output_column->ptr());
+                for (size_t row = 0; row < num_rows; ++row) {
+                    std::optional<std::tuple<const SegmentInMemory*, position_t, position_t>> location;
+                    if (matches[row].has_value()) {
+                        const auto& [right_slice, position] = *matches[row];
+                        location = right_slice->value_location(column_idx, position);
+                    }
+                    if constexpr (is_dynamic_string_type(output_type_info::data_type)) {
+                        std::optional<std::string_view> str;
+                        if (location.has_value()) {
+                            const auto& [segment, position, right_row] = *location;
+                            str = segment->string_at(right_row, position);
+                        }
+                        out[row] = str.has_value() ? output_segment.string_pool().get(*str).offset() : not_a_string();
+                    } else if constexpr (is_time_type(output_type_info::data_type)) {
+                        std::optional<timestamp> value;
+                        if (location.has_value()) {
+                            const auto& [segment, position, right_row] = *location;
+                            value = segment->column(position).scalar_at<timestamp>(right_row);
+                        }
+                        out[row] = value.value_or(NaT);
+                    } else if constexpr (is_floating_point_type(output_type_info::data_type)) {
+                        std::optional<double> value;
+                        if (location.has_value()) {
+                            const auto& [segment, position, right_row] = *location;
+                            const auto& column = segment->column(position);
+                            details::visit_type(column.type().data_type(), [&](auto input_tag) {
+                                using input_type_info = ScalarTypeInfo<decltype(input_tag)>;
+                                if constexpr (is_numeric_type(input_type_info::data_type) || is_bool_type(input_type_info::data_type)) {
+                                    if (auto input_value = column.scalar_at<typename input_type_info::RawType>(right_row); input_value.has_value()) {
+                                        value = static_cast<double>(*input_value);
+                                    }
+                                } else if constexpr (!is_empty_type(input_type_info::data_type)) {
+                                    schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+                                            "Cannot join column {} of type {} as {}", name, column.type(), data_type);
+                                }
+                            });
+                        }
+                        out[row] = value.value_or(std::numeric_limits<double>::quiet_NaN());
+                    } else {
+                        internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unexpected as-of join output type {}", data_type);
+                    }
+                }
+            });
+            output_column->set_row_data(num_rows - 1);
+            output_segment.add_column(scalar_field(data_type, name), output_column);
+            ++proc.col_ranges_->back()->second;
+        }
+        right_slices_->release(left_row_start);
+        output.push_back(push_entities(component_manager_, std::move(proc)));
+    });
+    return output;
+}
+
+std::string AsOfJoinClause::to_string() const {
+    return fmt::format("ASOF JOIN{}{}", by_.has_value() ? fmt::format(" BY {}", *by_) : "",
+                       tolerance_.has_value() ? fmt::format(" TOLERANCE {}", *tolerance_) : "");
+}
+
 }
@@ -8,6 +8,7 @@
 #pragma once
 
 #include <arcticdb/entity/key.hpp>
+#include <arcticdb/entity/index_range.hpp>
 #include <arcticdb/column_store/column.hpp>
 #include <arcticdb/pipeline/frame_slice.hpp>
 #include <arcticdb/pipeline/value.hpp>
@@ -18,6 +19,7 @@
 #include <arcticdb/processing/aggregation_interface.hpp>
 #include <arcticdb/processing/processing_unit.hpp>
 #include <arcticdb/processing/grouper.hpp>
+#include <arcticdb/processing/window.hpp>
 #include <arcticdb/stream/aggregator.hpp>
 #include <arcticdb/util/movable_priority_queue.hpp>
 #include <arcticdb/stream/merge.hpp>
@@ -26,13 +28,17 @@
 
 #include <folly/Poly.h>
 #include <folly/futures/Future.h>
+#include <ankerl/unordered_dense.h>
 
 #include <vector>
 #include <unordered_map>
+#include <unordered_set>
 #include <string>
 #include <variant>
 #include <memory>
 #include <atomic>
+#include <functional>
+#include <mutex>
 
 namespace arcticdb {
 
@@ -73,7 +79,7 @@ struct IClause {
         // TODO #732: Factor out start_from as part of https://github.com/man-group/ArcticDB/issues/732
         [[nodiscard]] std::vector<std::vector<size_t>>
         structure_for_processing(std::vector<RangesAndKey>& ranges_and_keys,
-                                 size_t start_from) const {
+                                 size_t start_from) {
             return std::move(folly::poly_call<0>(*this, ranges_and_keys, start_from));
         }
 
@@ -96,6 +102,8 @@ struct IClause {
         void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
             folly::poly_call<5>(*this, component_manager);
         }
+
+        [[nodiscard]] std::string to_string() const { return folly::poly_call<6>(*this); }
     };
 
     template<class T>
@@ -105,7 +113,8 @@ struct IClause {
             &T::repartition,
             &T::clause_info,
             &T::set_processing_config,
-            &T::set_component_manager>;
+            &T::set_component_manager,
+            &T::to_string>;
 };
 
 using Clause = folly::Poly<IClause>;
@@ -128,7 +137,7 @@ struct PassthroughClause {
 
     [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
             std::vector<RangesAndKey>& ranges_and_keys,
-            size_t start_from) const {
+            size_t start_from) {
         return structure_by_row_slice(ranges_and_keys, start_from);
     }
 
@@ -148,6 +157,10 @@ struct PassthroughClause {
     void set_processing_config(ARCTICDB_UNUSED const ProcessingConfig&) {}
 
     void set_component_manager(ARCTICDB_UNUSED std::shared_ptr<ComponentManager>) {}
+
+    [[nodiscard]] std::string to_string() const {
+        return "PASSTHROUGH";
+    }
 };
 
 struct FilterClause {
@@ -170,7 +183,7 @@ struct FilterClause {
 
     [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
             std::vector<RangesAndKey>& ranges_and_keys,
-            size_t start_from) const {
+            size_t start_from) {
         return structure_by_row_slice(ranges_and_keys, start_from);
     }
 
@@ -200,6 +213,12 @@ struct FilterClause {
     void set_pipeline_optimisation(PipelineOptimisation pipeline_optimisation) {
         optimisation_ = pipeline_optimisation;
     }
+
+    // A BitSet, EmptyResult, or FullResult, depending on which rows of proc pass the filter
+    [[nodiscard]] VariantData evaluate(ProcessingUnit& proc) const;
+
+    // Whether any rows of proc pass the filter. proc only needs to hold the segments with the input columns.
+    [[nodiscard]] bool has_matching_rows(ProcessingUnit& proc) const;
 };
 
 struct ProjectClause {
@@ -223,7 +242,7 @@ struct ProjectClause {
 
     [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
             std::vector<RangesAndKey>& ranges_and_keys,
-            size_t start_from) const {
+            size_t start_from) {
         return structure_by_row_slice(ranges_and_keys, start_from);
     }
 
@@ -250,12 +269,32 @@ struct ProjectClause {
     [[nodiscard]] std::string to_string() const;
 };
 
+struct NamedAggregator {
+    std::string aggregation_operator_;
+    std::string input_column_name_;
+    std::string output_column_name_;
+};
+
+/*
+ * Reduces the rows of a row-slice to one row per group, with the columns holding the partial state of each of the
+ * aggregations, which an AggregationClause in partial aggregation mode merges into the final aggregates.
+ * Returns the input unchanged if the grouping column is missing from, or empty in, the row-slice, and std::nullopt if
+ * none of its rows have a grouping value.
+ */
+std::optional<ProcessingUnit> partially_aggregate(ProcessingUnit&& proc,
+                                                  const std::string& grouping_column,
+                                                  const std::vector<NamedAggregator>& named_aggregators,
+                                                  bool dynamic_schema);
+
 template<typename GrouperType, typename BucketizerType>
 struct PartitionClause {
     ClauseInfo clause_info_;
     std::shared_ptr<ComponentManager> component_manager_;
     ProcessingConfig processing_config_;
     std::string grouping_column_;
+    // Set when the following AggregationClause merges partial aggregates, so that only one row per group from each
+    // row-slice is repartitioned, rather than every row
+    std::optional<std::vector<NamedAggregator>> partial_aggregations_;
 
     explicit PartitionClause(const std::string& grouping_column) :
             processing_config_(),
@@ -270,7 +309,7 @@ struct PartitionClause {
 
     [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
             std::vector<RangesAndKey>& ranges_and_keys,
-            size_t start_from) const {
+            size_t start_from) {
         return structure_by_row_slice(ranges_and_keys, start_from);
     }
 
@@ -278,6 +317,16 @@ struct PartitionClause {
         auto procs = gather_entities(component_manager_, std::move(entity_ids));
         Composite<EntityIds> output;
         procs.broadcast([&output, this](auto &proc) {
+            if (partial_aggregations_.has_value()) {
+                auto partially_aggregated = partially_aggregate(std::move(proc),
+                                                                grouping_column_,
+                                                                *partial_aggregations_,
+                                                                processing_config_.dynamic_schema_);
+                if (!partially_aggregated.has_value()) {
+                    return;
+                }
+                proc = std::move(*partially_aggregated);
+            }
             Composite<ProcessingUnit> partitioned_proc = partition_processing_segment<GrouperType, BucketizerType>(proc,
                                                                                                                    ColumnName(grouping_column_),
                                                                                                                    processing_config_.dynamic_schema_);
@@ -339,6 +388,10 @@ struct PartitionClause {
         component_manager_ = component_manager;
     }
 
+    void set_partial_aggregations(const std::vector<NamedAggregator>& named_aggregators) {
+        partial_aggregations_ = named_aggregators;
+    }
+
     [[nodiscard]] std::string to_string() const {
         return fmt::format("GROUPBY Column[\"{}\"]", grouping_column_);
     }
@@ -350,18 +403,15 @@ inline StreamDescriptor empty_descriptor(arcticdb::proto::descriptors::IndexDesc
     return StreamDescriptor{StreamId{id}, IndexDescriptor{field_count, type}, std::make_shared<FieldCollection>()};
 }
 
-struct NamedAggregator {
-    std::string aggregation_operator_;
-    std::string input_column_name_;
-    std::string output_column_name_;
-};
-
 struct AggregationClause {
     ClauseInfo clause_info_;
     std::shared_ptr<ComponentManager> component_manager_;
     ProcessingConfig processing_config_;
     std::string grouping_column_;
+    std::vector<NamedAggregator> named_aggregators_;
     std::vector<GroupingAggregator> aggregators_;
+    // Whether the input has been reduced by partially_aggregate, in which case aggregators_ merge the partial aggregates
+    bool merge_partial_aggregates_{false};
     std::string str_;
 
     AggregationClause() = delete;
@@ -373,7 +423,7 @@ struct AggregationClause {
 
     [[noreturn]] std::vector<std::vector<size_t>> structure_for_processing(
             ARCTICDB_UNUSED const std::vector<RangesAndKey>&,
-            ARCTICDB_UNUSED size_t) const {
+            ARCTICDB_UNUSED size_t) {
         internal::raise<ErrorCode::E_ASSERTION_FAILURE>(
                 "AggregationClause::structure_for_processing should never be called"
                 );
@@ -399,6 +449,203 @@ struct AggregationClause {
         component_manager_ = component_manager;
     }
 
+    // Whether all of the aggregations can be computed by merging partial aggregates of each row-slice
+    [[nodiscard]] bool supports_partial_aggregation() const;
+
+    void set_merge_partial_aggregates();
+
+    [[nodiscard]] std::string to_string() const;
+};
+
+// Aggregates rows into fixed-width time buckets, aligned to the Unix epoch, closed and labelled on the left.
+// Row-slices are processed in parallel. A bucket that straddles a row-slice boundary is owned by the processing unit
+// of the row-slice in which it starts, and that processing unit also contains the following row-slices it spills into.
+struct ResampleClause {
+    ClauseInfo clause_info_;
+    std::shared_ptr<ComponentManager> component_manager_;
+    ProcessingConfig processing_config_;
+    std::string rule_;
+    timestamp bucket_size_;
+    // Inclusive of start and end, populated when a date range is requested alongside the resampling
+    std::optional<std::pair<timestamp, timestamp>> date_range_;
+    std::vector<GroupingAggregator> aggregators_;
+    std::string str_;
+    // Row-slice starts whose first bucket began in the preceding row-slice, populated by structure_for_processing
+    std::unordered_set<size_t> continuing_row_slices_;
+
+    ResampleClause() = delete;
+
+    ARCTICDB_MOVE_COPY_DEFAULT(ResampleClause)
+
+    ResampleClause(std::string rule, timestamp bucket_size);
+
+    [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
+            std::vector<RangesAndKey>& ranges_and_keys,
+            size_t start_from);
+
+    [[nodiscard]] Composite<EntityIds> process(Composite<EntityIds>&& entity_ids) const;
+
+    [[nodiscard]] std::optional<std::vector<Composite<EntityIds>>> repartition(
+            ARCTICDB_UNUSED std::vector<Composite<EntityIds>>&&) const {
+        return std::nullopt;
+    }
+
+    [[nodiscard]] const ClauseInfo& clause_info() const {
+        return clause_info_;
+    }
+
+    void set_processing_config(const ProcessingConfig& processing_config) {
+        processing_config_ = processing_config;
+    }
+
+    void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
+        component_manager_ = component_manager;
+    }
+
+    void set_aggregations(const std::vector<NamedAggregator>& named_aggregators);
+
+    void set_date_range(timestamp start, timestamp end);
+
+    [[nodiscard]] timestamp bucket_start(timestamp ts) const;
+
+    [[nodiscard]] std::string to_string() const;
+};
+
+// Aggregates each row together with the rows preceding it, in either a rolling window of a fixed number of rows or of a
+// fixed duration, or an expanding window of every row so far, outputting one row per input row.
+// Rolling windows process row-slices in parallel, with each processing unit owning the output for its last row-slice,
+// and also containing the preceding row-slices needed to fill the windows of its first rows. Expanding windows process
+// every row-slice in order in a single processing unit.
+struct WindowClause {
+    ClauseInfo clause_info_;
+    std::shared_ptr<ComponentManager> component_manager_;
+    ProcessingConfig processing_config_;
+    std::string window_;
+    WindowSpec window_spec_;
+    // Inclusive of start and end, populated when a date range is requested alongside the windowing
+    std::optional<std::pair<timestamp, timestamp>> date_range_;
+    std::vector<std::pair<NamedAggregator, WindowOperator>> aggregators_;
+    std::string str_;
+
+    WindowClause() = delete;
+
+    ARCTICDB_MOVE_COPY_DEFAULT(WindowClause)
+
+    WindowClause(std::string window, WindowSpec::Type type, int64_t size, size_t min_periods);
+
+    [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
+            std::vector<RangesAndKey>& ranges_and_keys,
+            size_t start_from);
+
+    [[nodiscard]] Composite<EntityIds> process(Composite<EntityIds>&& entity_ids) const;
+
+    [[nodiscard]] std::optional<std::vector<Composite<EntityIds>>> repartition(
+            ARCTICDB_UNUSED std::vector<Composite<EntityIds>>&&) const {
+        return std::nullopt;
+    }
+
+    [[nodiscard]] const ClauseInfo& clause_info() const {
+        return clause_info_;
+    }
+
+    void set_processing_config(const ProcessingConfig& processing_config) {
+        processing_config_ = processing_config;
+    }
+
+    void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
+        component_manager_ = component_manager;
+    }
+
+    void set_aggregations(const std::vector<NamedAggregator>& named_aggregators);
+
+    void set_date_range(timestamp start, timestamp end);
+
+    [[nodiscard]] std::string to_string() const;
+};
+
+// Sorts each row-slice by a column, keeping only its first limit_ rows if a limit is given, so that only these rows
+// are repartitioned into the MergeSortedValuesClause that must follow it
+struct SortValuesClause {
+    ClauseInfo clause_info_;
+    std::shared_ptr<ComponentManager> component_manager_;
+    ProcessingConfig processing_config_;
+    std::string column_;
+    bool ascending_;
+    std::optional<size_t> limit_;
+
+    SortValuesClause() = delete;
+
+    ARCTICDB_MOVE_COPY_DEFAULT(SortValuesClause)
+
+    SortValuesClause(std::string column, bool ascending, std::optional<size_t> limit);
+
+    [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
+            std::vector<RangesAndKey>& ranges_and_keys,
+            size_t start_from) {
+        return structure_by_row_slice(ranges_and_keys, start_from);
+    }
+
+    [[nodiscard]] Composite<EntityIds> process(Composite<EntityIds>&& entity_ids) const;
+
+    [[nodiscard]] std::optional<std::vector<Composite<EntityIds>>> repartition(
+            std::vector<Composite<EntityIds>>&& entity_ids) const;
+
+    [[nodiscard]] const ClauseInfo& clause_info() const {
+        return clause_info_;
+    }
+
+    void set_processing_config(const ProcessingConfig& processing_config) {
+        processing_config_ = processing_config;
+    }
+
+    void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
+        component_manager_ = component_manager;
+    }
+
+    [[nodiscard]] std::string to_string() const;
+};
+
+// Merges the row-slices sorted by a SortValuesClause into a single sorted segment per column-slice, stopping after
+// limit_ rows if a limit is given
+struct MergeSortedValuesClause {
+    ClauseInfo clause_info_;
+    std::shared_ptr<ComponentManager> component_manager_;
+    ProcessingConfig processing_config_;
+    std::string column_;
+    bool ascending_;
+    std::optional<size_t> limit_;
+
+    MergeSortedValuesClause() = delete;
+
+    ARCTICDB_MOVE_COPY_DEFAULT(MergeSortedValuesClause)
+
+    MergeSortedValuesClause(std::string column, bool ascending, std::optional<size_t> limit);
+
+    [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
+            std::vector<RangesAndKey>& ranges_and_keys,
+            size_t start_from) {
+        return structure_by_row_slice(ranges_and_keys, start_from);
+    }
+
+    [[nodiscard]] Composite<EntityIds> process(Composite<EntityIds>&& entity_ids) const;
+
+    [[nodiscard]] std::optional<std::vector<Composite<EntityIds>>> repartition(
+            ARCTICDB_UNUSED std::vector<Composite<EntityIds>>&&) const {
+        return std::nullopt;
+    }
+
+    [[nodiscard]] const ClauseInfo& clause_info() const {
+        return clause_info_;
+    }
+
+    void set_processing_config(const ProcessingConfig& processing_config) {
+        processing_config_ = processing_config;
+    }
+
+    void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
+        component_manager_ = component_manager;
+    }
+
     [[nodiscard]] std::string to_string() const;
 };
 
@@ -414,7 +661,7 @@ struct RemoveColumnPartitioningClause {
 
     [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
             std::vector<RangesAndKey>& ranges_and_keys,
-            size_t start_from) const {
+            size_t start_from) {
         return structure_by_row_slice(ranges_and_keys, start_from);
     }
 
@@ -435,6 +682,10 @@ struct RemoveColumnPartitioningClause {
     void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
         component_manager_ = component_manager;
     }
+
+    [[nodiscard]] std::string to_string() const {
+        return "REMOVE_COLUMN_PARTITIONING";
+    }
 };
 
 struct SplitClause {
@@ -448,7 +699,7 @@ struct SplitClause {
 
     [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
             std::vector<RangesAndKey>& ranges_and_keys,
-            size_t start_from) const {
+            size_t start_from) {
         return structure_by_row_slice(ranges_and_keys, start_from);
     }
 
@@ -468,6 +719,10 @@ struct SplitClause {
     void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
         component_manager_ = component_manager;
     }
+
+    [[nodiscard]] std::string to_string() const {
+        return "SPLIT";
+    }
 };
 
 struct SortClause {
@@ -481,7 +736,7 @@ struct SortClause {
 
     [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
             std::vector<RangesAndKey>& ranges_and_keys,
-            size_t start_from) const {
+            size_t start_from) {
         return structure_by_row_slice(ranges_and_keys, start_from);
     }
 
@@ -501,6 +756,10 @@ struct SortClause {
     void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
         component_manager_ = component_manager;
     }
+
+    [[nodiscard]] std::string to_string() const {
+        return fmt::format("SORT Column[\"{}\"]", column_);
+    }
 };
 
 struct MergeClause {
@@ -527,7 +786,7 @@ struct MergeClause {
 
     [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
             std::vector<RangesAndKey>& ranges_and_keys,
-            size_t start_from) const {
+            size_t start_from) {
         return structure_by_row_slice(ranges_and_keys, start_from);
     }
 
@@ -546,6 +805,10 @@ struct MergeClause {
     void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
         component_manager_ = component_manager;
     }
+
+    [[nodiscard]] std::string to_string() const {
+        return "MERGE";
+    }
 };
 
 struct ColumnStatsGenerationClause {
@@ -568,7 +831,7 @@ struct ColumnStatsGenerationClause {
 
     [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
             std::vector<RangesAndKey>& ranges_and_keys,
-            size_t start_from) const {
+            size_t start_from) {
         return structure_by_row_slice(ranges_and_keys, start_from);
     }
 
@@ -590,6 +853,10 @@ struct ColumnStatsGenerationClause {
     void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
         component_manager_ = component_manager;
     }
+
+    [[nodiscard]] std::string to_string() const {
+        return "COLUMN_STATS_GENERATION";
+    }
 };
 
 // Used by head and tail to discard rows not requested by the user
@@ -636,7 +903,7 @@ struct RowRangeClause {
 
     [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
             std::vector<RangesAndKey>& ranges_and_keys,
-            ARCTICDB_UNUSED size_t start_from) const;
+            ARCTICDB_UNUSED size_t start_from);
 
     [[nodiscard]] Composite<EntityIds> process(Composite<EntityIds>&& entity_ids) const;
 
@@ -677,7 +944,7 @@ struct DateRangeClause {
 
     [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
             std::vector<RangesAndKey>& ranges_and_keys,
-            size_t start_from) const;
+            size_t start_from);
 
     [[nodiscard]] Composite<EntityIds> process(Composite<EntityIds>&& entity_ids) const;
 
@@ -708,4 +975,164 @@ struct DateRangeClause {
     [[nodiscard]] std::string to_string() const;
 };
 
+/*
+ * Rows of the right hand symbol of an as-of join, indexed for finding the prevailing row of each left hand row. Each
+ * row-slice holds the column slices read for it, and the row-slices are in index order.
+ */
+class AsOfJoinRightData {
+public:
+    AsOfJoinRightData() = default;
+
+    AsOfJoinRightData(std::vector<std::vector<SegmentInMemory>>&& row_slices,
+                      const std::vector<std::string>& column_names,
+                      const std::optional<std::string>& by);
+
+    ARCTICDB_MOVE_ONLY_DEFAULT(AsOfJoinRightData)
+
+    /*
+     * The position of the last row with an index value at or before ts, and within tolerance of it if specified. If key
+     * is provided, only rows whose value in the by column is equal to key are considered.
+     */
+    [[nodiscard]] std::optional<size_t> prevailing_row(
+            timestamp ts,
+            const std::optional<std::string>& key,
+            std::optional<timestamp> tolerance) const;
+
+    // The segment, column, and row holding the value of the column_idx'th joined column for the row at position, if the
+    // row-slice holding the row has the column
+    [[nodiscard]] std::optional<std::tuple<const SegmentInMemory*, position_t, position_t>> value_location(
+            size_t column_idx,
+            size_t position) const;
+
+    [[nodiscard]] timestamp index_value(size_t position) const {
+        return index_[position];
+    }
+
+private:
+    std::vector<std::vector<SegmentInMemory>> row_slices_;
+    std::vector<timestamp> index_;
+    // The row-slice, and the row within it, of each entry in index_
+    std::vector<std::pair<uint32_t, uint32_t>> row_locations_;
+    // For each joined column, the segment holding it in each row-slice and its position there, if present
+    std::vector<std::vector<std::optional<std::pair<const SegmentInMemory*, position_t>>>> column_locations_;
+    // The positions in index_ of the rows with each value of the by column, in index order
+    ankerl::unordered_dense::map<std::string, std::vector<size_t>> rows_by_key_;
+};
+
+/*
+ * The row-slices of the right hand symbol of an as-of join. Each row-slice is read when the first left hand row-slice
+ * that can be joined to it is processed, and released once every left hand row-slice that can be joined to it has been,
+ * so only the right hand rows that the left hand row-slices being processed can be joined to are held in memory. With a
+ * by column and no tolerance, a left hand row-slice can be joined to any earlier right hand row-slice, so these are
+ * held until the left hand row-slices after them have been processed.
+ */
+class AsOfJoinRightSlices {
+public:
+    // Reads the column slices of the idx'th row-slice
+    using Loader = std::function<std::vector<SegmentInMemory>(size_t idx)>;
+
+    AsOfJoinRightSlices(std::optional<std::string> by, std::optional<timestamp> tolerance);
+
+    ARCTICDB_NO_MOVE_OR_COPY(AsOfJoinRightSlices)
+
+    // The first and last index values of each row-slice, in index order
+    void set_right_slices(
+            const std::vector<TimestampRange>& index_ranges,
+            std::vector<std::string> column_names,
+            Loader loader);
+
+    // Records that the left hand row-slice starting at left_row_start, with index values in index_range, will be joined
+    void add_left_slice(size_t left_row_start, const TimestampRange& index_range);
+
+    /*
+     * The row-slices that the rows of the left hand row-slice starting at left_row_start, with index values in
+     * index_range, can be joined to, in index order. Row-slices needed by a left hand row-slice that was not recorded
+     * with add_left_slice, such as one produced by an earlier clause, are read for it alone.
+     */
+    [[nodiscard]] std::vector<std::shared_ptr<const AsOfJoinRightData>> acquire(
+            size_t left_row_start,
+            const TimestampRange& index_range);
+
+    // Releases the row-slices no left hand row-slice still to be processed can be joined to
+    void release(size_t left_row_start);
+
+private:
+    struct RightSlice {
+        TimestampRange index_range_;
+        std::mutex mutex_;
+        std::shared_ptr<const AsOfJoinRightData> data_;
+        // The number of recorded left hand row-slices still to be processed that can be joined to this row-slice
+        size_t remaining_uses_ = 0;
+    };
+
+    struct LeftSlice {
+        TimestampRange index_range_;
+        std::vector<size_t> right_slices_;
+        bool acquired_ = false;
+    };
+
+    [[nodiscard]] std::vector<size_t> right_slices_for(const TimestampRange& index_range) const;
+
+    std::optional<std::string> by_;
+    std::optional<timestamp> tolerance_;
+    std::vector<std::string> column_names_;
+    Loader loader_;
+    std::vector<std::unique_ptr<RightSlice>> right_slices_;
+    // Guards left_slices_ and the remaining uses of the right hand row-slices
+    std::mutex mutex_;
+    ankerl::unordered_dense::map<size_t, LeftSlice> left_slices_;
+};
+
+/*
+ * Joins each row of a timestamp indexed symbol to the last row at or before it of another timestamp indexed symbol, in
+ * the same way as pd.merge_asof with direction="backward". The columns of the right hand symbol are added to each
+ * row-slice of the left hand symbol. As rows may have no match, numeric and bool columns are joined as float64 columns
+ * holding NaN for unmatched rows, timestamps hold NaT, and strings hold None.
+ *
+ * Only constructed by read_asof_join_impl, which sets up right_slices_ before the clause is processed.
+ */
+struct AsOfJoinClause {
+    ClauseInfo clause_info_;
+    std::shared_ptr<ComponentManager> component_manager_;
+    ProcessingConfig processing_config_;
+    std::optional<std::string> by_;
+    std::optional<timestamp> tolerance_;
+    // The names of the columns joined from the right hand symbol, and the types they are output as
+    std::vector<std::pair<std::string, DataType>> right_columns_;
+    std::shared_ptr<AsOfJoinRightSlices> right_slices_;
+
+    AsOfJoinClause() = delete;
+
+    ARCTICDB_MOVE_COPY_DEFAULT(AsOfJoinClause)
+
+    AsOfJoinClause(std::optional<std::string> by, std::optional<timestamp> tolerance);
+
+    [[nodiscard]] std::vector<std::vector<size_t>> structure_for_processing(
+            std::vector<RangesAndKey>& ranges_and_keys,
+            size_t start_from) {
+        return structure_by_row_slice(ranges_and_keys, start_from);
+    }
+
+    [[nodiscard]] Composite<EntityIds> process(Composite<EntityIds>&& entity_ids) const;
+
+    [[nodiscard]] std::optional<std::vector<Composite<EntityIds>>> repartition(
+            ARCTICDB_UNUSED std::vector<Composite<EntityIds>>&&) const {
+        return std::nullopt;
+    }
+
+    [[nodiscard]] const ClauseInfo& clause_info() const {
+        return clause_info_;
+    }
+
+    void set_processing_config(const ProcessingConfig& processing_config) {
+        processing_config_ = processing_config;
+    }
+
+    void set_component_manager(std::shared_ptr<ComponentManager> component_manager) {
+        component_manager_ = component_manager;
+    }
+
+    [[nodiscard]] std::string to_string() const;
+};
+
 }//namespace arcticdb
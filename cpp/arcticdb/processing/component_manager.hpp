@@ -66,6 +66,24 @@ public:
         }
     }
 
+    // Unlike get, does not count towards the expected number of gets, and returns std::nullopt if there is no component
+    template<typename T>
+    std::optional<T> peek(EntityId id) {
+        if constexpr(std::is_same_v<T, std::shared_ptr<SegmentInMemory>>) {
+            return segment_map_.peek(id);
+        } else if constexpr(std::is_same_v<T, std::shared_ptr<RowRange>>) {
+            return row_range_map_.peek(id);
+        } else if constexpr(std::is_same_v<T, std::shared_ptr<ColRange>>) {
+            return col_range_map_.peek(id);
+        } else if constexpr(std::is_same_v<T, std::shared_ptr<AtomKey>>) {
+            return atom_key_map_.peek(id);
+        } else if constexpr(std::is_same_v<T, bucket_id>) {
+            return bucket_map_.peek(id);
+        } else {
+            static_assert(sizeof(T) == 0, "Unsupported component type passed to ComponentManager::peek");
+        }
+    }
+
 private:
     template<typename T>
     class ComponentMap {
@@ -114,6 +132,11 @@ private:
             }
             return res;
         }
+        std::optional<T> peek(EntityId id) {
+            std::lock_guard <std::mutex> lock(mtx_);
+            auto entity_it = map_.find(id);
+            return entity_it == map_.end() ? std::nullopt : std::make_optional<T>(entity_it->second);
+        }
     private:
         // Just used for logging/exception messages
         std::string entity_type_;
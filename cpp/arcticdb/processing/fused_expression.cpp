@@ -0,0 +1,479 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/processing/fused_expression.hpp>
+#include <arcticdb/processing/processing_unit.hpp>
+#include <arcticdb/processing/operation_dispatch.hpp>
+#include <arcticdb/column_store/column.hpp>
+#include <arcticdb/entity/type_utils.hpp>
+#include <arcticdb/entity/type_conversion.hpp>
+#include <arcticdb/util/configs_map.hpp>
+#include <arcticdb/util/variant.hpp>
+
+#include <algorithm>
+#include <cstring>
+#include <unordered_map>
+
+namespace arcticdb {
+
+namespace {
+
+using FusedKernel = std::function<void(std::vector<FusedStep>&, size_t, size_t)>;
+
+// A contiguous block of rows of an input column
+struct ColumnBlock {
+    const uint8_t* data_;
+    size_t start_row_;
+    size_t row_count_;
+};
+
+template<typename RawType>
+RawType* output_block(FusedStep& step, size_t start) {
+    return step.output_ != nullptr ? reinterpret_cast<RawType*>(step.output_) + start : reinterpret_cast<RawType*>(step.scratch_.data());
+}
+
+template<typename RawType>
+FusedStep operation_step(bool is_bitset, FusedKernel&& kernel) {
+    FusedStep step;
+    step.data_type_ = data_type_from_raw_type<RawType>();
+    step.is_bitset_ = is_bitset;
+    step.is_operation_ = true;
+    step.scratch_.resize(FusedExpression::FUSED_BLOCK_ROWS * sizeof(RawType));
+    step.kernel_ = std::move(kernel);
+    return step;
+}
+
+template<typename RawType>
+void read_column_block(FusedStep& step, const std::vector<ColumnBlock>& blocks, size_t start, size_t rows) {
+    auto block = std::prev(std::upper_bound(blocks.begin(), blocks.end(), start, [](size_t row, const ColumnBlock& column_block) {
+        return row < column_block.start_row_;
+    }));
+    // Rows are usually read in place, and only copied if they span blocks of the column
+    if (start + rows <= block->start_row_ + block->row_count_) {
+        step.block_data_ = block->data_ + (start - block->start_row_) * sizeof(RawType);
+        return;
+    }
+    auto out = reinterpret_cast<RawType*>(step.scratch_.data());
+    for (size_t copied = 0; copied < rows; ++block) {
+        const auto offset = start + copied - block->start_row_;
+        const auto count = std::min(rows - copied, block->row_count_ - offset);
+        std::memcpy(out + copied, block->data_ + offset * sizeof(RawType), count * sizeof(RawType));
+        copied += count;
+    }
+    step.block_data_ = step.scratch_.data();
+}
+
+template<typename Func>
+std::optional<FusedStep> arithmetic_step(DataType left_type, DataType right_type, size_t left, size_t right, size_t self) {
+    std::optional<FusedStep> res;
+    details::visit_type(left_type, [&](auto left_tag) {
+        using left_type_info = ScalarTypeInfo<decltype(left_tag)>;
+        details::visit_type(right_type, [&](auto right_tag) {
+            using right_type_info = ScalarTypeInfo<decltype(right_tag)>;
+            if constexpr(is_numeric_type(left_type_info::data_type) && is_numeric_type(right_type_info::data_type)) {
+                using LeftType = typename left_type_info::RawType;
+                using RightType = typename right_type_info::RawType;
+                using TargetType = typename type_arithmetic_promoted_type<LeftType, RightType, Func>::type;
+                res = operation_step<TargetType>(false, [left, right, self](std::vector<FusedStep>& steps, size_t start, size_t rows) {
+                    const auto left_data = reinterpret_cast<const LeftType*>(steps[left].block_data_);
+                    const auto right_data = reinterpret_cast<const RightType*>(steps[right].block_data_);
+                    auto out = output_block<TargetType>(steps[self], start);
+                    Func func;
+                    for (size_t idx = 0; idx < rows; ++idx) {
+                        out[idx] = func.apply(left_data[idx], right_data[idx]);
+                    }
+                    steps[self].block_data_ = reinterpret_cast<const uint8_t*>(out);
+                });
+            }
+        });
+    });
+    return res;
+}
+
+template<typename Func>
+std::optional<FusedStep> unary_arithmetic_step(DataType input_type, size_t input, size_t self) {
+    std::optional<FusedStep> res;
+    details::visit_type(input_type, [&](auto input_tag) {
+        using input_type_info = ScalarTypeInfo<decltype(input_tag)>;
+        if constexpr(is_numeric_type(input_type_info::data_type)) {
+            using InputType = typename input_type_info::RawType;
+            using TargetType = typename unary_arithmetic_promoted_type<InputType, Func>::type;
+            res = operation_step<TargetType>(false, [input, self](std::vector<FusedStep>& steps, size_t start, size_t rows) {
+                const auto input_data = reinterpret_cast<const InputType*>(steps[input].block_data_);
+                auto out = output_block<TargetType>(steps[self], start);
+                Func func;
+                for (size_t idx = 0; idx < rows; ++idx) {
+                    out[idx] = func.apply(input_data[idx]);
+                }
+                steps[self].block_data_ = reinterpret_cast<const uint8_t*>(out);
+            });
+        }
+    });
+    return res;
+}
+
+bool is_comparison_operation(OperationType operation) {
+    return operation >= OperationType::EQ && operation <= OperationType::GE;
+}
+
+// Which operand of a comparison, if any, is a value. Node by node evaluation casts the operands differently in each case
+enum class ComparisonOperands {
+    COLUMNS,
+    VALUE_ON_LEFT,
+    VALUE_ON_RIGHT
+};
+
+template<typename Func, ComparisonOperands operands>
+std::optional<FusedStep> comparison_step(DataType left_type, DataType right_type, size_t left, size_t right, size_t self) {
+    std::optional<FusedStep> res;
+    details::visit_type(left_type, [&](auto left_tag) {
+        using left_type_info = ScalarTypeInfo<decltype(left_tag)>;
+        details::visit_type(right_type, [&](auto right_tag) {
+            using right_type_info = ScalarTypeInfo<decltype(right_tag)>;
+            if constexpr((is_numeric_type(left_type_info::data_type) && is_numeric_type(right_type_info::data_type)) ||
+                         (is_bool_type(left_type_info::data_type) && is_bool_type(right_type_info::data_type))) {
+                using LeftType = typename left_type_info::RawType;
+                using RightType = typename right_type_info::RawType;
+                using comp = std::conditional_t<operands == ComparisonOperands::COLUMNS,
+                                                typename arcticdb::Comparable<LeftType, RightType>,
+                                                typename arcticdb::Comparable<RightType, LeftType>>;
+                using LeftCastType = std::conditional_t<operands == ComparisonOperands::VALUE_ON_RIGHT, typename comp::right_type, typename comp::left_type>;
+                using RightCastType = std::conditional_t<operands == ComparisonOperands::VALUE_ON_RIGHT, typename comp::left_type, typename comp::right_type>;
+                res = operation_step<bool>(true, [left, right, self](std::vector<FusedStep>& steps, size_t start, size_t rows) {
+                    const auto left_data = reinterpret_cast<const LeftType*>(steps[left].block_data_);
+                    const auto right_data = reinterpret_cast<const RightType*>(steps[right].block_data_);
+                    auto out = output_block<bool>(steps[self], start);
+                    const Func func;
+                    for (size_t idx = 0; idx < rows; ++idx) {
+                        out[idx] = func(static_cast<LeftCastType>(left_data[idx]), static_cast<RightCastType>(right_data[idx]));
+                    }
+                    steps[self].block_data_ = reinterpret_cast<const uint8_t*>(out);
+                });
+            }
+        });
+    });
+    return res;
+}
+
+template<typename Func>
+FusedStep boolean_step(size_t left, std::optional<size_t> right, size_t self) {
+    return operation_step<bool>(true, [left, right, self](std::vector<FusedStep>& steps, size_t start, size_t rows) {
+        const auto left_data = reinterpret_cast<const bool*>(steps[left].block_data_);
+        auto out = output_block<bool>(steps[self], start);
+        const Func func;
+        if constexpr(std::is_invocable_v<Func, bool, bool>) {
+            const auto right_data = reinterpret_cast<const bool*>(steps[*right].block_data_);
+            for (size_t idx = 0; idx < rows; ++idx) {
+                out[idx] = func(left_data[idx], right_data[idx]);
+            }
+        } else {
+            for (size_t idx = 0; idx < rows; ++idx) {
+                out[idx] = func(left_data[idx]);
+            }
+        }
+        steps[self].block_data_ = reinterpret_cast<const uint8_t*>(out);
+    });
+}
+
+// Converts an expression tree into FusedSteps, or fails if any part of it cannot be fused
+class FusedExpressionCompiler {
+public:
+    explicit FusedExpressionCompiler(ProcessingUnit& proc) :
+        proc_(proc) {
+    }
+
+    // Returns the index of the step evaluating the node, or std::nullopt if it cannot be fused
+    std::optional<size_t> compile(const VariantNode& node) {
+        return util::variant_match(node,
+            [this](const ColumnName& column_name) -> std::optional<size_t> {
+                return compile_column(column_name);
+            },
+            [this](const ValueName& value_name) -> std::optional<size_t> {
+                return compile_value(value_name);
+            },
+            [this](const ExpressionName& expression_name) -> std::optional<size_t> {
+                return compile_expression(expression_name);
+            },
+            [](const auto&) -> std::optional<size_t> {
+                return std::nullopt;
+            });
+    }
+
+    std::vector<FusedStep> steps_;
+    std::optional<size_t> num_rows_;
+    size_t num_operations_{0};
+
+private:
+    std::optional<size_t> compile_column(const ColumnName& column_name) {
+        auto data = proc_.get(column_name);
+        if (!std::holds_alternative<ColumnWithStrings>(data)) {
+            // Missing with dynamic schema
+            return std::nullopt;
+        }
+        auto column = std::get<ColumnWithStrings>(data).column_;
+        const auto data_type = column->type().data_type();
+        if (column->is_sparse() || column->type().dimension() != Dimension::Dim0 ||
+            !(is_numeric_type(data_type) || data_type == DataType::BOOL8)) {
+            return std::nullopt;
+        }
+        const auto num_rows = static_cast<size_t>(column->row_count());
+        if (num_rows_.has_value() && *num_rows_ != num_rows) {
+            return std::nullopt;
+        }
+        num_rows_ = num_rows;
+
+        const auto self = steps_.size();
+        FusedStep step;
+        step.data_type_ = data_type;
+        details::visit_type(data_type, [&](auto col_tag) {
+            using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
+            if constexpr(is_numeric_type(col_type_info::data_type) || is_bool_type(col_type_info::data_type)) {
+                using RawType = typename col_type_info::RawType;
+                std::vector<ColumnBlock> blocks;
+                size_t row{0};
+                auto column_data = column->data();
+                while (auto block = column_data.next<typename col_type_info::TDT>()) {
+                    if (block->row_count() > 0) {
+                        blocks.emplace_back(ColumnBlock{reinterpret_cast<const uint8_t*>(block->data()), row, block->row_count()});
+                        row += block->row_count();
+                    }
+                }
+                step.scratch_.resize(FusedExpression::FUSED_BLOCK_ROWS * sizeof(RawType));
+                step.kernel_ = [self, column, blocks = std::move(blocks)](std::vector<FusedStep>& steps, size_t start, size_t rows) {
+                    read_column_block<RawType>(steps[self], blocks, start, rows);
+                };
+            }
+        });
+        steps_.emplace_back(std::move(step));
+        is_value_.emplace_back(false);
+        return self;
+    }
+
+    std::optional<size_t> compile_value(const ValueName& value_name) {
+        auto data = proc_.get(value_name);
+        if (!std::holds_alternative<std::shared_ptr<Value>>(data)) {
+            return std::nullopt;
+        }
+        const auto& value = *std::get<std::shared_ptr<Value>>(data);
+        const auto data_type = value.type().data_type();
+        if (!(is_numeric_type(data_type) || data_type == DataType::BOOL8)) {
+            return std::nullopt;
+        }
+        // Broadcast to a block of rows once, which every block then reads. Without a kernel, block_data_ is pointed at
+        // scratch_ when the FusedExpression is constructed
+        FusedStep step;
+        step.data_type_ = data_type;
+        details::visit_type(data_type, [&](auto val_tag) {
+            using val_type_info = ScalarTypeInfo<decltype(val_tag)>;
+            if constexpr(is_numeric_type(val_type_info::data_type) || is_bool_type(val_type_info::data_type)) {
+                using RawType = typename val_type_info::RawType;
+                step.scratch_.resize(FusedExpression::FUSED_BLOCK_ROWS * sizeof(RawType));
+                std::fill_n(reinterpret_cast<RawType*>(step.scratch_.data()), FusedExpression::FUSED_BLOCK_ROWS, *reinterpret_cast<const RawType*>(value.data_));
+            }
+        });
+        steps_.emplace_back(std::move(step));
+        is_value_.emplace_back(true);
+        return steps_.size() - 1;
+    }
+
+    std::optional<size_t> compile_expression(const ExpressionName& expression_name) {
+        // Subexpressions referenced more than once are evaluated once
+        if (auto it = compiled_expressions_.find(expression_name.value); it != compiled_expressions_.end()) {
+            return it->second;
+        }
+        auto expression_node = proc_.expression_context_->expression_nodes_.get_value(expression_name.value);
+        auto left = compile(expression_node->left_);
+        if (!left.has_value()) {
+            return std::nullopt;
+        }
+        std::optional<size_t> right;
+        if (is_binary_operation(expression_node->operation_type_)) {
+            right = compile(expression_node->right_);
+            if (!right.has_value()) {
+                return std::nullopt;
+            }
+        }
+        auto step = compile_operation(expression_node->operation_type_, *left, right);
+        if (!step.has_value()) {
+            return std::nullopt;
+        }
+        steps_.emplace_back(std::move(*step));
+        is_value_.emplace_back(false);
+        ++num_operations_;
+        compiled_expressions_.try_emplace(expression_name.value, steps_.size() - 1);
+        return steps_.size() - 1;
+    }
+
+    // Only the combinations of inputs that node by node evaluation accepts are fused
+    std::optional<FusedStep> compile_operation(OperationType operation, size_t left, std::optional<size_t> right) {
+        const auto self = steps_.size();
+        const auto& left_step = steps_[left];
+        const auto is_column = [this](size_t idx) {
+            return !steps_[idx].is_bitset_;
+        };
+        // Unary operations on values give values in node by node evaluation
+        const auto is_column_input = [this](size_t idx) {
+            return !steps_[idx].is_bitset_ && !is_value_[idx];
+        };
+        const auto is_boolean = [this](size_t idx) {
+            return !is_value_[idx] && steps_[idx].data_type_ == DataType::BOOL8;
+        };
+        switch (operation) {
+        case OperationType::ABS:
+            return is_column_input(left) ? unary_arithmetic_step<AbsOperator>(left_step.data_type_, left, self) : std::nullopt;
+        case OperationType::NEG:
+            return is_column_input(left) ? unary_arithmetic_step<NegOperator>(left_step.data_type_, left, self) : std::nullopt;
+        case OperationType::IDENTITY:
+            return is_boolean(left) ? std::make_optional(boolean_step<std::identity>(left, std::nullopt, self)) : std::nullopt;
+        case OperationType::NOT:
+            return is_boolean(left) ? std::make_optional(boolean_step<std::logical_not<bool>>(left, std::nullopt, self)) : std::nullopt;
+        default:
+            break;
+        }
+
+        // Unary operations other than those above, such as null checks, are not fused
+        if (!right.has_value()) {
+            return std::nullopt;
+        }
+        const auto& right_step = steps_[*right];
+        // Operations on two values give a value in node by node evaluation, which is cast differently in comparisons
+        const bool both_columns = is_column(left) && is_column(*right) && !(is_value_[left] && is_value_[*right]);
+        switch (operation) {
+        case OperationType::ADD:
+            return both_columns ? arithmetic_step<PlusOperator>(left_step.data_type_, right_step.data_type_, left, *right, self) : std::nullopt;
+        case OperationType::SUB:
+            return both_columns ? arithmetic_step<MinusOperator>(left_step.data_type_, right_step.data_type_, left, *right, self) : std::nullopt;
+        case OperationType::MUL:
+            return both_columns ? arithmetic_step<TimesOperator>(left_step.data_type_, right_step.data_type_, left, *right, self) : std::nullopt;
+        case OperationType::DIV:
+            return both_columns ? arithmetic_step<DivideOperator>(left_step.data_type_, right_step.data_type_, left, *right, self) : std::nullopt;
+        default:
+            break;
+        }
+
+        if (is_comparison_operation(operation)) {
+            if (!both_columns) {
+                return std::nullopt;
+            } else if (is_value_[left]) {
+                return compile_comparison<ComparisonOperands::VALUE_ON_LEFT>(operation, left, *right, self);
+            } else if (is_value_[*right]) {
+                return compile_comparison<ComparisonOperands::VALUE_ON_RIGHT>(operation, left, *right, self);
+            } else {
+                return compile_comparison<ComparisonOperands::COLUMNS>(operation, left, *right, self);
+            }
+        }
+
+        const bool both_boolean = is_boolean(left) && is_boolean(*right);
+        switch (operation) {
+        case OperationType::AND:
+            return both_boolean ? std::make_optional(boolean_step<std::bit_and<bool>>(left, right, self)) : std::nullopt;
+        case OperationType::OR:
+            return both_boolean ? std::make_optional(boolean_step<std::bit_or<bool>>(left, right, self)) : std::nullopt;
+        case OperationType::XOR:
+            return both_boolean ? std::make_optional(boolean_step<std::bit_xor<bool>>(left, right, self)) : std::nullopt;
+        default:
+            // ISNULL, NOTNULL, ISIN, and ISNOTIN
+            return std::nullopt;
+        }
+    }
+
+    template<ComparisonOperands operands>
+    std::optional<FusedStep> compile_comparison(OperationType operation, size_t left, size_t right, size_t self) {
+        const auto left_type = steps_[left].data_type_;
+        const auto right_type = steps_[right].data_type_;
+        switch (operation) {
+        case OperationType::EQ:
+            return comparison_step<EqualsOperator, operands>(left_type, right_type, left, right, self);
+        case OperationType::NE:
+            return comparison_step<NotEqualsOperator, operands>(left_type, right_type, left, right, self);
+        case OperationType::LT:
+            return comparison_step<LessThanOperator, operands>(left_type, right_type, left, right, self);
+        case OperationType::LE:
+            return comparison_step<LessThanEqualsOperator, operands>(left_type, right_type, left, right, self);
+        case OperationType::GT:
+            return comparison_step<GreaterThanOperator, operands>(left_type, right_type, left, right, self);
+        case OperationType::GE:
+            return comparison_step<GreaterThanEqualsOperator, operands>(left_type, right_type, left, right, self);
+        default:
+            return std::nullopt;
+        }
+    }
+
+    ProcessingUnit& proc_;
+    std::vector<bool> is_value_;
+    std::unordered_map<std::string, size_t> compiled_expressions_;
+};
+
+} // namespace
+
+std::optional<FusedExpression> FusedExpression::compile(ProcessingUnit& proc, const ExpressionName& root_node_name) {
+    if (ConfigsMap::instance()->get_int("Expression.FusedEvaluation", 1) == 0) {
+        return std::nullopt;
+    }
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            static_cast<bool>(proc.expression_context_),
+            "FusedExpression::compile requires the processing unit to have an expression context");
+    FusedExpressionCompiler compiler(proc);
+    auto root = compiler.compile(root_node_name);
+    if (!root.has_value() || compiler.num_operations_ < 2 || !compiler.num_rows_.has_value() || *compiler.num_rows_ == 0) {
+        return std::nullopt;
+    }
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            *root == compiler.steps_.size() - 1,
+            "Expected the root of a fused expression to be evaluated last");
+    return FusedExpression(std::move(compiler.steps_), *compiler.num_rows_);
+}
+
+FusedExpression::FusedExpression(std::vector<FusedStep>&& steps, size_t num_rows) :
+    steps_(std::move(steps)),
+    num_rows_(num_rows) {
+    for (auto& step: steps_) {
+        if (!step.kernel_) {
+            step.block_data_ = step.scratch_.data();
+        }
+    }
+}
+
+void FusedExpression::evaluate_block(size_t start, size_t rows) {
+    for (auto& step: steps_) {
+        if (step.kernel_) {
+            step.kernel_(steps_, start, rows);
+        }
+    }
+}
+
+VariantData FusedExpression::evaluate() {
+    if (is_filter()) {
+        util::BitSet bitset;
+        bitset.resize(num_rows_);
+        util::BitSet::bulk_insert_iterator inserter(bitset);
+        for (size_t start = 0; start < num_rows_; start += FUSED_BLOCK_ROWS) {
+            const auto rows = std::min(FUSED_BLOCK_ROWS, num_rows_ - start);
+            evaluate_block(start, rows);
+            const auto matches = reinterpret_cast<const bool*>(steps_.back().block_data_);
+            for (size_t idx = 0; idx < rows; ++idx) {
+                if (matches[idx]) {
+                    inserter = start + idx;
+                }
+            }
+        }
+        inserter.flush();
+        return transform_to_placeholder(VariantData{std::move(bitset)});
+    }
+
+    // The root writes straight into the output column
+    auto output_column = std::make_unique<Column>(make_scalar_type(steps_.back().data_type_), num_rows_, true, false);
+    steps_.back().output_ = output_column->ptr();
+    for (size_t start = 0; start < num_rows_; start += FUSED_BLOCK_ROWS) {
+        evaluate_block(start, std::min(FUSED_BLOCK_ROWS, num_rows_ - start));
+    }
+    steps_.back().output_ = nullptr;
+    output_column->set_row_data(num_rows_ - 1);
+    return VariantData{ColumnWithStrings(std::move(output_column))};
+}
+
+} // namespace arcticdb
@@ -0,0 +1,75 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/entity/types.hpp>
+#include <arcticdb/processing/expression_node.hpp>
+
+#include <functional>
+#include <optional>
+#include <vector>
+
+namespace arcticdb {
+
+struct ProcessingUnit;
+
+// One node of a FusedExpression, holding its result for the block of rows currently being evaluated
+struct FusedStep {
+    DataType data_type_;
+    // Whether the result is a filter, which node by node evaluation would represent as a bitset, rather than a column
+    bool is_bitset_{false};
+    bool is_operation_{false};
+    // The result for the current block, pointing either into an input column or into scratch_
+    const uint8_t* block_data_{nullptr};
+    std::vector<uint8_t> scratch_;
+    // If set, the results are written here, offset by the first row of the block, rather than to scratch_
+    uint8_t* output_{nullptr};
+    // Evaluates the step for the block of rows starting at start, once the steps it depends on have been evaluated
+    std::function<void(std::vector<FusedStep>& steps, size_t start, size_t rows)> kernel_;
+};
+
+/*
+ * Evaluates an expression tree of arithmetic, comparison, and boolean operations over dense numeric and bool columns
+ * in a single pass over the rows of a processing unit, rather than node by node.
+ *
+ * Node by node evaluation materialises a column or bitset for every node, so (a + b) * c > 10 writes and then rereads
+ * two intermediate columns the length of the segment. Instead, the tree is compiled into a sequence of steps, each a
+ * loop specialised for the types of its inputs, which are run over blocks of FUSED_BLOCK_ROWS rows at a time. The
+ * intermediate results of a block stay in cache, and only the output column or bitset is written to memory.
+ *
+ * Operations are applied with the same operators and type promotion rules as node by node evaluation, so the results
+ * are identical. Expressions the fused evaluation does not support, such as those involving strings, sparse or missing
+ * columns, null checks, or set membership, are left to node by node evaluation, as are those that raise errors there.
+ */
+class FusedExpression {
+public:
+    static constexpr size_t FUSED_BLOCK_ROWS = 1024;
+
+    /*
+     * Returns std::nullopt if the expression rooted at root_node_name cannot be fused, consists of a single operation
+     * so that there are no intermediate results to avoid, or if fused evaluation is disabled with the
+     * Expression.FusedEvaluation runtime config option. The processing unit must have its expression context set.
+     */
+    static std::optional<FusedExpression> compile(ProcessingUnit& proc, const ExpressionName& root_node_name);
+
+    [[nodiscard]] bool is_filter() const { return steps_.back().is_bitset_; }
+
+    // Returns a BitSet, or an EmptyResult if no rows match, for filters, and a ColumnWithStrings for projections
+    [[nodiscard]] VariantData evaluate();
+
+private:
+    FusedExpression(std::vector<FusedStep>&& steps, size_t num_rows);
+
+    void evaluate_block(size_t start, size_t rows);
+
+    // In evaluation order, ending with the root of the expression
+    std::vector<FusedStep> steps_;
+    size_t num_rows_;
+};
+
+} // namespace arcticdb
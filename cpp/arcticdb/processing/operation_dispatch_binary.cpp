@@ -7,6 +7,7 @@
  */
 
 #include <arcticdb/processing/operation_dispatch_binary.hpp>
+#include <arcticdb/processing/operation_dispatch_string.hpp>
 
 namespace arcticdb {
 
@@ -150,6 +151,11 @@ VariantData dispatch_binary(const VariantData& left, const VariantData& right, O
             return visit_binary_membership(left, right, IsInOperator{});
         case OperationType::ISNOTIN:
             return visit_binary_membership(left, right, IsNotInOperator{});
+        case OperationType::STARTSWITH:
+        case OperationType::CONTAINS:
+        case OperationType::REGEX_SEARCH:
+        case OperationType::REGEX_MATCH:
+            return dispatch_binary_string(left, right, operation);
         case OperationType::AND:
         case OperationType::OR:
         case OperationType::XOR:
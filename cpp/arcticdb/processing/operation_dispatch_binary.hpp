@@ -64,6 +64,8 @@ VariantData binary_membership(const ColumnWithStrings& column_with_strings, Valu
 
     util::BitSet output_bitset;
     constexpr auto sparse_missing_value_output = std::is_same_v<Func, IsNotInOperator&&>;
+    // Set if none of the strings in the value set are in the column, in which case no row needs to be compared
+    bool values_absent_from_column = false;
     details::visit_type(column_with_strings.column_->type().data_type(),[&] (auto col_tag) {
         using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
         details::visit_type(value_set.base_type().data_type(), [&] (auto val_set_tag) {
@@ -79,6 +81,10 @@ VariantData binary_membership(const ColumnWithStrings& column_with_strings, Valu
                     typed_value_set = value_set.get_set<std::string>();
                 }
                 auto offset_set = column_with_strings.string_pool_->get_offsets_for_column(typed_value_set, *column_with_strings.column_);
+                if (offset_set.empty()) {
+                    values_absent_from_column = true;
+                    return;
+                }
                 Column::transform<typename col_type_info::TDT>(
                         *column_with_strings.column_,
                         output_bitset,
@@ -111,6 +117,14 @@ VariantData binary_membership(const ColumnWithStrings& column_with_strings, Valu
         });
     });
 
+    if (values_absent_from_column) {
+        if constexpr(std::is_same_v<Func, IsNotInOperator&&>) {
+            return FullResult{};
+        } else {
+            return EmptyResult{};
+        }
+    }
+
     log::version().debug("Filtered column of size {} down to {} bits", column_with_strings.column_->last_row() + 1, output_bitset.count());
 
     return {std::move(output_bitset)};
@@ -186,6 +200,8 @@ VariantData binary_comparator(const ColumnWithStrings& column_with_strings, cons
     }
     util::BitSet output_bitset;
     constexpr auto sparse_missing_value_output = std::is_same_v<Func, NotEqualsOperator&&>;
+    // Set if the string being compared against is not in the column, in which case no row needs to be compared
+    bool value_absent_from_column = false;
 
     details::visit_type(column_with_strings.column_->type().data_type(), [&](auto col_tag) {
         using col_type_info = ScalarTypeInfo<decltype(col_tag)>;
@@ -206,6 +222,12 @@ VariantData binary_comparator(const ColumnWithStrings& column_with_strings, cons
                     value_string = std::string(*val.str_data(), val.len());
                 }
                 auto value_offset = column_with_strings.string_pool_->get_offset_for_column(value_string, *column_with_strings.column_);
+                if constexpr (std::is_same_v<Func, EqualsOperator&&> || std::is_same_v<Func, NotEqualsOperator&&>) {
+                    if (!value_offset.has_value()) {
+                        value_absent_from_column = true;
+                        return;
+                    }
+                }
                 Column::transform<typename col_type_info::TDT>(
                         *column_with_strings.column_,
                         output_bitset,
@@ -241,6 +263,15 @@ VariantData binary_comparator(const ColumnWithStrings& column_with_strings, cons
             }
         });
     });
+
+    if (value_absent_from_column) {
+        if constexpr (std::is_same_v<Func, NotEqualsOperator&&>) {
+            return FullResult{};
+        } else {
+            return EmptyResult{};
+        }
+    }
+
     ARCTICDB_DEBUG(log::version(), "Filtered column of size {} down to {} bits", column_with_strings.column_->last_row() + 1, output_bitset.count());
 
     return VariantData{std::move(output_bitset)};
@@ -0,0 +1,254 @@
+/*
+ * Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/processing/operation_dispatch_string.hpp>
+#include <arcticdb/processing/operation_dispatch.hpp>
+#include <arcticdb/column_store/column.hpp>
+#include <arcticdb/column_store/string_pool.hpp>
+#include <arcticdb/util/regex_filter.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+#include <ankerl/unordered_dense.h>
+
+#include <algorithm>
+#include <cctype>
+#include <cstring>
+#include <limits>
+
+namespace arcticdb {
+
+namespace {
+
+std::string_view string_function_name(OperationType operation) {
+    switch (operation) {
+        case OperationType::STRLEN:
+            return "len";
+        case OperationType::LOWER:
+            return "lower";
+        case OperationType::STARTSWITH:
+            return "startswith";
+        case OperationType::CONTAINS:
+        case OperationType::REGEX_SEARCH:
+            return "contains";
+        case OperationType::REGEX_MATCH:
+            return "match";
+        default:
+            internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unexpected string operation {}", int(operation));
+    }
+}
+
+bool is_utf_string_type(DataType data_type) {
+    return is_utf_type(slice_value_type(data_type));
+}
+
+void check_string_column(const ColumnWithStrings& col, OperationType operation) {
+    const auto data_type = col.column_->type().data_type();
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            is_sequence_type(data_type) && col.string_pool_,
+            "String function {} cannot be applied to a column of type {}", string_function_name(operation), data_type);
+}
+
+void utf32_to_utf8(std::string_view utf32, std::string& utf8) {
+    utf8.clear();
+    for (size_t pos = 0; pos + UNICODE_WIDTH <= utf32.size(); pos += UNICODE_WIDTH) {
+        uint32_t code_point;
+        std::memcpy(&code_point, utf32.data() + pos, sizeof(code_point));
+        if (code_point < 0x80) {
+            utf8.push_back(static_cast<char>(code_point));
+        } else if (code_point < 0x800) {
+            utf8.push_back(static_cast<char>(0xC0 | (code_point >> 6)));
+            utf8.push_back(static_cast<char>(0x80 | (code_point & 0x3F)));
+        } else if (code_point < 0x10000) {
+            utf8.push_back(static_cast<char>(0xE0 | (code_point >> 12)));
+            utf8.push_back(static_cast<char>(0x80 | ((code_point >> 6) & 0x3F)));
+            utf8.push_back(static_cast<char>(0x80 | (code_point & 0x3F)));
+        } else {
+            utf8.push_back(static_cast<char>(0xF0 | (code_point >> 18)));
+            utf8.push_back(static_cast<char>(0x80 | ((code_point >> 12) & 0x3F)));
+            utf8.push_back(static_cast<char>(0x80 | ((code_point >> 6) & 0x3F)));
+            utf8.push_back(static_cast<char>(0x80 | (code_point & 0x3F)));
+        }
+    }
+}
+
+/*
+ * Memoises func, which takes the string at an offset or std::nullopt for None and NaN, over the offsets of a string
+ * column. Rows often repeat the string of the row before, so that is checked before the hash map. Unicode strings are
+ * passed to func as UTF-8, converting those in fixed-width columns from the UTF-32 they are stored as.
+ */
+template<typename ResultType, typename Func>
+class PerStringResults {
+public:
+    PerStringResults(const ColumnWithStrings& col, Func func) :
+        col_(col),
+        func_(std::move(func)),
+        is_utf32_(is_fixed_string_type(col.column_->type().data_type()) && is_utf_string_type(col.column_->type().data_type())) {
+    }
+
+    ResultType operator()(entity::position_t offset) {
+        if (last_offset_ == offset)
+            return last_result_;
+
+        auto [it, inserted] = results_.try_emplace(offset);
+        if (inserted) {
+            auto str = col_.string_at_offset(offset, true);
+            if (str.has_value() && is_utf32_) {
+                utf32_to_utf8(*str, utf8_);
+                str = utf8_;
+            }
+            it->second = func_(str);
+        }
+
+        last_offset_ = offset;
+        last_result_ = it->second;
+        return last_result_;
+    }
+
+private:
+    const ColumnWithStrings& col_;
+    Func func_;
+    const bool is_utf32_;
+    std::string utf8_;
+    ankerl::unordered_dense::map<entity::position_t, ResultType> results_;
+    std::optional<entity::position_t> last_offset_;
+    ResultType last_result_{};
+};
+
+template<typename ResultType, typename Func>
+PerStringResults<ResultType, std::decay_t<Func>> per_string_results(const ColumnWithStrings& col, Func&& func) {
+    return PerStringResults<ResultType, std::decay_t<Func>>(col, std::forward<Func>(func));
+}
+
+template<typename Func>
+VariantData string_predicate(const ColumnWithStrings& col, Func&& func) {
+    auto results = per_string_results<bool>(col, std::forward<Func>(func));
+    util::BitSet output_bitset;
+    details::visit_type(col.column_->type().data_type(), [&](auto col_tag) {
+        using type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr (is_sequence_type(type_info::data_type)) {
+            Column::transform<typename type_info::TDT>(*col.column_, output_bitset, false, [&results](auto offset) -> bool {
+                return results(static_cast<entity::position_t>(offset));
+            });
+        }
+    });
+    return transform_to_placeholder(VariantData{std::move(output_bitset)});
+}
+
+size_t character_count(std::string_view str, bool is_utf) {
+    if (!is_utf)
+        return str.size();
+    // Count the bytes that start a UTF-8 encoded character, i.e. all except continuation bytes
+    return static_cast<size_t>(std::count_if(str.begin(), str.end(), [](char c) { return (static_cast<uint8_t>(c) & 0xC0) != 0x80; }));
+}
+
+VariantData string_length(const ColumnWithStrings& col) {
+    const bool is_utf = is_utf_string_type(col.column_->type().data_type());
+    auto results = per_string_results<double>(col, [is_utf](std::optional<std::string_view> str) {
+        return str.has_value() ? static_cast<double>(character_count(*str, is_utf)) : std::numeric_limits<double>::quiet_NaN();
+    });
+    auto output_column = std::make_unique<Column>(make_scalar_type(DataType::FLOAT64), true);
+    details::visit_type(col.column_->type().data_type(), [&](auto col_tag) {
+        using type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr (is_sequence_type(type_info::data_type)) {
+            Column::transform<typename type_info::TDT, ScalarTagType<DataTypeTag<DataType::FLOAT64>>>(*col.column_, *output_column, [&results](auto offset) -> double {
+                return results(static_cast<entity::position_t>(offset));
+            });
+        }
+    });
+    return {ColumnWithStrings(std::move(output_column))};
+}
+
+VariantData string_lower(const ColumnWithStrings& col) {
+    auto output_string_pool = std::make_shared<StringPool>();
+    std::string lowered;
+    auto results = per_string_results<entity::position_t>(col, [&](std::optional<std::string_view> str) {
+        lowered.assign(str.value_or(std::string_view{}));
+        std::transform(lowered.begin(), lowered.end(), lowered.begin(), [](char c) {
+            return static_cast<char>(std::tolower(static_cast<unsigned char>(c)));
+        });
+        return output_string_pool->get(lowered).offset();
+    });
+    auto output_column = std::make_unique<Column>(make_scalar_type(DataType::UTF_DYNAMIC64), true);
+    details::visit_type(col.column_->type().data_type(), [&](auto col_tag) {
+        using type_info = ScalarTypeInfo<decltype(col_tag)>;
+        if constexpr (is_sequence_type(type_info::data_type)) {
+            Column::transform<typename type_info::TDT, ScalarTagType<DataTypeTag<DataType::UTF_DYNAMIC64>>>(*col.column_, *output_column, [&results](auto offset) -> uint64_t {
+                // None and NaN are kept as they are, as they are not offsets into the string pool
+                const auto position = static_cast<entity::position_t>(offset);
+                return static_cast<uint64_t>(is_a_string(position) ? results(position) : position);
+            });
+        }
+    });
+    return {ColumnWithStrings(std::move(*output_column), std::move(output_string_pool))};
+}
+
+std::string string_operand(const VariantData& right, OperationType operation) {
+    const auto* value = std::get_if<std::shared_ptr<Value>>(&right);
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            value != nullptr && is_sequence_type((*value)->type().data_type()),
+            "String function {} expects a string argument", string_function_name(operation));
+    return {*(*value)->str_data(), (*value)->len()};
+}
+
+} // namespace
+
+VariantData dispatch_unary_string(const VariantData& left, OperationType operation) {
+    if (std::holds_alternative<EmptyResult>(left))
+        return EmptyResult{};
+
+    const auto* col = std::get_if<ColumnWithStrings>(&left);
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            col != nullptr,
+            "String function {} can only be applied to a column", string_function_name(operation));
+    check_string_column(*col, operation);
+    switch (operation) {
+        case OperationType::STRLEN:
+            return string_length(*col);
+        case OperationType::LOWER:
+            return string_lower(*col);
+        default:
+            internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unexpected unary string operation {}", int(operation));
+    }
+}
+
+VariantData dispatch_binary_string(const VariantData& left, const VariantData& right, OperationType operation) {
+    const auto operand = string_operand(right, operation);
+    if (std::holds_alternative<EmptyResult>(left))
+        return EmptyResult{};
+
+    const auto* col = std::get_if<ColumnWithStrings>(&left);
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            col != nullptr,
+            "String function {} can only be applied to a column", string_function_name(operation));
+    check_string_column(*col, operation);
+    switch (operation) {
+        case OperationType::STARTSWITH:
+            return string_predicate(*col, [&operand](std::optional<std::string_view> str) {
+                return str.has_value() && str->starts_with(operand);
+            });
+        case OperationType::CONTAINS:
+            return string_predicate(*col, [&operand](std::optional<std::string_view> str) {
+                return str.has_value() && str->find(operand) != std::string_view::npos;
+            });
+        case OperationType::REGEX_SEARCH:
+        case OperationType::REGEX_MATCH: {
+            int options = operation == OperationType::REGEX_MATCH ? PCRE_ANCHORED : 0;
+            if (is_utf_string_type(col->column_->type().data_type()))
+                options |= PCRE_UTF8;
+            util::RegexPattern pattern(operand, options);
+            util::Regex regex(pattern);
+            return string_predicate(*col, [&regex](std::optional<std::string_view> str) {
+                return str.has_value() && regex.match(*str);
+            });
+        }
+        default:
+            internal::raise<ErrorCode::E_ASSERTION_FAILURE>("Unexpected binary string operation {}", int(operation));
+    }
+}
+
+}
@@ -0,0 +1,45 @@
+/*
+ * Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/processing/expression_node.hpp>
+#include <arcticdb/processing/operation_types.hpp>
+
+namespace arcticdb {
+
+/*
+ * String functions are evaluated once per distinct string in a column rather than once per row, and the result is
+ * broadcast to every row holding the same string pool offset. Their cost is therefore proportional to the number of
+ * distinct strings in the column, plus a lookup per row.
+ */
+
+constexpr bool is_string_operation(OperationType operation) {
+    switch (operation) {
+        case OperationType::STRLEN:
+        case OperationType::LOWER:
+        case OperationType::STARTSWITH:
+        case OperationType::CONTAINS:
+        case OperationType::REGEX_SEARCH:
+        case OperationType::REGEX_MATCH:
+            return true;
+        default:
+            return false;
+    }
+}
+
+// STRLEN gives a FLOAT64 column of the number of characters in each string, NaN for None or NaN. LOWER gives a UTF-8
+// string column, with ASCII characters lowered and other characters unchanged
+VariantData dispatch_unary_string(const VariantData& left, OperationType operation);
+
+// STARTSWITH and CONTAINS test each string for a prefix or substring, REGEX_SEARCH for a PCRE regex match anywhere in the
+// string, and REGEX_MATCH for a match at the start of the string. The right operand is the string or regex, and None and
+// NaN never match
+VariantData dispatch_binary_string(const VariantData& left, const VariantData& right, OperationType operation);
+
+}
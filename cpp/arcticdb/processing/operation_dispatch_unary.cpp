@@ -7,6 +7,7 @@
  */
 
 #include <arcticdb/processing/operation_dispatch_unary.hpp>
+#include <arcticdb/processing/operation_dispatch_string.hpp>
 
 namespace arcticdb {
 
@@ -74,6 +75,9 @@ VariantData dispatch_unary(const VariantData& left, OperationType operation) {
         case OperationType::IDENTITY:
         case OperationType::NOT:
             return visit_unary_boolean(left, operation);
+        case OperationType::STRLEN:
+        case OperationType::LOWER:
+            return dispatch_unary_string(left, operation);
         default:
             util::raise_rte("Unknown operation {}", int(operation));
     }
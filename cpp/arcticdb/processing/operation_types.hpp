@@ -28,6 +28,9 @@ enum class OperationType : uint8_t {
     // Boolean
     IDENTITY,
     NOT,
+    // String
+    STRLEN,
+    LOWER,
     // Binary
     // Operator
     ADD,
@@ -43,6 +46,11 @@ enum class OperationType : uint8_t {
     GE,
     ISIN,
     ISNOTIN,
+    // String
+    STARTSWITH,
+    CONTAINS,
+    REGEX_SEARCH,
+    REGEX_MATCH,
     // Boolean
     AND,
     OR,
@@ -0,0 +1,58 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/processing/query_profile.hpp>
+#include <arcticdb/processing/component_manager.hpp>
+
+#include <map>
+
+namespace arcticdb {
+
+void QueryProfile::set_clauses(const std::vector<std::shared_ptr<Clause>>& clauses) {
+    clauses_.clear();
+    for (const auto& clause: clauses) {
+        clauses_.emplace_back(clause->to_string());
+    }
+}
+
+uint64_t QueryProfile::row_count(const Composite<EntityIds>& entity_ids) const {
+    uint64_t rows{0};
+    entity_ids.broadcast([this, &rows](const EntityIds& ids) {
+        // Column slices of the same row slice hold the same rows
+        std::map<std::pair<size_t, size_t>, uint64_t> rows_by_row_range;
+        for (auto id: ids) {
+            auto segment = component_manager_->peek<std::shared_ptr<SegmentInMemory>>(id);
+            if (!segment.has_value())
+                continue;
+
+            const uint64_t segment_rows = (*segment)->row_count();
+            if (auto row_range = component_manager_->peek<std::shared_ptr<RowRange>>(id); row_range.has_value()) {
+                auto& range_rows = rows_by_row_range[{(*row_range)->first, (*row_range)->second}];
+                range_rows = std::max(range_rows, segment_rows);
+            } else {
+                rows += segment_rows;
+            }
+        }
+        for (const auto& [row_range, range_rows]: rows_by_row_range) {
+            rows += range_rows;
+        }
+    });
+    return rows;
+}
+
+interval QueryProfile::start_timer() {
+    interval timer;
+    timer.start();
+    return timer;
+}
+
+void QueryProfile::add_time(std::atomic<uint64_t>& total_ns, interval& timer) {
+    timer.end();
+    total_ns += static_cast<uint64_t>(timer.get_results_total() * 1e9);
+}
+
+} // namespace arcticdb
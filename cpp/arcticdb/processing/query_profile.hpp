@@ -0,0 +1,89 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/processing/clause.hpp>
+#include <arcticdb/util/timer.hpp>
+
+#include <atomic>
+#include <cstdint>
+#include <deque>
+#include <memory>
+#include <string>
+#include <vector>
+
+namespace arcticdb {
+
+struct ClauseProfile {
+    explicit ClauseProfile(std::string clause) :
+        clause_(std::move(clause)) {
+    }
+
+    std::string clause_;
+    // Time spent in the clause, including any repartitioning, summed over all of the threads it ran on
+    std::atomic<uint64_t> time_ns_{0};
+    std::atomic<uint64_t> rows_in_{0};
+    std::atomic<uint64_t> rows_out_{0};
+    std::atomic<uint64_t> processing_units_{0};
+};
+
+/*
+ * Statistics about where the time of a read goes, gathered when one is set on the ReadOptions. Times are summed over
+ * all of the tasks that contribute to them, so may be larger than the elapsed time of the read when tasks run in
+ * parallel. Segment and clause statistics are gathered for reads that run clauses from a QueryBuilder, while the
+ * number of segments in the index is gathered for all reads.
+ */
+struct QueryProfile {
+    void set_clauses(const std::vector<std::shared_ptr<Clause>>& clauses);
+
+    // The number of rows in the segments of entity_ids, counting segments with the same row range only once
+    [[nodiscard]] uint64_t row_count(const Composite<EntityIds>& entity_ids) const;
+
+    // Starts timing something that is then recorded with add_time
+    [[nodiscard]] static interval start_timer();
+    static void add_time(std::atomic<uint64_t>& total_ns, interval& timer);
+
+    std::deque<ClauseProfile> clauses_;
+    std::shared_ptr<ComponentManager> component_manager_;
+
+    std::atomic<uint64_t> segments_in_index_{0};
+    // Segments remaining after pruning using the index, for example by a date range
+    std::atomic<uint64_t> segments_selected_{0};
+    std::atomic<uint64_t> segments_read_{0};
+    // The compressed size of the segments read, and the size of the columns decoded from them
+    std::atomic<uint64_t> bytes_fetched_{0};
+    std::atomic<uint64_t> bytes_decoded_{0};
+    // From scheduling the read of a segment until its compressed bytes are ready to be decoded
+    std::atomic<uint64_t> fetch_time_ns_{0};
+    std::atomic<uint64_t> decode_time_ns_{0};
+    // Time tasks applying the clauses spent waiting for a thread of the CPU thread pool
+    std::atomic<uint64_t> queue_wait_ns_{0};
+};
+
+struct ClausePlan {
+    std::string clause_;
+    // Whether the results of all processing units are needed before the next clause can run, as for a groupby
+    bool requires_repartition_;
+};
+
+struct SegmentPlan {
+    RowRange row_range_;
+    ColRange col_range_;
+    // From the types of the columns to be read, excluding the contents of string pools
+    uint64_t estimated_bytes_;
+};
+
+// What a read would do, as returned by explain without reading any data segments
+struct QueryPlan {
+    std::vector<ClausePlan> clauses_;
+    uint64_t segments_in_index_{0};
+    std::vector<SegmentPlan> segments_;
+    uint64_t processing_units_{0};
+};
+
+} // namespace arcticdb
@@ -0,0 +1,203 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/processing/sketches.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+#include <algorithm>
+#include <bit>
+#include <cmath>
+#include <limits>
+#include <numbers>
+
+namespace arcticdb {
+
+/***************
+ * HyperLogLog *
+ ***************/
+
+HyperLogLog::HyperLogLog(uint8_t precision) :
+    precision_(precision),
+    registers_(size_t(1) << precision, 0) {
+}
+
+void HyperLogLog::add(uint64_t hash) {
+    // The leading bits of the hash choose the register, and the position of the first set bit in the rest of the hash
+    // is the rank recorded in it. The sentinel bit bounds the rank if the rest of the hash is zero
+    const auto idx = hash >> (64 - precision_);
+    const auto rest = (hash << precision_) | (uint64_t(1) << (precision_ - 1));
+    const auto rank = static_cast<uint8_t>(std::countl_zero(rest) + 1);
+    registers_[idx] = std::max(registers_[idx], rank);
+}
+
+void HyperLogLog::merge(const HyperLogLog& other) {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            other.precision_ == precision_,
+            "Cannot merge HyperLogLog sketches with precisions {} and {}", precision_, other.precision_);
+    for (size_t idx = 0; idx < registers_.size(); ++idx) {
+        registers_[idx] = std::max(registers_[idx], other.registers_[idx]);
+    }
+}
+
+double HyperLogLog::estimate() const {
+    const auto num_registers = static_cast<double>(registers_.size());
+    double inverse_sum{0.0};
+    size_t empty_registers{0};
+    for (auto rank: registers_) {
+        inverse_sum += std::ldexp(1.0, -rank);
+        if (rank == 0) {
+            ++empty_registers;
+        }
+    }
+    const double alpha = 0.7213 / (1.0 + 1.079 / num_registers);
+    const double raw_estimate = alpha * num_registers * num_registers / inverse_sum;
+    // Linear counting is more accurate for small cardinalities. With 64-bit hashes no large range correction is needed
+    if (raw_estimate <= 2.5 * num_registers && empty_registers > 0) {
+        return num_registers * std::log(num_registers / static_cast<double>(empty_registers));
+    }
+    return raw_estimate;
+}
+
+/*******************
+ * DistinctCounter *
+ *******************/
+
+DistinctCounter::DistinctCounter(size_t exact_threshold) :
+    exact_threshold_(exact_threshold) {
+}
+
+void DistinctCounter::add(uint64_t hash) {
+    if (sketch_.has_value()) {
+        sketch_->add(hash);
+    } else {
+        hashes_.insert(hash);
+        if (hashes_.size() > exact_threshold_) {
+            switch_to_sketch();
+        }
+    }
+}
+
+void DistinctCounter::merge(const DistinctCounter& other) {
+    if (other.sketch_.has_value()) {
+        if (!sketch_.has_value()) {
+            switch_to_sketch();
+        }
+        sketch_->merge(*other.sketch_);
+    } else {
+        for (auto hash: other.hashes_) {
+            add(hash);
+        }
+    }
+}
+
+uint64_t DistinctCounter::count() const {
+    return sketch_.has_value() ? static_cast<uint64_t>(std::llround(sketch_->estimate())) : hashes_.size();
+}
+
+void DistinctCounter::switch_to_sketch() {
+    sketch_.emplace();
+    for (auto hash: hashes_) {
+        sketch_->add(hash);
+    }
+    hashes_ = {};
+}
+
+/***********
+ * TDigest *
+ ***********/
+
+TDigest::TDigest(double compression) :
+    compression_(compression),
+    min_(std::numeric_limits<double>::infinity()),
+    max_(-std::numeric_limits<double>::infinity()) {
+}
+
+void TDigest::add(double value) {
+    if (std::isnan(value)) {
+        return;
+    }
+    unmerged_.emplace_back(Centroid{value, 1.0});
+    total_weight_ += 1.0;
+    min_ = std::min(min_, value);
+    max_ = std::max(max_, value);
+    if (static_cast<double>(unmerged_.size()) >= 5 * compression_) {
+        compress();
+    }
+}
+
+void TDigest::merge(const TDigest& other) {
+    unmerged_.insert(unmerged_.end(), other.centroids_.begin(), other.centroids_.end());
+    unmerged_.insert(unmerged_.end(), other.unmerged_.begin(), other.unmerged_.end());
+    total_weight_ += other.total_weight_;
+    min_ = std::min(min_, other.min_);
+    max_ = std::max(max_, other.max_);
+    if (static_cast<double>(unmerged_.size()) >= 5 * compression_) {
+        compress();
+    }
+}
+
+double TDigest::scale(double q) const {
+    return compression_ / (2.0 * std::numbers::pi) * std::asin(2.0 * std::clamp(q, 0.0, 1.0) - 1.0);
+}
+
+void TDigest::compress() {
+    if (unmerged_.empty()) {
+        return;
+    }
+    unmerged_.insert(unmerged_.end(), centroids_.begin(), centroids_.end());
+    std::sort(unmerged_.begin(), unmerged_.end(), [](const Centroid& left, const Centroid& right) {
+        return left.mean_ < right.mean_;
+    });
+    centroids_.clear();
+    centroids_.emplace_back(unmerged_.front());
+    // Weight of the centroids before the last one in centroids_
+    double weight_before{0.0};
+    for (auto it = std::next(unmerged_.begin()); it != unmerged_.end(); ++it) {
+        auto& last = centroids_.back();
+        const double merged_weight = last.weight_ + it->weight_;
+        if (scale((weight_before + merged_weight) / total_weight_) - scale(weight_before / total_weight_) <= 1.0) {
+            last.mean_ += (it->mean_ - last.mean_) * it->weight_ / merged_weight;
+            last.weight_ = merged_weight;
+        } else {
+            weight_before += last.weight_;
+            centroids_.emplace_back(*it);
+        }
+    }
+    unmerged_.clear();
+}
+
+double TDigest::quantile(double q) {
+    compress();
+    if (centroids_.empty()) {
+        return std::numeric_limits<double>::quiet_NaN();
+    }
+    // Positions are in the units of indexes into the sorted values, and each centroid sits at the mean position of the
+    // values it holds, so that a centroid holding one value sits at the index of that value
+    const double position = q * (total_weight_ - 1.0);
+    double weight_before{0.0};
+    double previous_position{0.0};
+    double previous_value = min_;
+    for (const auto& centroid: centroids_) {
+        const double centroid_position = weight_before + (centroid.weight_ - 1.0) / 2.0;
+        if (position <= centroid_position) {
+            if (centroid_position <= previous_position) {
+                return centroid.mean_;
+            }
+            return previous_value + (centroid.mean_ - previous_value) * (position - previous_position) / (centroid_position - previous_position);
+        }
+        previous_position = centroid_position;
+        previous_value = centroid.mean_;
+        weight_before += centroid.weight_;
+    }
+    const double last_position = total_weight_ - 1.0;
+    if (last_position <= previous_position) {
+        return previous_value;
+    }
+    return previous_value + (max_ - previous_value) * (position - previous_position) / (last_position - previous_position);
+}
+
+} // namespace arcticdb
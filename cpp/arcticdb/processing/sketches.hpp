@@ -0,0 +1,102 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <optional>
+#include <unordered_set>
+#include <vector>
+
+namespace arcticdb {
+
+/*
+ * HyperLogLog sketch of the number of distinct values added to it, from well-mixed 64-bit hashes of the values. The
+ * relative standard error of the estimate is about 1.04 / sqrt(2^precision). Merging two sketches of the same
+ * precision gives the sketch of all of the values added to either.
+ */
+class HyperLogLog {
+public:
+    static constexpr uint8_t DEFAULT_PRECISION = 14;
+
+    explicit HyperLogLog(uint8_t precision = DEFAULT_PRECISION);
+
+    void add(uint64_t hash);
+    void merge(const HyperLogLog& other);
+    [[nodiscard]] double estimate() const;
+
+private:
+    uint8_t precision_;
+    std::vector<uint8_t> registers_;
+};
+
+/*
+ * Counts distinct hashes exactly until more than exact_threshold of them have been seen, after which the hashes are
+ * moved into a HyperLogLog sketch and the count is estimated. Small groups, which are the most common, therefore have
+ * exact counts without paying for the registers of a sketch.
+ */
+class DistinctCounter {
+public:
+    static constexpr size_t DEFAULT_EXACT_THRESHOLD = 1024;
+
+    explicit DistinctCounter(size_t exact_threshold = DEFAULT_EXACT_THRESHOLD);
+
+    void add(uint64_t hash);
+    void merge(const DistinctCounter& other);
+    [[nodiscard]] uint64_t count() const;
+    [[nodiscard]] bool is_exact() const { return !sketch_.has_value(); }
+
+private:
+    void switch_to_sketch();
+
+    size_t exact_threshold_;
+    std::unordered_set<uint64_t> hashes_;
+    std::optional<HyperLogLog> sketch_;
+};
+
+/*
+ * Merging t-digest (Dunning and Ertl) for estimating quantiles of the values added to it. Values are buffered and
+ * periodically merged into centroids, whose sizes are bounded using the arcsine scale function so that the tails are
+ * represented more accurately than the middle of the distribution. Digests can be merged with each other.
+ *
+ * Quantiles linearly interpolate between the centroids, in the same way that Pandas and numpy interpolate between
+ * values by default. Until a digest holds more values than it can represent individually, which is over a hundred values
+ * with the default compression, each centroid holds a single value and quantiles are exact.
+ */
+class TDigest {
+public:
+    static constexpr double DEFAULT_COMPRESSION = 100.0;
+
+    explicit TDigest(double compression = DEFAULT_COMPRESSION);
+
+    // NaN values are ignored
+    void add(double value);
+    void merge(const TDigest& other);
+    // q must be in [0, 1]. Returns NaN if no values have been added
+    [[nodiscard]] double quantile(double q);
+    [[nodiscard]] double total_weight() const { return total_weight_; }
+
+private:
+    struct Centroid {
+        double mean_;
+        double weight_;
+    };
+
+    void compress();
+    [[nodiscard]] double scale(double q) const;
+
+    double compression_;
+    // Sorted by mean
+    std::vector<Centroid> centroids_;
+    std::vector<Centroid> unmerged_;
+    double total_weight_{0.0};
+    double min_;
+    double max_;
+};
+
+} // namespace arcticdb
@@ -164,6 +164,45 @@ TEST(Clause, AggregationColumn)
     check_column<uint64_t>(*segments[0], "count_int", unique_grouping_values, [](size_t) { return 10; });
 }
 
+TEST(Clause, PartialAggregation)
+{
+    using namespace arcticdb;
+    auto component_manager = std::make_shared<ComponentManager>();
+
+    std::vector<NamedAggregator> named_aggregators{{"sum", "sum_int", "sum_int"},
+                                                   {"min", "min_int", "min_int"},
+                                                   {"max", "max_int", "max_int"},
+                                                   {"mean", "mean_int", "mean_int"},
+                                                   {"count", "count_int", "count_int"}};
+    AggregationClause aggregation("int_repeated_values", named_aggregators);
+    aggregation.set_merge_partial_aggregates();
+    aggregation.set_component_manager(component_manager);
+
+    size_t num_rows{100};
+    size_t unique_grouping_values{10};
+    auto partial = partially_aggregate(ProcessingUnit{generate_groupby_testing_segment(num_rows, unique_grouping_values)},
+                                       "int_repeated_values",
+                                       named_aggregators,
+                                       false);
+    ASSERT_TRUE(partial.has_value());
+    // One row per group, with the mean split into its numerator and denominator
+    ASSERT_EQ(unique_grouping_values, partial->segments_->front()->row_count());
+    ASSERT_EQ(7, partial->segments_->front()->descriptor().field_count());
+
+    auto entity_ids = Composite<EntityIds>(push_entities(component_manager, std::move(*partial)));
+    auto aggregated = gather_entities(component_manager, aggregation.process(std::move(entity_ids))).as_range();
+    ASSERT_EQ(1, aggregated.size());
+    auto segments = aggregated[0].segments_.value();
+    ASSERT_EQ(1, segments.size());
+
+    using aggregation_test::check_column;
+    check_column<int64_t>(*segments[0], "sum_int", unique_grouping_values, [](size_t idx) { return 450 + 10*idx; });
+    check_column<int64_t>(*segments[0], "min_int", unique_grouping_values, [](size_t idx) { return idx; });
+    check_column<int64_t>(*segments[0], "max_int", unique_grouping_values, [](size_t idx) { return 90+idx; });
+    check_column<double>(*segments[0], "mean_int", unique_grouping_values, [](size_t idx) { return double(45+idx); });
+    check_column<uint64_t>(*segments[0], "count_int", unique_grouping_values, [](size_t) { return 10; });
+}
+
 TEST(Clause, AggregationSparseColumn)
 {
     using namespace arcticdb;
@@ -334,6 +373,42 @@ TEST(Clause, Sort) {
     ASSERT_EQ(*res[0].segments_->at(0), copied);
 }
 
+TEST(Clause, SortValuesWithLimit) {
+    using namespace arcticdb;
+    auto component_manager = std::make_shared<ComponentManager>();
+
+    SortValuesClause sort_values_clause("int_repeated_values", false, 5);
+    sort_values_clause.set_component_manager(component_manager);
+    MergeSortedValuesClause merge_clause("int_repeated_values", false, 5);
+    merge_clause.set_component_manager(component_manager);
+
+    // Two row-slices of 20 rows, each with values i % 7 in the int_repeated_values column and i in the sum_int column
+    std::vector<Composite<EntityIds>> sorted;
+    for (size_t row_slice = 0; row_slice < 2; ++row_slice) {
+        auto proc_unit = ProcessingUnit{generate_groupby_testing_segment(20, 7), RowRange{row_slice * 20, (row_slice + 1) * 20}};
+        auto entity_ids = Composite<EntityIds>(push_entities(component_manager, std::move(proc_unit)));
+        sorted.emplace_back(sort_values_clause.process(std::move(entity_ids)));
+    }
+    auto repartitioned = sort_values_clause.repartition(std::move(sorted));
+    ASSERT_TRUE(repartitioned.has_value());
+    ASSERT_EQ(1, repartitioned->size());
+
+    auto res = gather_entities(component_manager, merge_clause.process(std::move(repartitioned->front()))).as_range();
+    ASSERT_EQ(1, res.size());
+    auto segment = *res[0].segments_->front();
+    ASSERT_EQ(5, segment.row_count());
+    // Rows with equal values are in the order of their row-slices, then their rows
+    const std::vector<int64_t> expected_values{6, 6, 6, 6, 5};
+    const std::vector<int64_t> expected_rows{6, 13, 6, 13, 5};
+    auto values_index = segment.column_index("int_repeated_values");
+    auto rows_index = segment.column_index("sum_int");
+    ASSERT_TRUE(values_index.has_value() && rows_index.has_value());
+    for (size_t idx = 0; idx < expected_values.size(); ++idx) {
+        ASSERT_EQ(expected_values[idx], segment.column(*values_index).scalar_at<int64_t>(idx));
+        ASSERT_EQ(expected_rows[idx], segment.column(*rows_index).scalar_at<int64_t>(idx));
+    }
+}
+
 TEST(Clause, Split) {
     using namespace arcticdb;
     auto component_manager = std::make_shared<ComponentManager>();
@@ -421,3 +496,146 @@ TEST(Clause, Merge) {
         }
     }
 }
+
+TEST(Clause, ResampleStructureForProcessing) {
+    using namespace arcticdb;
+    ResampleClause resample_clause("10ns", 10);
+
+    // Row-slices covering index values [0, 15), [15, 18), [18, 35), and [40, 50)
+    std::vector<std::pair<timestamp, timestamp>> index_ranges{{0, 15}, {15, 18}, {18, 35}, {40, 50}};
+    std::vector<RangesAndKey> ranges_and_keys;
+    size_t row_start{0};
+    for (const auto& [start_index, end_index]: index_ranges) {
+        auto num_rows = static_cast<size_t>(end_index - start_index);
+        auto key = entity::atom_key_builder().start_index(start_index).end_index(end_index).build<entity::KeyType::TABLE_DATA>("resample");
+        ranges_and_keys.emplace_back(RowRange{row_start, row_start + num_rows}, ColRange{1, 2}, key);
+        row_start += num_rows;
+    }
+
+    auto processing_unit_indexes = resample_clause.structure_for_processing(ranges_and_keys, 0);
+    // The second row-slice is entirely within the bucket starting at 10, which is owned by the first processing unit
+    std::vector<std::vector<size_t>> expected{{0, 1, 2}, {2}, {3}};
+    ASSERT_EQ(expected, processing_unit_indexes);
+    ASSERT_EQ(std::unordered_set<size_t>({15, 18}), resample_clause.continuing_row_slices_);
+}
+
+TEST(Clause, ResampleProcess) {
+    using namespace arcticdb;
+    auto component_manager = std::make_shared<ComponentManager>();
+
+    ResampleClause resample_clause("10ns", 10);
+    resample_clause.set_aggregations({{"sum", "uint64", "sum"},
+                                      {"count", "uint64", "count"},
+                                      {"first", "int8", "first"},
+                                      {"last", "int8", "last"}});
+    resample_clause.set_component_manager(component_manager);
+
+    // Index values 0 to 29, split into row-slices [0, 15) and [15, 30)
+    auto seg = get_standard_timeseries_segment("resample", 30);
+    auto first_row_slice = seg.truncate(0, 15, false);
+    auto second_row_slice = seg.truncate(15, 30, false);
+    // The bucket starting at 10 is owned by the first row-slice
+    resample_clause.continuing_row_slices_.insert(15);
+
+    auto first_entity_ids = push_entities(component_manager, ProcessingUnit(std::move(first_row_slice), RowRange{0, 15}));
+    auto spilled_entity_ids = push_entities(component_manager, ProcessingUnit(second_row_slice.clone(), RowRange{15, 30}));
+    first_entity_ids.insert(first_entity_ids.end(), spilled_entity_ids.begin(), spilled_entity_ids.end());
+    auto second_entity_ids = push_entities(component_manager, ProcessingUnit(std::move(second_row_slice), RowRange{15, 30}));
+    Composite<EntityIds> entity_ids;
+    entity_ids.push_back(std::move(first_entity_ids));
+    entity_ids.push_back(std::move(second_entity_ids));
+
+    auto res = gather_entities(component_manager, resample_clause.process(std::move(entity_ids))).as_range();
+    ASSERT_EQ(2, res.size());
+    std::sort(res.begin(), res.end(), [](const auto& left, const auto& right) {
+        return left.row_ranges_->at(0)->start() < right.row_ranges_->at(0)->start();
+    });
+    ASSERT_EQ(RowRange(0, 2), *res[0].row_ranges_->at(0));
+    ASSERT_EQ(RowRange(15, 16), *res[1].row_ranges_->at(0));
+
+    // Index value i has int8 value i and uint64 value 2i
+    auto check_buckets = [](const SegmentInMemory& segment, const std::vector<timestamp>& bucket_starts) {
+        ASSERT_EQ(bucket_starts.size(), segment.row_count());
+        ASSERT_EQ(IndexDescriptor::TIMESTAMP, segment.descriptor().index().type());
+        const auto& index_column = segment.column(0);
+        for (size_t idx = 0; idx < bucket_starts.size(); ++idx) {
+            ASSERT_EQ(bucket_starts[idx], index_column.scalar_at<timestamp>(idx));
+        }
+        using aggregation_test::check_column;
+        check_column<uint64_t>(segment, "sum", bucket_starts.size(), [&](size_t idx) { return uint64_t(20 * bucket_starts[idx] + 90); });
+        check_column<uint64_t>(segment, "count", bucket_starts.size(), [](size_t) { return uint64_t(10); });
+        check_column<int8_t>(segment, "first", bucket_starts.size(), [&](size_t idx) { return int8_t(bucket_starts[idx]); });
+        check_column<int8_t>(segment, "last", bucket_starts.size(), [&](size_t idx) { return int8_t(bucket_starts[idx] + 9); });
+    };
+    check_buckets(*res[0].segments_->at(0), {0, 10});
+    check_buckets(*res[1].segments_->at(0), {20});
+}
+
+TEST(Clause, AsOfJoinPrevailingRow) {
+    using namespace arcticdb;
+    // Index values 0 to 8, with int8 values 1, 1, 1, 2, 2, 2, 1, 1, 1, split into row-slices [0, 5) and [5, 9)
+    auto seg = get_groupable_timeseries_segment("asof", 3, {1, 2, 1});
+    std::vector<std::vector<SegmentInMemory>> row_slices;
+    row_slices.emplace_back().emplace_back(seg.truncate(0, 5, false));
+    row_slices.emplace_back().emplace_back(seg.truncate(5, 9, false));
+    AsOfJoinRightData right_data(std::move(row_slices), {"strings"}, "int8");
+
+    ASSERT_EQ(std::optional<size_t>(4), right_data.prevailing_row(4, std::nullopt, std::nullopt));
+    ASSERT_EQ(std::optional<size_t>(8), right_data.prevailing_row(100, std::nullopt, std::nullopt));
+    ASSERT_FALSE(right_data.prevailing_row(-1, std::nullopt, std::nullopt).has_value());
+    // Within a key
+    ASSERT_EQ(std::optional<size_t>(2), right_data.prevailing_row(5, "1", std::nullopt));
+    ASSERT_EQ(std::optional<size_t>(5), right_data.prevailing_row(7, "2", std::nullopt));
+    ASSERT_FALSE(right_data.prevailing_row(7, "3", std::nullopt).has_value());
+    // Tolerance
+    ASSERT_EQ(std::optional<size_t>(2), right_data.prevailing_row(5, "1", 3));
+    ASSERT_FALSE(right_data.prevailing_row(5, "1", 2).has_value());
+    ASSERT_EQ(std::optional<size_t>(4), right_data.prevailing_row(4, std::nullopt, 0));
+
+    // Row 7 is the third row of the second row-slice
+    auto location = right_data.value_location(0, 7);
+    ASSERT_TRUE(location.has_value());
+    const auto& [segment, column, row] = *location;
+    ASSERT_EQ(2, row);
+    ASSERT_EQ(std::optional<std::string_view>("string_1"), segment->string_at(row, column));
+}
+
+TEST(Clause, AsOfJoinRightSlicesReleased) {
+    using namespace arcticdb;
+    // Index values 0 to 8 split into row-slices [0, 3), [3, 6), and [6, 9)
+    auto seg = get_groupable_timeseries_segment("asof", 3, {1, 2, 1});
+    std::vector<size_t> loads;
+    AsOfJoinRightSlices right_slices(std::nullopt, std::nullopt);
+    right_slices.set_right_slices({{0, 2}, {3, 5}, {6, 8}}, {"strings"}, [&seg, &loads](size_t idx) {
+        loads.emplace_back(idx);
+        std::vector<SegmentInMemory> segments;
+        segments.emplace_back(seg.truncate(3 * idx, 3 * idx + 3, false));
+        return segments;
+    });
+    // Left row-slices with index values 4 to 5, and 5 to 7
+    right_slices.add_left_slice(0, {4, 5});
+    right_slices.add_left_slice(10, {5, 7});
+
+    auto first = right_slices.acquire(0, {4, 5});
+    ASSERT_EQ(1, first.size());
+    ASSERT_EQ(std::optional<size_t>(1), first[0]->prevailing_row(4, std::nullopt, std::nullopt));
+    std::weak_ptr<const AsOfJoinRightData> shared = first[0];
+    first.clear();
+    right_slices.release(0);
+    // Still needed by the second left row-slice, so not read again
+    ASSERT_FALSE(shared.expired());
+
+    auto second = right_slices.acquire(10, {5, 7});
+    ASSERT_EQ(2, second.size());
+    ASSERT_EQ(std::vector<size_t>({1, 2}), loads);
+    std::weak_ptr<const AsOfJoinRightData> last = second[1];
+    second.clear();
+    right_slices.release(10);
+    ASSERT_TRUE(shared.expired());
+    ASSERT_TRUE(last.expired());
+
+    // Left row-slices that were not added read what they need without keeping it
+    auto unrecorded = right_slices.acquire(20, {0, 1});
+    ASSERT_EQ(1, unrecorded.size());
+    ASSERT_EQ(std::vector<size_t>({1, 2, 0}), loads);
+}
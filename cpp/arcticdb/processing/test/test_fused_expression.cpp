@@ -0,0 +1,168 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+#include <arcticdb/processing/fused_expression.hpp>
+#include <arcticdb/processing/processing_unit.hpp>
+#include <arcticdb/util/configs_map.hpp>
+
+using namespace arcticdb;
+
+class FusedExpressionTest : public testing::Test {
+protected:
+    // More rows than fit in a block, and than fit in the first block of the columns' buffers, so that blocks of rows
+    // span blocks of the input columns
+    static constexpr size_t num_rows = 3 * FusedExpression::FUSED_BLOCK_ROWS + 17;
+
+    void SetUp() override {
+        SegmentInMemory seg;
+        auto int64s = std::make_shared<Column>(make_scalar_type(DataType::INT64), 0, false, false);
+        auto uint8s = std::make_shared<Column>(make_scalar_type(DataType::UINT8), 0, false, false);
+        auto float64s = std::make_shared<Column>(make_scalar_type(DataType::FLOAT64), 0, false, false);
+        auto bools = std::make_shared<Column>(make_scalar_type(DataType::BOOL8), 0, false, false);
+        for (size_t idx = 0; idx < num_rows; ++idx) {
+            int64s->set_scalar<int64_t>(idx, static_cast<int64_t>(idx % 97) - 48);
+            uint8s->set_scalar<uint8_t>(idx, static_cast<uint8_t>(idx % 251));
+            float64s->set_scalar<double>(idx, idx % 13 == 0 ? std::numeric_limits<double>::quiet_NaN() : static_cast<double>(idx) / 7.0);
+            bools->set_scalar<bool>(idx, idx % 3 == 0);
+        }
+        seg.add_column(scalar_field(DataType::INT64, "int64s"), int64s);
+        seg.add_column(scalar_field(DataType::UINT8, "uint8s"), uint8s);
+        seg.add_column(scalar_field(DataType::FLOAT64, "float64s"), float64s);
+        seg.add_column(scalar_field(DataType::BOOL8, "bools"), bools);
+        seg.set_row_id(num_rows - 1);
+        proc_unit = ProcessingUnit(std::move(seg));
+    }
+
+    ExpressionName add_node(const std::string& name, VariantNode left, VariantNode right, OperationType op) {
+        expression_context->add_expression_node(name, std::make_shared<ExpressionNode>(std::move(left), std::move(right), op));
+        return ExpressionName(name);
+    }
+
+    ExpressionName add_node(const std::string& name, VariantNode input, OperationType op) {
+        expression_context->add_expression_node(name, std::make_shared<ExpressionNode>(std::move(input), op));
+        return ExpressionName(name);
+    }
+
+    template<typename T>
+    ValueName add_value(const std::string& name, T value, DataType data_type) {
+        expression_context->add_value(name, std::make_shared<Value>(value, data_type));
+        return ValueName(name);
+    }
+
+    // Evaluates the expression both fused and node by node
+    std::pair<VariantData, VariantData> evaluate(const ExpressionName& root) {
+        expression_context->root_node_name_ = root;
+        proc_unit.set_expression_context(expression_context);
+        auto fused_expression = FusedExpression::compile(proc_unit, root);
+        EXPECT_TRUE(fused_expression.has_value());
+        if (!fused_expression.has_value()) {
+            return {};
+        }
+        return {fused_expression->evaluate(), proc_unit.get(root)};
+    }
+
+    void check_filter(const ExpressionName& root) {
+        auto [fused, node_by_node] = evaluate(root);
+        ASSERT_EQ(fused.index(), node_by_node.index());
+        if (std::holds_alternative<util::BitSet>(node_by_node)) {
+            ASSERT_EQ(std::get<util::BitSet>(fused), std::get<util::BitSet>(node_by_node));
+        }
+    }
+
+    template<typename T>
+    void check_projection(const ExpressionName& root) {
+        auto [fused, node_by_node] = evaluate(root);
+        const auto& fused_column = *std::get<ColumnWithStrings>(fused).column_;
+        const auto& expected_column = *std::get<ColumnWithStrings>(node_by_node).column_;
+        ASSERT_EQ(fused_column.type(), expected_column.type());
+        ASSERT_EQ(fused_column.row_count(), expected_column.row_count());
+        for (size_t idx = 0; idx < num_rows; ++idx) {
+            const auto fused_value = fused_column.scalar_at<T>(idx).value();
+            const auto expected_value = expected_column.scalar_at<T>(idx).value();
+            if constexpr (std::is_floating_point_v<T>) {
+                if (std::isnan(expected_value)) {
+                    ASSERT_TRUE(std::isnan(fused_value));
+                    continue;
+                }
+            }
+            ASSERT_EQ(fused_value, expected_value) << "row " << idx;
+        }
+    }
+
+    ProcessingUnit proc_unit;
+    std::shared_ptr<ExpressionContext> expression_context{std::make_shared<ExpressionContext>()};
+};
+
+TEST_F(FusedExpressionTest, ArithmeticComparisonFilter) {
+    // (int64s + uint8s) * 2 > 50
+    auto sum = add_node("sum", ColumnName("int64s"), ColumnName("uint8s"), OperationType::ADD);
+    auto product = add_node("product", sum, add_value("two", int64_t(2), DataType::INT64), OperationType::MUL);
+    check_filter(add_node("root", product, add_value("fifty", int64_t(50), DataType::INT64), OperationType::GT));
+}
+
+TEST_F(FusedExpressionTest, ValueOnLeftOfComparison) {
+    // 10.5 < float64s - uint8s
+    auto difference = add_node("difference", ColumnName("float64s"), ColumnName("uint8s"), OperationType::SUB);
+    check_filter(add_node("root", add_value("value", 10.5, DataType::FLOAT64), difference, OperationType::LT));
+}
+
+TEST_F(FusedExpressionTest, BooleanCombinations) {
+    // ((int64s < 0) & bools) | ~(float64s != float64s)
+    auto negative = add_node("negative", ColumnName("int64s"), add_value("zero", int64_t(0), DataType::INT64), OperationType::LT);
+    auto both = add_node("both", negative, ColumnName("bools"), OperationType::AND);
+    auto is_nan = add_node("is_nan", ColumnName("float64s"), ColumnName("float64s"), OperationType::NE);
+    auto not_nan = add_node("not_nan", is_nan, OperationType::NOT);
+    check_filter(add_node("root", both, not_nan, OperationType::OR));
+}
+
+TEST_F(FusedExpressionTest, EmptyFilter) {
+    // abs(int64s) > 1000
+    auto abs = add_node("abs", ColumnName("int64s"), OperationType::ABS);
+    auto [fused, node_by_node] = evaluate(add_node("root", abs, add_value("thousand", int64_t(1000), DataType::INT64), OperationType::GT));
+    ASSERT_TRUE(std::holds_alternative<EmptyResult>(fused));
+    ASSERT_TRUE(std::holds_alternative<EmptyResult>(node_by_node));
+}
+
+TEST_F(FusedExpressionTest, Projection) {
+    // -(int64s * uint8s) / float64s
+    auto product = add_node("product", ColumnName("int64s"), ColumnName("uint8s"), OperationType::MUL);
+    auto negated = add_node("negated", product, OperationType::NEG);
+    check_projection<double>(add_node("root", negated, ColumnName("float64s"), OperationType::DIV));
+}
+
+TEST_F(FusedExpressionTest, IntegerProjectionWithSharedSubexpression) {
+    // (uint8s + int64s) - (uint8s + int64s) * uint8s
+    auto sum = add_node("sum", ColumnName("uint8s"), ColumnName("int64s"), OperationType::ADD);
+    auto product = add_node("product", sum, ColumnName("uint8s"), OperationType::MUL);
+    check_projection<int64_t>(add_node("root", sum, product, OperationType::SUB));
+}
+
+TEST_F(FusedExpressionTest, Unsupported) {
+    proc_unit.set_expression_context(expression_context);
+    // Single operations are evaluated node by node, as there are no intermediate results to avoid
+    auto single = add_node("single", ColumnName("int64s"), ColumnName("uint8s"), OperationType::ADD);
+    ASSERT_FALSE(FusedExpression::compile(proc_unit, single).has_value());
+    // Null checks
+    auto is_null = add_node("is_null", ColumnName("float64s"), OperationType::ISNULL);
+    auto null_or_flag = add_node("null_or_flag", is_null, ColumnName("bools"), OperationType::OR);
+    ASSERT_FALSE(FusedExpression::compile(proc_unit, null_or_flag).has_value());
+    // Filters as inputs to arithmetic
+    auto less = add_node("less", ColumnName("int64s"), ColumnName("uint8s"), OperationType::LT);
+    auto sum_of_filter = add_node("sum_of_filter", less, ColumnName("int64s"), OperationType::ADD);
+    auto root = add_node("root", sum_of_filter, ColumnName("int64s"), OperationType::GT);
+    ASSERT_FALSE(FusedExpression::compile(proc_unit, root).has_value());
+}
+
+TEST_F(FusedExpressionTest, Disabled) {
+    proc_unit.set_expression_context(expression_context);
+    auto sum = add_node("sum", ColumnName("int64s"), ColumnName("uint8s"), OperationType::ADD);
+    auto root = add_node("root", sum, ColumnName("float64s"), OperationType::GE);
+    ASSERT_TRUE(FusedExpression::compile(proc_unit, root).has_value());
+    ScopedConfig disabled("Expression.FusedEvaluation", 0);
+    ASSERT_FALSE(FusedExpression::compile(proc_unit, root).has_value());
+}
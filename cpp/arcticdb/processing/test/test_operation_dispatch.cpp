@@ -7,9 +7,12 @@
 
 #include <gtest/gtest.h>
 
+#include <cmath>
+
 #include <arcticdb/processing/expression_node.hpp>
 #include <arcticdb/processing/operation_dispatch_binary.hpp>
 #include <arcticdb/processing/operation_dispatch_unary.hpp>
+#include <arcticdb/processing/operation_dispatch_string.hpp>
 #include <arcticdb/pipeline/value.hpp>
 #include <arcticdb/pipeline/value_set.hpp>
 #include <arcticdb/util/test/generators.hpp>
@@ -136,4 +139,107 @@ TEST(OperationDispatch, binary_membership) {
     ASSERT_TRUE(std::holds_alternative<EmptyResult>(visit_binary_membership(empty_column, value_set, IsInOperator{})));
     // empty col isnotin set
     ASSERT_TRUE(std::holds_alternative<FullResult>(visit_binary_membership(empty_column, value_set, IsNotInOperator{})));
-}
\ No newline at end of file
+}
+
+TEST(OperationDispatch, string_predicates_on_pool_offsets) {
+    using namespace arcticdb;
+    auto string_pool = std::make_shared<StringPool>();
+    // Strings in the pool but not the column should not match anything
+    string_pool->get("unused");
+    Column column(make_scalar_type(DataType::UTF_DYNAMIC64), false);
+    const std::vector<std::optional<std::string>> values{"a", "a", "b", std::nullopt, "a", "c", "c", std::nullopt, "b"};
+    for (size_t idx = 0; idx < values.size(); ++idx) {
+        column.set_scalar(idx, values[idx].has_value() ? string_pool->get(*values[idx]).offset() : not_a_string());
+    }
+    ColumnWithStrings string_column(std::move(column), string_pool);
+
+    auto offset = string_pool->get_offset_for_column("c", *string_column.column_);
+    ASSERT_TRUE(offset.has_value());
+    ASSERT_EQ(string_pool->get_const_view(*offset), "c");
+    ASSERT_FALSE(string_pool->get_offset_for_column("unused", *string_column.column_).has_value());
+    auto offsets = string_pool->get_offsets_for_column(
+            std::make_shared<std::unordered_set<std::string>>(std::unordered_set<std::string>{"b", "c", "d"}),
+            *string_column.column_);
+    ASSERT_EQ(offsets.size(), 2);
+
+    // col == val and col != val
+    auto equals = visit_binary_comparator(string_column, std::make_shared<Value>(construct_string_value("b")), EqualsOperator{});
+    auto not_equals = visit_binary_comparator(string_column, std::make_shared<Value>(construct_string_value("b")), NotEqualsOperator{});
+    ASSERT_TRUE(std::holds_alternative<util::BitSet>(equals));
+    ASSERT_TRUE(std::holds_alternative<util::BitSet>(not_equals));
+    for (size_t idx = 0; idx < values.size(); ++idx) {
+        ASSERT_EQ(values[idx] == "b", std::get<util::BitSet>(equals).get_bit(idx));
+        ASSERT_EQ(values[idx] != "b", std::get<util::BitSet>(not_equals).get_bit(idx));
+    }
+    // Values that are not in the column do not need any rows to be compared
+    auto absent = std::make_shared<Value>(construct_string_value("unused"));
+    ASSERT_TRUE(std::holds_alternative<EmptyResult>(visit_binary_comparator(string_column, absent, EqualsOperator{})));
+    ASSERT_TRUE(std::holds_alternative<FullResult>(visit_binary_comparator(absent, string_column, NotEqualsOperator{})));
+
+    // col isin set and col isnotin set
+    auto value_set = std::make_shared<ValueSet>(std::vector<std::string>{"a", "d"});
+    auto is_in = visit_binary_membership(string_column, value_set, IsInOperator{});
+    ASSERT_TRUE(std::holds_alternative<util::BitSet>(is_in));
+    for (size_t idx = 0; idx < values.size(); ++idx) {
+        ASSERT_EQ(values[idx] == "a", std::get<util::BitSet>(is_in).get_bit(idx));
+    }
+    auto absent_set = std::make_shared<ValueSet>(std::vector<std::string>{"unused", "d"});
+    ASSERT_TRUE(std::holds_alternative<EmptyResult>(visit_binary_membership(string_column, absent_set, IsInOperator{})));
+    ASSERT_TRUE(std::holds_alternative<FullResult>(visit_binary_membership(string_column, absent_set, IsNotInOperator{})));
+}
+
+TEST(OperationDispatch, string_functions) {
+    using namespace arcticdb;
+    auto string_pool = std::make_shared<StringPool>();
+    Column column(make_scalar_type(DataType::UTF_DYNAMIC64), false);
+    const std::vector<std::optional<std::string>> values{"EURUSD", "EURUSD", "GBPeur", std::nullopt, "Caf\xC3\xA9", "EURUSD", "usd"};
+    for (size_t idx = 0; idx < values.size(); ++idx) {
+        column.set_scalar(idx, values[idx].has_value() ? string_pool->get(*values[idx]).offset() : not_a_string());
+    }
+    ColumnWithStrings string_column(std::move(column), string_pool);
+    auto string_value = [](const std::string& str) {
+        return VariantData{std::make_shared<Value>(construct_string_value(str))};
+    };
+    auto check_predicate = [&](OperationType operation, const std::string& operand, auto&& expected) {
+        auto result = dispatch_binary(string_column, string_value(operand), operation);
+        ASSERT_TRUE(std::holds_alternative<util::BitSet>(result));
+        for (size_t idx = 0; idx < values.size(); ++idx) {
+            ASSERT_EQ(values[idx].has_value() && expected(*values[idx]), std::get<util::BitSet>(result).get_bit(idx));
+        }
+    };
+    check_predicate(OperationType::STARTSWITH, "EUR", [](const std::string& str) { return str.starts_with("EUR"); });
+    check_predicate(OperationType::CONTAINS, "USD", [](const std::string& str) { return str.find("USD") != std::string::npos; });
+    check_predicate(OperationType::REGEX_SEARCH, "[Ee]ur|sd$", [](const std::string& str) { return str == "GBPeur" || str == "usd"; });
+    check_predicate(OperationType::REGEX_MATCH, "[A-Z]{3}", [](const std::string& str) { return str == "EURUSD" || str == "GBPeur"; });
+    check_predicate(OperationType::REGEX_MATCH, "Caf.$", [](const std::string& str) { return str == "Caf\xC3\xA9"; });
+    ASSERT_TRUE(std::holds_alternative<EmptyResult>(dispatch_binary(string_column, string_value("JPY"), OperationType::STARTSWITH)));
+
+    auto lengths = dispatch_unary(string_column, OperationType::STRLEN);
+    ASSERT_TRUE(std::holds_alternative<ColumnWithStrings>(lengths));
+    const auto& length_column = *std::get<ColumnWithStrings>(lengths).column_;
+    ASSERT_EQ(length_column.type().data_type(), DataType::FLOAT64);
+    const std::vector<double> expected_lengths{6, 6, 6, 0, 4, 6, 3};
+    for (size_t idx = 0; idx < values.size(); ++idx) {
+        if (values[idx].has_value()) {
+            ASSERT_EQ(expected_lengths[idx], *length_column.scalar_at<double>(idx));
+        } else {
+            ASSERT_TRUE(std::isnan(*length_column.scalar_at<double>(idx)));
+        }
+    }
+
+    auto lowered = dispatch_unary(string_column, OperationType::LOWER);
+    ASSERT_TRUE(std::holds_alternative<ColumnWithStrings>(lowered));
+    const auto& lowered_column = std::get<ColumnWithStrings>(lowered);
+    const std::vector<std::optional<std::string_view>> expected_lowered{"eurusd", "eurusd", "gbpeur", std::nullopt, "caf\xC3\xA9", "eurusd", "usd"};
+    for (size_t idx = 0; idx < values.size(); ++idx) {
+        ASSERT_EQ(expected_lowered[idx], lowered_column.string_at_offset(*lowered_column.column_->scalar_at<entity::position_t>(idx)));
+    }
+    // Functions compose, so that the output of lower can be filtered
+    auto lowered_predicate = dispatch_binary(lowered, string_value("eur"), OperationType::STARTSWITH);
+    ASSERT_TRUE(std::holds_alternative<util::BitSet>(lowered_predicate));
+    ASSERT_EQ(std::get<util::BitSet>(lowered_predicate).count(), 3);
+
+    auto int_column = ColumnWithStrings(std::make_unique<Column>(generate_int_column(10)));
+    ASSERT_THROW(dispatch_unary(int_column, OperationType::STRLEN), UserInputException);
+    ASSERT_THROW(dispatch_binary(string_column, VariantData{std::make_shared<Value>(construct_value<int64_t>(1))}, OperationType::STARTSWITH), UserInputException);
+}
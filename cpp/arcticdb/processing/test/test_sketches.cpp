@@ -0,0 +1,178 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+#include <arcticdb/processing/sketches.hpp>
+
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <random>
+
+namespace {
+// splitmix64, so that consecutive integers give well-mixed hashes
+uint64_t test_hash(uint64_t value) {
+    value += 0x9e3779b97f4a7c15ULL;
+    value = (value ^ (value >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    value = (value ^ (value >> 27)) * 0x94d049bb133111ebULL;
+    return value ^ (value >> 31);
+}
+
+// Linear interpolation between the sorted values, as in numpy and Pandas
+double exact_quantile(std::vector<double> values, double q) {
+    std::sort(values.begin(), values.end());
+    const double position = q * static_cast<double>(values.size() - 1);
+    const auto lower = static_cast<size_t>(std::floor(position));
+    const auto upper = std::min(lower + 1, values.size() - 1);
+    return values[lower] + (values[upper] - values[lower]) * (position - static_cast<double>(lower));
+}
+}
+
+TEST(HyperLogLog, Estimate) {
+    using namespace arcticdb;
+    for (uint64_t num_distinct: {100, 10'000, 1'000'000}) {
+        HyperLogLog sketch;
+        for (uint64_t value = 0; value < num_distinct; ++value) {
+            // Repeated values do not change the estimate
+            sketch.add(test_hash(value));
+            sketch.add(test_hash(value));
+        }
+        ASSERT_NEAR(sketch.estimate(), static_cast<double>(num_distinct), 0.03 * static_cast<double>(num_distinct));
+    }
+}
+
+TEST(HyperLogLog, Merge) {
+    using namespace arcticdb;
+    HyperLogLog left;
+    HyperLogLog right;
+    HyperLogLog all;
+    for (uint64_t value = 0; value < 50'000; ++value) {
+        // Overlapping halves
+        (value < 30'000 ? left : right).add(test_hash(value));
+        if (value >= 20'000 && value < 30'000)
+            right.add(test_hash(value));
+        all.add(test_hash(value));
+    }
+    left.merge(right);
+    ASSERT_EQ(left.estimate(), all.estimate());
+}
+
+TEST(DistinctCounter, ExactBelowThreshold) {
+    using namespace arcticdb;
+    DistinctCounter counter(100);
+    for (uint64_t value = 0; value < 100; ++value) {
+        counter.add(test_hash(value % 60));
+        counter.add(test_hash(value));
+    }
+    ASSERT_TRUE(counter.is_exact());
+    ASSERT_EQ(counter.count(), 100);
+    counter.add(test_hash(100));
+    ASSERT_FALSE(counter.is_exact());
+    ASSERT_NEAR(static_cast<double>(counter.count()), 101.0, 2.0);
+}
+
+TEST(DistinctCounter, Merge) {
+    using namespace arcticdb;
+    DistinctCounter small_left(100);
+    DistinctCounter small_right(100);
+    for (uint64_t value = 0; value < 80; ++value) {
+        small_left.add(test_hash(value));
+        small_right.add(test_hash(value + 10));
+    }
+    small_left.merge(small_right);
+    ASSERT_TRUE(small_left.is_exact());
+    ASSERT_EQ(small_left.count(), 90);
+
+    // Merging exact counts that are large together moves them into a sketch, as does merging a sketch
+    DistinctCounter exact(100);
+    DistinctCounter sketched(100);
+    for (uint64_t value = 0; value < 5'000; ++value) {
+        sketched.add(test_hash(value));
+    }
+    for (uint64_t value = 4'950; value < 5'010; ++value) {
+        exact.add(test_hash(value));
+    }
+    exact.merge(sketched);
+    ASSERT_FALSE(exact.is_exact());
+    ASSERT_NEAR(static_cast<double>(exact.count()), 5'010.0, 0.03 * 5'010.0);
+}
+
+TEST(TDigest, ExactForSmallInputs) {
+    using namespace arcticdb;
+    std::vector<double> values{5, 1, 4, 1, 3, 9, 2, 6};
+    TDigest digest;
+    for (auto value: values) {
+        digest.add(value);
+    }
+    digest.add(std::numeric_limits<double>::quiet_NaN());
+    ASSERT_EQ(digest.total_weight(), values.size());
+    for (double q: {0.0, 0.1, 0.25, 0.5, 0.75, 0.99, 1.0}) {
+        ASSERT_DOUBLE_EQ(digest.quantile(q), exact_quantile(values, q)) << "q=" << q;
+    }
+}
+
+TEST(TDigest, Empty) {
+    using namespace arcticdb;
+    TDigest digest;
+    ASSERT_TRUE(std::isnan(digest.quantile(0.5)));
+    digest.add(3.0);
+    ASSERT_EQ(digest.quantile(0.0), 3.0);
+    ASSERT_EQ(digest.quantile(0.5), 3.0);
+    ASSERT_EQ(digest.quantile(1.0), 3.0);
+}
+
+TEST(TDigest, LargeInputs) {
+    using namespace arcticdb;
+    std::mt19937_64 gen(42);
+    std::normal_distribution<double> dist(100.0, 15.0);
+    std::vector<double> values;
+    TDigest digest;
+    for (size_t idx = 0; idx < 100'000; ++idx) {
+        values.emplace_back(dist(gen));
+        digest.add(values.back());
+    }
+    ASSERT_EQ(digest.quantile(0.0), *std::min_element(values.begin(), values.end()));
+    ASSERT_EQ(digest.quantile(1.0), *std::max_element(values.begin(), values.end()));
+    for (double q: {0.001, 0.01, 0.5, 0.9, 0.99, 0.999}) {
+        // Accuracy is relative to the density of values around the quantile, so compare the quantiles of the output
+        std::sort(values.begin(), values.end());
+        const auto estimate = digest.quantile(q);
+        const auto rank = static_cast<double>(std::lower_bound(values.begin(), values.end(), estimate) - values.begin());
+        ASSERT_NEAR(rank / static_cast<double>(values.size()), q, 0.005) << "q=" << q;
+    }
+}
+
+TEST(TDigest, Merge) {
+    using namespace arcticdb;
+    std::vector<double> values;
+    std::vector<TDigest> digests(8);
+    for (size_t idx = 0; idx < 80'000; ++idx) {
+        values.emplace_back(static_cast<double>((idx * 7919) % 80'000));
+        digests[idx % digests.size()].add(values.back());
+    }
+    TDigest merged;
+    for (const auto& digest: digests) {
+        merged.merge(digest);
+    }
+    ASSERT_EQ(merged.total_weight(), values.size());
+    for (double q: {0.01, 0.5, 0.99}) {
+        ASSERT_NEAR(merged.quantile(q), exact_quantile(values, q), 0.005 * 80'000) << "q=" << q;
+    }
+
+    // Merging small digests keeps every value
+    TDigest left;
+    TDigest right;
+    for (double value: {3.0, 1.0, 2.0}) {
+        left.add(value);
+    }
+    for (double value: {10.0, 0.5}) {
+        right.add(value);
+    }
+    left.merge(right);
+    ASSERT_DOUBLE_EQ(left.quantile(0.5), 2.0);
+    ASSERT_DOUBLE_EQ(left.quantile(0.9), exact_quantile({3.0, 1.0, 2.0, 10.0, 0.5}, 0.9));
+}
@@ -0,0 +1,93 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+#include <arcticdb/processing/window.hpp>
+#include <arcticdb/util/error_code.hpp>
+
+#include <cmath>
+#include <limits>
+
+namespace {
+constexpr double nan = std::numeric_limits<double>::quiet_NaN();
+
+void assert_equal_with_nans(const std::vector<double>& expected, const std::vector<double>& actual) {
+    ASSERT_EQ(expected.size(), actual.size());
+    for (size_t idx = 0; idx < expected.size(); ++idx) {
+        if (std::isnan(expected[idx])) {
+            ASSERT_TRUE(std::isnan(actual[idx])) << "at row " << idx;
+        } else {
+            ASSERT_DOUBLE_EQ(expected[idx], actual[idx]) << "at row " << idx;
+        }
+    }
+}
+}
+
+TEST(WindowAggregate, RowsWindow) {
+    using namespace arcticdb;
+    std::vector<double> values{1, 4, 2, 8, 5};
+    WindowSpec spec{WindowSpec::Type::ROWS, 3, 3};
+    assert_equal_with_nans({nan, nan, 7, 14, 15}, window_aggregate(WindowOperator::SUM, spec, {}, values, 0));
+    assert_equal_with_nans({nan, nan, 7.0 / 3, 14.0 / 3, 5}, window_aggregate(WindowOperator::MEAN, spec, {}, values, 0));
+    assert_equal_with_nans({nan, nan, 1, 2, 2}, window_aggregate(WindowOperator::MIN, spec, {}, values, 0));
+    assert_equal_with_nans({nan, nan, 4, 8, 8}, window_aggregate(WindowOperator::MAX, spec, {}, values, 0));
+    spec.min_periods_ = 1;
+    assert_equal_with_nans({1, 2, 3, 3, 3}, window_aggregate(WindowOperator::COUNT, spec, {}, values, 0));
+}
+
+TEST(WindowAggregate, SkipsNaNs) {
+    using namespace arcticdb;
+    std::vector<double> values{1, nan, 3, nan, nan, 6};
+    WindowSpec spec{WindowSpec::Type::ROWS, 2, 1};
+    assert_equal_with_nans({1, 1, 3, 3, nan, 6}, window_aggregate(WindowOperator::SUM, spec, {}, values, 0));
+    assert_equal_with_nans({1, 1, 3, 3, nan, 6}, window_aggregate(WindowOperator::MAX, spec, {}, values, 0));
+    assert_equal_with_nans({1, 1, 1, 1, 0, 1}, window_aggregate(WindowOperator::COUNT, spec, {}, values, 0));
+}
+
+TEST(WindowAggregate, TimeWindow) {
+    using namespace arcticdb;
+    std::vector<timestamp> index{0, 1, 5, 5, 9, 20};
+    std::vector<double> values{1, 2, 3, 4, 5, 6};
+    // Windows cover (t - 5, t]
+    WindowSpec spec{WindowSpec::Type::TIME, 5, 1};
+    assert_equal_with_nans({1, 3, 5, 9, 12, 6}, window_aggregate(WindowOperator::SUM, spec, index, values, 0));
+    assert_equal_with_nans({1, 1, 2, 2, 3, 6}, window_aggregate(WindowOperator::MIN, spec, index, values, 0));
+}
+
+TEST(WindowAggregate, ExpandingWindow) {
+    using namespace arcticdb;
+    std::vector<double> values{3, 1, nan, 2};
+    WindowSpec spec{WindowSpec::Type::EXPANDING, 0, 2};
+    assert_equal_with_nans({nan, 4, 4, 6}, window_aggregate(WindowOperator::SUM, spec, {}, values, 0));
+    assert_equal_with_nans({nan, 1, 1, 1}, window_aggregate(WindowOperator::MIN, spec, {}, values, 0));
+}
+
+TEST(WindowAggregate, OutputStart) {
+    using namespace arcticdb;
+    // The rows before output_start fill the windows of the output rows, as for the preceding row-slices of a processing unit
+    std::vector<double> values{1, 2, 3, 4, 5, 6};
+    WindowSpec spec{WindowSpec::Type::ROWS, 3, 3};
+    auto all_rows = window_aggregate(WindowOperator::SUM, spec, {}, values, 0);
+    auto last_rows = window_aggregate(WindowOperator::SUM, spec, {}, values, 4);
+    assert_equal_with_nans({all_rows.begin() + 4, all_rows.end()}, last_rows);
+    assert_equal_with_nans({}, window_aggregate(WindowOperator::SUM, spec, {}, values, 6));
+}
+
+TEST(WindowAggregate, TimeWindowUnsorted) {
+    using namespace arcticdb;
+    std::vector<timestamp> index{0, 2, 1};
+    std::vector<double> values{1, 2, 3};
+    WindowSpec spec{WindowSpec::Type::TIME, 5, 1};
+    ASSERT_THROW(window_aggregate(WindowOperator::SUM, spec, index, values, 0), SortingException);
+}
+
+TEST(WindowOperator, FromString) {
+    using namespace arcticdb;
+    ASSERT_EQ(window_operator_from_string("mean"), WindowOperator::MEAN);
+    ASSERT_EQ(window_operator_from_string("count"), WindowOperator::COUNT);
+    ASSERT_FALSE(window_operator_from_string("first").has_value());
+}
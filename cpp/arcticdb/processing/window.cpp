@@ -0,0 +1,132 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/processing/window.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+#include <cmath>
+#include <deque>
+#include <limits>
+
+namespace arcticdb {
+
+std::optional<WindowOperator> window_operator_from_string(std::string_view name) {
+    if (name == "sum")
+        return WindowOperator::SUM;
+    if (name == "mean")
+        return WindowOperator::MEAN;
+    if (name == "min")
+        return WindowOperator::MIN;
+    if (name == "max")
+        return WindowOperator::MAX;
+    if (name == "count")
+        return WindowOperator::COUNT;
+    return std::nullopt;
+}
+
+std::string WindowSpec::to_string() const {
+    switch (type_) {
+    case Type::ROWS:
+        return fmt::format("ROWS({})", size_);
+    case Type::TIME:
+        return fmt::format("TIME({}ns)", size_);
+    default:
+        return "EXPANDING";
+    }
+}
+
+std::vector<double> window_aggregate(
+        WindowOperator op,
+        const WindowSpec& spec,
+        const std::vector<timestamp>& index,
+        const std::vector<double>& values,
+        size_t output_start) {
+    internal::check<ErrorCode::E_ASSERTION_FAILURE>(
+            spec.type_ != WindowSpec::Type::TIME || index.size() == values.size(),
+            "Time windows require an index value for each of the {} values, received {}", values.size(), index.size());
+    std::vector<double> res;
+    res.reserve(values.size() > output_start ? values.size() - output_start : 0);
+
+    double sum{0.0};
+    size_t count{0};
+    size_t window_start{0};
+    // Rows whose values could still be the minimum (or maximum) of a later window, with their values in increasing
+    // (or decreasing) order
+    std::deque<size_t> extremes;
+    const auto displaces = [op](double candidate, double existing) {
+        return op == WindowOperator::MIN ? candidate <= existing : candidate >= existing;
+    };
+
+    for (size_t row = 0; row < values.size(); ++row) {
+        const double value = values[row];
+        if (!std::isnan(value)) {
+            sum += value;
+            ++count;
+            if (op == WindowOperator::MIN || op == WindowOperator::MAX) {
+                while (!extremes.empty() && displaces(value, values[extremes.back()]))
+                    extremes.pop_back();
+                extremes.push_back(row);
+            }
+        }
+
+        size_t new_window_start = window_start;
+        switch (spec.type_) {
+        case WindowSpec::Type::ROWS:
+            if (row + 1 > static_cast<size_t>(spec.size_))
+                new_window_start = row + 1 - static_cast<size_t>(spec.size_);
+            break;
+        case WindowSpec::Type::TIME:
+            sorting::check<ErrorCode::E_UNSORTED_DATA>(
+                    row == 0 || index[row - 1] <= index[row],
+                    "Time windows require data sorted by its index, but {} follows {}", index[row], index[row - 1]);
+            while (index[new_window_start] <= index[row] - spec.size_)
+                ++new_window_start;
+            break;
+        default:
+            break;
+        }
+        for (; window_start < new_window_start; ++window_start) {
+            if (!std::isnan(values[window_start])) {
+                sum -= values[window_start];
+                --count;
+            }
+        }
+        // Avoid accumulating rounding errors from values that have left the window
+        if (count == 0)
+            sum = 0.0;
+        while (!extremes.empty() && extremes.front() < window_start)
+            extremes.pop_front();
+
+        if (row < output_start)
+            continue;
+
+        // As in Pandas, the minimum number of periods for counts applies to all rows in the window, including NaNs
+        const auto periods = op == WindowOperator::COUNT ? row + 1 - window_start : count;
+        if (periods < spec.min_periods_) {
+            res.emplace_back(std::numeric_limits<double>::quiet_NaN());
+            continue;
+        }
+        switch (op) {
+        case WindowOperator::SUM:
+            res.emplace_back(sum);
+            break;
+        case WindowOperator::MEAN:
+            res.emplace_back(count > 0 ? sum / static_cast<double>(count) : std::numeric_limits<double>::quiet_NaN());
+            break;
+        case WindowOperator::MIN:
+        case WindowOperator::MAX:
+            res.emplace_back(extremes.empty() ? std::numeric_limits<double>::quiet_NaN() : values[extremes.front()]);
+            break;
+        case WindowOperator::COUNT:
+            res.emplace_back(static_cast<double>(count));
+            break;
+        }
+    }
+    return res;
+}
+
+} // namespace arcticdb
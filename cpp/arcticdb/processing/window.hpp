@@ -0,0 +1,63 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/entity/types.hpp>
+
+#include <optional>
+#include <string>
+#include <string_view>
+#include <vector>
+
+namespace arcticdb {
+
+enum class WindowOperator {
+    SUM,
+    MEAN,
+    MIN,
+    MAX,
+    COUNT
+};
+
+std::optional<WindowOperator> window_operator_from_string(std::string_view name);
+
+// The rows each output row is aggregated over, which always end at (and include) the output row
+struct WindowSpec {
+    enum class Type {
+        // The last size_ rows
+        ROWS,
+        // Rows with an index value in (t - size_, t], where t is the index value of the output row
+        TIME,
+        // All rows up to and including the output row
+        EXPANDING
+    };
+
+    Type type_;
+    int64_t size_{0};
+    // Number of non-NaN values required in the window for the output not to be NaN
+    size_t min_periods_{1};
+
+    [[nodiscard]] std::string to_string() const;
+};
+
+/*
+ * Aggregates values over the window ending at each row, returning one value per row from output_start onwards. Rows
+ * before output_start only contribute to the windows of later rows, which is how state is carried across row-slices.
+ *
+ * NaN values are skipped, as are NaN values passed for rows that a column is missing from. The output is NaN for rows
+ * whose window has fewer than min_periods_ non-NaN values, or fewer than min_periods_ rows for COUNT. Index values are only used by TIME windows, and must be
+ * non-decreasing for them.
+ */
+std::vector<double> window_aggregate(
+    WindowOperator op,
+    const WindowSpec& spec,
+    const std::vector<timestamp>& index,
+    const std::vector<double>& values,
+    size_t output_start);
+
+} // namespace arcticdb
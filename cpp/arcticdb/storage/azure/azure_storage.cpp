@@ -154,6 +154,7 @@ void do_read_impl(Composite<VariantKey> && ks,
     const ReadVisitor& visitor,
     const std::string& root_folder,
     AzureClientWrapper& azure_client,
+    RequestHedger& hedger,
     KeyBucketizer&& bucketizer,
     ReadKeyOpts opts,
     const Azure::Storage::Blobs::DownloadBlobToOptions& download_option,
@@ -163,13 +164,16 @@ void do_read_impl(Composite<VariantKey> && ks,
         std::vector<VariantKey> failed_reads;
 
         (fg::from(ks.as_range()) | fg::move | fg::groupBy(fmt_db)).foreach(
-            [&azure_client, &root_folder, b=std::move(bucketizer), &visitor, &failed_reads,
+            [&azure_client, &hedger, &root_folder, b=std::move(bucketizer), &visitor, &failed_reads,
             opts=opts, &download_option, &request_timeout] (auto&& group) {
             for (auto& k : group.values()) {
                 auto key_type_dir = key_type_folder(root_folder, variant_key_type(k));
                 auto blob_name = object_path(b.bucketize(key_type_dir, k), k);
                 try {
-                    visitor(k, azure_client.read_blob(blob_name, download_option, request_timeout));
+                    // Captures by value, as a hedged duplicate of the request may outlive this read
+                    visitor(k, hedger.run([&azure_client, blob_name, download_option, request_timeout]() {
+                        return azure_client.read_blob(blob_name, download_option, request_timeout);
+                    }));
 
                     ARCTICDB_DEBUG(log::storage(), "Read key {}: {}", variant_key_type(k), variant_key_view(k));
                 }
@@ -309,7 +313,7 @@ void AzureStorage::do_update(Composite<KeySegmentPair>&& kvs, UpdateOpts) {
 }
 
 void AzureStorage::do_read(Composite<VariantKey>&& ks, const ReadVisitor& visitor, ReadKeyOpts opts) {
-    detail::do_read_impl(std::move(ks), visitor, root_folder_, *azure_client_, FlatBucketizer{}, opts, download_option_, request_timeout_);
+    detail::do_read_impl(std::move(ks), visitor, root_folder_, *azure_client_, hedger_, FlatBucketizer{}, opts, download_option_, request_timeout_);
 }
 
 void AzureStorage::do_remove(Composite<VariantKey>&& ks, RemoveOpts) {
@@ -8,6 +8,7 @@
 #pragma once
 
 #include <arcticdb/storage/storage.hpp>
+#include <arcticdb/storage/hedged_requests.hpp>
 #include <arcticdb/storage/storage_factory.hpp>
 #include <arcticdb/storage/object_store_utils.hpp>
 #include <arcticdb/storage/azure/azure_client_wrapper.hpp>
@@ -61,6 +62,8 @@ class AzureStorage final : public Storage {
     unsigned int request_timeout_;
     Azure::Storage::Blobs::UploadBlockBlobFromOptions upload_option_;
     Azure::Storage::Blobs::DownloadBlobToOptions download_option_;
+    // Last, so that any hedged reads still running complete before the client is destroyed
+    RequestHedger hedger_{"AzureStorage"};
 
     Azure::Storage::Blobs::BlobClientOptions get_client_options(const Config &conf);
 };
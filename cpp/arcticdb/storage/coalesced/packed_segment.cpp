@@ -0,0 +1,141 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/storage/coalesced/packed_segment.hpp>
+#include <arcticdb/storage/coalesced/multi_segment_header.hpp>
+#include <arcticdb/codec/codec.hpp>
+#include <arcticdb/codec/default_codecs.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+#include <algorithm>
+#include <cstring>
+
+namespace arcticdb::storage {
+
+bool is_packed_segment_key(const VariantKey& key) {
+    const auto* atom_key = std::get_if<AtomKey>(&key);
+    return atom_key != nullptr && atom_key->type() == KeyType::MULTI_SEGMENT && atom_key->content_hash() != 0;
+}
+
+AtomKey coalesced_object_key(const StreamId& stream_id, timestamp creation_ts) {
+    return atom_key_builder()
+        .version_id(0)
+        .creation_ts(creation_ts)
+        .content_hash(0)
+        .start_index(NumericIndex{0})
+        .end_index(NumericIndex{0})
+        .build(stream_id, KeyType::MULTI_SEGMENT);
+}
+
+AtomKey coalesced_object_key(const AtomKey& packed_key) {
+    return coalesced_object_key(packed_key.id(), packed_key.creation_ts());
+}
+
+uint64_t packed_segment_content_hash(uint64_t offset, uint64_t bytes) {
+    constexpr uint64_t max_packed_value = std::numeric_limits<uint32_t>::max();
+    util::check(offset <= max_packed_value && bytes <= max_packed_value,
+                "Cannot reference {} bytes at offset {} of a multi-segment object, both must be less than 4GB",
+                bytes, offset);
+    return (offset << 32) | bytes;
+}
+
+ObjectRange packed_segment_range(const AtomKey& packed_key) {
+    util::check(is_packed_segment_key(packed_key), "Expected a key of a packed segment, got {}", packed_key);
+    return {packed_key.content_hash() >> 32, packed_key.content_hash() & std::numeric_limits<uint32_t>::max()};
+}
+
+ObjectRange spanning_range(const std::vector<ObjectRange>& ranges) {
+    util::check(!ranges.empty(), "Expected at least one range of an object to read");
+    auto begin = std::numeric_limits<uint64_t>::max();
+    uint64_t end = 0;
+    for (const auto& [offset, bytes] : ranges) {
+        begin = std::min(begin, offset);
+        end = std::max(end, offset + bytes);
+    }
+    return {begin, end - begin};
+}
+
+CoalescedObject pack_segments(
+    const StreamId& stream_id,
+    timestamp creation_ts,
+    std::vector<std::pair<AtomKey, Segment>>&& segments) {
+    util::check(!segments.empty(), "No segments to pack for symbol {}", stream_id);
+    MultiSegmentHeader header;
+    header.initalize(stream_id, segments.size());
+    std::vector<size_t> header_sizes;
+    std::vector<ObjectRange> relative_ranges;
+    uint64_t body_bytes = 0;
+    for (const auto& [key, segment] : segments) {
+        const auto hdr_size = segment.segment_header_bytes_size();
+        const auto bytes = segment.total_segment_size(hdr_size);
+        util::check(bytes <= MAX_COALESCED_OBJECT_BYTES,
+                    "Cannot pack segment {} of symbol {}, as it is {} bytes and packed segments must be less than 4GB",
+                    key, stream_id, bytes);
+        header.add_key_and_offset(key, body_bytes, bytes);
+        header_sizes.emplace_back(hdr_size);
+        relative_ranges.emplace_back(body_bytes, bytes);
+        body_bytes += bytes;
+    }
+    header.sort();
+
+    auto object = encode_dispatch(header.detach_segment(), codec::default_lz4_codec(), EncodingVersion::V1);
+    const auto header_bytes = object.total_segment_size();
+    const auto header_body_bytes = object.buffer_bytes();
+    util::check(header_bytes + body_bytes <= MAX_COALESCED_OBJECT_BYTES,
+                "Cannot pack {} bytes of segments of symbol {} into one object, the limit is {}",
+                header_bytes + body_bytes, stream_id, MAX_COALESCED_OBJECT_BYTES);
+
+    // The packed segments follow the body of the header segment, which ignores bytes after its own body when read
+    auto buffer = std::make_shared<Buffer>(header_body_bytes + body_bytes);
+    std::memcpy(buffer->data(), object.buffer().data(), header_body_bytes);
+    CoalescedObject result;
+    result.packed_keys_.reserve(segments.size());
+    for (size_t i = 0; i < segments.size(); ++i) {
+        auto& [key, segment] = segments[i];
+        const auto [relative_offset, bytes] = relative_ranges[i];
+        segment.write_to(buffer->data() + header_body_bytes + relative_offset, header_sizes[i]);
+        result.packed_keys_.emplace_back(atom_key_builder()
+            .version_id(key.version_id())
+            .creation_ts(creation_ts)
+            .content_hash(packed_segment_content_hash(header_bytes + relative_offset, bytes))
+            .start_index(key.start_index())
+            .end_index(key.end_index())
+            .build(key.id(), KeyType::MULTI_SEGMENT));
+    }
+    object.set_buffer(std::move(buffer));
+    result.object_ = KeySegmentPair{coalesced_object_key(stream_id, creation_ts), std::move(object)};
+    return result;
+}
+
+std::vector<Segment> segments_in_span(
+    const uint8_t* data,
+    const ObjectRange& span,
+    const std::vector<ObjectRange>& ranges,
+    const std::any& keepalive) {
+    const auto& [span_offset, span_bytes] = span;
+    std::vector<Segment> segments;
+    segments.reserve(ranges.size());
+    for (const auto& [offset, bytes] : ranges) {
+        util::check(offset >= span_offset && offset + bytes <= span_offset + span_bytes,
+                    "Range of {} bytes at offset {} is outside of the {} bytes read at offset {}",
+                    bytes, offset, span_bytes, span_offset);
+        auto segment = Segment::from_bytes(data + (offset - span_offset), bytes);
+        segment.set_keepalive(std::any(keepalive));
+        segments.emplace_back(std::move(segment));
+    }
+    return segments;
+}
+
+std::vector<Segment> read_segment_ranges(Segment& object, const std::vector<ObjectRange>& ranges) {
+    const auto hdr_size = object.segment_header_bytes_size();
+    const auto object_bytes = object.total_segment_size(hdr_size);
+    auto buffer = std::make_shared<Buffer>(object_bytes);
+    object.write_to(buffer->data(), hdr_size);
+    return segments_in_span(buffer->data(), {0, object_bytes}, ranges, std::any(buffer));
+}
+
+} //namespace arcticdb::storage
@@ -0,0 +1,80 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/entity/atom_key.hpp>
+#include <arcticdb/storage/key_segment_pair.hpp>
+#include <arcticdb/storage/storage.hpp>
+
+#include <any>
+#include <limits>
+#include <utility>
+#include <vector>
+
+/*
+ * Many small data segments of a symbol can be coalesced into a single storage object, so that reading them takes one
+ * object fetch rather than one per segment. The object is a segment holding a MultiSegmentHeader, which lists the
+ * original keys of the packed segments, with the serialized packed segments appended after it.
+ *
+ * Index segments reference a packed segment with a MULTI_SEGMENT key in place of its TABLE_DATA key. It keeps the
+ * stream id, version id and index range of the original key, its creation timestamp is that of the object, and its
+ * content hash holds the offset of the segment in the object in the upper 32 bits and its size in the lower 32 bits.
+ * The key of the object itself is the MULTI_SEGMENT key with the same stream id and creation timestamp, and a content
+ * hash of zero. A packed segment is therefore read with a ranged read of the object, without reading its header.
+ *
+ * This is a change to the storage format. Clients that predate MULTI_SEGMENT keys cannot read a version referencing
+ * packed segments, or any later version of the symbol that still references them.
+ */
+namespace arcticdb::storage {
+
+// Objects are limited to 4GB so that the offset and size of a packed segment fit in the content hash of its key
+constexpr uint64_t MAX_COALESCED_OBJECT_BYTES = std::numeric_limits<uint32_t>::max();
+
+// Whether key references a segment packed into a multi-segment object, rather than the object itself
+bool is_packed_segment_key(const VariantKey& key);
+
+AtomKey coalesced_object_key(const StreamId& stream_id, timestamp creation_ts);
+
+// The key of the object the segment referenced by packed_key is packed into
+AtomKey coalesced_object_key(const AtomKey& packed_key);
+
+// The content hash of the key of a packed segment of the given size at offset within its object. Both must fit in 32
+// bits, so segments of 4GB or more cannot be packed
+uint64_t packed_segment_content_hash(uint64_t offset, uint64_t bytes);
+
+// The offset and size in bytes of the segment referenced by packed_key within its object
+ObjectRange packed_segment_range(const AtomKey& packed_key);
+
+// The smallest range covering all of ranges
+ObjectRange spanning_range(const std::vector<ObjectRange>& ranges);
+
+struct CoalescedObject {
+    KeySegmentPair object_;
+    // The keys referencing the packed segments, in the order the segments were given
+    std::vector<AtomKey> packed_keys_;
+};
+
+// Packs the compressed segments into one object with the given creation timestamp, which must be unique among the
+// objects of the symbol
+CoalescedObject pack_segments(
+    const StreamId& stream_id,
+    timestamp creation_ts,
+    std::vector<std::pair<AtomKey, Segment>>&& segments);
+
+// The segments at each of ranges within an object, given the bytes of the range span of the object. The segments
+// reference these bytes rather than copying them, so keepalive must own them
+std::vector<Segment> segments_in_span(
+    const uint8_t* data,
+    const ObjectRange& span,
+    const std::vector<ObjectRange>& ranges,
+    const std::any& keepalive);
+
+// The segments at each of ranges within object, for storages holding objects in memory
+std::vector<Segment> read_segment_ranges(Segment& object, const std::vector<ObjectRange>& ranges);
+
+} //namespace arcticdb::storage
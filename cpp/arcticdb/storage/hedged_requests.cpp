@@ -0,0 +1,94 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/storage/hedged_requests.hpp>
+#include <arcticdb/entity/metrics.hpp>
+#include <arcticdb/log/log.hpp>
+#include <arcticdb/util/configs_map.hpp>
+#include <arcticdb/util/preconditions.hpp>
+
+#include <folly/executors/thread_factory/NamedThreadFactory.h>
+
+#include <algorithm>
+
+namespace arcticdb::storage {
+
+namespace {
+
+// The number of recent latencies the hedging percentile is taken over
+constexpr size_t LATENCY_WINDOW = 1024;
+// The hedging latency is recomputed after every this many requests
+constexpr size_t LATENCY_RECOMPUTE_INTERVAL = 32;
+
+int64_t hedge_config(const std::string& config_prefix, const std::string& name, int64_t default_value) {
+    return ConfigsMap::instance()->get_int(fmt::format("{}.{}", config_prefix, name), default_value);
+}
+
+} // namespace
+
+RequestHedger::RequestHedger(const std::string& config_prefix) :
+    percentile_(hedge_config(config_prefix, "HedgePercentile", 0)),
+    budget_percent_(hedge_config(config_prefix, "HedgeBudgetPercent", 5)),
+    min_samples_(static_cast<size_t>(hedge_config(config_prefix, "HedgeMinSamples", 100))),
+    min_delay_ns_(hedge_config(config_prefix, "HedgeMinDelayMs", 10) * 1'000'000) {
+    if (!enabled())
+        return;
+
+    util::check(percentile_ < 100, "{}.HedgePercentile must be below 100, got {}", config_prefix, percentile_);
+    latencies_.resize(LATENCY_WINDOW);
+    // Each request being made may need a thread for the original and one for its duplicate
+    const auto num_threads = hedge_config(config_prefix, "HedgeNumThreads", 2 * ConfigsMap::instance()->get_int("VersionStore.NumIOThreads", 16));
+    executor_ = std::make_unique<folly::CPUThreadPoolExecutor>(
+        static_cast<size_t>(num_threads),
+        std::make_shared<folly::NamedThreadFactory>(fmt::format("{}Hedge", config_prefix)));
+    ARCTICDB_DEBUG(log::storage(), "Hedging {} requests slower than percentile {} of recent latencies", config_prefix, percentile_);
+}
+
+HedgingStats RequestHedger::stats() const {
+    return {requests_.load(), hedges_fired_.load(), hedges_won_.load()};
+}
+
+std::optional<std::chrono::nanoseconds> RequestHedger::hedge_delay() const {
+    const auto delay_ns = hedge_delay_ns_.load();
+    if (delay_ns == 0)
+        return std::nullopt;
+
+    return std::chrono::nanoseconds{delay_ns};
+}
+
+void RequestHedger::record_latency(std::chrono::nanoseconds latency) {
+    std::lock_guard lock{latencies_mutex_};
+    latencies_[next_latency_] = latency.count();
+    next_latency_ = (next_latency_ + 1) % latencies_.size();
+    ++recorded_latencies_;
+    if (recorded_latencies_ < min_samples_ || recorded_latencies_ % LATENCY_RECOMPUTE_INTERVAL != 0)
+        return;
+
+    std::vector<int64_t> latencies(latencies_.begin(), latencies_.begin() + std::min(recorded_latencies_, latencies_.size()));
+    auto nth = latencies.begin() + static_cast<ptrdiff_t>(latencies.size() * percentile_ / 100);
+    std::nth_element(latencies.begin(), nth, latencies.end());
+    hedge_delay_ns_ = std::max(*nth, min_delay_ns_);
+}
+
+bool RequestHedger::try_reserve_hedge() {
+    const auto budget = requests_.load() * budget_percent_ / 100;
+    auto fired = hedges_fired_.load();
+    do {
+        if (fired >= budget)
+            return false;
+    } while (!hedges_fired_.compare_exchange_weak(fired, fired + 1));
+
+    log_prometheus_counter(STORAGE_HEDGES_FIRED, "Duplicate storage requests made for slow requests", 1);
+    return true;
+}
+
+void RequestHedger::record_hedge_won() {
+    ++hedges_won_;
+    log_prometheus_counter(STORAGE_HEDGES_WON, "Duplicate storage requests that completed before the original", 1);
+}
+
+} // namespace arcticdb::storage
@@ -0,0 +1,124 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/util/constructors.hpp>
+
+#include <folly/executors/CPUThreadPoolExecutor.h>
+#include <folly/futures/Future.h>
+
+#include <atomic>
+#include <chrono>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <string>
+#include <type_traits>
+#include <vector>
+
+namespace arcticdb::storage {
+
+struct HedgingStats {
+    uint64_t requests_ = 0;
+    // Duplicate requests made because the original was slower than the hedging latency
+    uint64_t hedges_fired_ = 0;
+    // Duplicate requests that completed before the original
+    uint64_t hedges_won_ = 0;
+};
+
+/*
+ * Hedges the reads of a storage to cut their tail latency: when a read takes longer than a percentile of the latencies
+ * of recent reads, the same read is made again and the result of whichever completes first is used. The duplicate
+ * reads are capped to a percentage of all reads, so that a slow storage is not overloaded with them.
+ *
+ * Configured with the ConfigsMap options {prefix}.HedgePercentile, which enables hedging when above 0,
+ * {prefix}.HedgeBudgetPercent, {prefix}.HedgeMinSamples, {prefix}.HedgeMinDelayMs and {prefix}.HedgeNumThreads, where
+ * the prefix names the storage, e.g. S3Storage. These are read when the hedger is created, i.e. when a library is
+ * opened.
+ */
+class RequestHedger {
+public:
+    explicit RequestHedger(const std::string& config_prefix);
+
+    ARCTICDB_NO_MOVE_OR_COPY(RequestHedger)
+
+    [[nodiscard]] bool enabled() const {
+        return percentile_ > 0;
+    }
+
+    // Makes the request, which must be safe to make twice concurrently, and must own or outlive everything it refers
+    // to as a slower duplicate may still be running after this returns. If both fail, the exception of the last to
+    // complete is thrown.
+    template<typename Request>
+    std::invoke_result_t<Request&> run(Request request) {
+        using ResultType = std::invoke_result_t<Request&>;
+        if (!enabled())
+            return request();
+
+        ++requests_;
+        const auto delay = hedge_delay();
+        const auto start = std::chrono::steady_clock::now();
+        if (!delay) {
+            auto result = request();
+            record_latency(std::chrono::steady_clock::now() - start);
+            return result;
+        }
+
+        auto original = folly::via(executor_.get(), [request]() mutable { return request(); });
+        original.wait(*delay);
+        if (original.isReady() || !try_reserve_hedge()) {
+            auto result = std::move(original).get();
+            record_latency(std::chrono::steady_clock::now() - start);
+            return result;
+        }
+
+        std::vector<folly::Future<ResultType>> requests;
+        requests.emplace_back(std::move(original));
+        requests.emplace_back(folly::via(executor_.get(), [request]() mutable { return request(); }));
+        auto [index, result] = folly::collectAnyWithoutException(std::move(requests)).get();
+        if (index == 1)
+            record_hedge_won();
+
+        record_latency(std::chrono::steady_clock::now() - start);
+        return std::move(result);
+    }
+
+    [[nodiscard]] HedgingStats stats() const;
+
+private:
+    // The latency after which a request is hedged, if enough have been recorded to know it
+    std::optional<std::chrono::nanoseconds> hedge_delay() const;
+
+    void record_latency(std::chrono::nanoseconds latency);
+
+    // Counts a hedge if within the budget of duplicate requests
+    bool try_reserve_hedge();
+
+    void record_hedge_won();
+
+    const int64_t percentile_;
+    const int64_t budget_percent_;
+    const size_t min_samples_;
+    const int64_t min_delay_ns_;
+
+    std::atomic<uint64_t> requests_ = 0;
+    std::atomic<uint64_t> hedges_fired_ = 0;
+    std::atomic<uint64_t> hedges_won_ = 0;
+    std::atomic<int64_t> hedge_delay_ns_ = 0;
+
+    mutable std::mutex latencies_mutex_;
+    // The latencies of the most recent requests, in a ring buffer
+    std::vector<int64_t> latencies_;
+    size_t next_latency_ = 0;
+    size_t recorded_latencies_ = 0;
+
+    // Runs both the original and duplicate requests, so that the caller can return as soon as either completes
+    std::unique_ptr<folly::CPUThreadPoolExecutor> executor_;
+};
+
+} // namespace arcticdb::storage
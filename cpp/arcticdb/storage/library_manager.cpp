@@ -146,7 +146,7 @@ std::shared_ptr<Library> LibraryManager::get_library(const LibraryPath& path,
     for(const auto& storage: config.storage_by_id()){
         st.emplace_back(storage.second);
     }
-    auto storages = create_storages(path, OpenMode::DELETE, st);
+    auto storages = create_storages(path, OpenMode::DELETE, st, storage_override.local_cache_override());
 
     auto lib = std::make_shared<Library>(path, std::move(storages), config.lib_desc().version());
 
@@ -11,6 +11,7 @@
 #include <arcticdb/entity/atom_key.hpp>
 #include <arcticdb/entity/variant_key.hpp>
 #include <arcticdb/storage/storage_utils.hpp>
+#include <arcticdb/storage/storage.hpp>
 
 // LMDB++ is using `std::is_pod` in `lmdb++.h`, which is deprecated as of C++20.
 // See: https://github.com/drycpp/lmdbxx/blob/0b43ca87d8cfabba392dfe884eb1edb83874de02/lmdb%2B%2B.h#L1068
@@ -42,6 +43,14 @@ public:
             ::lmdb::txn& txn,
             ::lmdb::dbi& dbi) const = 0;
 
+    // Reads the segments at each of ranges within the value stored at path
+    virtual std::optional<std::vector<Segment>> read_ranges(
+            const std::string& db_name,
+            std::string& path,
+            ::lmdb::txn& txn,
+            ::lmdb::dbi& dbi,
+            const std::vector<ObjectRange>& ranges) const = 0;
+
     virtual void write(
             const std::string& db_name,
             std::string& path,
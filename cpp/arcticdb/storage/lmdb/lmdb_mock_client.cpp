@@ -11,6 +11,7 @@
 #include <arcticdb/entity/atom_key.hpp>
 #include <arcticdb/entity/serialized_key.hpp>
 #include <arcticdb/util/string_utils.hpp>
+#include <arcticdb/storage/coalesced/packed_segment.hpp>
 
 
 namespace arcticdb::storage::lmdb {
@@ -89,6 +90,19 @@ std::optional<Segment> MockLmdbClient::read(const std::string& db_name, std::str
     return lmdb_contents_.at(key);
 }
 
+std::optional<std::vector<Segment>> MockLmdbClient::read_ranges(const std::string& db_name, std::string& path, ::lmdb::txn&,
+                                                                ::lmdb::dbi&, const std::vector<ObjectRange>& ranges) const {
+    LmdbKey key = {db_name, path};
+    raise_if_has_failure_trigger(key, StorageOperation::READ);
+
+    if (!has_key(key)) {
+        return std::nullopt;
+    }
+
+    auto object = lmdb_contents_.at(key);
+    return read_segment_ranges(object, ranges);
+}
+
 void MockLmdbClient::write(const std::string& db_name, std::string& path, arcticdb::Segment&& segment,
                            ::lmdb::txn&, ::lmdb::dbi&, int64_t) {
     LmdbKey key = {db_name, path};
@@ -11,6 +11,7 @@
 #include <arcticdb/entity/variant_key.hpp>
 #include <arcticdb/storage/lmdb/lmdb_real_client.hpp>
 #include <arcticdb/storage/storage_utils.hpp>
+#include <arcticdb/storage/coalesced/packed_segment.hpp>
 
 
 namespace arcticdb::storage::lmdb {
@@ -39,6 +40,20 @@ std::optional<Segment> RealLmdbClient::read(const std::string&, std::string& pat
     return segment;
 }
 
+std::optional<std::vector<Segment>> RealLmdbClient::read_ranges(const std::string&, std::string& path, ::lmdb::txn& txn,
+                                                                ::lmdb::dbi& dbi, const std::vector<ObjectRange>& ranges) const {
+    MDB_val mdb_key{path.size(), path.data()};
+    MDB_val mdb_val;
+
+    ARCTICDB_SUBSAMPLE(LmdbStorageGetRanges, 0)
+    if(!::lmdb::dbi_get(txn, dbi.handle(), &mdb_key, &mdb_val)) {
+        return std::nullopt;
+    }
+
+    // The value is memory mapped, so only the pages holding the ranges are read
+    return segments_in_span(reinterpret_cast<std::uint8_t *>(mdb_val.mv_data), {0, mdb_val.mv_size}, ranges, {});
+}
+
 void RealLmdbClient::write(const std::string&, std::string& path, arcticdb::Segment&& seg,
                            ::lmdb::txn& txn, ::lmdb::dbi& dbi, int64_t overwrite_flag) {
     MDB_val mdb_key{path.size(), path.data()};
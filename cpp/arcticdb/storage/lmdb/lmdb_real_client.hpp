@@ -31,6 +31,13 @@ public:
             ::lmdb::txn& txn,
             ::lmdb::dbi& dbi) const override;
 
+    std::optional<std::vector<Segment>> read_ranges(
+            const std::string& db_name,
+            std::string& path,
+            ::lmdb::txn& txn,
+            ::lmdb::dbi& dbi,
+            const std::vector<ObjectRange>& ranges) const override;
+
     void write(
             const std::string& db_name,
             std::string& path,
@@ -146,6 +146,32 @@ void LmdbStorage::do_read(Composite<VariantKey>&& ks, const ReadVisitor& visitor
         throw KeyNotFoundException(Composite<VariantKey>(std::move(failed_reads)));
 }
 
+std::vector<Segment> LmdbStorage::do_read_ranges(const VariantKey& key, const std::vector<ObjectRange>& ranges) {
+    ARCTICDB_SAMPLE(LmdbStorageReadRanges, 0)
+    auto txn = std::make_shared<::lmdb::txn>(::lmdb::txn::begin(env(), nullptr, MDB_RDONLY));
+    auto db_name = fmt::format("{}", variant_key_type(key));
+    ::lmdb::dbi& dbi = dbi_by_key_type_.at(db_name);
+    auto stored_key = to_serialized_key(key);
+    std::optional<std::vector<Segment>> segments;
+    try {
+        segments = lmdb_client_->read_ranges(db_name, stored_key, *txn, dbi, ranges);
+    } catch (const ::lmdb::not_found_error&) {
+        // Reported as a missing key below
+    } catch (const ::lmdb::error& ex) {
+        raise_lmdb_exception(ex);
+    }
+
+    if (!segments.has_value()) {
+        ARCTICDB_DEBUG(log::storage(), "Failed to find segment for key {}", variant_key_view(key));
+        throw KeyNotFoundException(key);
+    }
+    // The segments reference the memory mapped value, which is valid for as long as the transaction
+    for (auto& segment : *segments)
+        segment.set_keepalive(std::any(txn));
+
+    return std::move(*segments);
+}
+
 bool LmdbStorage::do_key_exists(const VariantKey&key) {
     ARCTICDB_SAMPLE(LmdbStorageKeyExists, 0)
     auto txn = ::lmdb::txn::begin(env(), nullptr, MDB_RDONLY);
@@ -38,6 +38,8 @@ class LmdbStorage final : public Storage {
 
     void do_read(Composite<VariantKey>&& ks, const ReadVisitor& visitor, storage::ReadKeyOpts opts) final;
 
+    std::vector<Segment> do_read_ranges(const VariantKey& key, const std::vector<ObjectRange>& ranges) final;
+
     void do_remove(Composite<VariantKey>&& ks, RemoveOpts opts) final;
 
     bool do_supports_prefix_matching() const final {
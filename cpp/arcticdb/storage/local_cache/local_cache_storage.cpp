@@ -0,0 +1,347 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <arcticdb/storage/local_cache/local_cache_storage.hpp>
+#include <arcticdb/entity/serialized_key.hpp>
+#include <arcticdb/entity/performance_tracing.hpp>
+#include <arcticdb/util/preconditions.hpp>
+#include <arcticdb/util/hash.hpp>
+#include <arcticdb/log/log.hpp>
+
+#include <fstream>
+#include <thread>
+
+namespace arcticdb::storage::local_cache {
+
+namespace fs = std::filesystem;
+
+namespace {
+
+constexpr std::string_view TEMP_SUFFIX = ".tmp";
+
+bool is_temp_file(const fs::path& path) {
+    return path.extension() == TEMP_SUFFIX;
+}
+
+} // anonymous namespace
+
+LocalDiskCache::LocalDiskCache(fs::path root, uint64_t max_bytes) :
+    root_(std::move(root)),
+    max_bytes_(max_bytes) {
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(max_bytes_ > 0, "Local cache size for {} must be positive", root_.string());
+    fs::create_directories(root_);
+    load_existing();
+}
+
+std::shared_ptr<LocalDiskCache> LocalDiskCache::open(const std::string& root, uint64_t max_bytes) {
+    static std::mutex mutex;
+    static std::unordered_map<std::string, std::weak_ptr<LocalDiskCache>> caches;
+    const auto key = fs::weakly_canonical(fs::path{root}).string();
+    std::lock_guard lock{mutex};
+    if(auto it = caches.find(key); it != caches.end()) {
+        if(auto cache = it->second.lock()) {
+            if(cache->max_bytes() != max_bytes)
+                log::storage().warn("Local cache {} is already open with a size of {} bytes, ignoring the requested size of {} bytes",
+                                    key, cache->max_bytes(), max_bytes);
+            return cache;
+        }
+    }
+    auto cache = std::make_shared<LocalDiskCache>(fs::path{key}, max_bytes);
+    caches[key] = cache;
+    return cache;
+}
+
+void LocalDiskCache::load_existing() {
+    struct ExistingFile {
+        fs::file_time_type last_write_time_;
+        std::string name_;
+        uint64_t bytes_;
+    };
+    std::vector<ExistingFile> files;
+    for(const auto& entry : fs::recursive_directory_iterator(root_)) {
+        if(!entry.is_regular_file())
+            continue;
+
+        std::error_code ec;
+        if(is_temp_file(entry.path())) {
+            // Left behind by a process that died mid-write
+            fs::remove(entry.path(), ec);
+            continue;
+        }
+        files.emplace_back(ExistingFile{entry.last_write_time(), fs::relative(entry.path(), root_).generic_string(), entry.file_size()});
+    }
+    std::sort(std::begin(files), std::end(files), [] (const auto& left, const auto& right) {
+        return left.last_write_time_ < right.last_write_time_;
+    });
+
+    std::lock_guard lock{mutex_};
+    for(auto& file : files)
+        insert(std::move(file.name_), file.bytes_);
+
+    evict_to(max_bytes_);
+    ARCTICDB_DEBUG(log::storage(), "Opened local cache {} holding {} segments, {} bytes", root_.string(), entries_.size(), bytes_);
+}
+
+std::optional<Segment> LocalDiskCache::get(const std::string& name) {
+    ARCTICDB_SAMPLE(LocalDiskCacheGet, 0)
+    {
+        std::lock_guard lock{mutex_};
+        auto it = index_.find(name);
+        if(it == index_.end())
+            return std::nullopt;
+
+        entries_.splice(entries_.begin(), entries_, it->second);
+    }
+
+    const auto path = root_ / name;
+    try {
+        std::ifstream file{path, std::ios::binary};
+        util::check(file.good(), "Failed to open {}", path.string());
+        const auto bytes = fs::file_size(path);
+        auto buffer = std::make_shared<Buffer>(bytes);
+        file.read(reinterpret_cast<char*>(buffer->data()), static_cast<std::streamsize>(bytes));
+        util::check(file.gcount() == static_cast<std::streamsize>(bytes), "Short read of {} from {}", bytes, path.string());
+        // Record the access on disk too, so that the recency order survives a restart
+        std::error_code ec;
+        fs::last_write_time(path, fs::file_time_type::clock::now(), ec);
+        return Segment::from_buffer(std::move(buffer));
+    } catch(const std::exception& e) {
+        log::storage().warn("Failed to read {} from local cache, falling back to origin storage: {}", path.string(), e.what());
+        std::lock_guard lock{mutex_};
+        erase(name);
+        return std::nullopt;
+    }
+}
+
+void LocalDiskCache::put(const std::string& name, Segment& segment) {
+    ARCTICDB_SAMPLE(LocalDiskCachePut, 0)
+    const auto header_size = segment.segment_header_bytes_size();
+    const uint64_t bytes = segment.total_segment_size(header_size);
+    if(bytes > max_bytes_)
+        return;
+
+    {
+        std::lock_guard lock{mutex_};
+        if(index_.find(name) != index_.end())
+            return;
+    }
+
+    const auto path = root_ / name;
+    // Written under a unique name then renamed, so that a concurrent reader never sees a partial segment
+    auto temp_path = path;
+    temp_path += fmt::format(".{}{}", std::hash<std::thread::id>{}(std::this_thread::get_id()), TEMP_SUFFIX);
+    try {
+        std::vector<uint8_t> data(bytes);
+        segment.write_to(data.data(), header_size);
+        fs::create_directories(path.parent_path());
+        {
+            std::ofstream file{temp_path, std::ios::binary | std::ios::trunc};
+            file.write(reinterpret_cast<const char*>(data.data()), static_cast<std::streamsize>(bytes));
+            util::check(file.good(), "Failed to write {}", temp_path.string());
+        }
+        fs::rename(temp_path, path);
+    } catch(const std::exception& e) {
+        log::storage().warn("Failed to write {} to local cache: {}", path.string(), e.what());
+        std::error_code ec;
+        fs::remove(temp_path, ec);
+        return;
+    }
+
+    std::lock_guard lock{mutex_};
+    if(index_.find(name) == index_.end()) {
+        insert(name, bytes);
+        evict_to(max_bytes_);
+    }
+}
+
+void LocalDiskCache::remove(const std::string& name) {
+    std::lock_guard lock{mutex_};
+    erase(name);
+}
+
+void LocalDiskCache::remove_prefix(const std::string& prefix) {
+    std::lock_guard lock{mutex_};
+    for(auto it = entries_.begin(); it != entries_.end();) {
+        auto next = std::next(it);
+        if(it->name_.rfind(prefix, 0) == 0)
+            erase(it->name_);
+        it = next;
+    }
+}
+
+uint64_t LocalDiskCache::bytes() const {
+    std::lock_guard lock{mutex_};
+    return bytes_;
+}
+
+size_t LocalDiskCache::size() const {
+    std::lock_guard lock{mutex_};
+    return entries_.size();
+}
+
+void LocalDiskCache::insert(std::string name, uint64_t bytes) {
+    entries_.push_front(Entry{name, bytes});
+    index_.try_emplace(std::move(name), entries_.begin());
+    bytes_ += bytes;
+}
+
+void LocalDiskCache::erase(const std::string& name) {
+    auto it = index_.find(name);
+    if(it == index_.end())
+        return;
+
+    std::error_code ec;
+    fs::remove(root_ / name, ec);
+    bytes_ -= it->second->bytes_;
+    entries_.erase(it->second);
+    index_.erase(it);
+}
+
+void LocalDiskCache::evict_to(uint64_t max_bytes) {
+    while(bytes_ > max_bytes && !entries_.empty()) {
+        auto& entry = entries_.back();
+        ARCTICDB_DEBUG(log::storage(), "Evicting {} ({} bytes) from local cache", entry.name_, entry.bytes_);
+        std::error_code ec;
+        fs::remove(root_ / entry.name_, ec);
+        bytes_ -= entry.bytes_;
+        index_.erase(entry.name_);
+        entries_.pop_back();
+    }
+}
+
+LocalCacheStorage::LocalCacheStorage(std::shared_ptr<Storage> origin, std::shared_ptr<LocalDiskCache> cache) :
+    Storage(origin->library_path(), origin->open_mode()),
+    origin_(std::move(origin)),
+    cache_(std::move(cache)) {
+}
+
+bool LocalCacheStorage::is_cacheable(const VariantKey& key) {
+    if(!std::holds_alternative<AtomKey>(key))
+        return false;
+
+    const auto key_type = variant_key_type(key);
+    return key_type == KeyType::TABLE_DATA || key_type == KeyType::TABLE_INDEX || key_type == KeyType::MULTI_SEGMENT;
+}
+
+std::string LocalCacheStorage::cache_name(const VariantKey& key) const {
+    // Symbols can contain characters that are not valid in file names, so name files by hash. The hash must be stable
+    // across processes and builds, as the cache outlives them
+    const auto& atom_key = std::get<AtomKey>(key);
+    const auto tokenized_key = to_tokenized_key(atom_key);
+    HashAccum accum;
+    accum(tokenized_key.data(), tokenized_key.size());
+    return fmt::format("{}/{}/{:016x}_{:016x}",
+                       library_path().to_delim_path('/'),
+                       atom_key.type(),
+                       accum.digest(),
+                       atom_key.content_hash());
+}
+
+void LocalCacheStorage::do_write(Composite<KeySegmentPair>&& kvs) {
+    origin_->write(std::move(kvs));
+}
+
+void LocalCacheStorage::do_update(Composite<KeySegmentPair>&& kvs, UpdateOpts opts) {
+    origin_->update(std::move(kvs), opts);
+}
+
+void LocalCacheStorage::do_read(Composite<VariantKey>&& ks, const ReadVisitor& visitor, ReadKeyOpts opts) {
+    ARCTICDB_SAMPLE(LocalCacheStorageRead, 0)
+    std::vector<VariantKey> misses;
+    auto keys = std::move(ks);
+    keys.broadcast([this, &visitor, &misses] (const VariantKey& key) {
+        if(is_cacheable(key)) {
+            if(auto segment = cache_->get(cache_name(key))) {
+                ARCTICDB_DEBUG(log::storage(), "Read key {} from local cache", variant_key_view(key));
+                visitor(key, std::move(*segment));
+                return;
+            }
+        }
+        misses.emplace_back(key);
+    });
+
+    if(misses.empty())
+        return;
+
+    const ReadVisitor& caching_visitor = [this, &visitor] (const VariantKey& key, Segment&& segment) {
+        if(is_cacheable(key))
+            cache_->put(cache_name(key), segment);
+
+        visitor(key, std::move(segment));
+    };
+    // Whole segments are read from the origin so that they can be cached for reads of any of their columns
+    auto origin_opts = opts;
+    origin_opts.columns_to_decode_.reset();
+    origin_->read(Composite<VariantKey>{std::move(misses)}, caching_visitor, origin_opts);
+}
+
+std::vector<Segment> LocalCacheStorage::do_read_ranges(const VariantKey& key, const std::vector<ObjectRange>& ranges) {
+    if(!is_cacheable(key))
+        return origin_->read_ranges(key, ranges);
+
+    // Ranges of a multi-segment object are cached separately, under names starting with the name of the object
+    auto range_name = [this, &key] (const ObjectRange& range) {
+        return fmt::format("{}_{:x}_{:x}", cache_name(key), range.first, range.second);
+    };
+    std::vector<std::optional<Segment>> segments;
+    std::vector<ObjectRange> misses;
+    for(const auto& range : ranges) {
+        segments.emplace_back(cache_->get(range_name(range)));
+        if(!segments.back())
+            misses.emplace_back(range);
+    }
+
+    if(!misses.empty()) {
+        auto read = origin_->read_ranges(key, misses);
+        auto read_it = read.begin();
+        for(size_t i = 0; i < ranges.size(); ++i) {
+            if(segments[i])
+                continue;
+
+            cache_->put(range_name(ranges[i]), *read_it);
+            segments[i] = std::move(*read_it++);
+        }
+    }
+
+    std::vector<Segment> output;
+    output.reserve(segments.size());
+    for(auto& segment : segments)
+        output.emplace_back(std::move(*segment));
+
+    return output;
+}
+
+void LocalCacheStorage::do_remove(Composite<VariantKey>&& ks, RemoveOpts opts) {
+    ks.broadcast([this] (const VariantKey& key) {
+        if(!is_cacheable(key))
+            return;
+
+        if(variant_key_type(key) == KeyType::MULTI_SEGMENT)
+            cache_->remove_prefix(cache_name(key));
+        else
+            cache_->remove(cache_name(key));
+    });
+    origin_->remove(std::move(ks), opts);
+}
+
+bool LocalCacheStorage::do_key_exists(const VariantKey& key) {
+    return origin_->key_exists(key);
+}
+
+bool LocalCacheStorage::do_fast_delete() {
+    if(!origin_->fast_delete())
+        return false;
+
+    cache_->remove_prefix(library_path().to_delim_path('/') + "/");
+    return true;
+}
+
+void LocalCacheStorage::do_iterate_type(KeyType key_type, const IterateTypeVisitor& visitor, const std::string& prefix) {
+    origin_->iterate_type(key_type, visitor, prefix);
+}
+
+} // namespace arcticdb::storage::local_cache
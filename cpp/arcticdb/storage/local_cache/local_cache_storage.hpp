@@ -0,0 +1,125 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#pragma once
+
+#include <arcticdb/storage/storage.hpp>
+#include <arcticdb/codec/segment.hpp>
+
+#include <filesystem>
+#include <list>
+#include <mutex>
+#include <optional>
+#include <unordered_map>
+
+namespace arcticdb::storage::local_cache {
+
+/*
+ * A directory of serialized segments on local disk, bounded by max_bytes and evicted least recently used first.
+ *
+ * One instance is shared by every library in the process that caches under the same directory, so that the size cap
+ * applies to the directory as a whole. The recency order is rebuilt from file modification times when the directory
+ * is first opened, so the cache survives process restarts.
+ *
+ * Failing to read or write the cache is never an error: a missing or unreadable file is treated as a miss, so
+ * several processes can share a directory (each evicting according to its own view of the recency order).
+ */
+class LocalDiskCache {
+public:
+    LocalDiskCache(std::filesystem::path root, uint64_t max_bytes);
+
+    // Returns the cache for the given directory, opening it if this is the first use in the process
+    static std::shared_ptr<LocalDiskCache> open(const std::string& root, uint64_t max_bytes);
+
+    std::optional<Segment> get(const std::string& name);
+
+    void put(const std::string& name, Segment& segment);
+
+    void remove(const std::string& name);
+
+    // Removes every segment whose name starts with the given prefix
+    void remove_prefix(const std::string& prefix);
+
+    [[nodiscard]] const std::filesystem::path& root() const { return root_; }
+    [[nodiscard]] uint64_t max_bytes() const { return max_bytes_; }
+    [[nodiscard]] uint64_t bytes() const;
+    [[nodiscard]] size_t size() const;
+
+private:
+    struct Entry {
+        std::string name_;
+        uint64_t bytes_;
+    };
+
+    void load_existing();
+    void insert(std::string name, uint64_t bytes);
+    void erase(const std::string& name);
+    void evict_to(uint64_t max_bytes);
+
+    std::filesystem::path root_;
+    uint64_t max_bytes_;
+
+    mutable std::mutex mutex_;
+    // Most recently used at the front
+    std::list<Entry> entries_;
+    std::unordered_map<std::string, std::list<Entry>::iterator> index_;
+    uint64_t bytes_ = 0;
+};
+
+/*
+ * Read-through decorator that serves immutable keys from a LocalDiskCache before going to the origin storage.
+ *
+ * Only data and index keys are cached. Reference keys and version keys can change, or be superseded, in the origin
+ * so they are always read from there, as are all writes, updates, iterations and existence checks. Removing a key
+ * removes it from both.
+ */
+class LocalCacheStorage final : public Storage {
+public:
+    LocalCacheStorage(std::shared_ptr<Storage> origin, std::shared_ptr<LocalDiskCache> cache);
+
+    static bool is_cacheable(const VariantKey& key);
+
+    void cleanup() final {
+        origin_->cleanup();
+    }
+
+private:
+    void do_write(Composite<KeySegmentPair>&& kvs) final;
+
+    void do_update(Composite<KeySegmentPair>&& kvs, UpdateOpts opts) final;
+
+    void do_read(Composite<VariantKey>&& ks, const ReadVisitor& visitor, ReadKeyOpts opts) final;
+
+    std::vector<Segment> do_read_ranges(const VariantKey& key, const std::vector<ObjectRange>& ranges) final;
+
+    void do_remove(Composite<VariantKey>&& ks, RemoveOpts opts) final;
+
+    bool do_key_exists(const VariantKey& key) final;
+
+    bool do_supports_prefix_matching() const final {
+        return origin_->supports_prefix_matching();
+    }
+
+    bool do_fast_delete() final;
+
+    void do_iterate_type(KeyType key_type, const IterateTypeVisitor& visitor, const std::string& prefix) final;
+
+    std::string do_key_path(const VariantKey& key) const final {
+        return origin_->key_path(key);
+    }
+
+    bool do_is_path_valid(const std::string_view path) const final {
+        return origin_->is_path_valid(path);
+    }
+
+    [[nodiscard]] std::string cache_name(const VariantKey& key) const;
+
+    std::shared_ptr<Storage> origin_;
+    std::shared_ptr<LocalDiskCache> cache_;
+};
+
+} // namespace arcticdb::storage::local_cache
@@ -13,6 +13,7 @@
 #include <arcticdb/entity/performance_tracing.hpp>
 #include <arcticdb/storage/storage_options.hpp>
 #include <arcticdb/storage/storage_utils.hpp>
+#include <arcticdb/storage/coalesced/packed_segment.hpp>
 
 namespace arcticdb::storage::memory {
 
@@ -91,6 +92,17 @@ namespace arcticdb::storage::memory {
         });
     }
 
+    std::vector<Segment> MemoryStorage::do_read_ranges(const VariantKey& key, const std::vector<ObjectRange>& ranges) {
+        ARCTICDB_SAMPLE(MemoryStorageReadRanges, 0)
+        const auto& key_vec = data_[variant_key_type(key)];
+        auto it = key_vec.find(key);
+        if(it == key_vec.end())
+            throw KeyNotFoundException(key);
+
+        auto object = it->second;
+        return read_segment_ranges(object, ranges);
+    }
+
     bool MemoryStorage::do_key_exists(const VariantKey& key) {
         ARCTICDB_SAMPLE(MemoryStorageKeyExists, 0)
         const auto& key_vec = data_[variant_key_type(key)];
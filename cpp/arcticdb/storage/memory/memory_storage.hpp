@@ -30,6 +30,8 @@ namespace arcticdb::storage::memory {
 
         void do_read(Composite<VariantKey>&& ks, const ReadVisitor& visitor, ReadKeyOpts opts) final;
 
+        std::vector<Segment> do_read_ranges(const VariantKey& key, const std::vector<ObjectRange>& ranges) final;
+
         void do_remove(Composite<VariantKey>&& ks, RemoveOpts opts) final;
 
         bool do_key_exists(const VariantKey& key) final;
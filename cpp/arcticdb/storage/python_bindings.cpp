@@ -63,6 +63,7 @@ void register_bindings(py::module& storage) {
         .value("SNAPSHOT_TOMBSTONE", KeyType::SNAPSHOT_TOMBSTONE)
         .value("LOG_COMPACTED", KeyType::LOG_COMPACTED)
         .value("COLUMN_STATS", KeyType::COLUMN_STATS)
+        .value("MULTI_SEGMENT", KeyType::MULTI_SEGMENT)
         ;
 
     py::enum_<OpenMode>(storage, "OpenMode")
@@ -131,11 +132,17 @@ void register_bindings(py::module& storage) {
             .def_property("path", &LmdbOverride::path, &LmdbOverride::set_path)
             .def_property("map_size", &LmdbOverride::map_size, &LmdbOverride::set_map_size);
 
+    py::class_<LocalCacheOverride>(storage, "LocalCacheOverride")
+            .def(py::init<>())
+            .def_property("path", &LocalCacheOverride::path, &LocalCacheOverride::set_path)
+            .def_property("max_bytes", &LocalCacheOverride::max_bytes, &LocalCacheOverride::set_max_bytes);
+
     py::class_<StorageOverride>(storage, "StorageOverride")
         .def(py::init<>())
         .def("set_s3_override", &StorageOverride::set_s3_override)
         .def("set_azure_override", &StorageOverride::set_azure_override)
-        .def("set_lmdb_override", &StorageOverride::set_lmdb_override);
+        .def("set_lmdb_override", &StorageOverride::set_lmdb_override)
+        .def("set_local_cache_override", &StorageOverride::set_local_cache_override);
 
     py::class_<LibraryManager, std::shared_ptr<LibraryManager>>(storage, "LibraryManager")
         .def(py::init<std::shared_ptr<storage::Library>>())
@@ -6,11 +6,17 @@
 #include <arcticdb/util/buffer_pool.hpp>
 
 #include <google/protobuf/io/zero_copy_stream_impl_lite.h>
+#include <folly/executors/CPUThreadPoolExecutor.h>
+#include <folly/executors/thread_factory/NamedThreadFactory.h>
+#include <folly/futures/Future.h>
 #include <folly/gen/Base.h>
 #include <arcticdb/storage/object_store_utils.hpp>
 #include <arcticdb/storage/storage_options.hpp>
 #include <arcticdb/storage/storage_utils.hpp>
+#include <arcticdb/storage/hedged_requests.hpp>
 #include <arcticdb/storage/s3/s3_client_wrapper.hpp>
+#include <arcticdb/storage/coalesced/packed_segment.hpp>
+#include <arcticdb/codec/codec.hpp>
 #include <arcticdb/entity/serialized_key.hpp>
 #include <arcticdb/util/exponential_backoff.hpp>
 #include <arcticdb/util/configs_map.hpp>
@@ -28,6 +34,9 @@
 
 #include <boost/interprocess/streams/bufferstream.hpp>
 
+#include <algorithm>
+#include <cstring>
+
 #undef GetMessage
 
 namespace arcticdb::storage {
@@ -143,29 +152,146 @@ namespace s3 {
             do_write_impl(std::move(kvs), root_folder, bucket_name, s3_client, std::move(bucketizer));
         }
 
+        // The ranges to request beyond the first fetched_bytes of an object, merging those separated by no more than
+        // merge_gap_bytes, as reading a few unwanted bytes is cheaper than making another request
+        inline std::vector<ObjectRange> ranges_to_request(
+                const std::vector<std::pair<uint64_t, uint64_t>> &ranges,
+                uint64_t fetched_bytes,
+                uint64_t merge_gap_bytes) {
+            std::vector<ObjectRange> output;
+            for (auto [offset, bytes] : ranges) {
+                const auto end = offset + bytes;
+                if (end <= fetched_bytes)
+                    continue;
+
+                offset = std::max(offset, fetched_bytes);
+                if (!output.empty() && offset <= output.back().first + output.back().second + merge_gap_bytes)
+                    output.back().second = end - output.back().first;
+                else
+                    output.emplace_back(offset, end - offset);
+            }
+            return output;
+        }
+
+        // Runs the ranged reads of a column read after its first, so that they are made concurrently. These are
+        // separate from the IO threads, which wait for them.
+        inline folly::Executor &column_read_executor() {
+            static const auto executor = std::make_unique<folly::CPUThreadPoolExecutor>(
+                static_cast<size_t>(ConfigsMap::instance()->get_int("S3Storage.ColumnReadNumThreads",
+                    ConfigsMap::instance()->get_int("VersionStore.NumIOThreads", 16))),
+                std::make_shared<folly::NamedThreadFactory>("S3ColumnRead"));
+            return *executor;
+        }
+
+        // Whether reading only the given ranges of an object skips enough of it to be worth making more requests than
+        // a single read of the rest of it
+        inline bool ranges_skip_enough(const std::vector<ObjectRange> &ranges, uint64_t fetched_bytes, uint64_t object_bytes) {
+            if (ranges.size() <= 1)
+                return true;
+
+            uint64_t requested_bytes = 0;
+            for (const auto &range : ranges)
+                requested_bytes += range.second;
+            const auto skipped_bytes = object_bytes - fetched_bytes - requested_bytes;
+            const auto min_skip_percent = static_cast<uint64_t>(ConfigsMap::instance()->get_int("S3Storage.ColumnReadMinSkipPercent", 25));
+            return skipped_bytes * 100 >= object_bytes * min_skip_percent;
+        }
+
+        /*
+         * Reads only the parts of a data segment needed to decode the given columns. The first prefix_bytes of the
+         * object, which hold its headers, are read first, so objects no larger than that take a single request as
+         * before. The encoded fields of the columns beyond the prefix are then read with concurrent ranged reads into a
+         * buffer the size of the segment, leaving the bytes of other columns unset as they are skipped when decoding.
+         * If the ranges would skip little of the object, the rest of it is read with a single request instead.
+         */
+        inline S3Result<Segment> get_object_columns(
+                const std::string &s3_object_name,
+                const std::string &bucket_name,
+                const S3ClientWrapper &s3_client,
+                const std::unordered_set<std::string> &columns,
+                uint64_t prefix_bytes) {
+            ARCTICDB_SAMPLE(S3StorageReadColumns, 0)
+            auto prefix_result = s3_client.get_object_range(s3_object_name, bucket_name, {0, prefix_bytes});
+            if (!prefix_result.is_success())
+                return {prefix_result.get_error()};
+
+            auto prefix = std::move(prefix_result.get_output());
+            if (prefix->bytes() < prefix_bytes)
+                return {Segment::from_buffer(std::move(prefix))};
+
+            auto column_ranges = encoded_column_ranges(prefix->data(), prefix->bytes(), columns);
+            if (!column_ranges) {
+                ARCTICDB_DEBUG(log::storage(), "Headers of object {} are larger than {} bytes, reading it whole", s3_object_name, prefix_bytes);
+                return s3_client.get_object(s3_object_name, bucket_name);
+            }
+
+            const auto segment_bytes = column_ranges->segment_bytes_;
+            auto buffer = std::make_shared<Buffer>(segment_bytes);
+            std::memcpy(buffer->data(), prefix->data(), std::min<uint64_t>(segment_bytes, prefix->bytes()));
+            const auto merge_gap_bytes = static_cast<uint64_t>(ConfigsMap::instance()->get_int("S3Storage.ColumnReadMergeGapBytes", 1 << 20));
+            auto ranges = ranges_to_request(column_ranges->ranges_, prefix->bytes(), merge_gap_bytes);
+            if (!ranges_skip_enough(ranges, prefix->bytes(), segment_bytes))
+                ranges = {{prefix->bytes(), segment_bytes - prefix->bytes()}};
+
+            // Copies into disjoint parts of the buffer, so the ranges can be read concurrently
+            auto read_range = [&s3_client, &s3_object_name, &bucket_name, buffer](const ObjectRange &range) -> std::optional<Aws::S3::S3Error> {
+                auto range_result = s3_client.get_object_range(s3_object_name, bucket_name, range);
+                if (!range_result.is_success())
+                    return range_result.get_error();
+
+                const auto &part = range_result.get_output();
+                util::check(part->bytes() == range.second, "Expected {} bytes at offset {} of object {}, got {}",
+                            range.second, range.first, s3_object_name, part->bytes());
+                std::memcpy(buffer->data() + range.first, part->data(), range.second);
+                return std::nullopt;
+            };
+            std::vector<folly::Future<std::optional<Aws::S3::S3Error>>> range_futures;
+            range_futures.reserve(ranges.size());
+            for (size_t idx = 1; idx < ranges.size(); ++idx)
+                range_futures.emplace_back(folly::via(&column_read_executor(), [&read_range, range = ranges[idx]]() { return read_range(range); }));
+            if (!ranges.empty())
+                range_futures.emplace_back(folly::makeFutureWith([&read_range, &ranges]() { return read_range(ranges.front()); }));
+
+            // Waits for all of the reads, which refer to this frame, before raising any of their errors
+            auto range_results = folly::collectAll(range_futures).get();
+            for (auto &range_result : range_results) {
+                if (auto error = std::move(range_result).value())
+                    return {*error};
+            }
+            ARCTICDB_DEBUG(log::storage(), "Read columns of object {} of {} bytes with {} ranged reads", s3_object_name, segment_bytes, ranges.size());
+            return {Segment::from_buffer(std::move(buffer))};
+        }
+
         template<class KeyBucketizer>
         void do_read_impl(Composite<VariantKey> &&ks,
                           const ReadVisitor &visitor,
                           const std::string &root_folder,
                           const std::string &bucket_name,
                           const S3ClientWrapper &s3_client,
+                          RequestHedger &hedger,
                           KeyBucketizer &&bucketizer,
                           ReadKeyOpts opts) {
             ARCTICDB_SAMPLE(S3StorageRead, 0)
             auto fmt_db = [](auto &&k) { return variant_key_type(k); };
             std::vector<VariantKey> keys_not_found;
+            const auto column_read_prefix_bytes = static_cast<uint64_t>(ConfigsMap::instance()->get_int("S3Storage.ColumnReadPrefixBytes", 1 << 20));
 
             (fg::from(ks.as_range()) | fg::move | fg::groupBy(fmt_db)).foreach(
-                    [&s3_client, &bucket_name, &root_folder, b = std::move(bucketizer), &visitor, &keys_not_found,
-                            opts = opts](auto &&group) {
+                    [&s3_client, &hedger, &bucket_name, &root_folder, b = std::move(bucketizer), &visitor, &keys_not_found,
+                            opts = opts, column_read_prefix_bytes](auto &&group) {
 
                         for (auto &k: group.values()) {
                             auto key_type_dir = key_type_folder(root_folder, variant_key_type(k));
                             auto s3_object_name = object_path(b.bucketize(key_type_dir, k), k);
 
-                            auto get_object_result = s3_client.get_object(
-                                    s3_object_name,
-                                    bucket_name);
+                            const auto columns = opts.columns_to_decode_ && column_read_prefix_bytes > 0 && variant_key_type(k) == KeyType::TABLE_DATA ?
+                                    opts.columns_to_decode_ : nullptr;
+                            // Captures by value, as a hedged duplicate of the request may outlive this read
+                            auto get_object_result = hedger.run([&s3_client, s3_object_name, bucket_name, columns, column_read_prefix_bytes]() {
+                                return columns ?
+                                    get_object_columns(s3_object_name, bucket_name, s3_client, *columns, column_read_prefix_bytes) :
+                                    s3_client.get_object(s3_object_name, bucket_name);
+                            });
 
                             if (get_object_result.is_success()) {
                                 ARCTICDB_SUBSAMPLE(S3StorageVisitSegment, 0)
@@ -193,6 +319,36 @@ namespace s3 {
                 throw KeyNotFoundException(Composite<VariantKey>{std::move(keys_not_found)});
         }
 
+        template<class KeyBucketizer>
+        std::vector<Segment> do_read_ranges_impl(const VariantKey &key,
+                                                 const std::vector<ObjectRange> &ranges,
+                                                 const std::string &root_folder,
+                                                 const std::string &bucket_name,
+                                                 const S3ClientWrapper &s3_client,
+                                                 KeyBucketizer &&bucketizer) {
+            ARCTICDB_SAMPLE(S3StorageReadRanges, 0)
+            auto key_type_dir = key_type_folder(root_folder, variant_key_type(key));
+            auto s3_object_name = object_path(bucketizer.bucketize(key_type_dir, key), key);
+            // A single request for the range covering all of the segments to read
+            const auto span = spanning_range(ranges);
+            auto get_object_result = s3_client.get_object_range(s3_object_name, bucket_name, span);
+            if (!get_object_result.is_success()) {
+                auto &error = get_object_result.get_error();
+                raise_if_unexpected_error(error);
+                log::storage().warn("Failed to find segment for key '{}' {}: {}",
+                                    variant_key_view(key),
+                                    error.GetExceptionName().c_str(),
+                                    error.GetMessage().c_str());
+                throw KeyNotFoundException(key);
+            }
+
+            auto buffer = std::move(get_object_result.get_output());
+            util::check(buffer->bytes() == span.second, "Expected {} bytes at offset {} of key {}, got {}",
+                        span.second, span.first, variant_key_view(key), buffer->bytes());
+            ARCTICDB_DEBUG(log::storage(), "Read {} ranges of key {} with {} bytes", ranges.size(), variant_key_view(key), span.second);
+            return segments_in_span(buffer->data(), span, ranges, std::any(buffer));
+        }
+
         struct FailedDelete {
             VariantKey failed_key;
             std::string error_message;
@@ -141,7 +141,11 @@ void NfsBackedStorage::do_read(Composite<VariantKey>&& ks, const ReadVisitor& vi
         return encode_object_id(key);
     });
 
-    s3::detail::do_read_impl(std::move(enc), func, root_folder_, bucket_name_, *s3_client_, NfsBucketizer{}, opts);
+    s3::detail::do_read_impl(std::move(enc), func, root_folder_, bucket_name_, *s3_client_, hedger_, NfsBucketizer{}, opts);
+}
+
+std::vector<Segment> NfsBackedStorage::do_read_ranges(const VariantKey& key, const std::vector<ObjectRange>& ranges) {
+    return s3::detail::do_read_ranges_impl(encode_object_id(key), ranges, root_folder_, bucket_name_, *s3_client_, NfsBucketizer{});
 }
 
 void NfsBackedStorage::do_remove(Composite<VariantKey>&& ks, RemoveOpts) {
@@ -8,6 +8,7 @@
 #pragma once
 
 #include <arcticdb/storage/storage.hpp>
+#include <arcticdb/storage/hedged_requests.hpp>
 #include <arcticdb/storage/storage_factory.hpp>
 #include <aws/core/Aws.h>
 #include <aws/s3/model/PutObjectRequest.h>
@@ -37,6 +38,8 @@ private:
 
     void do_read(Composite<VariantKey>&& ks, const ReadVisitor& visitor, ReadKeyOpts opts) final;
 
+    std::vector<Segment> do_read_ranges(const VariantKey& key, const std::vector<ObjectRange>& ranges) final;
+
     void do_remove(Composite<VariantKey>&& ks, RemoveOpts opts) final;
 
     void do_iterate_type(KeyType key_type, const IterateTypeVisitor& visitor, const std::string &prefix) final;
@@ -61,6 +64,8 @@ private:
     std::unique_ptr<storage::s3::S3ClientWrapper> s3_client_;
     std::string root_folder_;
     std::string bucket_name_;
+    // Last, so that any hedged reads still running complete before the client is destroyed
+    RequestHedger hedger_{"NfsBackedStorage"};
 };
 
 inline arcticdb::proto::storage::VariantStorage pack_config(const std::string &bucket_name) {
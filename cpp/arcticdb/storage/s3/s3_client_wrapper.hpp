@@ -17,6 +17,7 @@
 #include <arcticdb/storage/object_store_utils.hpp>
 #include <arcticdb/storage/storage_utils.hpp>
 #include <arcticdb/storage/storage_mock_client.hpp>
+#include <arcticdb/storage/storage.hpp>
 #include <arcticdb/entity/serialized_key.hpp>
 #include <arcticdb/util/exponential_backoff.hpp>
 #include <arcticdb/util/configs_map.hpp>
@@ -54,6 +55,12 @@ public:
 
     virtual S3Result<Segment> get_object(const std::string& s3_object_name, const std::string& bucket_name) const = 0;
 
+    // Gets the bytes of the object in range, given as an offset and size in bytes
+    virtual S3Result<std::shared_ptr<Buffer>> get_object_range(
+            const std::string& s3_object_name,
+            const std::string& bucket_name,
+            const ObjectRange& range) const = 0;
+
     virtual S3Result<std::monostate> put_object(
             const std::string& s3_object_name,
             Segment&& segment,
@@ -15,6 +15,8 @@
 
 #include <aws/s3/S3Errors.h>
 
+#include <thread>
+
 namespace arcticdb::storage{
 
 using namespace object_store_utils;
@@ -49,6 +51,24 @@ std::optional<Aws::S3::S3Error> has_failure_trigger(const std::string& s3_object
 
 const auto not_found_error = Aws::S3::S3Error(Aws::Client::AWSError<Aws::S3::S3Errors>(Aws::S3::S3Errors::RESOURCE_NOT_FOUND, false));
 
+void MockS3Client::delay_next_reads(const std::vector<std::chrono::milliseconds>& delays) {
+    std::lock_guard lock{read_delays_mutex_};
+    read_delays_.insert(read_delays_.end(), delays.begin(), delays.end());
+}
+
+void MockS3Client::apply_read_delay() const {
+    std::optional<std::chrono::milliseconds> delay;
+    {
+        std::lock_guard lock{read_delays_mutex_};
+        if (!read_delays_.empty()) {
+            delay = read_delays_.front();
+            read_delays_.pop_front();
+        }
+    }
+    if (delay)
+        std::this_thread::sleep_for(*delay);
+}
+
 S3Result<std::monostate> MockS3Client::head_object(
         const std::string& s3_object_name,
         const std::string &bucket_name) const {
@@ -67,6 +87,8 @@ S3Result<std::monostate> MockS3Client::head_object(
 S3Result<Segment> MockS3Client::get_object(
         const std::string &s3_object_name,
         const std::string &bucket_name) const {
+    ++read_requests_;
+    apply_read_delay();
     auto maybe_error = has_failure_trigger(s3_object_name, StorageOperation::READ);
     if (maybe_error.has_value()) {
         return {maybe_error.value()};
@@ -79,6 +101,35 @@ S3Result<Segment> MockS3Client::get_object(
     return {pos->second};
 }
 
+S3Result<std::shared_ptr<Buffer>> MockS3Client::get_object_range(
+        const std::string &s3_object_name,
+        const std::string &bucket_name,
+        const ObjectRange& range) const {
+    ++read_requests_;
+    apply_read_delay();
+    auto maybe_error = has_failure_trigger(s3_object_name, StorageOperation::READ);
+    if (maybe_error.has_value()) {
+        return {maybe_error.value()};
+    }
+
+    auto pos = s3_contents.find({bucket_name, s3_object_name});
+    if (pos == s3_contents.end()){
+        return {not_found_error};
+    }
+
+    auto object = pos->second;
+    const auto hdr_size = object.segment_header_bytes_size();
+    Buffer contents{object.total_segment_size(hdr_size)};
+    object.write_to(contents.data(), hdr_size);
+    const auto& [offset, bytes] = range;
+    util::check(offset < contents.bytes(), "Range at offset {} is beyond the end of object {}", offset, s3_object_name);
+    // Like S3, a range extending past the end of the object returns the bytes up to its end
+    const auto available_bytes = std::min<uint64_t>(bytes, contents.bytes() - offset);
+    auto output = std::make_shared<Buffer>(available_bytes);
+    std::memcpy(output->data(), contents.data() + offset, available_bytes);
+    return {output};
+}
+
 S3Result<std::monostate> MockS3Client::put_object(
         const std::string &s3_object_name,
         Segment &&segment,
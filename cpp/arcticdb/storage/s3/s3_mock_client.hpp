@@ -24,6 +24,11 @@
 #include <arcticdb/util/configs_map.hpp>
 #include <arcticdb/util/composite.hpp>
 
+#include <atomic>
+#include <chrono>
+#include <deque>
+#include <mutex>
+
 namespace arcticdb::storage::s3 {
 
 struct S3Key {
@@ -54,10 +59,23 @@ public:
             Aws::S3::S3Errors error_to_fail_with,
             bool retryable=true);
 
+    // Delays the next reads, one delay per read, e.g. to simulate a storage with slow requests in its tail
+    void delay_next_reads(const std::vector<std::chrono::milliseconds>& delays);
+
+    // The number of get_object and get_object_range requests made
+    size_t read_requests() const {
+        return read_requests_;
+    }
+
     S3Result<std::monostate> head_object(const std::string& s3_object_name, const std::string& bucket_name) const override;
 
     S3Result<Segment> get_object(const std::string& s3_object_name, const std::string& bucket_name) const override;
 
+    S3Result<std::shared_ptr<Buffer>> get_object_range(
+            const std::string& s3_object_name,
+            const std::string& bucket_name,
+            const ObjectRange& range) const override;
+
     S3Result<std::monostate> put_object(
             const std::string& s3_object_name,
             Segment&& segment,
@@ -73,7 +91,12 @@ public:
             const std::optional<std::string> continuation_token) const override;
 
 private:
+    void apply_read_delay() const;
+
     std::map<S3Key, Segment> s3_contents;
+    mutable std::mutex read_delays_mutex_;
+    mutable std::deque<std::chrono::milliseconds> read_delays_;
+    mutable std::atomic<size_t> read_requests_ = 0;
 };
 
 }
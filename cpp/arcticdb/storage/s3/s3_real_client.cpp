@@ -131,6 +131,29 @@ S3Result<Segment> RealS3Client::get_object(
     return {Segment::from_buffer(retrieved.get_buffer())};
 }
 
+S3Result<std::shared_ptr<Buffer>> RealS3Client::get_object_range(
+        const std::string &s3_object_name,
+        const std::string &bucket_name,
+        const ObjectRange& range) const {
+
+    const auto& [offset, bytes] = range;
+    ARCTICDB_RUNTIME_DEBUG(log::storage(), "Looking for {} bytes at offset {} of object {}", bytes, offset, s3_object_name);
+    Aws::S3::Model::GetObjectRequest request;
+    request.WithBucket(bucket_name.c_str()).WithKey(s3_object_name.c_str());
+    // HTTP byte ranges are inclusive of the last byte
+    request.SetRange(fmt::format("bytes={}-{}", offset, offset + bytes - 1).c_str());
+    request.SetResponseStreamFactory(S3StreamFactory());
+    auto outcome = s3_client.GetObject(request);
+
+    if (!outcome.IsSuccess()) {
+        return {outcome.GetError()};
+    }
+    auto &retrieved = dynamic_cast<S3IOStream &>(outcome.GetResult().GetBody());
+
+    ARCTICDB_RUNTIME_DEBUG(log::storage(), "Returning range of object {}", s3_object_name);
+    return {retrieved.get_buffer()};
+}
+
 S3Result<std::monostate> RealS3Client::put_object(
         const std::string &s3_object_name,
         Segment &&segment,
@@ -35,6 +35,11 @@ public:
 
     S3Result<Segment> get_object(const std::string& s3_object_name, const std::string& bucket_name) const override;
 
+    S3Result<std::shared_ptr<Buffer>> get_object_range(
+            const std::string& s3_object_name,
+            const std::string& bucket_name,
+            const ObjectRange& range) const override;
+
     S3Result<std::monostate> put_object(
             const std::string& s3_object_name,
             Segment&& segment,
@@ -71,7 +71,11 @@ void S3Storage::do_update(Composite<KeySegmentPair>&& kvs, UpdateOpts) {
 }
 
 void S3Storage::do_read(Composite<VariantKey>&& ks, const ReadVisitor& visitor, ReadKeyOpts opts) {
-    detail::do_read_impl(std::move(ks), visitor, root_folder_, bucket_name_, *s3_client_, FlatBucketizer{}, opts);
+    detail::do_read_impl(std::move(ks), visitor, root_folder_, bucket_name_, *s3_client_, hedger_, FlatBucketizer{}, opts);
+}
+
+std::vector<Segment> S3Storage::do_read_ranges(const VariantKey& key, const std::vector<ObjectRange>& ranges) {
+    return detail::do_read_ranges_impl(key, ranges, root_folder_, bucket_name_, *s3_client_, FlatBucketizer{});
 }
 
 void S3Storage::do_remove(Composite<VariantKey>&& ks, RemoveOpts) {
@@ -15,6 +15,9 @@ namespace arcticdb::storage {
 
 using ReadVisitor = std::function<void(const VariantKey&, Segment &&)>;
 
+// The offset and size in bytes of a range of a stored object
+using ObjectRange = std::pair<uint64_t, uint64_t>;
+
 class DuplicateKeyException : public ArcticSpecificException<ErrorCode::E_DUPLICATE_KEY> {
 public:
     explicit DuplicateKeyException(std::string message) :
@@ -136,6 +139,14 @@ public:
         return key_seg;
     }
 
+    // Reads the segments serialized at each of ranges within the object stored under key, fetching the smallest range
+    // of the object covering all of them rather than the whole object. Used to read segments packed into a
+    // multi-segment object
+    std::vector<Segment> read_ranges(const VariantKey& key, const std::vector<ObjectRange>& ranges) {
+        ARCTICDB_SAMPLE(StorageReadRanges, 0)
+        return do_read_ranges(key, ranges);
+    }
+
     void remove(Composite<VariantKey> &&ks, RemoveOpts opts) {
         do_remove(std::move(ks), opts);
     }
@@ -180,6 +191,10 @@ private:
 
     virtual void do_read(Composite<VariantKey>&& ks, const ReadVisitor& visitor, ReadKeyOpts opts) = 0;
 
+    virtual std::vector<Segment> do_read_ranges(const VariantKey& key, const std::vector<ObjectRange>&) {
+        util::raise_rte("Ranged reads of key {} are not supported by this storage", variant_key_view(key));
+    }
+
     virtual void do_remove(Composite<VariantKey>&& ks, RemoveOpts opts) = 0;
 
     virtual bool do_key_exists(const VariantKey& key) = 0;
@@ -7,6 +7,10 @@
 
 #pragma once
 
+#include <memory>
+#include <string>
+#include <unordered_set>
+
 namespace arcticdb::storage {
 
 /**
@@ -34,6 +38,15 @@ struct ReadKeyOpts {
      * - s3_storage-inl.cpp:do_read_impl()
      */
     bool dont_warn_about_missing_key = false;
+
+    /**
+     * The columns that will be decoded from data segments read, if not all of them. Storages may then read only the
+     * parts of a segment needed to decode these columns, see encoded_column_ranges.
+     *
+     * Applies to:
+     * - s3 detail-inl.hpp:do_read_impl()
+     */
+    std::shared_ptr<std::unordered_set<std::string>> columns_to_decode_;
 };
 
 /**
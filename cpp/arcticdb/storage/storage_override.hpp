@@ -1,5 +1,6 @@
 #pragma once
 
+#include <optional>
 #include <variant>
 #include <string>
 
@@ -202,16 +203,48 @@ public:
     }
 };
 
+class LocalCacheOverride {
+    std::string path_;
+    uint64_t max_bytes_ = 0;
+
+public:
+    [[nodiscard]] std::string path() const {
+        return path_;
+    }
+
+    [[nodiscard]] uint64_t max_bytes() const {
+        return max_bytes_;
+    }
+
+    void set_path(std::string path) {
+        path_ = std::move(path);
+    }
+
+    void set_max_bytes(uint64_t max_bytes) {
+        max_bytes_ = max_bytes;
+    }
+};
+
 using VariantStorageOverride = std::variant<std::monostate, S3Override, AzureOverride, LmdbOverride>;
 
 class StorageOverride {
     VariantStorageOverride override_;
+    // Not part of the storage config, as the cache is local to this client rather than a property of the library
+    std::optional<LocalCacheOverride> local_cache_override_;
 
 public:
     const VariantStorageOverride& variant() const {
         return override_;
     }
 
+    const std::optional<LocalCacheOverride>& local_cache_override() const {
+        return local_cache_override_;
+    }
+
+    void set_local_cache_override(const LocalCacheOverride& local_cache_override) {
+        local_cache_override_ = local_cache_override;
+    }
+
     void set_s3_override(const S3Override& storage_override) {
         override_ = storage_override;
     }
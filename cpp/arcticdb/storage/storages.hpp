@@ -13,8 +13,12 @@
 #include <arcticdb/util/composite.hpp>
 #include <arcticdb/util/configs_map.hpp>
 #include <arcticdb/storage/single_file_storage.hpp>
+#include <arcticdb/storage/storage_override.hpp>
+#include <arcticdb/storage/local_cache/local_cache_storage.hpp>
+#include <arcticdb/storage/coalesced/packed_segment.hpp>
 
 #include <memory>
+#include <unordered_map>
 #include <vector>
 
 namespace arcticdb::storage {
@@ -64,6 +68,9 @@ class Storages {
     }
 
     bool key_exists(const VariantKey& key) {
+        if(is_packed_segment_key(key))
+            return primary().key_exists(coalesced_object_key(std::get<AtomKey>(key)));
+
         return primary().key_exists(key);
     }
 
@@ -73,6 +80,9 @@ class Storages {
 
     auto read(Composite<VariantKey>&& ks, const ReadVisitor& visitor, ReadKeyOpts opts, bool primary_only=true) {
         ARCTICDB_RUNTIME_SAMPLE(StoragesRead, 0)
+        if(auto rg = ks.as_range(); std::any_of(std::begin(rg), std::end(rg), is_packed_segment_key))
+            return read_packed_segments(std::move(rg), visitor, opts);
+
         if(primary_only)
             return primary().read(std::move(ks), visitor, opts);
 
@@ -145,6 +155,57 @@ class Storages {
         }
     }
   private:
+    // Packed segments are read from the primary storage, with one ranged read of each object for all of the segments
+    // to be read from it
+    void read_packed_segments(std::vector<VariantKey>&& keys, const ReadVisitor& visitor, ReadKeyOpts opts) {
+        ARCTICDB_SAMPLE(StoragesReadPackedSegments, 0)
+        std::vector<VariantKey> other_keys;
+        std::vector<AtomKey> object_keys;
+        std::unordered_map<AtomKey, std::vector<VariantKey>> packed_keys_by_object;
+        for(auto& key : keys) {
+            if(!is_packed_segment_key(key)) {
+                other_keys.emplace_back(std::move(key));
+                continue;
+            }
+
+            auto object_key = coalesced_object_key(std::get<AtomKey>(key));
+            auto& packed_keys = packed_keys_by_object[object_key];
+            if(packed_keys.empty())
+                object_keys.emplace_back(std::move(object_key));
+
+            packed_keys.emplace_back(std::move(key));
+        }
+
+        std::vector<VariantKey> keys_not_found;
+        for(const auto& object_key : object_keys) {
+            auto& packed_keys = packed_keys_by_object.at(object_key);
+            std::vector<ObjectRange> ranges;
+            ranges.reserve(packed_keys.size());
+            for(const auto& packed_key : packed_keys)
+                ranges.emplace_back(packed_segment_range(std::get<AtomKey>(packed_key)));
+
+            try {
+                auto segments = primary().read_ranges(object_key, ranges);
+                for(size_t i = 0; i < packed_keys.size(); ++i)
+                    visitor(packed_keys[i], std::move(segments[i]));
+            } catch (const KeyNotFoundException&) {
+                std::move(packed_keys.begin(), packed_keys.end(), std::back_inserter(keys_not_found));
+            }
+        }
+
+        if(!other_keys.empty()) {
+            try {
+                primary().read(Composite<VariantKey>{std::move(other_keys)}, visitor, opts);
+            } catch (KeyNotFoundException& ex) {
+                for(auto& key : ex.keys().as_range())
+                    keys_not_found.emplace_back(std::move(key));
+            }
+        }
+
+        if(!keys_not_found.empty())
+            throw KeyNotFoundException(Composite<VariantKey>{std::move(keys_not_found)});
+    }
+
     Storage& primary() {
         util::check(!storages_.empty(), "No storages configured");
         return *storages_[0];
@@ -166,10 +227,22 @@ inline std::shared_ptr<Storages> create_storages(const LibraryPath& library_path
     return std::make_shared<Storages>(std::move(storages), mode);
 }
 
-inline std::shared_ptr<Storages> create_storages(const LibraryPath& library_path, OpenMode mode, const std::vector<arcticdb::proto::storage::VariantStorage> &storage_configs) {
+inline std::shared_ptr<Storages> create_storages(
+    const LibraryPath& library_path,
+    OpenMode mode,
+    const std::vector<arcticdb::proto::storage::VariantStorage> &storage_configs,
+    const std::optional<LocalCacheOverride>& local_cache = std::nullopt) {
     Storages::StorageVector storages;
+    std::shared_ptr<local_cache::LocalDiskCache> disk_cache;
+    if (local_cache)
+        disk_cache = local_cache::LocalDiskCache::open(local_cache->path(), local_cache->max_bytes());
+
     for (const auto& storage_config: storage_configs) {
-        storages.push_back(create_storage(library_path, mode, storage_config));
+        auto storage = create_storage(library_path, mode, storage_config);
+        if (disk_cache)
+            storage = std::make_shared<local_cache::LocalCacheStorage>(std::move(storage), disk_cache);
+
+        storages.push_back(std::move(storage));
     }
     return std::make_shared<Storages>(std::move(storages), mode);
 }
@@ -45,7 +45,8 @@ namespace arcticdb {
 
         std::vector<folly::Future<pipelines::SegmentAndSlice>> batch_read_uncompressed(
                 std::vector<pipelines::RangesAndKey>&&,
-                std::shared_ptr<std::unordered_set<std::string>>) override {
+                std::shared_ptr<std::unordered_set<std::string>>,
+                std::shared_ptr<QueryProfile>) override {
             throw std::runtime_error("Not implemented for tests");
         }
 
@@ -0,0 +1,88 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+#include <arcticdb/codec/codec.hpp>
+#include <arcticdb/storage/hedged_requests.hpp>
+#include <arcticdb/storage/s3/s3_mock_client.hpp>
+#include <arcticdb/util/configs_map.hpp>
+#include <arcticdb/util/test/generators.hpp>
+
+using namespace arcticdb;
+using namespace arcticdb::storage;
+using namespace std::chrono_literals;
+
+namespace {
+
+const std::string bucket_name = "bucket";
+const std::string object_name = "object";
+
+class HedgedRequestsFixture : public testing::Test {
+protected:
+    HedgedRequestsFixture() {
+        arcticdb::proto::encoding::VariantCodec codec_opts;
+        codec_opts.mutable_lz4()->set_acceleration(1);
+        auto segment = encode_dispatch(get_standard_timeseries_segment("symbol", 10), codec_opts, EncodingVersion::V1);
+        segment_bytes_ = segment.total_segment_size();
+        client_.put_object(object_name, std::move(segment), bucket_name);
+    }
+
+    // Reads the object through the hedger, returning how long it took
+    std::chrono::milliseconds timed_read(RequestHedger& hedger) {
+        const auto start = std::chrono::steady_clock::now();
+        auto result = hedger.run([this]() { return client_.get_object(object_name, bucket_name); });
+        const auto elapsed = std::chrono::steady_clock::now() - start;
+        EXPECT_TRUE(result.is_success());
+        EXPECT_EQ(result.get_output().total_segment_size(), segment_bytes_);
+        return std::chrono::duration_cast<std::chrono::milliseconds>(elapsed);
+    }
+
+    void warm_up(RequestHedger& hedger) {
+        for (auto i = 0; i < 64; ++i)
+            timed_read(hedger);
+    }
+
+    s3::MockS3Client client_;
+    size_t segment_bytes_ = 0;
+    ScopedConfig percentile_{"TestStorage.HedgePercentile", 90};
+    ScopedConfig min_samples_{"TestStorage.HedgeMinSamples", 32};
+    ScopedConfig min_delay_{"TestStorage.HedgeMinDelayMs", 20};
+};
+
+} // namespace
+
+TEST_F(HedgedRequestsFixture, DisabledByDefault) {
+    RequestHedger hedger{"UnconfiguredStorage"};
+    ASSERT_FALSE(hedger.enabled());
+    timed_read(hedger);
+    ASSERT_EQ(hedger.stats().requests_, 0u);
+}
+
+TEST_F(HedgedRequestsFixture, SlowReadIsHedged) {
+    ScopedConfig budget{"TestStorage.HedgeBudgetPercent", 100};
+    RequestHedger hedger{"TestStorage"};
+    ASSERT_TRUE(hedger.enabled());
+    warm_up(hedger);
+    ASSERT_EQ(hedger.stats().hedges_fired_, 0u);
+
+    client_.delay_next_reads({500ms});
+    ASSERT_LT(timed_read(hedger), 250ms);
+    const auto stats = hedger.stats();
+    ASSERT_EQ(stats.requests_, 65u);
+    ASSERT_EQ(stats.hedges_fired_, 1u);
+    ASSERT_EQ(stats.hedges_won_, 1u);
+}
+
+TEST_F(HedgedRequestsFixture, HedgesLimitedByBudget) {
+    ScopedConfig budget{"TestStorage.HedgeBudgetPercent", 0};
+    RequestHedger hedger{"TestStorage"};
+    warm_up(hedger);
+
+    client_.delay_next_reads({100ms});
+    ASSERT_GE(timed_read(hedger), 100ms);
+    ASSERT_EQ(hedger.stats().hedges_fired_, 0u);
+}
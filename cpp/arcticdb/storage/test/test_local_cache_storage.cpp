@@ -0,0 +1,133 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
+#include <gtest/gtest.h>
+#include <arcticdb/codec/codec.hpp>
+#include <arcticdb/storage/local_cache/local_cache_storage.hpp>
+#include <arcticdb/storage/memory/memory_storage.hpp>
+#include <arcticdb/util/test/generators.hpp>
+
+#include <filesystem>
+
+namespace fs = std::filesystem;
+
+using namespace arcticdb;
+using namespace arcticdb::storage;
+
+class LocalCacheStorageTest : public testing::Test {
+protected:
+    const fs::path cache_path_ = "./test_local_cache";
+    const LibraryPath library_path_{"a", "b"};
+
+    void SetUp() override {
+        fs::remove_all(cache_path_);
+        origin_ = std::make_shared<memory::MemoryStorage>(library_path_, OpenMode::DELETE, memory::MemoryStorage::Config{});
+        segment_size_ = encoded_segment().total_segment_size();
+    }
+
+    void TearDown() override {
+        fs::remove_all(cache_path_);
+    }
+
+    static Segment encoded_segment() {
+        arcticdb::proto::encoding::VariantCodec opt;
+        opt.mutable_lz4()->set_acceleration(1);
+        return encode_dispatch(get_standard_timeseries_segment("sym"), opt, EncodingVersion::V1);
+    }
+
+    static AtomKey data_key(size_t id) {
+        return atom_key_builder().gen_id(id).start_index(0).end_index(10).creation_ts(999)
+            .build("sym", KeyType::TABLE_DATA);
+    }
+
+    void write_to_origin(const VariantKey& key) {
+        origin_->write(KeySegmentPair{VariantKey{key}, encoded_segment()});
+    }
+
+    std::shared_ptr<memory::MemoryStorage> origin_;
+    size_t segment_size_ = 0;
+};
+
+TEST_F(LocalCacheStorageTest, ReadThrough) {
+    auto cache = std::make_shared<local_cache::LocalDiskCache>(cache_path_, 100 * segment_size_);
+    local_cache::LocalCacheStorage storage{origin_, cache};
+    write_to_origin(data_key(0));
+
+    auto first = storage.read(VariantKey{data_key(0)}, ReadKeyOpts{});
+    ASSERT_EQ(cache->size(), 1);
+    ASSERT_EQ(cache->bytes(), segment_size_);
+
+    // Served from the cache once the origin no longer has it
+    origin_->remove(VariantKey{data_key(0)}, RemoveOpts{});
+    auto second = storage.read(VariantKey{data_key(0)}, ReadKeyOpts{});
+    ASSERT_EQ(std::get<AtomKey>(second.variant_key()), data_key(0));
+    ASSERT_EQ(decode_segment(std::move(second.segment())).row_count(), 10);
+}
+
+TEST_F(LocalCacheStorageTest, RefKeysGoToOrigin) {
+    auto cache = std::make_shared<local_cache::LocalDiskCache>(cache_path_, 100 * segment_size_);
+    local_cache::LocalCacheStorage storage{origin_, cache};
+    RefKey ref_key{"sym", KeyType::VERSION_REF};
+    write_to_origin(ref_key);
+    auto version_key = atom_key_builder().gen_id(0).build("sym", KeyType::VERSION);
+    write_to_origin(version_key);
+
+    storage.read(VariantKey{ref_key}, ReadKeyOpts{});
+    storage.read(VariantKey{version_key}, ReadKeyOpts{});
+    ASSERT_EQ(cache->size(), 0);
+}
+
+TEST_F(LocalCacheStorageTest, RemoveEvictsFromCache) {
+    auto cache = std::make_shared<local_cache::LocalDiskCache>(cache_path_, 100 * segment_size_);
+    local_cache::LocalCacheStorage storage{origin_, cache};
+    write_to_origin(data_key(0));
+    storage.read(VariantKey{data_key(0)}, ReadKeyOpts{});
+    ASSERT_EQ(cache->size(), 1);
+
+    storage.remove(VariantKey{data_key(0)}, RemoveOpts{});
+    ASSERT_EQ(cache->size(), 0);
+    ASSERT_THROW(storage.read(VariantKey{data_key(0)}, ReadKeyOpts{}), KeyNotFoundException);
+}
+
+TEST_F(LocalCacheStorageTest, EvictsLeastRecentlyUsed) {
+    auto cache = std::make_shared<local_cache::LocalDiskCache>(cache_path_, 2 * segment_size_);
+    local_cache::LocalCacheStorage storage{origin_, cache};
+    for (size_t i = 0; i < 3; ++i)
+        write_to_origin(data_key(i));
+
+    storage.read(VariantKey{data_key(0)}, ReadKeyOpts{});
+    storage.read(VariantKey{data_key(1)}, ReadKeyOpts{});
+    // Touch key 0 so that key 1 is the least recently used
+    storage.read(VariantKey{data_key(0)}, ReadKeyOpts{});
+    storage.read(VariantKey{data_key(2)}, ReadKeyOpts{});
+    ASSERT_EQ(cache->size(), 2);
+    ASSERT_LE(cache->bytes(), 2 * segment_size_);
+
+    origin_->remove(Composite<VariantKey>{std::vector<VariantKey>{data_key(0), data_key(1), data_key(2)}}, RemoveOpts{});
+    ASSERT_NO_THROW(storage.read(VariantKey{data_key(0)}, ReadKeyOpts{}));
+    ASSERT_THROW(storage.read(VariantKey{data_key(1)}, ReadKeyOpts{}), KeyNotFoundException);
+    ASSERT_NO_THROW(storage.read(VariantKey{data_key(2)}, ReadKeyOpts{}));
+}
+
+TEST_F(LocalCacheStorageTest, SurvivesReopen) {
+    {
+        auto cache = std::make_shared<local_cache::LocalDiskCache>(cache_path_, 100 * segment_size_);
+        local_cache::LocalCacheStorage storage{origin_, cache};
+        write_to_origin(data_key(0));
+        write_to_origin(data_key(1));
+        storage.read(Composite<VariantKey>{std::vector<VariantKey>{data_key(0), data_key(1)}}, [] (const VariantKey&, Segment&&) {}, ReadKeyOpts{});
+        ASSERT_EQ(cache->size(), 2);
+    }
+    auto cache = std::make_shared<local_cache::LocalDiskCache>(cache_path_, 100 * segment_size_);
+    ASSERT_EQ(cache->size(), 2);
+    ASSERT_EQ(cache->bytes(), 2 * segment_size_);
+
+    // Reopening with a smaller cap evicts down to it
+    cache.reset();
+    cache = std::make_shared<local_cache::LocalDiskCache>(cache_path_, segment_size_);
+    ASSERT_EQ(cache->size(), 1);
+}
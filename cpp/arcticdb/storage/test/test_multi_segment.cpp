@@ -1,7 +1,107 @@
+/* Copyright 2023 Man Group Operations Limited
+ *
+ * Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+ *
+ * As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+ */
+
 #include <gtest/gtest.h>
-#include <arcticdb/storage/coalesced/multi_segment_aggregator.hpp>
+#include <arcticdb/codec/codec.hpp>
+#include <arcticdb/storage/coalesced/packed_segment.hpp>
+#include <arcticdb/storage/memory/memory_storage.hpp>
+#include <arcticdb/util/test/generators.hpp>
+
+using namespace arcticdb;
+using namespace arcticdb::storage;
+
+namespace {
+
+Segment encoded_segment(size_t num_rows) {
+    arcticdb::proto::encoding::VariantCodec opt;
+    opt.mutable_lz4()->set_acceleration(1);
+    return encode_dispatch(get_standard_timeseries_segment("sym", num_rows), opt, EncodingVersion::V1);
+}
+
+AtomKey data_key(timestamp start, timestamp end) {
+    return atom_key_builder().version_id(3).creation_ts(999).content_hash(42).start_index(start).end_index(end)
+        .build("sym", KeyType::TABLE_DATA);
+}
+
+CoalescedObject pack_test_segments(const std::vector<size_t>& rows_per_segment) {
+    std::vector<std::pair<AtomKey, Segment>> segments;
+    timestamp start = 0;
+    for (auto num_rows : rows_per_segment) {
+        const auto end = start + timestamp(num_rows);
+        segments.emplace_back(data_key(start, end), encoded_segment(num_rows));
+        start = end;
+    }
+    return pack_segments("sym", 1000, std::move(segments));
+}
+
+void check_decoded(Segment&& segment, size_t num_rows) {
+    auto decoded = decode_segment(std::move(segment));
+    ASSERT_EQ(decoded.row_count(), num_rows);
+    for (size_t row = 0; row < num_rows; ++row)
+        ASSERT_EQ(decoded.scalar_at<uint64_t>(row, 2).value(), row * 2);
+}
+
+} // namespace
+
+TEST(MultiSegment, PackedKeysLocateSegments) {
+    auto packed = pack_test_segments({10, 100, 5});
+    ASSERT_EQ(packed.packed_keys_.size(), 3u);
+    ASSERT_EQ(packed.object_.atom_key(), coalesced_object_key("sym", 1000));
+    ASSERT_FALSE(is_packed_segment_key(packed.object_.variant_key()));
+
+    uint64_t expected_offset = 0;
+    for (const auto& key : packed.packed_keys_) {
+        ASSERT_TRUE(is_packed_segment_key(key));
+        ASSERT_EQ(key.type(), KeyType::MULTI_SEGMENT);
+        ASSERT_EQ(key.version_id(), 3u);
+        ASSERT_EQ(coalesced_object_key(key), packed.object_.atom_key());
+        const auto [offset, bytes] = packed_segment_range(key);
+        if (expected_offset != 0)
+            ASSERT_EQ(offset, expected_offset);
+        expected_offset = offset + bytes;
+    }
+    ASSERT_EQ(std::get<NumericIndex>(packed.packed_keys_[1].start_index()), 10);
+    ASSERT_EQ(std::get<NumericIndex>(packed.packed_keys_[1].end_index()), 110);
+    ASSERT_EQ(expected_offset, packed.object_.segment().total_segment_size());
+}
+
+TEST(MultiSegment, ReadRangesOfObject) {
+    auto packed = pack_test_segments({10, 100, 5});
+    std::vector<ObjectRange> ranges{packed_segment_range(packed.packed_keys_[2]), packed_segment_range(packed.packed_keys_[0])};
+    auto segments = read_segment_ranges(packed.object_.segment(), ranges);
+    ASSERT_EQ(segments.size(), 2u);
+    check_decoded(std::move(segments[0]), 5);
+    check_decoded(std::move(segments[1]), 10);
+}
+
+TEST(MultiSegment, SpanningRange) {
+    ASSERT_EQ(spanning_range({{100, 10}, {20, 5}, {50, 30}}), ObjectRange(20, 90));
+    ASSERT_EQ(spanning_range({{7, 3}}), ObjectRange(7, 3));
+}
+
+TEST(MultiSegment, MemoryStorageReadRanges) {
+    memory::MemoryStorage storage{LibraryPath{"a", "b"}, OpenMode::DELETE, memory::MemoryStorage::Config{}};
+    auto packed = pack_test_segments({20, 30});
+    const auto object_key = packed.object_.atom_key();
+    storage.write(std::move(packed.object_));
 
+    auto segments = storage.read_ranges(object_key, {packed_segment_range(packed.packed_keys_[1])});
+    ASSERT_EQ(segments.size(), 1u);
+    check_decoded(std::move(segments[0]), 30);
 
-TEST(MultiSegment, Roundtrip) {
+    ASSERT_THROW(storage.read_ranges(coalesced_object_key("sym", 1001), {{0, 10}}), KeyNotFoundException);
+}
 
-}
\ No newline at end of file
+TEST(MultiSegment, PackedSegmentContentHashLimits) {
+    constexpr uint64_t max_packed_value = std::numeric_limits<uint32_t>::max();
+    const auto key = atom_key_builder().creation_ts(1000).content_hash(packed_segment_content_hash(max_packed_value, max_packed_value))
+        .start_index(NumericIndex{0}).end_index(NumericIndex{1}).build("sym", KeyType::MULTI_SEGMENT);
+    ASSERT_EQ(packed_segment_range(key), ObjectRange(max_packed_value, max_packed_value));
+    // Segments of 4GB or more, or at offsets beyond it, cannot be referenced
+    ASSERT_THROW(packed_segment_content_hash(0, max_packed_value + 1), ArcticException);
+    ASSERT_THROW(packed_segment_content_hash(max_packed_value + 1, 10), ArcticException);
+}
@@ -15,6 +15,7 @@
 #include <arcticdb/entity/protobufs.hpp>
 #include <arcticdb/entity/variant_key.hpp>
 #include <arcticdb/storage/test/common.hpp>
+#include <arcticdb/util/test/generators.hpp>
 
 #include <aws/core/Aws.h>
 
@@ -299,3 +300,94 @@ TEST_F(S3StorageFixture, test_matching_key_type_prefix_list) {
 
     ASSERT_EQ(list_in_store(store, entity::KeyType::LOG), log_symbols);
 }
+
+namespace {
+
+// Decodes the given columns of a segment, like DecodeSliceTask
+SegmentInMemory decode_columns(Segment&& segment, const std::unordered_set<std::string>& columns) {
+    auto& hdr = segment.header();
+    StreamDescriptor desc(std::make_shared<StreamDescriptor::Proto>(std::move(*hdr.mutable_stream_descriptor())), segment.fields_ptr());
+    FieldCollection fields;
+    for (const auto& field : desc.fields()) {
+        if (columns.contains(std::string{field.name()}))
+            fields.add({field.type(), field.name()});
+    }
+    SegmentInMemory output(index_descriptor(StreamDescriptor::id_from_proto(desc.proto()), stream::TimeseriesIndex::default_index(), fields));
+    decode_into_memory_segment(segment, hdr, output, desc);
+    return output;
+}
+
+} // namespace
+
+TEST_F(S3StorageFixture, test_read_columns) {
+    // Small enough that the segment is read with ranged reads after its headers
+    ScopedConfig prefix_bytes("S3Storage.ColumnReadPrefixBytes", 1024);
+    ScopedConfig merge_gap_bytes("S3Storage.ColumnReadMergeGapBytes", 0);
+    arcticdb::proto::encoding::VariantCodec codec_opts;
+    codec_opts.mutable_lz4()->set_acceleration(1);
+    const size_t num_rows = 10'000;
+    auto segment = encode_dispatch(get_standard_timeseries_segment("symbol", num_rows), codec_opts, EncodingVersion::V1);
+    const auto segment_bytes = segment.total_segment_size();
+    auto key = get_test_key("symbol");
+    store.write(KeySegmentPair(VariantKey{key}, std::move(segment)));
+
+    ReadKeyOpts opts;
+    opts.columns_to_decode_ = std::make_shared<std::unordered_set<std::string>>(std::unordered_set<std::string>{"time", "uint64"});
+    auto key_seg = store.read(VariantKey{key}, opts);
+    ASSERT_EQ(key_seg.segment().total_segment_size(), segment_bytes);
+    auto decoded = decode_columns(key_seg.release_segment(), *opts.columns_to_decode_);
+    ASSERT_EQ(decoded.row_count(), num_rows);
+    ASSERT_EQ(decoded.descriptor().field_count(), 2u);
+    for (size_t row = 0; row < num_rows; ++row)
+        ASSERT_EQ(decoded.scalar_at<uint64_t>(row, 1).value(), row * 2);
+
+    ASSERT_THROW(store.read(get_test_key("symbol-not-present"), opts), KeyNotFoundException);
+}
+
+TEST(TestS3Storage, ranges_to_request) {
+    using namespace arcticdb::storage::s3::detail;
+    const std::vector<std::pair<uint64_t, uint64_t>> ranges{{0, 100}, {150, 50}, {300, 10}, {1000, 20}};
+    ASSERT_EQ(ranges_to_request(ranges, 120, 0), (std::vector<ObjectRange>{{150, 50}, {300, 10}, {1000, 20}}));
+    ASSERT_EQ(ranges_to_request(ranges, 160, 100), (std::vector<ObjectRange>{{160, 150}, {1000, 20}}));
+    ASSERT_TRUE(ranges_to_request(ranges, 2000, 100).empty());
+}
+
+TEST(TestS3Storage, column_read_requests) {
+    using namespace arcticdb::storage::s3::detail;
+    ScopedConfig merge_gap_bytes("S3Storage.ColumnReadMergeGapBytes", 0);
+    const std::string root_folder = "root";
+    const std::string bucket_name = "bucket";
+    arcticdb::proto::encoding::VariantCodec codec_opts;
+    codec_opts.mutable_lz4()->set_acceleration(1);
+    auto segment = encode_dispatch(get_standard_timeseries_segment("symbol", 10'000), codec_opts, EncodingVersion::V1);
+    const auto segment_bytes = segment.total_segment_size();
+    const auto key = get_test_key("symbol");
+    const auto object_name = object_path(FlatBucketizer{}.bucketize(key_type_folder(root_folder, variant_key_type(key)), key), key);
+    MockS3Client client;
+    client.put_object(object_name, std::move(segment), bucket_name);
+
+    // Reads decoding every column of a segment do not pass the columns, and take a single request
+    RequestHedger hedger{"UnconfiguredStorage"};
+    size_t bytes_read = 0;
+    do_read_impl(Composite<VariantKey>{VariantKey{key}}, [&bytes_read](const VariantKey&, Segment&& segment) {
+        bytes_read = segment.total_segment_size();
+    }, root_folder, bucket_name, client, hedger, FlatBucketizer{}, ReadKeyOpts{});
+    ASSERT_EQ(bytes_read, segment_bytes);
+    ASSERT_EQ(client.read_requests(), 1u);
+
+    // Ranges skipping little of the object are read with one request after the headers
+    const std::unordered_set<std::string> all_columns{"time", "int8", "uint64", "strings"};
+    auto all_columns_result = get_object_columns(object_name, bucket_name, client, all_columns, 1024);
+    ASSERT_TRUE(all_columns_result.is_success());
+    ASSERT_EQ(all_columns_result.get_output().total_segment_size(), segment_bytes);
+    ASSERT_EQ(client.read_requests(), 3u);
+
+    ScopedConfig min_skip_percent("S3Storage.ColumnReadMinSkipPercent", 100);
+    const std::unordered_set<std::string> some_columns{"time", "uint64"};
+    auto some_columns_result = get_object_columns(object_name, bucket_name, client, some_columns, 1024);
+    ASSERT_TRUE(some_columns_result.is_success());
+    auto decoded = decode_columns(std::move(some_columns_result.get_output()), some_columns);
+    for (size_t row = 0; row < 10'000; ++row)
+        ASSERT_EQ(decoded.scalar_at<uint64_t>(row, 1).value(), row * 2);
+    ASSERT_EQ(client.read_requests(), 5u);
+}
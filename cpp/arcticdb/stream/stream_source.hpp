@@ -15,6 +15,7 @@
 #include <arcticdb/util/configs_map.hpp>
 #include <arcticdb/async/batch_read_args.hpp>
 #include <arcticdb/processing/clause.hpp>
+#include <arcticdb/processing/query_profile.hpp>
 
 #include <folly/futures/Future.h>
 #include <folly/Function.h>
@@ -65,7 +66,8 @@ struct StreamSource {
 
     virtual std::vector<folly::Future<pipelines::SegmentAndSlice>> batch_read_uncompressed(
         std::vector<pipelines::RangesAndKey>&& ranges_and_keys,
-        std::shared_ptr<std::unordered_set<std::string>> columns_to_decode) = 0;
+        std::shared_ptr<std::unordered_set<std::string>> columns_to_decode,
+        std::shared_ptr<QueryProfile> query_profile) = 0;
 
     virtual folly::Future<std::pair<std::optional<VariantKey>, std::optional<google::protobuf::Any>>> read_metadata(
         const entity::VariantKey &key,
@@ -234,7 +234,9 @@ inline auto generate_keys_from_segments(
                 key_segs.pop();
                 for (ssize_t i = 0; i < ssize_t(seg.row_count()); ++i) {
                     auto read_key = read_key_row(seg, i);
-                    if(read_key.type() != expected_key_type) {
+                    // Data segments coalesced into a multi-segment object are referenced by MULTI_SEGMENT keys
+                    const bool is_packed_data = expected_key_type == KeyType::TABLE_DATA && read_key.type() == KeyType::MULTI_SEGMENT;
+                    if(read_key.type() != expected_key_type && !is_packed_data) {
                         util::check_arg(expected_index_type && read_key.type() == *expected_index_type,
                             "Found unsupported key type in index segment. Expected {} or (index) {}, actual {}",
                             expected_key_type, expected_index_type.value_or(KeyType::UNDEFINED), read_key
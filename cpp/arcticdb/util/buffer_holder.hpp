@@ -8,11 +8,34 @@
 #pragma once
 
 #include <column_store/column.hpp>
+#include <unordered_map>
 #include <vector>
 
 namespace arcticdb {
+
+// The distinct values of a dynamic string column read with OutputFormat::ARROW, laid out as an Arrow large_string
+// (or large_binary) array. The column itself holds int64 indices into this dictionary, with null_code for missing
+// values, so that the Python layer can assemble a pyarrow.DictionaryArray without copying either buffer.
+struct ArrowStringDictionary {
+    static constexpr int64_t null_code = -1;
+
+    std::vector<int64_t> offsets_{0};
+    std::vector<char> data_;
+    bool is_utf_ = true;
+
+    [[nodiscard]] size_t size() const {
+        return offsets_.size() - 1;
+    }
+
+    void append(std::string_view value) {
+        data_.insert(data_.end(), value.begin(), value.end());
+        offsets_.emplace_back(static_cast<int64_t>(data_.size()));
+    }
+};
+
 struct BufferHolder {
     std::vector<std::shared_ptr<Column>> columns_;
+    std::unordered_map<std::string, std::shared_ptr<ArrowStringDictionary>> string_dictionaries_;
     std::mutex mutex_;
 
     std::shared_ptr<Column> get_buffer(const TypeDescriptor& td, bool allow_sparse) {
@@ -21,5 +44,12 @@ struct BufferHolder {
         columns_.emplace_back(column);
         return column;
     }
+
+    std::shared_ptr<ArrowStringDictionary> get_string_dictionary(std::string_view column_name) {
+        std::lock_guard lock(mutex_);
+        auto dictionary = std::make_shared<ArrowStringDictionary>();
+        string_dictionaries_.insert_or_assign(std::string{column_name}, dictionary);
+        return dictionary;
+    }
 };
 }
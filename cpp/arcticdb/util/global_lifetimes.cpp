@@ -13,6 +13,7 @@
 #include <arcticdb/log/log.hpp>
 #include <arcticdb/entity/metrics.hpp>
 #include <arcticdb/util/buffer_pool.hpp>
+#include <arcticdb/async/segment_cache.hpp>
 
 #if defined(_MSC_VER) && defined(_DEBUG)
 #include <crtdbg.h>
@@ -22,6 +23,7 @@
 namespace arcticdb {
 
 ModuleData::~ModuleData() {
+    async::SegmentCache::destroy_instance();
     BufferPool::destroy_instance();
     TracingData::destroy_instance();
     Allocator::destroy_instance();
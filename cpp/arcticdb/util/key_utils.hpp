@@ -139,6 +139,7 @@ inline std::unordered_set<AtomKey> recurse_segment(const std::shared_ptr<stream:
         if ((version_id && key.version_id() == *version_id) || !version_id) {
             switch (key.type()) {
                 case KeyType::TABLE_DATA:
+                case KeyType::MULTI_SEGMENT:
                     res.emplace(std::move(key));
                     break;
                 case KeyType::TABLE_INDEX:
@@ -8,6 +8,7 @@
 #pragma once
 
 #include <pcre.h>
+#include <string_view>
 #include <arcticdb/util/constructors.hpp>
 #include <arcticdb/util/preconditions.hpp>
 
@@ -37,8 +38,10 @@ class RegexPattern : private PcreRegex {
     int capturing_groups_ = 0;
 
 public:
-    explicit RegexPattern(const std::string& pattern) :
-    text_(pattern) {
+    // options are PCRE compile options, such as PCRE_ANCHORED to only match at the start of the text
+    explicit RegexPattern(const std::string& pattern, OptionsType options = 0) :
+    text_(pattern),
+    options_(options) {
         compile_regex();
     }
 
@@ -88,7 +91,7 @@ public:
     results_((pattern_.capturing_groups() + 1) * 3, 0) {
     }
 
-    bool match(const std::string& text) {
+    bool match(std::string_view text) {
         ResultsType res = ::pcre_exec(pattern_.handle(), extra_, text.data(), static_cast<int>(text.size()), 0, options_, &results_[0], static_cast<int>(results_.size()));
         util::check(res >= 0 || res == PCRE_ERROR_NOMATCH, "Invalid result in regex compile with pattern {} and text {}: {}", pattern_.text(), text, res);
         return res > 0;
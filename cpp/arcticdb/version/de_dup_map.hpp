@@ -44,6 +44,10 @@ public:
         if (!de_dup_map_) {
             util::raise_rte("Invalid de dup map object");
         }
+        // The content hash of a segment coalesced into a multi-segment object holds its location in that object
+        if (key.type() == KeyType::MULTI_SEGMENT)
+            return;
+
         if (de_dup_map_->count(key.content_hash()) != 0)
             de_dup_map_->at(key.content_hash()).push_back(key);
         else
@@ -10,6 +10,7 @@
 #include <arcticdb/version/version_core.hpp>
 #include <arcticdb/storage/storage.hpp>
 #include <arcticdb/storage/storage_options.hpp>
+#include <arcticdb/storage/coalesced/packed_segment.hpp>
 #include <arcticdb/util/optional_defaults.hpp>
 #include <arcticdb/version/snapshot.hpp>
 #include <arcticdb/stream/stream_sink.hpp>
@@ -21,6 +22,7 @@
 #include <arcticdb/version/version_map_batch_methods.hpp>
 #include <arcticdb/util/container_filter_wrapper.hpp>
 #include <arcticdb/python/gil_lock.hpp>
+#include <arcticdb/util/configs_map.hpp>
 
 namespace arcticdb::version_store {
 
@@ -358,6 +360,48 @@ ReadVersionOutput LocalVersionedEngine::read_dataframe_version_internal(
     return ReadVersionOutput{version.value_or(VersionedItem{}), std::move(frame_and_descriptor)};
 }
 
+ReadVersionOutput LocalVersionedEngine::read_asof_join_internal(
+    const StreamId& left_stream_id,
+    const VersionQuery& left_version_query,
+    ReadQuery& left_read_query,
+    const StreamId& right_stream_id,
+    const VersionQuery& right_version_query,
+    const std::optional<std::vector<std::string>>& right_columns,
+    const std::optional<std::string>& by,
+    std::optional<timestamp> tolerance,
+    const ReadOptions& read_options) {
+    ARCTICDB_RUNTIME_SAMPLE(ReadAsOfJoinInternal, 0)
+    ARCTICDB_RUNTIME_DEBUG(log::version(), "Command: read_asof_join");
+    auto left_version = get_version_to_read(left_stream_id, left_version_query);
+    missing_data::check<ErrorCode::E_NO_SUCH_VERSION>(left_version.has_value(),
+            "read_asof_join: version matching query '{}' not found for symbol '{}'", left_version_query, left_stream_id);
+    auto right_version = get_version_to_read(right_stream_id, right_version_query);
+    missing_data::check<ErrorCode::E_NO_SUCH_VERSION>(right_version.has_value(),
+            "read_asof_join: version matching query '{}' not found for symbol '{}'", right_version_query, right_stream_id);
+    auto frame_and_descriptor = read_asof_join_impl(
+        store(),
+        *left_version,
+        left_read_query,
+        *right_version,
+        right_columns,
+        by,
+        tolerance,
+        read_options);
+    return ReadVersionOutput{std::move(*left_version), std::move(frame_and_descriptor)};
+}
+
+QueryPlan LocalVersionedEngine::explain_internal(
+    const StreamId& stream_id,
+    const VersionQuery& version_query,
+    ReadQuery& read_query,
+    const ReadOptions& read_options) {
+    ARCTICDB_RUNTIME_DEBUG(log::version(), "Command: explain");
+    auto version = get_version_to_read(stream_id, version_query);
+    missing_data::check<ErrorCode::E_NO_SUCH_VERSION>(version.has_value(),
+            "explain: version matching query '{}' not found for symbol '{}'", version_query, stream_id);
+    return explain_impl(store(), *version, read_query, read_options);
+}
+
 folly::Future<DescriptorItem> LocalVersionedEngine::get_descriptor(
     AtomKey&& k){
     const auto key = std::move(k);
@@ -913,6 +957,14 @@ folly::Future<folly::Unit> LocalVersionedEngine::delete_trees_responsibly(
     read_opts.dont_warn_about_missing_key = true;
     auto data_keys_not_to_be_deleted = get_data_keys_set(store(), *not_to_delete, read_opts);
     not_to_delete.clear();
+    // Segments coalesced into a multi-segment object are deleted with the object, which must be kept while any
+    // remaining version references a segment packed into it
+    std::vector<AtomKey> objects_not_to_be_deleted;
+    for (const auto& key: data_keys_not_to_be_deleted) {
+        if (storage::is_packed_segment_key(key))
+            objects_not_to_be_deleted.emplace_back(storage::coalesced_object_key(key));
+    }
+    data_keys_not_to_be_deleted.insert(objects_not_to_be_deleted.begin(), objects_not_to_be_deleted.end());
     log::version().debug("Forbidden: {} total of data keys", data_keys_not_to_be_deleted.size());
     storage::RemoveOpts remove_opts;
     remove_opts.ignores_missing_key_ = true;
@@ -933,10 +985,19 @@ folly::Future<folly::Unit> LocalVersionedEngine::delete_trees_responsibly(
     log::version().debug("Number of Index keys to be deleted: {}", vks_to_delete.size());
 
     std::vector<entity::VariantKey> vks_data_to_delete;
-    std::copy_if(std::make_move_iterator(data_keys_to_be_deleted.begin()),
-                std::make_move_iterator(data_keys_to_be_deleted.end()),
-                std::back_inserter(vks_data_to_delete),
-                [&](const auto& k) {return !data_keys_not_to_be_deleted.count(k);});
+    std::unordered_set<AtomKey> objects_to_delete;
+    for (const auto& key: data_keys_to_be_deleted) {
+        if (data_keys_not_to_be_deleted.count(key))
+            continue;
+
+        if (storage::is_packed_segment_key(key)) {
+            auto object_key = storage::coalesced_object_key(key);
+            if (!data_keys_not_to_be_deleted.count(object_key) && objects_to_delete.insert(object_key).second)
+                vks_data_to_delete.emplace_back(std::move(object_key));
+        } else {
+            vks_data_to_delete.emplace_back(key);
+        }
+    }
     log::version().debug("Number of Data keys to be deleted: {}", vks_data_to_delete.size());
 
     folly::Future<folly::Unit> remove_keys_fut;
@@ -1049,6 +1110,116 @@ VersionedItem LocalVersionedEngine::defragment_symbol_data(const StreamId& strea
     return versioned_item;
 }
 
+VersionedItem LocalVersionedEngine::coalesce_symbol_data(
+        const StreamId& stream_id,
+        std::optional<size_t> object_bytes,
+        bool prune_previous_versions) {
+    log::version().info("Coalescing data segments of symbol {}", stream_id);
+    auto update_info = get_latest_undeleted_version_and_next_version_id(
+        store(), version_map(), stream_id, VersionQuery{});
+    util::check(update_info.previous_index_key_.has_value(), "Cannot coalesce non-existent symbol {}", stream_id);
+    const auto max_object_bytes = object_bytes.value_or(
+        ConfigsMap::instance()->get_int("SymbolDataCoalesce.ObjectBytes", 64 * 1024 * 1024));
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+        max_object_bytes > 0 && max_object_bytes <= storage::MAX_COALESCED_OBJECT_BYTES,
+        "Coalesced objects must be between 1 and {} bytes, got {}", storage::MAX_COALESCED_OBJECT_BYTES, max_object_bytes);
+
+    auto index_and_slices = index::read_index_to_vector(store(), *update_info.previous_index_key_);
+    auto& index_segment_reader = index_and_slices.first;
+    auto& slice_and_keys = index_and_slices.second;
+    std::vector<size_t> unpacked;
+    for (size_t pos = 0; pos < slice_and_keys.size(); ++pos) {
+        if (slice_and_keys[pos].key().type() == KeyType::TABLE_DATA)
+            unpacked.emplace_back(pos);
+    }
+    if (unpacked.size() < 2) {
+        log::version().info("Symbol {} has no data segments to coalesce", stream_id);
+        return VersionedItem{*update_info.previous_index_key_};
+    }
+
+    // Segments are packed in index order, so that the segments of a time range are fetched together
+    std::vector<AtomKey> object_keys;
+    std::vector<std::pair<AtomKey, Segment>> block;
+    std::vector<size_t> block_positions;
+    uint64_t block_bytes = 0;
+    timestamp last_creation_ts = 0;
+    auto write_block = [&]() {
+        if (block.size() > 1) {
+            // Objects of the symbol are told apart by their creation timestamps
+            const auto creation_ts = std::max(store()->current_timestamp(), last_creation_ts + 1);
+            last_creation_ts = creation_ts;
+            auto coalesced = storage::pack_segments(stream_id, creation_ts, std::move(block));
+            object_keys.emplace_back(std::get<AtomKey>(coalesced.object_.variant_key()));
+            store()->write_compressed_sync(std::move(coalesced.object_));
+            for (size_t i = 0; i < block_positions.size(); ++i)
+                slice_and_keys[block_positions[i]].key_ = std::move(coalesced.packed_keys_[i]);
+        }
+        block.clear();
+        block_positions.clear();
+        block_bytes = 0;
+    };
+
+    constexpr size_t read_batch_size = 64;
+    for (size_t batch_start = 0; batch_start < unpacked.size(); batch_start += read_batch_size) {
+        const auto batch_end = std::min(batch_start + read_batch_size, unpacked.size());
+        std::vector<folly::Future<storage::KeySegmentPair>> reads;
+        for (auto i = batch_start; i < batch_end; ++i)
+            reads.emplace_back(store()->read_compressed(slice_and_keys[unpacked[i]].key(), storage::ReadKeyOpts{}));
+
+        auto key_segments = folly::collect(reads).get();
+        for (auto i = batch_start; i < batch_end; ++i) {
+            auto& segment = key_segments[i - batch_start].segment();
+            const auto bytes = segment.total_segment_size();
+            if (!block.empty() && block_bytes + bytes > max_object_bytes)
+                write_block();
+
+            block.emplace_back(slice_and_keys[unpacked[i]].key(), std::move(segment));
+            block_positions.emplace_back(unpacked[i]);
+            block_bytes += bytes;
+        }
+    }
+    write_block();
+
+    if (object_keys.empty()) {
+        log::version().info("Data segments of symbol {} are too large to coalesce", stream_id);
+        return VersionedItem{*update_info.previous_index_key_};
+    }
+
+    // Fail before creating a version referencing the objects if they cannot be read back, for example as the storage
+    // does not support ranged reads
+    try {
+        auto packed_key = std::find_if(slice_and_keys.begin(), slice_and_keys.end(), [](const auto& slice_and_key) {
+            return storage::is_packed_segment_key(slice_and_key.key());
+        });
+        store()->read_compressed_sync(packed_key->key(), storage::ReadKeyOpts{});
+    } catch (const std::exception&) {
+        store()->remove_keys(std::vector<VariantKey>{object_keys.begin(), object_keys.end()}, storage::RemoveOpts{}).get();
+        throw;
+    }
+
+    auto index = index_type_from_descriptor(index_segment_reader.tsd().as_stream_descriptor());
+    bool bucketize_dynamic = index_segment_reader.bucketize_dynamic();
+    auto& tsd = index_segment_reader.mutable_tsd();
+    auto time_series = make_timeseries_descriptor(
+        tsd.proto().total_rows(),
+        StreamDescriptor{tsd.as_stream_descriptor()},
+        std::move(*tsd.mutable_proto().mutable_normalization()),
+        std::move(*tsd.mutable_proto().mutable_user_meta()),
+        std::nullopt,
+        std::nullopt,
+        bucketize_dynamic);
+
+    auto versioned_item = pipelines::index::index_and_version(
+        index, store(), time_series, std::move(slice_and_keys), stream_id, update_info.next_version_id_).get();
+    write_version_and_prune_previous(prune_previous_versions, versioned_item.key_, update_info.previous_index_key_);
+
+    if(cfg_.symbol_list())
+        symbol_list().add_symbol(store_, stream_id, versioned_item.key_.version_id());
+
+    log::version().info("Coalesced data segments of symbol {} into {} objects", stream_id, object_keys.size());
+    return versioned_item;
+}
+
 folly::Future<ReadVersionOutput> async_read_direct(
     const std::shared_ptr<Store>& store,
     const VariantKey& index_key,
@@ -1079,9 +1250,9 @@ folly::Future<ReadVersionOutput> async_read_direct(
     auto frame = allocate_frame(pipeline_context);
 
     return fetch_data(frame, pipeline_context, store, dynamic_schema, buffers).thenValue(
-        [pipeline_context, frame, read_options](auto &&) mutable {
+        [pipeline_context, frame, read_options, buffers](auto &&) mutable {
             ScopedGILLock gil_lock;
-            reduce_and_fix_columns(pipeline_context, frame, read_options);
+            reduce_and_fix_columns(pipeline_context, frame, read_options, buffers);
         }).thenValue(
         [index_segment_reader, frame, index_key, buffers](auto &&) {
             return ReadVersionOutput{VersionedItem{to_atom(index_key)},
@@ -1166,6 +1337,94 @@ std::vector<std::variant<ReadVersionOutput, DataError>> LocalVersionedEngine::te
     return read_versions_or_errors;
 }
 
+/*
+ * Reads symbols with clause pipelines without waiting for each symbol in turn: the versions are looked up and the
+ * indexes read in parallel, then the reads and clause processing of every symbol are scheduled together on the shared
+ * IO and CPU executors, so that small symbols do not leave the executors idle.
+ */
+std::vector<std::variant<ReadVersionOutput, DataError>> LocalVersionedEngine::batch_read_and_process_internal(
+    const std::vector<StreamId>& stream_ids,
+    const std::vector<VersionQuery>& version_queries,
+    std::vector<ReadQuery>& read_queries,
+    const ReadOptions& read_options) {
+    py::gil_scoped_release release_gil;
+    std::vector<VersionQuery> queries_for_versions;
+    std::vector<ReadQuery> queries_for_reads;
+    queries_for_versions.reserve(stream_ids.size());
+    queries_for_reads.reserve(stream_ids.size());
+    for (size_t idx = 0; idx < stream_ids.size(); ++idx) {
+        queries_for_versions.emplace_back(version_queries.size() > idx ? version_queries[idx] : VersionQuery{});
+        queries_for_reads.emplace_back(read_queries.size() > idx ? read_queries[idx] : ReadQuery{});
+    }
+
+    // Setting up a pipeline reads the index and column stats keys on the thread it runs on, so run them on the IO executor
+    auto versions = batch_get_versions_async(store(), version_map(), stream_ids, queries_for_versions);
+    std::vector<folly::Future<std::pair<VersionedItem, std::shared_ptr<PipelineContext>>>> pipeline_futs;
+    pipeline_futs.reserve(versions.size());
+    for (auto&& [idx, version] : folly::enumerate(versions)) {
+        pipeline_futs.emplace_back(std::move(version)
+            .via(&async::io_executor())
+            .thenValue([store = store(), &read_query = queries_for_reads[idx], &read_options](auto&& maybe_index_key) {
+                missing_data::check<ErrorCode::E_NO_SUCH_VERSION>(
+                        maybe_index_key.has_value(),
+                        "Version not found for symbol");
+                VersionedItem version_info{std::move(*maybe_index_key)};
+                auto pipeline_context = std::make_shared<PipelineContext>();
+                pipeline_context->stream_id_ = version_info.key_.id();
+                read_indexed_keys_to_pipeline(store, pipeline_context, version_info, read_query, read_options);
+                return std::make_pair(std::move(version_info), std::move(pipeline_context));
+            }));
+    }
+    auto pipelines = folly::collectAll(pipeline_futs).get();
+
+    std::vector<folly::Future<ReadVersionOutput>> read_versions_futs;
+    read_versions_futs.reserve(pipelines.size());
+    for (auto&& [idx, pipeline] : folly::enumerate(pipelines)) {
+        if (pipeline.hasException()) {
+            read_versions_futs.emplace_back(folly::makeFuture<ReadVersionOutput>(std::move(pipeline.exception())));
+            continue;
+        }
+        auto [version_info, pipeline_context] = std::move(pipeline.value());
+        if (pipeline_context->multi_key_) {
+            // Multi-key reads recurse into blocking reads, so are done on this thread
+            read_versions_futs.emplace_back(folly::makeFutureWith([this, &version_info = version_info, &pipeline_context = pipeline_context]() {
+                return ReadVersionOutput{version_info, read_multi_key(store(), *pipeline_context->multi_key_)};
+            }));
+            continue;
+        }
+        read_versions_futs.emplace_back(folly::makeFutureWith([this, &pipeline_context = pipeline_context, &read_query = queries_for_reads[idx], &read_options]() {
+                return read_dataframe_from_pipeline_async(store(), pipeline_context, read_query, read_options);
+            })
+            .thenValue([version_info = version_info](FrameAndDescriptor&& frame_and_descriptor) {
+                return ReadVersionOutput{version_info, std::move(frame_and_descriptor)};
+            }));
+    }
+    auto read_versions = folly::collectAll(read_versions_futs).get();
+    Allocator::instance()->trim();
+
+    std::vector<std::variant<ReadVersionOutput, DataError>> read_versions_or_errors;
+    read_versions_or_errors.reserve(read_versions.size());
+    for (auto&& [idx, read_version]: folly::enumerate(read_versions)) {
+        if (read_version.hasValue()) {
+            read_versions_or_errors.emplace_back(std::move(read_version.value()));
+            continue;
+        }
+        if (*read_options.batch_throw_on_error_) {
+            read_version.throwUnlessValue();
+        }
+        auto exception = read_version.exception();
+        DataError data_error(stream_ids[idx], exception.what().toStdString(), queries_for_versions[idx].content_);
+        if (exception.is_compatible_with<NoSuchVersionException>()) {
+            data_error.set_error_code(ErrorCode::E_NO_SUCH_VERSION);
+        } else if (exception.is_compatible_with<storage::NoDataFoundException>() ||
+                   exception.is_compatible_with<storage::KeyNotFoundException>()) {
+            data_error.set_error_code(ErrorCode::E_KEY_NOT_FOUND);
+        }
+        read_versions_or_errors.emplace_back(std::move(data_error));
+    }
+    return read_versions_or_errors;
+}
+
 std::vector<std::variant<ReadVersionOutput, DataError>> LocalVersionedEngine::batch_read_internal(
     const std::vector<StreamId>& stream_ids,
     const std::vector<VersionQuery>& version_queries,
@@ -1181,6 +1440,10 @@ std::vector<std::variant<ReadVersionOutput, DataError>> LocalVersionedEngine::ba
         return temp_batch_read_internal_direct(stream_ids, version_queries, read_queries, read_options);
     }
 
+    if (!opt_false(read_options.incompletes_) && ConfigsMap::instance()->get_int("VersionStore.SharedBatchPipeline", 1) != 0) {
+        return batch_read_and_process_internal(stream_ids, version_queries, read_queries, read_options);
+    }
+
     std::vector<std::variant<ReadVersionOutput, DataError>> read_versions_or_errors;
     read_versions_or_errors.reserve(stream_ids.size());
     for (size_t idx=0; idx < stream_ids.size(); idx++) {
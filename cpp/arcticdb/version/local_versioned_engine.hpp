@@ -139,6 +139,23 @@ public:
         ReadQuery& read_query,
         const ReadOptions& read_options) override;
 
+    ReadVersionOutput read_asof_join_internal(
+        const StreamId& left_stream_id,
+        const VersionQuery& left_version_query,
+        ReadQuery& left_read_query,
+        const StreamId& right_stream_id,
+        const VersionQuery& right_version_query,
+        const std::optional<std::vector<std::string>>& right_columns,
+        const std::optional<std::string>& by,
+        std::optional<timestamp> tolerance,
+        const ReadOptions& read_options);
+
+    QueryPlan explain_internal(
+        const StreamId& stream_id,
+        const VersionQuery& version_query,
+        ReadQuery& read_query,
+        const ReadOptions& read_options);
+
     DescriptorItem read_descriptor_internal(
             const StreamId& stream_id,
             const VersionQuery& version_query);
@@ -297,6 +314,12 @@ public:
         std::vector<ReadQuery>& read_queries,
         const ReadOptions& read_options);
 
+    std::vector<std::variant<ReadVersionOutput, DataError>> batch_read_and_process_internal(
+        const std::vector<StreamId>& stream_ids,
+        const std::vector<VersionQuery>& version_queries,
+        std::vector<ReadQuery>& read_queries,
+        const ReadOptions& read_options);
+
     std::vector<std::variant<ReadVersionOutput, DataError>> temp_batch_read_internal_direct(
         const std::vector<StreamId>& stream_ids,
         const std::vector<VersionQuery>& version_queries,
@@ -330,6 +353,13 @@ public:
     bool is_symbol_fragmented(const StreamId& stream_id, std::optional<size_t> segment_size) override;
 
     VersionedItem defragment_symbol_data(const StreamId& stream_id, std::optional<size_t> segment_size) override;
+
+    // Packs the small data segments of the latest version of a symbol into multi-segment objects of up to object_bytes
+    // bytes each, and writes a version referencing the packed segments
+    VersionedItem coalesce_symbol_data(
+        const StreamId& stream_id,
+        std::optional<size_t> object_bytes,
+        bool prune_previous_versions) override;
     
     StorageLockWrapper get_storage_lock(const StreamId& stream_id) override;
 
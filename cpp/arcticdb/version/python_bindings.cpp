@@ -24,9 +24,30 @@
 #include <arcticdb/python/adapt_read_dataframe.hpp>
 #include <arcticdb/version/schema_checks.hpp>
 #include <arcticdb/util/pybind_mutex.hpp>
+#include <arcticdb/util/configs_map.hpp>
 
 namespace arcticdb::version_store {
 
+namespace {
+// Converts the Python aggregation dict {output column: operator or (input column, operator)} to NamedAggregators
+std::vector<NamedAggregator> named_aggregators_from_dict(
+        const std::unordered_map<std::string, std::variant<std::string, std::pair<std::string, std::string>>>& aggregations) {
+    std::vector<NamedAggregator> named_aggregators;
+    for (const auto& [output_column_name, var_agg_named_agg]: aggregations) {
+        util::variant_match(
+                var_agg_named_agg,
+                [&named_aggregators, &output_column_name] (const std::string& agg_operator) {
+                    named_aggregators.emplace_back(agg_operator, output_column_name, output_column_name);
+                },
+                [&named_aggregators, &output_column_name] (const std::pair<std::string, std::string>& input_col_and_agg) {
+                    named_aggregators.emplace_back(input_col_and_agg.second, input_col_and_agg.first, output_column_name);
+                }
+        );
+    }
+    return named_aggregators;
+}
+}
+
 void register_bindings(py::module &version, py::exception<arcticdb::ArcticException>& base_exception) {
 
     py::register_exception<StreamDescriptorMismatch>(version, "StreamDescriptorMismatch", base_exception.ptr());
@@ -101,6 +122,17 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
         .def("set_version", &VersionQuery::set_version)
         .def("set_iterate_on_failure", &VersionQuery::set_iterate_on_failure);
 
+    py::enum_<OutputFormat>(version, "OutputFormat", R"pbdoc(
+        Format in which the data read from a symbol is returned.
+    )pbdoc")
+            .value("PANDAS", OutputFormat::PANDAS, R"pbdoc(
+            Numpy arrays, with dynamic strings as Python objects, which are denormalized into Pandas objects.
+    )pbdoc")
+            .value("ARROW", OutputFormat::ARROW, R"pbdoc(
+            Numpy arrays, with dynamic strings as indices into per-column dictionaries, which are assembled into a
+            pyarrow.Table.
+    )pbdoc");
+
     py::class_<ReadOptions>(version, "PythonVersionStoreReadOptions")
         .def(py::init())
         .def("set_force_strings_to_object", &ReadOptions::set_force_strings_to_object)
@@ -110,7 +142,12 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
         .def("set_set_tz", &ReadOptions::set_set_tz)
         .def("set_optimise_string_memory", &ReadOptions::set_optimise_string_memory)
         .def("set_batch_throw_on_error", &ReadOptions::set_batch_throw_on_error)
-        .def_property_readonly("incompletes", &ReadOptions::get_incompletes);
+        .def("set_output_format", &ReadOptions::set_output_format)
+        .def("set_query_profile", &ReadOptions::set_query_profile)
+        .def_property_readonly("incompletes", &ReadOptions::get_incompletes)
+        .def_property_readonly("output_format", [](const ReadOptions& read_options) {
+            return read_options.output_format_;
+        });
 
     version.def("write_dataframe_to_file", &write_dataframe_to_file);
     version.def("read_dataframe_from_file",
@@ -136,7 +173,11 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
             return self.frame().offset();
         })
         .def_property_readonly("names", &PythonOutputFrame::names, py::return_value_policy::reference)
-        .def_property_readonly("index_columns", &PythonOutputFrame::index_columns, py::return_value_policy::reference);
+        .def_property_readonly("index_columns", &PythonOutputFrame::index_columns, py::return_value_policy::reference)
+        .def_property_readonly("string_dictionaries", [](py::object & obj){
+            auto& fd = obj.cast<PythonOutputFrame&>();
+            return fd.string_dictionaries(obj);
+        });
 
     py::enum_<VersionRequestType>(version, "VersionRequestType", R"pbdoc(
         Enum of possible version request types passed to as_of.
@@ -273,22 +314,46 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
             .def(py::init([](
                     const std::string& grouping_colum,
                     const std::unordered_map<std::string, std::variant<std::string, std::pair<std::string, std::string>>> aggregations) {
-                std::vector<NamedAggregator> named_aggregators;
-                for (const auto& [output_column_name, var_agg_named_agg]: aggregations) {
-                    util::variant_match(
-                            var_agg_named_agg,
-                            [&named_aggregators, &output_column_name] (const std::string& agg_operator) {
-                                named_aggregators.emplace_back(agg_operator, output_column_name, output_column_name);
-                            },
-                            [&named_aggregators, &output_column_name] (const std::pair<std::string, std::string>& input_col_and_agg) {
-                                named_aggregators.emplace_back(input_col_and_agg.second, input_col_and_agg.first, output_column_name);
-                            }
-                    );
-                }
-                return AggregationClause(grouping_colum, named_aggregators);
+                return AggregationClause(grouping_colum, named_aggregators_from_dict(aggregations));
             }))
             .def("__str__", &AggregationClause::to_string);
 
+    py::class_<ResampleClause, std::shared_ptr<ResampleClause>>(version, "ResampleClause")
+            .def(py::init<std::string, timestamp>())
+            .def_property_readonly("rule", [](const ResampleClause& self) {
+                return self.rule_;
+            })
+            .def("set_aggregations", [](
+                    ResampleClause& self,
+                    const std::unordered_map<std::string, std::variant<std::string, std::pair<std::string, std::string>>> aggregations) {
+                self.set_aggregations(named_aggregators_from_dict(aggregations));
+            })
+            .def("set_date_range", &ResampleClause::set_date_range)
+            .def("__str__", &ResampleClause::to_string);
+
+    py::enum_<WindowSpec::Type>(version, "WindowType")
+            .value("ROWS", WindowSpec::Type::ROWS)
+            .value("TIME", WindowSpec::Type::TIME)
+            .value("EXPANDING", WindowSpec::Type::EXPANDING);
+
+    py::class_<WindowClause, std::shared_ptr<WindowClause>>(version, "WindowClause")
+            .def(py::init<std::string, WindowSpec::Type, int64_t, size_t>())
+            .def("set_aggregations", [](
+                    WindowClause& self,
+                    const std::unordered_map<std::string, std::variant<std::string, std::pair<std::string, std::string>>> aggregations) {
+                self.set_aggregations(named_aggregators_from_dict(aggregations));
+            })
+            .def("set_date_range", &WindowClause::set_date_range)
+            .def("__str__", &WindowClause::to_string);
+
+    py::class_<SortValuesClause, std::shared_ptr<SortValuesClause>>(version, "SortValuesClause")
+            .def(py::init<std::string, bool, std::optional<size_t>>())
+            .def("__str__", &SortValuesClause::to_string);
+
+    py::class_<MergeSortedValuesClause, std::shared_ptr<MergeSortedValuesClause>>(version, "MergeSortedValuesClause")
+            .def(py::init<std::string, bool, std::optional<size_t>>())
+            .def("__str__", &MergeSortedValuesClause::to_string);
+
     py::enum_<RowRangeClause::RowRangeType>(version, "RowRangeType")
             .value("HEAD", RowRangeClause::RowRangeType::HEAD)
             .value("TAIL", RowRangeClause::RowRangeType::TAIL)
@@ -317,12 +382,33 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
                                 std::shared_ptr<ProjectClause>,
                                 std::shared_ptr<GroupByClause>,
                                 std::shared_ptr<AggregationClause>,
+                                std::shared_ptr<ResampleClause>,
+                                std::shared_ptr<WindowClause>,
+                                std::shared_ptr<SortValuesClause>,
+                                std::shared_ptr<MergeSortedValuesClause>,
                                 std::shared_ptr<RowRangeClause>,
                                 std::shared_ptr<DateRangeClause>>> clauses) {
                 std::vector<std::shared_ptr<Clause>> _clauses;
-                for (auto&& clause: clauses) {
+                const bool partial_aggregation = ConfigsMap::instance()->get_int("GroupBy.PartialAggregation", 1) != 0;
+                for (size_t idx = 0; idx < clauses.size(); ++idx) {
+                    // Reduce each row-slice to one row per group before repartitioning, and merge these partial
+                    // aggregates, rather than repartitioning every row. The clauses are copied so that those held by
+                    // the QueryBuilder are not modified
+                    if (partial_aggregation && idx + 1 < clauses.size() &&
+                        std::holds_alternative<std::shared_ptr<GroupByClause>>(clauses[idx]) &&
+                        std::holds_alternative<std::shared_ptr<AggregationClause>>(clauses[idx + 1]) &&
+                        std::get<std::shared_ptr<AggregationClause>>(clauses[idx + 1])->supports_partial_aggregation()) {
+                        auto group_by_clause = *std::get<std::shared_ptr<GroupByClause>>(clauses[idx]);
+                        auto aggregation_clause = *std::get<std::shared_ptr<AggregationClause>>(clauses[idx + 1]);
+                        group_by_clause.set_partial_aggregations(aggregation_clause.named_aggregators_);
+                        aggregation_clause.set_merge_partial_aggregates();
+                        _clauses.emplace_back(std::make_shared<Clause>(std::move(group_by_clause)));
+                        _clauses.emplace_back(std::make_shared<Clause>(std::move(aggregation_clause)));
+                        ++idx;
+                        continue;
+                    }
                     util::variant_match(
-                        clause,
+                        clauses[idx],
                         [&](auto&& clause) {_clauses.emplace_back(std::make_shared<Clause>(*clause));}
                     );
                 }
@@ -336,6 +422,8 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
             .value("NOTNULL", OperationType::NOTNULL)
             .value("IDENTITY", OperationType::IDENTITY)
             .value("NOT", OperationType::NOT)
+            .value("STRLEN", OperationType::STRLEN)
+            .value("LOWER", OperationType::LOWER)
             .value("ADD", OperationType::ADD)
             .value("SUB", OperationType::SUB)
             .value("MUL", OperationType::MUL)
@@ -348,6 +436,10 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
             .value("GE", OperationType::GE)
             .value("ISIN", OperationType::ISIN)
             .value("ISNOTIN", OperationType::ISNOTIN)
+            .value("STARTSWITH", OperationType::STARTSWITH)
+            .value("CONTAINS", OperationType::CONTAINS)
+            .value("REGEX_SEARCH", OperationType::REGEX_SEARCH)
+            .value("REGEX_MATCH", OperationType::REGEX_MATCH)
             .value("AND", OperationType::AND)
             .value("OR", OperationType::OR)
             .value("XOR", OperationType::XOR);
@@ -358,6 +450,60 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
             .value("ASCENDING", SortedValue::ASCENDING)
             .value("DESCENDING", SortedValue::DESCENDING);
 
+    py::class_<QueryProfile, std::shared_ptr<QueryProfile>>(version, "QueryProfile")
+            .def(py::init())
+            .def("to_dict", [](const QueryProfile& profile) {
+                const auto seconds = [](const std::atomic<uint64_t>& ns) { return static_cast<double>(ns.load()) / 1e9; };
+                py::list clauses;
+                for (const auto& clause: profile.clauses_) {
+                    py::dict clause_dict;
+                    clause_dict["clause"] = clause.clause_;
+                    clause_dict["time"] = seconds(clause.time_ns_);
+                    clause_dict["rows_in"] = clause.rows_in_.load();
+                    clause_dict["rows_out"] = clause.rows_out_.load();
+                    clause_dict["processing_units"] = clause.processing_units_.load();
+                    clauses.append(clause_dict);
+                }
+                py::dict res;
+                res["segments_in_index"] = profile.segments_in_index_.load();
+                res["segments_pruned"] = profile.segments_in_index_.load() - profile.segments_selected_.load();
+                res["segments_read"] = profile.segments_read_.load();
+                res["bytes_fetched"] = profile.bytes_fetched_.load();
+                res["bytes_decoded"] = profile.bytes_decoded_.load();
+                res["fetch_time"] = seconds(profile.fetch_time_ns_);
+                res["decode_time"] = seconds(profile.decode_time_ns_);
+                res["queue_wait_time"] = seconds(profile.queue_wait_ns_);
+                res["clauses"] = clauses;
+                return res;
+            });
+
+    py::class_<QueryPlan>(version, "QueryPlan")
+            .def("to_dict", [](const QueryPlan& plan) {
+                py::list clauses;
+                for (const auto& clause: plan.clauses_) {
+                    py::dict clause_dict;
+                    clause_dict["clause"] = clause.clause_;
+                    clause_dict["requires_repartition"] = clause.requires_repartition_;
+                    clauses.append(clause_dict);
+                }
+                py::list segments;
+                for (const auto& segment: plan.segments_) {
+                    py::dict segment_dict;
+                    segment_dict["start_row"] = segment.row_range_.first;
+                    segment_dict["end_row"] = segment.row_range_.second;
+                    segment_dict["start_col"] = segment.col_range_.first;
+                    segment_dict["end_col"] = segment.col_range_.second;
+                    segment_dict["estimated_bytes"] = segment.estimated_bytes_;
+                    segments.append(segment_dict);
+                }
+                py::dict res;
+                res["clauses"] = clauses;
+                res["segments_in_index"] = plan.segments_in_index_;
+                res["processing_units"] = plan.processing_units_;
+                res["segments"] = segments;
+                return res;
+            });
+
     py::class_<ColumnStats>(version, "ColumnStats")
             .def(py::init<std::unordered_map<std::string, std::unordered_set<std::string>>>())
             .def("to_map", &ColumnStats::to_map);
@@ -499,6 +645,9 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
         .def("defragment_symbol_data",
              &PythonVersionStore::defragment_symbol_data,
              py::call_guard<SingleThreadMutexHolder>(), "Compact small data segments into larger data segments")
+        .def("coalesce_symbol_data",
+             &PythonVersionStore::coalesce_symbol_data,
+             py::call_guard<SingleThreadMutexHolder>(), "Pack small data segments into multi-segment storage objects")
         .def("get_incomplete_symbols",
              &PythonVersionStore::get_incomplete_symbols,
              py::call_guard<SingleThreadMutexHolder>(), "Get all the symbols that have incomplete entries")
@@ -558,6 +707,26 @@ void register_bindings(py::module &version, py::exception<arcticdb::ArcticExcept
               },
              py::call_guard<SingleThreadMutexHolder>(),
              "Read the specified version of the dataframe from the store")
+        .def("read_asof_join",
+             [&](PythonVersionStore& v,
+                 StreamId left_sid,
+                 const VersionQuery& left_version_query,
+                 ReadQuery& left_read_query,
+                 StreamId right_sid,
+                 const VersionQuery& right_version_query,
+                 std::optional<std::vector<std::string>> right_columns,
+                 std::optional<std::string> by,
+                 std::optional<timestamp> tolerance,
+                 const ReadOptions& read_options){
+                return adapt_read_df(v.read_asof_join(left_sid, left_version_query, left_read_query, right_sid,
+                                                      right_version_query, right_columns, by, tolerance, read_options));
+              },
+             py::call_guard<SingleThreadMutexHolder>(),
+             "Read a version of a dataframe as-of joined to a version of another dataframe")
+        .def("explain",
+             &PythonVersionStore::explain_internal,
+             py::call_guard<SingleThreadMutexHolder>(),
+             "Describe what reading the specified version of the dataframe would do, without reading its data")
         .def("read_index",
              [&](PythonVersionStore& v,  StreamId sid, const VersionQuery& version_query){
                  return adapt_read_df(v.read_index(sid, version_query));
@@ -7,6 +7,8 @@
 
 #include <folly/futures/FutureSplitter.h>
 
+#include <atomic>
+
 #include <arcticdb/version/version_core.hpp>
 #include <arcticdb/pipeline/write_options.hpp>
 #include <arcticdb/stream/index.hpp>
@@ -34,6 +36,7 @@
 #include <arcticdb/version/version_utils.hpp>
 #include <arcticdb/entity/merge_descriptors.hpp>
 #include <arcticdb/processing/component_manager.hpp>
+#include <arcticdb/python/gil_lock.hpp>
 
 namespace arcticdb::version_store {
 
@@ -421,19 +424,138 @@ FrameAndDescriptor read_multi_key(
     return {res.frame_, multi_key_desc, keys, std::shared_ptr<BufferHolder>{}};
 }
 
-Composite<EntityIds> process_clauses(
+namespace {
+
+// State shared by the stages of process_clauses, which run asynchronously and so may outlive the call
+struct ClauseProcessingState {
+    ClauseProcessingState(
+            std::shared_ptr<ComponentManager> component_manager,
+            std::vector<folly::Future<pipelines::SegmentAndSlice>>&& segment_and_slice_futures,
+            std::vector<std::shared_ptr<Clause>>&& clauses,
+            std::shared_ptr<QueryProfile> query_profile) :
+        component_manager_(std::move(component_manager)),
+        segment_proc_unit_counts_(segment_and_slice_futures.size(), 0),
+        entity_added_mtx_(segment_and_slice_futures.size()),
+        entity_added_(segment_and_slice_futures.size(), false),
+        clauses_(std::move(clauses)),
+        query_profile_(std::move(query_profile)) {
+        segment_and_slice_future_splitters_.reserve(segment_and_slice_futures.size());
+        for (auto&& future: segment_and_slice_futures) {
+            segment_and_slice_future_splitters_.emplace_back(folly::splitFuture(std::move(future)));
+        }
+    }
+
+    std::shared_ptr<ComponentManager> component_manager_;
+    std::vector<folly::FutureSplitter<pipelines::SegmentAndSlice>> segment_and_slice_future_splitters_;
+    // Map from index in segment_and_slice_future_splitters_ to the number of processing units that require that segment
+    std::vector<size_t> segment_proc_unit_counts_;
+    // Used to make sure each entity is only added into the component manager once
+    std::vector<std::mutex> entity_added_mtx_;
+    std::vector<bool> entity_added_;
+    std::vector<std::shared_ptr<Clause>> clauses_;
+    std::shared_ptr<QueryProfile> query_profile_;
+    // The number of clauses that have been removed from the front of clauses_ as they have been processed
+    size_t clauses_processed_{0};
+};
+
+folly::Future<Composite<EntityIds>> process_remaining_clauses(
+        std::shared_ptr<ClauseProcessingState> state,
+        std::vector<Composite<EntityIds>>&& vec_comp_entity_ids,
+        bool first_clause) {
+    if (state->clauses_.empty())
+        return folly::makeFuture(merge_composites(std::move(vec_comp_entity_ids)));
+
+    std::vector<folly::Future<Composite<EntityIds>>> futures;
+    futures.reserve(vec_comp_entity_ids.size());
+    for (auto&& comp_entity_ids: vec_comp_entity_ids) {
+        if (first_clause) {
+            internal::check<ErrorCode::E_ASSERTION_FAILURE>(comp_entity_ids.is_single(),
+                                                            "Expected Composite of size 1 on entry to process_clauses");
+            std::vector<folly::Future<pipelines::SegmentAndSlice>> local_futs;
+            for (auto id: std::get<EntityIds>(comp_entity_ids[0])) {
+                local_futs.emplace_back(state->segment_and_slice_future_splitters_[id].getFuture());
+            }
+            futures.emplace_back(
+                    folly::collect(local_futs)
+                    .via(&async::cpu_executor())
+                    .thenValue([state, comp_entity_ids = std::move(comp_entity_ids)](std::vector<pipelines::SegmentAndSlice>&& segment_and_slices) mutable {
+                        auto entity_ids = std::get<EntityIds>(comp_entity_ids[0]);
+                        for (auto&& [idx, segment_and_slice]: folly::enumerate(segment_and_slices)) {
+                            std::lock_guard<std::mutex> lock(state->entity_added_mtx_[entity_ids[idx]]);
+                            if (!state->entity_added_[entity_ids[idx]]) {
+                                state->component_manager_->add(
+                                        std::make_shared<SegmentInMemory>(std::move(segment_and_slice.segment_in_memory_)),
+                                        entity_ids[idx], state->segment_proc_unit_counts_[entity_ids[idx]]);
+                                state->component_manager_->add(
+                                        std::make_shared<RowRange>(std::move(segment_and_slice.ranges_and_key_.row_range_)),
+                                        entity_ids[idx]);
+                                state->component_manager_->add(
+                                        std::make_shared<ColRange>(std::move(segment_and_slice.ranges_and_key_.col_range_)),
+                                        entity_ids[idx]);
+                                state->component_manager_->add(
+                                        std::make_shared<AtomKey>(std::move(segment_and_slice.ranges_and_key_.key_)),
+                                        entity_ids[idx]);
+                                state->entity_added_[entity_ids[idx]] = true;
+                            }
+                        }
+                        return async::submit_cpu_task(async::MemSegmentProcessingTask(state->clauses_,
+                                                                                      std::move(comp_entity_ids),
+                                                                                      state->query_profile_,
+                                                                                      state->clauses_processed_));
+                    }));
+        } else {
+            futures.emplace_back(
+                    async::submit_cpu_task(
+                            async::MemSegmentProcessingTask(state->clauses_,
+                                                            std::move(comp_entity_ids),
+                                                            state->query_profile_,
+                                                            state->clauses_processed_)
+                    )
+            );
+        }
+    }
+    return folly::collect(futures)
+        .via(&async::cpu_executor())
+        .thenValue([state](std::vector<Composite<EntityIds>>&& processed_comp_entity_ids) {
+            auto& clauses = state->clauses_;
+            // Erasing from front of vector not ideal, but they're just shared_ptr and there shouldn't be loads of clauses
+            while (clauses.size() > 0 && !clauses[0]->clause_info().requires_repartition_) {
+                clauses.erase(clauses.begin());
+                ++state->clauses_processed_;
+            }
+            if (clauses.size() > 0 && clauses[0]->clause_info().requires_repartition_) {
+                if (state->query_profile_) {
+                    auto timer = QueryProfile::start_timer();
+                    processed_comp_entity_ids = clauses[0]->repartition(std::move(processed_comp_entity_ids)).value();
+                    QueryProfile::add_time(state->query_profile_->clauses_.at(state->clauses_processed_).time_ns_, timer);
+                } else {
+                    processed_comp_entity_ids = clauses[0]->repartition(std::move(processed_comp_entity_ids)).value();
+                }
+                clauses.erase(clauses.begin());
+                ++state->clauses_processed_;
+            }
+            return process_remaining_clauses(std::move(state), std::move(processed_comp_entity_ids), false);
+        });
+}
+
+} // anonymous namespace
+
+/*
+ * Schedules the clauses to run over the segments as they are read, without blocking the calling thread. Stages of the
+ * pipeline between clauses that require a repartition run on the CPU executor, so the pipelines of many symbols can be
+ * in progress at once.
+ */
+folly::Future<Composite<EntityIds>> process_clauses(
         std::shared_ptr<ComponentManager> component_manager,
         std::vector<folly::Future<pipelines::SegmentAndSlice>>&& segment_and_slice_futures,
         const std::vector<std::vector<size_t>>& processing_unit_indexes,
-        std::vector<std::shared_ptr<Clause>> clauses ) { // pass by copy deliberately as we don't want to modify read_query
-    std::vector<folly::FutureSplitter<pipelines::SegmentAndSlice>> segment_and_slice_future_splitters;
-    segment_and_slice_future_splitters.reserve(segment_and_slice_futures.size());
-    for (auto&& future: segment_and_slice_futures) {
-        segment_and_slice_future_splitters.emplace_back(folly::splitFuture(std::move(future)));
-    }
-
-    // Map from index in segment_and_slice_future_splitters to the number of processing units that require that segment
-    std::vector<size_t> segment_proc_unit_counts(segment_and_slice_futures.size(), 0);
+        std::vector<std::shared_ptr<Clause>> clauses, // pass by copy deliberately as we don't want to modify read_query
+        std::shared_ptr<QueryProfile> query_profile) {
+    auto state = std::make_shared<ClauseProcessingState>(std::move(component_manager),
+                                                         std::move(segment_and_slice_futures),
+                                                         std::move(clauses),
+                                                         std::move(query_profile));
+    auto& segment_proc_unit_counts = state->segment_proc_unit_counts_;
     for (const auto& list: processing_unit_indexes) {
         for (auto idx: list) {
             internal::check<ErrorCode::E_ASSERTION_FAILURE>(
@@ -458,73 +580,7 @@ Composite<EntityIds> process_clauses(
         }
         vec_comp_entity_ids.emplace_back(Composite<EntityIds>(std::move(entity_ids)));
     }
-
-    // Used to make sure each entity is only added into the component manager once
-    std::vector<std::mutex> entity_added_mtx(segment_and_slice_futures.size());
-    std::vector<bool> entity_added(segment_and_slice_futures.size(), false);
-    std::vector<folly::Future<Composite<EntityIds>>> futures;
-    bool first_clause{true};
-    while (!clauses.empty()) {
-        for (auto&& comp_entity_ids: vec_comp_entity_ids) {
-            if (first_clause) {
-                internal::check<ErrorCode::E_ASSERTION_FAILURE>(comp_entity_ids.is_single(),
-                                                                "Expected Composite of size 1 on entry to process_clauses");
-                std::vector<folly::Future<pipelines::SegmentAndSlice>> local_futs;
-                for (auto id: std::get<EntityIds>(comp_entity_ids[0])) {
-                    local_futs.emplace_back(segment_and_slice_future_splitters[id].getFuture());
-                }
-                futures.emplace_back(
-                        folly::collect(local_futs)
-                        .via(&async::cpu_executor())
-                        .thenValue([component_manager,
-                                           &segment_proc_unit_counts,
-                                           &entity_added_mtx,
-                                           &entity_added,
-                                           &clauses,
-                                           comp_entity_ids = std::move(comp_entity_ids)](std::vector<pipelines::SegmentAndSlice>&& segment_and_slices) mutable {
-                            auto entity_ids = std::get<EntityIds>(comp_entity_ids[0]);
-                            for (auto&& [idx, segment_and_slice]: folly::enumerate(segment_and_slices)) {
-                                std::lock_guard<std::mutex> lock(entity_added_mtx[entity_ids[idx]]);
-                                if (!entity_added[entity_ids[idx]]) {
-                                    component_manager->add(
-                                            std::make_shared<SegmentInMemory>(std::move(segment_and_slice.segment_in_memory_)),
-                                            entity_ids[idx], segment_proc_unit_counts[entity_ids[idx]]);
-                                    component_manager->add(
-                                            std::make_shared<RowRange>(std::move(segment_and_slice.ranges_and_key_.row_range_)),
-                                            entity_ids[idx]);
-                                    component_manager->add(
-                                            std::make_shared<ColRange>(std::move(segment_and_slice.ranges_and_key_.col_range_)),
-                                            entity_ids[idx]);
-                                    component_manager->add(
-                                            std::make_shared<AtomKey>(std::move(segment_and_slice.ranges_and_key_.key_)),
-                                            entity_ids[idx]);
-                                    entity_added[entity_ids[idx]] = true;
-                                }
-                            }
-                            return async::submit_cpu_task(async::MemSegmentProcessingTask(clauses, std::move(comp_entity_ids)));
-                        }));
-            } else {
-                futures.emplace_back(
-                        async::submit_cpu_task(
-                                async::MemSegmentProcessingTask(clauses,
-                                                                std::move(comp_entity_ids))
-                        )
-                );
-            }
-        }
-        first_clause = false;
-        vec_comp_entity_ids = folly::collect(futures).get();
-        futures.clear();
-        // Erasing from front of vector not ideal, but they're just shared_ptr and there shouldn't be loads of clauses
-        while (clauses.size() > 0 && !clauses[0]->clause_info().requires_repartition_) {
-            clauses.erase(clauses.begin());
-        }
-        if (clauses.size() > 0 && clauses[0]->clause_info().requires_repartition_) {
-            vec_comp_entity_ids = clauses[0]->repartition(std::move(vec_comp_entity_ids)).value();
-            clauses.erase(clauses.begin());
-        }
-    }
-    return merge_composites(std::move(vec_comp_entity_ids));
+    return process_remaining_clauses(std::move(state), std::move(vec_comp_entity_ids), true);
 }
 
 void set_output_descriptors(
@@ -604,18 +660,176 @@ std::shared_ptr<std::unordered_set<std::string>> columns_to_decode(const std::sh
     return res;
 }
 
-std::vector<RangesAndKey> generate_ranges_and_keys(const std::vector<SliceAndKey>& slice_and_keys) {
+std::vector<RangesAndKey> generate_ranges_and_keys(const PipelineContext& pipeline_context) {
+    const auto& slice_and_keys = pipeline_context.slice_and_keys_;
+    const auto& column_bitset = pipeline_context.overall_column_bitset_;
     std::vector<RangesAndKey> res;
     res.reserve(slice_and_keys.size());
     for (auto& slice_and_key: slice_and_keys) {
         internal::check<ErrorCode::E_ASSERTION_FAILURE>(slice_and_key.key_.has_value(), "Missing key in pipeline context");
         // Take a copy here as things like defrag need the keys in pipeline_context->slice_and_keys_ that aren't being modified at the end
         auto key = *slice_and_key.key_;
-        res.emplace_back(slice_and_key.slice_, std::move(key));
+        auto& ranges_and_key = res.emplace_back(slice_and_key.slice_, std::move(key));
+        // Segments all of whose columns are selected are read whole, with a single request
+        if (column_bitset) {
+            const auto& col_range = ranges_and_key.col_range_;
+            for (auto position = col_range.start(); position < col_range.end(); ++position) {
+                if (position >= column_bitset->size() || !column_bitset->test(position)) {
+                    ranges_and_key.decodes_some_columns_ = true;
+                    break;
+                }
+            }
+        }
+    }
+    return res;
+}
+
+namespace {
+
+// Segments read by read_segments_late_materialised, and the number of them that were never fetched from storage
+struct LateMaterialisedReads {
+    std::vector<folly::Future<pipelines::SegmentAndSlice>> segment_and_slice_futures_;
+    std::shared_ptr<std::atomic<size_t>> skipped_segments_;
+};
+
+/*
+ * Late materialisation of column-sliced symbols whose processing starts with a filter. Only the column slices of each
+ * row-slice holding the columns the filter reads are fetched up front. The filter is evaluated on them, and the other
+ * column slices of the row-slice are only fetched if some of its rows pass it. For a selective filter on a wide symbol,
+ * most column slices are therefore never read.
+ *
+ * Segments of row-slices with no matching rows are replaced with empty segments, as the filter clause removes these
+ * row-slices before anything else sees them.
+ *
+ * Returns std::nullopt if this does not apply, in which case all of the segments should be read at once.
+ */
+std::optional<LateMaterialisedReads> read_segments_late_materialised(
+        const std::shared_ptr<Store>& store,
+        const std::shared_ptr<PipelineContext>& pipeline_context,
+        const std::vector<std::shared_ptr<Clause>>& clauses,
+        const std::vector<RangesAndKey>& ranges_and_keys,
+        const std::vector<std::vector<size_t>>& processing_unit_indexes,
+        const std::shared_ptr<QueryProfile>& query_profile) {
+    if (clauses.empty() || folly::poly_type(*clauses[0]) != typeid(FilterClause) ||
+        ConfigsMap::instance()->get_int("Read.LateMaterialisation", 1) == 0)
+        return std::nullopt;
+    const auto& input_columns = clauses[0]->clause_info().input_columns_;
+    if (!input_columns.has_value())
+        return std::nullopt;
+    const auto& descriptor = pipeline_context->descriptor();
+    std::vector<size_t> filter_column_positions;
+    for (const auto& column: *input_columns) {
+        auto position = descriptor.find_field(column);
+        // Columns may be missing from the descriptor with dynamic schema, or be levels of a multi-index
+        if (!position.has_value())
+            return std::nullopt;
+        filter_column_positions.emplace_back(*position);
+    }
+
+    // Whether each segment is needed to evaluate the filter on its row-slice
+    std::vector<bool> is_filter_segment(ranges_and_keys.size(), false);
+    bool any_deferred{false};
+    for (const auto& indexes: processing_unit_indexes) {
+        for (auto idx: indexes) {
+            const auto& col_range = ranges_and_keys[idx].col_range_;
+            is_filter_segment[idx] = std::any_of(filter_column_positions.begin(), filter_column_positions.end(), [&col_range](size_t position) {
+                return position >= col_range.start() && position < col_range.end();
+            });
+        }
+        // Filters only on the index, which every column slice holds
+        if (std::none_of(indexes.begin(), indexes.end(), [&is_filter_segment](size_t idx) { return is_filter_segment[idx]; }))
+            is_filter_segment[indexes.front()] = true;
+        any_deferred |= std::any_of(indexes.begin(), indexes.end(), [&is_filter_segment](size_t idx) { return !is_filter_segment[idx]; });
+    }
+    if (!any_deferred)
+        return std::nullopt;
+
+    const auto columns = columns_to_decode(pipeline_context);
+    std::vector<RangesAndKey> filter_ranges_and_keys;
+    for (auto&& [idx, ranges_and_key]: folly::enumerate(ranges_and_keys)) {
+        if (is_filter_segment[idx])
+            filter_ranges_and_keys.emplace_back(ranges_and_key);
+    }
+    auto filter_segment_futures = store->batch_read_uncompressed(std::move(filter_ranges_and_keys), columns, query_profile);
+
+    LateMaterialisedReads res;
+    res.skipped_segments_ = std::make_shared<std::atomic<size_t>>(0);
+    res.segment_and_slice_futures_.reserve(ranges_and_keys.size());
+    auto filter_segment_future = filter_segment_futures.begin();
+    const StreamDescriptor empty_descriptor{descriptor.id(), descriptor.index()};
+    for (const auto& indexes: processing_unit_indexes) {
+        const bool has_deferred = std::any_of(indexes.begin(), indexes.end(), [&is_filter_segment](size_t idx) { return !is_filter_segment[idx]; });
+        if (!has_deferred) {
+            for (auto idx: indexes) {
+                util::check(idx == res.segment_and_slice_futures_.size(), "Unexpected segment order in late materialisation");
+                res.segment_and_slice_futures_.emplace_back(std::move(*filter_segment_future++));
+            }
+            continue;
+        }
+        // The filter segments are needed both to evaluate the filter here, and by the filter clause itself
+        std::vector<folly::FutureSplitter<pipelines::SegmentAndSlice>> filter_segment_splitters;
+        std::vector<folly::Future<pipelines::SegmentAndSlice>> row_slice_filter_futures;
+        std::vector<RangesAndKey> deferred_ranges_and_keys;
+        for (auto idx: indexes) {
+            if (is_filter_segment[idx]) {
+                filter_segment_splitters.emplace_back(folly::splitFuture(std::move(*filter_segment_future++)));
+                row_slice_filter_futures.emplace_back(filter_segment_splitters.back().getFuture());
+            } else {
+                deferred_ranges_and_keys.emplace_back(ranges_and_keys[idx]);
+            }
+        }
+        auto deferred_segments = folly::splitFuture(folly::collect(row_slice_filter_futures)
+            .via(&async::cpu_executor())
+            .thenValue([filter_clause = clauses[0]](std::vector<pipelines::SegmentAndSlice>&& segment_and_slices) {
+                ProcessingUnit proc;
+                std::vector<std::shared_ptr<SegmentInMemory>> segments;
+                std::vector<std::shared_ptr<RowRange>> row_ranges;
+                std::vector<std::shared_ptr<ColRange>> col_ranges;
+                for (auto& segment_and_slice: segment_and_slices) {
+                    segments.emplace_back(std::make_shared<SegmentInMemory>(std::move(segment_and_slice.segment_in_memory_)));
+                    row_ranges.emplace_back(std::make_shared<RowRange>(segment_and_slice.ranges_and_key_.row_range_));
+                    col_ranges.emplace_back(std::make_shared<ColRange>(segment_and_slice.ranges_and_key_.col_range_));
+                }
+                proc.set_segments(std::move(segments));
+                proc.set_row_ranges(std::move(row_ranges));
+                proc.set_col_ranges(std::move(col_ranges));
+                return folly::poly_cast<FilterClause>(*filter_clause).has_matching_rows(proc);
+            })
+            // Errors are raised when the filter clause is processed
+            .thenError(folly::tag_t<std::exception>{}, [](auto&&) { return true; })
+            .thenValue([store, columns, query_profile, empty_descriptor, skipped_segments = res.skipped_segments_,
+                        deferred_ranges_and_keys = std::move(deferred_ranges_and_keys)](bool has_matching_rows) mutable
+                        -> folly::SemiFuture<std::vector<pipelines::SegmentAndSlice>> {
+                if (has_matching_rows)
+                    return folly::collect(store->batch_read_uncompressed(std::move(deferred_ranges_and_keys), columns, query_profile));
+                *skipped_segments += deferred_ranges_and_keys.size();
+                std::vector<pipelines::SegmentAndSlice> empty_segments;
+                for (auto& ranges_and_key: deferred_ranges_and_keys)
+                    empty_segments.emplace_back(std::move(ranges_and_key), SegmentInMemory{empty_descriptor});
+                return folly::makeSemiFuture(std::move(empty_segments));
+            }));
+
+        auto filter_segment_splitter = filter_segment_splitters.begin();
+        size_t deferred_idx{0};
+        for (auto idx: indexes) {
+            // structure_by_row_slice numbers the segments in order
+            util::check(idx == res.segment_and_slice_futures_.size(), "Unexpected segment order in late materialisation");
+            if (is_filter_segment[idx]) {
+                res.segment_and_slice_futures_.emplace_back((filter_segment_splitter++)->getFuture());
+            } else {
+                res.segment_and_slice_futures_.emplace_back(deferred_segments.getFuture().thenValue(
+                    [deferred_idx](std::vector<pipelines::SegmentAndSlice>&& segment_and_slices) {
+                        return std::move(segment_and_slices[deferred_idx]);
+                    }));
+                ++deferred_idx;
+            }
+        }
     }
     return res;
 }
 
+} // anonymous namespace
+
 /*
  * Processes the slices in the given pipeline_context.
  *
@@ -627,7 +841,7 @@ std::vector<RangesAndKey> generate_ranges_and_keys(const std::vector<SliceAndKey
  * segments will be retrieved from storage and decompressed before being passed to a MemSegmentProcessingTask which
  * will process all clauses up until a reducing clause.
  */
-std::vector<SliceAndKey> read_and_process(
+folly::Future<std::vector<SliceAndKey>> read_and_process_async(
     const std::shared_ptr<Store>& store,
     const std::shared_ptr<PipelineContext>& pipeline_context,
     const ReadQuery& read_query,
@@ -640,9 +854,14 @@ std::vector<SliceAndKey> read_and_process(
         clause->set_processing_config(processing_config);
         clause->set_component_manager(component_manager);
     }
+    const auto& query_profile = read_options.query_profile_;
+    if (query_profile) {
+        query_profile->set_clauses(read_query.clauses_);
+        query_profile->component_manager_ = component_manager;
+    }
 
     // Generate RangesAndKey objects from pipeline SliceAndKey objects
-    auto ranges_and_keys = generate_ranges_and_keys(pipeline_context->slice_and_keys_);
+    auto ranges_and_keys = generate_ranges_and_keys(*pipeline_context);
 
     // Each element of the vector corresponds to one processing unit containing the list of indexes in ranges_and_keys required for that processing unit
     // i.e. if the first processing unit needs ranges_and_keys[0] and ranges_and_keys[1], and the second needs ranges_and_keys[2] and ranges_and_keys[3]
@@ -651,20 +870,44 @@ std::vector<SliceAndKey> read_and_process(
         component_manager->set_next_entity_id(ranges_and_keys.size());
 
     // Start reading as early as possible
-    auto segment_and_slice_futures = store->batch_read_uncompressed(std::move(ranges_and_keys), columns_to_decode(pipeline_context));
+    std::vector<folly::Future<pipelines::SegmentAndSlice>> segment_and_slice_futures;
+    std::shared_ptr<std::atomic<size_t>> skipped_segments;
+    if (auto late_materialised = read_segments_late_materialised(store, pipeline_context, read_query.clauses_, ranges_and_keys, processing_unit_indexes, query_profile)) {
+        segment_and_slice_futures = std::move(late_materialised->segment_and_slice_futures_);
+        skipped_segments = std::move(late_materialised->skipped_segments_);
+    } else {
+        segment_and_slice_futures = store->batch_read_uncompressed(std::move(ranges_and_keys), columns_to_decode(pipeline_context), query_profile);
+    }
 
-    auto processed_entity_ids = process_clauses(component_manager,
-                                                std::move(segment_and_slice_futures),
-                                                processing_unit_indexes,
-                                                read_query.clauses_);
-    auto comp_processing_units = gather_entities(component_manager, std::move(processed_entity_ids));
+    return process_clauses(component_manager,
+                           std::move(segment_and_slice_futures),
+                           processing_unit_indexes,
+                           read_query.clauses_,
+                           query_profile)
+        .thenValue([component_manager, pipeline_context, clauses = read_query.clauses_, skipped_segments](Composite<EntityIds>&& processed_entity_ids) {
+            if (skipped_segments && *skipped_segments > 0) {
+                log_prometheus_counter(LATE_MATERIALISATION_SKIPPED_SEGMENTS, "Segments not read as the filter matched no rows of their row-slice", *skipped_segments);
+                log::version().debug("Late materialisation skipped reading {} segments of {}", skipped_segments->load(), pipeline_context->stream_id_);
+            }
+            auto comp_processing_units = gather_entities(component_manager, std::move(processed_entity_ids));
 
-    if (std::any_of(read_query.clauses_.begin(), read_query.clauses_.end(), [](const std::shared_ptr<Clause>& clause) {
-        return clause->clause_info().modifies_output_descriptor_;
-    })) {
-        set_output_descriptors(comp_processing_units, read_query.clauses_, pipeline_context);
-    }
-    return collect_segments(std::move(comp_processing_units));
+            if (std::any_of(clauses.begin(), clauses.end(), [](const std::shared_ptr<Clause>& clause) {
+                return clause->clause_info().modifies_output_descriptor_;
+            })) {
+                set_output_descriptors(comp_processing_units, clauses, pipeline_context);
+            }
+            return collect_segments(std::move(comp_processing_units));
+        });
+}
+
+std::vector<SliceAndKey> read_and_process(
+    const std::shared_ptr<Store>& store,
+    const std::shared_ptr<PipelineContext>& pipeline_context,
+    const ReadQuery& read_query,
+    const ReadOptions& read_options,
+    size_t start_from
+    ) {
+    return read_and_process_async(store, pipeline_context, read_query, read_options, start_from).get();
 }
 
 SegmentInMemory read_direct(const std::shared_ptr<Store>& store,
@@ -734,6 +977,45 @@ std::optional<pipelines::index::IndexSegmentReader> get_index_segment_reader(
     return std::make_optional<pipelines::index::IndexSegmentReader>(std::move(index_key_seg.second));
 }
 
+// Removes the row slices that the column stats of this version show cannot match the leading filters of the query
+void prune_slices_with_column_stats(
+    const std::shared_ptr<Store>& store,
+    const std::shared_ptr<PipelineContext>& pipeline_context,
+    const VersionedItem& version_info,
+    const ReadQuery& read_query,
+    const StreamDescriptor& descriptor,
+    bool dynamic_schema) {
+    std::vector<std::shared_ptr<ExpressionContext>> filters;
+    // Only filters that come before any other clause are applied to the stored values
+    for (const auto& clause: read_query.clauses_) {
+        if (folly::poly_type(*clause) != typeid(FilterClause))
+            break;
+        filters.emplace_back(folly::poly_cast<FilterClause>(*clause).expression_context_);
+    }
+    if (filters.empty() || pipeline_context->slice_and_keys_.empty() ||
+        ConfigsMap::instance()->get_int("ColumnStats.PruneOnRead", 0) == 0)
+        return;
+
+    // Opt-in, as looking for the column stats costs a storage round trip on every filtered read
+    SegmentInMemory column_stats_segment;
+    try {
+        // Read on the calling thread, which may be an IO thread when batch reads set up their pipelines in parallel
+        column_stats_segment = store->read_sync(index_key_to_column_stats_key(version_info.key_)).second;
+    } catch (const storage::KeyNotFoundException&) {
+        // No column stats have been created for this version
+        return;
+    }
+    const auto row_slices_before = pipeline_context->slice_and_keys_.size();
+    pipeline_context->pruned_row_slices_ = prune_with_column_stats(
+        pipeline_context->slice_and_keys_, column_stats_segment, filters, descriptor, dynamic_schema);
+    log_prometheus_counter(COLUMN_STATS_PRUNED_ROW_SLICES, "Row slices skipped using column stats", pipeline_context->pruned_row_slices_);
+    log::version().debug("Column stats pruned {} row slices ({} of {} segments) from the read of {}",
+                         pipeline_context->pruned_row_slices_,
+                         row_slices_before - pipeline_context->slice_and_keys_.size(),
+                         row_slices_before,
+                         pipeline_context->stream_id_);
+}
+
 void read_indexed_keys_to_pipeline(
     const std::shared_ptr<Store>& store,
     const std::shared_ptr<PipelineContext>& pipeline_context,
@@ -764,6 +1046,11 @@ void read_indexed_keys_to_pipeline(
         bucketize_dynamic);
 
     pipeline_context->slice_and_keys_ = filter_index(index_segment_reader, combine_filter_functions(queries));
+    prune_slices_with_column_stats(store, pipeline_context, version_info, read_query, tsd.as_stream_descriptor(), dynamic_schema);
+    if (const auto& query_profile = read_options.query_profile_) {
+        query_profile->segments_in_index_ += index_segment_reader.size();
+        query_profile->segments_selected_ += pipeline_context->slice_and_keys_.size();
+    }
     pipeline_context->total_rows_ = pipeline_context->calc_rows();
     pipeline_context->rows_ = index_segment_reader.tsd().proto().total_rows();
     pipeline_context->norm_meta_ = std::make_unique<arcticdb::proto::descriptors::NormalizationMetadata>(std::move(*index_segment_reader.mutable_tsd().mutable_proto().mutable_normalization()));
@@ -1134,6 +1421,40 @@ SegmentInMemory do_direct_read_or_process(
     return frame;
 }
 
+folly::Future<FrameAndDescriptor> read_dataframe_from_pipeline_async(
+        const std::shared_ptr<Store>& store,
+        const std::shared_ptr<PipelineContext>& pipeline_context,
+        const ReadQuery& read_query,
+        const ReadOptions& read_options) {
+    modify_descriptor(pipeline_context, read_options);
+    generate_filtered_field_descriptors(pipeline_context, read_query.columns);
+    auto buffers = std::make_shared<BufferHolder>();
+    const auto reduce = [pipeline_context, read_options, buffers](SegmentInMemory&& frame) {
+        {
+            ScopedGILLock gil_lock;
+            reduce_and_fix_columns(pipeline_context, frame, read_options, buffers);
+        }
+        return FrameAndDescriptor{frame, timeseries_descriptor_from_pipeline_context(pipeline_context, {}, pipeline_context->bucketize_dynamic_), {}, buffers};
+    };
+
+    if(!read_query.clauses_.empty()) {
+        util::check_rte(!pipeline_context->is_pickled(),"Cannot filter pickled data");
+        return read_and_process_async(store, pipeline_context, read_query, read_options, 0u)
+            .thenValue([store, pipeline_context, read_options, reduce](std::vector<SliceAndKey>&& segs) {
+                return reduce(prepare_output_frame(std::move(segs), pipeline_context, store, read_options));
+            });
+    }
+
+    util::check_rte(!(pipeline_context->is_pickled() && std::holds_alternative<RowRange>(read_query.row_filter)), "Cannot use head/tail/row_range with pickled data, use plain read instead");
+    mark_index_slices(pipeline_context, opt_false(read_options.dynamic_schema_), pipeline_context->bucketize_dynamic_);
+    auto frame = allocate_frame(pipeline_context);
+    return fetch_data(frame, pipeline_context, store, opt_false(read_options.dynamic_schema_), buffers)
+        .via(&async::cpu_executor())
+        .thenValue([frame, reduce](auto&&) mutable {
+            return reduce(std::move(frame));
+        });
+}
+
 FrameAndDescriptor read_dataframe_impl(
     const std::shared_ptr<Store>& store,
     const std::variant<VersionedItem, StreamId>& version_info,
@@ -1174,10 +1495,294 @@ FrameAndDescriptor read_dataframe_impl(
     auto frame = do_direct_read_or_process(store, read_query, read_options, pipeline_context, buffers);
 
     ARCTICDB_DEBUG(log::version(), "Reduce and fix columns");
-    reduce_and_fix_columns(pipeline_context, frame, read_options);
+    {
+        // Callers may have released the GIL for the fetch and decode, but it is needed to create string objects
+        ScopedGILLock gil_lock;
+        reduce_and_fix_columns(pipeline_context, frame, read_options, buffers);
+    }
     return {frame, timeseries_descriptor_from_pipeline_context(pipeline_context, {}, pipeline_context->bucketize_dynamic_), {}, buffers};
 }
 
+QueryPlan explain_impl(
+    const std::shared_ptr<Store>& store,
+    const VersionedItem& version_info,
+    ReadQuery& read_query,
+    const ReadOptions& read_options
+    ) {
+    auto pipeline_context = std::make_shared<PipelineContext>();
+    pipeline_context->stream_id_ = version_info.key_.id();
+    // Used to count the segments in the index
+    auto query_profile = std::make_shared<QueryProfile>();
+    auto profiled_read_options = read_options;
+    profiled_read_options.set_query_profile(query_profile);
+    read_indexed_keys_to_pipeline(store, pipeline_context, version_info, read_query, profiled_read_options);
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            !pipeline_context->multi_key_,
+            "Cannot explain reading symbol {} as it was recursively normalized", pipeline_context->stream_id_);
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            read_query.clauses_.empty() || !pipeline_context->is_pickled(),
+            "Cannot filter pickled data in symbol {}", pipeline_context->stream_id_);
+
+    QueryPlan plan;
+    plan.segments_in_index_ = query_profile->segments_in_index_;
+    for (const auto& clause: read_query.clauses_) {
+        plan.clauses_.push_back(ClausePlan{clause->to_string(), clause->clause_info().requires_repartition_});
+    }
+
+    auto ranges_and_keys = generate_ranges_and_keys(*pipeline_context);
+    if (!read_query.clauses_.empty()) {
+        ProcessingConfig processing_config{opt_false(read_options.dynamic_schema_), pipeline_context->rows_};
+        for (auto& clause: read_query.clauses_) {
+            clause->set_processing_config(processing_config);
+        }
+        // Clauses such as a date range may prune segments here that the index could not
+        plan.processing_units_ = read_query.clauses_[0]->structure_for_processing(ranges_and_keys, 0).size();
+    }
+
+    const auto columns = columns_to_decode(pipeline_context);
+    const auto& descriptor = pipeline_context->descriptor();
+    const auto index_field_count = descriptor.index().field_count();
+    for (const auto& ranges_and_key: ranges_and_keys) {
+        uint64_t row_bytes{0};
+        for (size_t idx = 0; idx < descriptor.field_count(); ++idx) {
+            const auto& field = descriptor.field(idx);
+            if ((idx >= index_field_count && !ranges_and_key.col_range_.contains(idx)) ||
+                (columns && !columns->contains(std::string(field.name()))))
+                continue;
+
+            row_bytes += get_type_size(field.type().data_type());
+        }
+        plan.segments_.push_back(SegmentPlan{ranges_and_key.row_range_, ranges_and_key.col_range_, row_bytes * ranges_and_key.row_range_.diff()});
+    }
+    return plan;
+}
+
+namespace {
+// Columns are joined with types that can represent rows with no match
+DataType as_of_join_output_type(const StreamId& stream_id, const Field& field) {
+    const auto data_type = field.type().data_type();
+    schema::check<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+            field.type().dimension() == Dimension::Dim0,
+            "Column {} of symbol {} cannot be as-of joined as it is not a scalar column", field.name(), stream_id);
+    if (is_dynamic_string_type(data_type))
+        return DataType::UTF_DYNAMIC64;
+    if (is_time_type(data_type))
+        return DataType::NANOSECONDS_UTC64;
+    if (is_numeric_type(data_type) || is_bool_type(data_type) || is_empty_type(data_type))
+        return DataType::FLOAT64;
+    schema::raise<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+            "Column {} of symbol {} cannot be as-of joined as it has type {}", field.name(), stream_id, field.type());
+}
+
+void check_as_of_join_by_column(
+        const std::string& by,
+        const PipelineContext& left_context,
+        const PipelineContext& right_context) {
+    const auto& left_descriptor = left_context.descriptor();
+    const auto& right_descriptor = right_context.descriptor();
+    auto left_pos = left_descriptor.find_field(by);
+    auto right_pos = right_descriptor.find_field(by);
+    schema::check<ErrorCode::E_COLUMN_DOESNT_EXIST>(left_pos.has_value(), "As-of join column {} not found in symbol {}", by, left_context.stream_id_);
+    schema::check<ErrorCode::E_COLUMN_DOESNT_EXIST>(right_pos.has_value(), "As-of join column {} not found in symbol {}", by, right_context.stream_id_);
+    const auto left_type = left_descriptor.field(*left_pos).type().data_type();
+    const auto right_type = right_descriptor.field(*right_pos).type().data_type();
+    schema::check<ErrorCode::E_UNSUPPORTED_COLUMN_TYPE>(
+            (is_dynamic_string_type(left_type) && is_dynamic_string_type(right_type)) ||
+            (is_integer_type(left_type) && is_integer_type(right_type)),
+            "As-of join column {} must be a string or integer column in both symbols, but has type {} in {} and {} in {}",
+            by, left_type, left_context.stream_id_, right_type, right_context.stream_id_);
+}
+
+// The first and last index values of the rows of the left hand symbol that will be read
+std::optional<TimestampRange> as_of_join_left_range(const PipelineContext& left_context, const ReadQuery& left_read_query) {
+    if (left_context.slice_and_keys_.empty())
+        return std::nullopt;
+    timestamp start = std::numeric_limits<timestamp>::max();
+    timestamp end = std::numeric_limits<timestamp>::min();
+    for (const auto& slice_and_key: left_context.slice_and_keys_) {
+        const auto [key_start, key_end] = slice_and_key.key().time_range();
+        start = std::min(start, key_start);
+        // The end index of a data key is one greater than its last index value
+        end = std::max(end, key_end - 1);
+    }
+    if (std::holds_alternative<IndexRange>(left_read_query.row_filter)) {
+        const auto& index_range = std::get<IndexRange>(left_read_query.row_filter);
+        if (index_range.specified_) {
+            start = std::max(start, std::get<timestamp>(index_range.start_));
+            end = std::min(end, std::get<timestamp>(index_range.end_));
+        }
+    }
+    return TimestampRange{start, end};
+}
+
+/*
+ * Removes the row-slices of the right hand symbol that cannot hold the prevailing row of any row of the left hand
+ * symbol. Row-slices after the end of the left hand symbol are never needed. Without a by column, nothing before the
+ * last row-slice starting at or before the start of the left hand symbol is needed either. With a by column, the
+ * prevailing row for a key may be in any earlier row-slice, unless the tolerance rules them out.
+ */
+void prune_as_of_join_right_slices(
+        PipelineContext& right_context,
+        const TimestampRange& left_range,
+        const std::optional<std::string>& by,
+        std::optional<timestamp> tolerance) {
+    const auto left_start = left_range.first;
+    const auto left_end = left_range.second;
+    std::optional<timestamp> lower_bound;
+    if (tolerance.has_value()) {
+        lower_bound = left_start > std::numeric_limits<timestamp>::min() + *tolerance ? left_start - *tolerance : std::numeric_limits<timestamp>::min();
+    } else if (!by.has_value()) {
+        for (const auto& slice_and_key: right_context.slice_and_keys_) {
+            const auto key_start = slice_and_key.key().time_range().first;
+            if (key_start <= left_start)
+                lower_bound = lower_bound.has_value() ? std::max(*lower_bound, key_start) : key_start;
+        }
+    }
+    const auto slices_before = right_context.slice_and_keys_.size();
+    std::erase_if(right_context.slice_and_keys_, [&](const SliceAndKey& slice_and_key) {
+        const auto [key_start, key_end] = slice_and_key.key().time_range();
+        return key_start > left_end || (lower_bound.has_value() && key_end <= *lower_bound);
+    });
+    ARCTICDB_DEBUG(log::version(), "As-of join pruned {} of {} segments of {}",
+                   slices_before - right_context.slice_and_keys_.size(), slices_before, right_context.stream_id_);
+}
+} // anonymous namespace
+
+FrameAndDescriptor read_asof_join_impl(
+    const std::shared_ptr<Store>& store,
+    const VersionedItem& left_version,
+    ReadQuery& left_read_query,
+    const VersionedItem& right_version,
+    const std::optional<std::vector<std::string>>& right_columns,
+    const std::optional<std::string>& by,
+    std::optional<timestamp> tolerance,
+    const ReadOptions& read_options
+    ) {
+    using namespace arcticdb::pipelines;
+    user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+            tolerance.value_or(0) >= 0, "As-of join tolerance must not be negative, received {}", tolerance.value_or(0));
+
+    // Set up the right hand symbol first, as the columns it contributes are part of the join clause
+    auto right_context = std::make_shared<PipelineContext>();
+    right_context->stream_id_ = right_version.key_.id();
+    ReadQuery right_read_query;
+    if (right_columns.has_value()) {
+        right_read_query.columns = *right_columns;
+        if (by.has_value())
+            right_read_query.columns.emplace_back(*by);
+    }
+    read_indexed_keys_to_pipeline(store, right_context, right_version, right_read_query, read_options);
+    schema::check<ErrorCode::E_OPERATION_NOT_SUPPORTED_WITH_PICKLED_DATA>(
+            !right_context->multi_key_ && !right_context->is_pickled(),
+            "As-of joins are not supported for pickled or recursively normalized symbols such as {}", right_context->stream_id_);
+    const auto& right_descriptor = right_context->descriptor();
+    schema::check<ErrorCode::E_UNSUPPORTED_INDEX_TYPE>(
+            right_descriptor.index().type() == IndexDescriptor::TIMESTAMP,
+            "As-of joins require a timestamp index, but symbol {} does not have one", right_context->stream_id_);
+
+    const auto right_index_fields = right_descriptor.index().field_count();
+    std::vector<std::pair<std::string, DataType>> joined_columns;
+    if (right_columns.has_value()) {
+        for (const auto& name: *right_columns) {
+            auto position = right_descriptor.find_field(name);
+            schema::check<ErrorCode::E_COLUMN_DOESNT_EXIST>(
+                    position.has_value() && *position >= right_index_fields,
+                    "Column {} not found in symbol {}", name, right_context->stream_id_);
+            if (name != by)
+                joined_columns.emplace_back(name, as_of_join_output_type(right_context->stream_id_, right_descriptor.field(*position)));
+        }
+    } else {
+        for (auto position = right_index_fields; position < right_descriptor.field_count(); ++position) {
+            const auto& field = right_descriptor.field(position);
+            if (field.name() != by)
+                joined_columns.emplace_back(field.name(), as_of_join_output_type(right_context->stream_id_, field));
+        }
+    }
+
+    AsOfJoinClause as_of_join_clause(by, tolerance);
+    as_of_join_clause.right_columns_ = joined_columns;
+    auto right_slices = as_of_join_clause.right_slices_;
+    left_read_query.clauses_.emplace_back(std::make_shared<Clause>(std::move(as_of_join_clause)));
+
+    auto left_context = std::make_shared<PipelineContext>();
+    left_context->stream_id_ = left_version.key_.id();
+    read_indexed_keys_to_pipeline(store, left_context, left_version, left_read_query, read_options);
+    schema::check<ErrorCode::E_OPERATION_NOT_SUPPORTED_WITH_PICKLED_DATA>(
+            !left_context->multi_key_ && !left_context->is_pickled(),
+            "As-of joins are not supported for pickled or recursively normalized symbols such as {}", left_context->stream_id_);
+    const auto& left_descriptor = left_context->descriptor();
+    schema::check<ErrorCode::E_UNSUPPORTED_INDEX_TYPE>(
+            left_descriptor.index().type() == IndexDescriptor::TIMESTAMP,
+            "As-of joins require a timestamp index, but symbol {} does not have one", left_context->stream_id_);
+    for (const auto& [name, _]: joined_columns) {
+        user_input::check<ErrorCode::E_INVALID_USER_ARGUMENT>(
+                !left_descriptor.find_field(name).has_value(),
+                "Column {} is in both {} and {}, select the columns to join with right_columns",
+                name, left_context->stream_id_, right_context->stream_id_);
+    }
+    if (by.has_value())
+        check_as_of_join_by_column(*by, *left_context, *right_context);
+
+    // Only the row-slices of the right hand symbol that can be joined to the rows being read are fetched. Each is read
+    // when the first left row-slice that can be joined to it is processed, and released once none still to be processed
+    // can be joined to it.
+    auto left_range = as_of_join_left_range(*left_context, left_read_query);
+    if (left_range.has_value())
+        prune_as_of_join_right_slices(*right_context, *left_range, by, tolerance);
+    else
+        right_context->slice_and_keys_.clear();
+
+    auto right_ranges_and_keys = generate_ranges_and_keys(*right_context);
+    std::sort(right_ranges_and_keys.begin(), right_ranges_and_keys.end(), [](const RangesAndKey& left, const RangesAndKey& right) {
+        return std::tie(left.row_range_.first, left.col_range_.first) < std::tie(right.row_range_.first, right.col_range_.first);
+    });
+    std::vector<std::vector<RangesAndKey>> right_row_slices;
+    std::vector<TimestampRange> right_index_ranges;
+    for (auto& ranges_and_key: right_ranges_and_keys) {
+        if (right_row_slices.empty() || right_row_slices.back().front().row_range_ != ranges_and_key.row_range_) {
+            const auto [key_start, key_end] = ranges_and_key.key_.time_range();
+            // The end index of a data key is one greater than its last index value
+            right_index_ranges.emplace_back(key_start, key_end - 1);
+            right_row_slices.emplace_back();
+        }
+        right_row_slices.back().emplace_back(std::move(ranges_and_key));
+    }
+    std::vector<std::string> joined_names;
+    for (const auto& [name, _]: joined_columns)
+        joined_names.emplace_back(name);
+    // Read on the thread joining the left row-slice, as waiting on reads scheduled on the CPU executor from it could
+    // deadlock
+    right_slices->set_right_slices(right_index_ranges, std::move(joined_names),
+            [store, columns = columns_to_decode(right_context), right_row_slices = std::move(right_row_slices)](size_t idx) {
+        std::vector<SegmentInMemory> segments;
+        for (const auto& ranges_and_key: right_row_slices[idx]) {
+            storage::ReadKeyOpts opts;
+            if (ranges_and_key.decodes_some_columns_)
+                opts.columns_to_decode_ = columns;
+            auto key_segment = store->read_compressed_sync(ranges_and_key.key_, opts);
+            segments.emplace_back(async::DecodeSliceTask{RangesAndKey{ranges_and_key}, columns}(std::move(key_segment)).segment_in_memory_);
+        }
+        return segments;
+    });
+    for (const auto& slice_and_key: left_context->slice_and_keys_) {
+        auto [key_start, key_end] = slice_and_key.key().time_range();
+        right_slices->add_left_slice(
+                slice_and_key.slice_.row_range.first,
+                {std::max(key_start, left_range->first), std::min(key_end - 1, left_range->second)});
+    }
+
+    modify_descriptor(left_context, read_options);
+    generate_filtered_field_descriptors(left_context, left_read_query.columns);
+    auto buffers = std::make_shared<BufferHolder>();
+    auto frame = do_direct_read_or_process(store, left_read_query, read_options, left_context, buffers);
+    {
+        // Callers may have released the GIL for the fetch and decode, but it is needed to create string objects
+        ScopedGILLock gil_lock;
+        reduce_and_fix_columns(left_context, frame, read_options, buffers);
+    }
+    return {frame, timeseries_descriptor_from_pipeline_context(left_context, {}, left_context->bucketize_dynamic_), {}, buffers};
+}
+
 VersionedItem collate_and_write(
     const std::shared_ptr<Store>& store,
     const std::shared_ptr<PipelineContext>& pipeline_context,
@@ -21,6 +21,7 @@
 #include <arcticdb/stream/aggregator.hpp>
 #include <arcticdb/entity/frame_and_descriptor.hpp>
 #include <arcticdb/version/version_store_objects.hpp>
+#include <arcticdb/processing/query_profile.hpp>
 
 #include <string>
 
@@ -110,6 +111,32 @@ FrameAndDescriptor read_dataframe_impl(
     const ReadOptions& read_options
     );
 
+/*
+ * Describes what reading version_info with read_query would do, from its index alone. The clauses are structured for
+ * processing as they would be for the read, so the segments listed are those that would be read.
+ */
+QueryPlan explain_impl(
+    const std::shared_ptr<Store>& store,
+    const VersionedItem& version_info,
+    ReadQuery& read_query,
+    const ReadOptions& read_options
+    );
+
+/*
+ * Reads left_version with left_read_query, joining to each row the columns of the last row of right_version at or before
+ * its index value. Only the row-slices of right_version that can be joined to the rows read are fetched.
+ */
+FrameAndDescriptor read_asof_join_impl(
+    const std::shared_ptr<Store>& store,
+    const VersionedItem& left_version,
+    ReadQuery& left_read_query,
+    const VersionedItem& right_version,
+    const std::optional<std::vector<std::string>>& right_columns,
+    const std::optional<std::string>& by,
+    std::optional<timestamp> tolerance,
+    const ReadOptions& read_options
+    );
+
 FrameAndDescriptor read_segment_impl(
     const std::shared_ptr<Store>& store,
     const VariantKey& key);
@@ -148,6 +175,17 @@ SegmentInMemory do_direct_read_or_process(
     const std::shared_ptr<PipelineContext>& pipeline_context,
     const std::shared_ptr<BufferHolder>& buffers);
 
+/*
+ * Reads the data of a version whose pipeline context has been set up by read_indexed_keys_to_pipeline, without blocking
+ * the calling thread, so that the reads and clause pipelines of many symbols can share the IO and CPU executors. The
+ * GIL is acquired to build the output columns, so must not be held by the thread waiting on the returned future.
+ */
+folly::Future<FrameAndDescriptor> read_dataframe_from_pipeline_async(
+    const std::shared_ptr<Store>& store,
+    const std::shared_ptr<PipelineContext>& pipeline_context,
+    const ReadQuery& read_query,
+    const ReadOptions& read_options);
+
 PredefragmentationInfo get_pre_defragmentation_info(
         const std::shared_ptr<Store>& store,
         const StreamId& stream_id,
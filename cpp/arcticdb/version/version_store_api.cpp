@@ -822,10 +822,33 @@ ReadResult PythonVersionStore::read_dataframe_version(
     ReadQuery& read_query,
     const ReadOptions& read_options) {
 
-    auto opt_version_and_frame = read_dataframe_version_internal(stream_id, version_query, read_query, read_options);
+    auto opt_version_and_frame = [&]() {
+        // Allows other Python threads, such as the consumer of Library.iter_read, to run while the data is fetched
+        py::gil_scoped_release release_gil;
+        return read_dataframe_version_internal(stream_id, version_query, read_query, read_options);
+    }();
     return create_python_read_result(opt_version_and_frame.versioned_item_, std::move(opt_version_and_frame.frame_and_descriptor_));
 }
 
+ReadResult PythonVersionStore::read_asof_join(
+    const StreamId& left_stream_id,
+    const VersionQuery& left_version_query,
+    ReadQuery& left_read_query,
+    const StreamId& right_stream_id,
+    const VersionQuery& right_version_query,
+    const std::optional<std::vector<std::string>>& right_columns,
+    const std::optional<std::string>& by,
+    std::optional<timestamp> tolerance,
+    const ReadOptions& read_options) {
+
+    auto version_and_frame = [&]() {
+        py::gil_scoped_release release_gil;
+        return read_asof_join_internal(left_stream_id, left_version_query, left_read_query, right_stream_id,
+                                       right_version_query, right_columns, by, tolerance, read_options);
+    }();
+    return create_python_read_result(version_and_frame.versioned_item_, std::move(version_and_frame.frame_and_descriptor_));
+}
+
 void PythonVersionStore::delete_snapshot(const SnapshotId& snap_name) {
     ARCTICDB_RUNTIME_DEBUG(log::version(), "Command: delete_snapshot");
     auto opt_snapshot =  get_snapshot(store(), snap_name);
@@ -164,6 +164,17 @@ class PythonVersionStore : public LocalVersionedEngine {
         ReadQuery& read_query,
         const ReadOptions& read_options);
 
+    ReadResult read_asof_join(
+        const StreamId& left_stream_id,
+        const VersionQuery& left_version_query,
+        ReadQuery& left_read_query,
+        const StreamId& right_stream_id,
+        const VersionQuery& right_version_query,
+        const std::optional<std::vector<std::string>>& right_columns,
+        const std::optional<std::string>& by,
+        std::optional<timestamp> tolerance,
+        const ReadOptions& read_options);
+
     VersionedItem sort_merge(
             const StreamId& stream_id,
             const py::object& user_meta,
@@ -147,6 +147,11 @@ public:
 
     virtual VersionedItem defragment_symbol_data(const StreamId& stream_id, std::optional<size_t> segment_size) = 0;
 
+    virtual VersionedItem coalesce_symbol_data(
+        const StreamId& stream_id,
+        std::optional<size_t> object_bytes,
+        bool prune_previous_versions) = 0;
+
     virtual void move_storage(
         KeyType key_type,
         timestamp horizon,
@@ -12,6 +12,7 @@ from arcticdb_ext.version_store import DataError, VersionRequestType
 from arcticdb_ext.exceptions import ErrorCode, ErrorCategory
 from arcticdb.version_store.library import WritePayload, ReadInfoRequest, ReadRequest
 from arcticdb.version_store.library import StagedDataFinalizeMethod, WriteMetadataPayload
+from arcticdb.version_store.async_library import AsyncLibrary
 
 set_config_from_env_vars(_os.environ)
 
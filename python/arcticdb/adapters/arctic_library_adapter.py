@@ -6,15 +6,16 @@ Use of this software is governed by the Business Source License 1.1 included in
 As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 from arcticc.pb2.storage_pb2 import EnvironmentConfigsMap, LibraryConfig
 from arcticdb.config import _DEFAULT_ENV
 from arcticdb.version_store._store import NativeVersionStore
 from arcticdb.options import DEFAULT_ENCODING_VERSION, LibraryOptions, EnterpriseLibraryOptions
 from arcticc.pb2.storage_pb2 import LibraryConfig
-from arcticdb_ext.storage import Library, StorageOverride, CONFIG_LIBRARY_NAME
+from arcticdb_ext.storage import Library, StorageOverride, LocalCacheOverride, CONFIG_LIBRARY_NAME
 from arcticdb.encoding_version import EncodingVersion
 
 
@@ -46,6 +47,33 @@ def set_library_options(lib_desc: "LibraryConfig", options: LibraryOptions,
     write_options.delayed_deletes = enterprise_library_options.background_deletion
 
 
+LOCAL_CACHE_SUFFIX_TO_SCALE = {"KB": int(1e3), "MB": int(1e6), "GB": int(1e9), "TB": int(1e12)}
+
+LOCAL_CACHE_OPTION_ERROR_TEMPLATE = (
+    "Incorrect format for local_cache option in connection string. Correct format is a directory followed by a "
+    "colon and a positive integer size in one of (KB, MB, GB, TB), eg '/ssd/arctic:200GB'. But option local_cache "
+    "was [{}]."
+)
+
+
+def set_local_cache_override(storage_override: StorageOverride, local_cache: Optional[str]):
+    """
+    Parse a local_cache option of the form <directory>:<size>, eg /ssd/arctic:200GB, and apply it to storage_override.
+
+    Data and index segments read through the resulting library are kept in the directory, up to the given size, and
+    served from there on later reads rather than from the origin storage.
+    """
+    if not local_cache:
+        return
+    match = re.fullmatch(r"(?P<path>.+):(?P<size>[0-9]+)(?P<suffix>[KMGT]B)", local_cache)
+    if match is None or int(match["size"]) < 1:
+        raise ValueError(LOCAL_CACHE_OPTION_ERROR_TEMPLATE.format(local_cache))
+    local_cache_override = LocalCacheOverride()
+    local_cache_override.path = match["path"]
+    local_cache_override.max_bytes = int(match["size"]) * LOCAL_CACHE_SUFFIX_TO_SCALE[match["suffix"]]
+    storage_override.set_local_cache_override(local_cache_override)
+
+
 class ArcticLibraryAdapter(ABC):
     @abstractmethod
     def __init__(self, uri: str, encoding_version: EncodingVersion):
@@ -14,7 +14,7 @@ from arcticc.pb2.storage_pb2 import EnvironmentConfigsMap, LibraryConfig
 from arcticdb.version_store.helper import add_azure_library_to_env
 from arcticdb.config import _DEFAULT_ENV
 from arcticdb.version_store._store import NativeVersionStore
-from arcticdb.adapters.arctic_library_adapter import ArcticLibraryAdapter, set_library_options
+from arcticdb.adapters.arctic_library_adapter import ArcticLibraryAdapter, set_library_options, set_local_cache_override
 from arcticdb_ext.storage import StorageOverride, AzureOverride, CONFIG_LIBRARY_NAME
 from arcticdb.encoding_version import EncodingVersion
 from collections import namedtuple
@@ -28,6 +28,7 @@ class ParsedQuery:
     Path_prefix: Optional[str] = None
     CA_cert_path: str = ""
     Container: Optional[str] = None
+    Local_cache: Optional[str] = None
 
 
 class AzureLibraryAdapter(ArcticLibraryAdapter):
@@ -114,6 +115,7 @@ class AzureLibraryAdapter(ArcticLibraryAdapter):
 
         storage_override = StorageOverride()
         storage_override.set_azure_override(azure_override)
+        set_local_cache_override(storage_override, self._query_params.Local_cache)
 
         return storage_override
 
@@ -16,7 +16,7 @@ from arcticc.pb2.storage_pb2 import EnvironmentConfigsMap, LibraryConfig
 from arcticdb.version_store.helper import add_s3_library_to_env
 from arcticdb.config import _DEFAULT_ENV
 from arcticdb.version_store._store import NativeVersionStore
-from arcticdb.adapters.arctic_library_adapter import ArcticLibraryAdapter, set_library_options
+from arcticdb.adapters.arctic_library_adapter import ArcticLibraryAdapter, set_library_options, set_local_cache_override
 from arcticdb_ext.storage import StorageOverride, S3Override, CONFIG_LIBRARY_NAME
 from arcticdb.encoding_version import EncodingVersion
 from collections import namedtuple
@@ -54,9 +54,12 @@ class ParsedQuery:
 
     ssl: Optional[bool] = False
 
+    # <directory>:<size> to cache data read from S3 on local disk, eg /ssd/arctic:200GB
+    local_cache: Optional[str] = None
+
 
 class S3LibraryAdapter(ArcticLibraryAdapter):
-    REGEX = r"s3(s)?://(?P<endpoint>.*):(?P<bucket>[-_a-zA-Z0-9.]+)(?P<query>\?.*)?"
+    REGEX = r"s3(s)?://(?P<endpoint>[^?]*):(?P<bucket>[-_a-zA-Z0-9.]+)(?P<query>\?.*)?"
 
     @staticmethod
     def supports_uri(uri: str) -> bool:
@@ -197,6 +200,7 @@ class S3LibraryAdapter(ArcticLibraryAdapter):
 
         storage_override = StorageOverride()
         storage_override.set_s3_override(s3_override)
+        set_local_cache_override(storage_override, self._query_params.local_cache)
 
         return storage_override
 
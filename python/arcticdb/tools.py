@@ -11,6 +11,7 @@ from typing import Dict
 from arcticdb.config import set_log_level, Defaults
 
 from arcticdb_ext import set_config_int, set_config_string, set_config_double
+from arcticdb_ext.cpp_async import io_concurrency_stats as _io_concurrency_stats
 
 # Setting config from environment variables. This code is used in the package __init__.py
 _ARCTICDB_ENV_VAR_PREFIX = "ARCTICDB_"
@@ -68,3 +69,23 @@ def set_config_from_env_vars(env_vars: Dict[str, str]):
 
     if log_level_changes or default_log_level != Defaults.DEFAULT_LOG_LEVEL:
         set_log_level(default_level=default_log_level, specific_log_levels=log_level_changes)
+
+
+def io_concurrency_stats() -> Dict[str, int]:
+    """
+    Returns the state of the IO thread pool, for monitoring:
+
+    * adaptive - whether the number of IO tasks run at once adapts to the storage (see VersionStore.AdaptiveIOConcurrency)
+    * concurrency - the most IO tasks that may run at once, between min_concurrency and max_concurrency
+    * in_flight - the IO tasks running
+    * queue_depth - the IO tasks waiting to run
+    """
+    stats = _io_concurrency_stats()
+    return {
+        "adaptive": stats.adaptive,
+        "concurrency": stats.concurrency,
+        "min_concurrency": stats.min_concurrency,
+        "max_concurrency": stats.max_concurrency,
+        "in_flight": stats.in_flight,
+        "queue_depth": stats.queue_depth,
+    }
@@ -0,0 +1,71 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+from typing import Dict, Tuple
+
+import numpy as np
+
+from arcticdb.exceptions import ArcticNativeException
+from arcticdb.version_store._normalization import FrameData
+
+# Index written into dictionary encoded string columns for None and NaN values
+ARROW_NULL_CODE = -1
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ArcticNativeException("pyarrow must be installed to read data with output_format='arrow'")
+    return pyarrow
+
+
+def arrow_table_from_frame(frame_data: FrameData, string_dictionaries: Dict[str, Tuple[np.ndarray, np.ndarray, bool]]):
+    """
+    Assemble a pyarrow.Table from the columns of a frame read with OutputFormat.ARROW.
+
+    Numeric and timestamp columns are adopted by Arrow without copying. Dynamic string columns hold int64 indices into
+    the per-column dictionaries, whose offsets and data buffers are also adopted without copying. Any other column
+    (e.g. fixed-width strings, or object columns) is converted by pyarrow.
+
+    Index columns are included as regular leading columns, under the names they are stored with.
+    """
+    pa = _import_pyarrow()
+    names = list(frame_data.index_columns) + list(frame_data.names)
+    arrays = []
+    for name, values in zip(names, frame_data.data):
+        if name in string_dictionaries:
+            offsets, data, is_utf = string_dictionaries[name]
+            dictionary = pa.Array.from_buffers(
+                pa.large_string() if is_utf else pa.large_binary(),
+                len(offsets) - 1,
+                [None, pa.py_buffer(offsets), pa.py_buffer(data)],
+            )
+            indices = pa.array(values, mask=values == ARROW_NULL_CODE)
+            arrays.append(pa.DictionaryArray.from_arrays(indices, dictionary))
+        else:
+            arrays.append(pa.array(values, from_pandas=values.dtype == np.object_))
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def concat_tables_with_symbol_column(tables, symbols, symbol_column: str):
+    """
+    Concatenate the tables read for the given symbols, adding a dictionary encoded column holding the symbol of each
+    row. Columns missing from some of the tables are filled with nulls.
+    """
+    pa = _import_pyarrow()
+    labelled = []
+    for code, table in enumerate(tables):
+        indices = pa.array(np.full(table.num_rows, code, dtype=np.int32))
+        labelled.append(table.append_column(symbol_column, pa.DictionaryArray.from_arrays(indices, pa.array(symbols))))
+    if not labelled:
+        return pa.table({symbol_column: pa.array([], type=pa.string())})
+    try:
+        return pa.concat_tables(labelled, promote_options="default")
+    except TypeError:
+        # pyarrow < 14
+        return pa.concat_tables(labelled, promote=True)
@@ -7,7 +7,9 @@ As of the Change Date specified in that file, in accordance with the Business So
 """
 import datetime
 import os
+import pickle
 import sys
+import time
 import pandas as pd
 import pytz
 import re
@@ -15,10 +17,13 @@ import itertools
 import attr
 import warnings
 import difflib
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from numpy import datetime64
 from pandas import Timestamp, to_datetime, Timedelta
-from typing import Any, Optional, Union, List, Sequence, Tuple, Dict, Set
+from typing import Any, Optional, Union, List, Sequence, Tuple, Dict, Set, Iterator
 from contextlib import contextmanager
 
 from arcticc.pb2.descriptors_pb2 import IndexDescriptor, TypeDescriptor, SortedValue
@@ -43,7 +48,9 @@ from arcticdb_ext.version_store import PythonVersionStoreReadQuery as _PythonVer
 from arcticdb_ext.version_store import PythonVersionStoreUpdateQuery as _PythonVersionStoreUpdateQuery
 from arcticdb_ext.version_store import PythonVersionStoreReadOptions as _PythonVersionStoreReadOptions
 from arcticdb_ext.version_store import PythonVersionStoreVersionQuery as _PythonVersionStoreVersionQuery
+from arcticdb_ext.version_store import OutputFormat
 from arcticdb_ext.version_store import ColumnStats as _ColumnStats
+from arcticdb_ext.version_store import QueryProfile as _QueryProfile
 from arcticdb_ext.version_store import StreamDescriptorMismatch
 from arcticdb_ext.version_store import DataError
 from arcticdb.authorization.permissions import OpenMode
@@ -51,6 +58,8 @@ from arcticdb.exceptions import ArcticDbNotYetImplemented, ArcticNativeException
 from arcticdb.flattener import Flattener
 from arcticdb.log import version as log
 from arcticdb.version_store._custom_normalizers import get_custom_normalizer, CompositeCustomNormalizer
+from arcticdb.version_store._arrow import arrow_table_from_frame
+from arcticdb.version_store import _views
 from arcticdb.version_store._normalization import (
     NPDDataFrame,
     normalize_metadata,
@@ -94,6 +103,8 @@ class VersionedItem:
         Availability depends on the method used and may be different from that of `data`.
     host: Optional[str]
         Informational / for backwards compatibility.
+    profile: Optional[Dict[str, Any]]
+        Where the time of a read went, if the read was profiled.
     """
 
     symbol: str = attr.ib()
@@ -103,6 +114,7 @@ class VersionedItem:
     metadata: Any = attr.ib(default=None)
     host: Optional[str] = attr.ib(default=None)
     timestamp: Optional[int] = attr.ib(default=0)
+    profile: Optional[Dict[str, Any]] = attr.ib(default=None, repr=False)
 
     def __iter__(self):  # Backwards compatible with the old NamedTuple implementation
         warnings.warn("Don't iterate VersionedItem. Use attrs.astuple() explicitly", SyntaxWarning, stacklevel=2)
@@ -197,6 +209,59 @@ def _assume_false(name, kwargs):
         return True
 
 
+def _iter_read_batches(index: pd.DataFrame, rows_per_batch: int, date_range: Optional[DateRangeInput]) -> List[Dict]:
+    """
+    Group the row-slices in the index of a symbol into batches of at most rows_per_batch rows, other than where a
+    single row-slice is larger than that. Returns the read arguments selecting each batch.
+    """
+    row_slices = index.drop_duplicates("start_row").sort_values("start_row")
+    if date_range is not None:
+        start, end = normalize_dt_range_to_ts(date_range)
+        # end_index is one greater than the last index value in the row-slice
+        row_slices = row_slices[
+            (row_slices["end_index"].values.view(np.int64) > start.value)
+            & (row_slices["start_index"].values.view(np.int64) <= end.value)
+        ]
+    start_rows = row_slices["start_row"].values
+    end_rows = row_slices["end_row"].values
+    start_indexes = row_slices["start_index"].values.view(np.int64)
+    end_indexes = row_slices["end_index"].values.view(np.int64)
+
+    batch_starts = []
+    for idx in range(len(row_slices)):
+        if not batch_starts:
+            batch_starts.append(idx)
+        elif end_rows[idx] - start_rows[batch_starts[-1]] > rows_per_batch:
+            # Date range batches cannot be split between row-slices sharing an index value, as that value would then
+            # be read in both batches
+            if date_range is None or end_indexes[idx - 1] <= start_indexes[idx]:
+                batch_starts.append(idx)
+
+    batches = []
+    for batch, batch_start in enumerate(batch_starts):
+        last = batch == len(batch_starts) - 1
+        if date_range is None:
+            batch_end = len(row_slices) if last else batch_starts[batch + 1]
+            batches.append({"row_range": (int(start_rows[batch_start]), int(end_rows[batch_end - 1]))})
+        else:
+            batch_start_ts = start if batch == 0 else Timestamp(start_indexes[batch_start], tz="UTC")
+            batch_end_ts = end if last else Timestamp(start_indexes[batch_starts[batch + 1]] - 1, tz="UTC")
+            batches.append({"date_range": (batch_start_ts, batch_end_ts)})
+    return batches
+
+
+def _output_format(kwargs):
+    output_format = kwargs.get("output_format")
+    if output_format is None or isinstance(output_format, OutputFormat):
+        return output_format or OutputFormat.PANDAS
+    output_formats = {"pandas": OutputFormat.PANDAS, "arrow": OutputFormat.ARROW}
+    if not isinstance(output_format, str) or output_format.lower() not in output_formats:
+        raise ArcticNativeException(
+            f"Unrecognised output_format {output_format}, must be one of {list(output_formats.keys())}"
+        )
+    return output_formats[output_format.lower()]
+
+
 class NativeVersionStore:
     """
     NativeVersionStore objects provide access to ArcticDB libraries, enabling fundamental library operations
@@ -813,9 +878,11 @@ class NativeVersionStore:
         self, symbol: str, column_stats: Dict[str, Set[str]], as_of: Optional[VersionQueryInput] = None
     ) -> None:
         """
-        Calculates the specified column statistics for each row-slice for the given symbol. In the future, these
-        statistics will be used by `QueryBuilder` filtering operations to reduce the number of data segments read out
-        of storage.
+        Calculates the specified column statistics for each row-slice for the given symbol. These statistics are used
+        by `QueryBuilder` filters at the start of a query to skip row-slices that cannot contain matching rows, without
+        reading them from storage. "MINMAX" statistics are used for comparisons with a value (==, <, <=, >, >=), and
+        "BLOOM" and "DISTINCT" statistics for equality and isin. Reads only use them when the ColumnStats.PruneOnRead
+        runtime config option is set to 1.
 
         Parameters
         ----------
@@ -826,6 +893,9 @@ class NativeVersionStore:
             Keys are column names.
             Values are sets of statistic types to build for that column. Options are:
                 "MINMAX" : store the minimum and maximum value for the column in each row-slice
+                "BLOOM" : store a 1024-bit bloom filter of the values in the column in each row-slice
+                "DISTINCT" : store the set of values in the column in each row-slice with at most 16 distinct values
+            "BLOOM" and "DISTINCT" support numeric, bool, and dynamic string columns.
         as_of : `Optional[VersionQueryInput]`, default=None
             See documentation of `read` method for more details.
 
@@ -1005,7 +1075,7 @@ class NativeVersionStore:
                 query = None
                 if query_builder is not None:
                     query = query_builder if isinstance(query_builder, QueryBuilder) else query_builder[i]
-                vitem = self._post_process_dataframe(read_result, read_query, query)
+                vitem = self._post_process_dataframe(read_result, read_query, query, read_options.output_format)
                 versioned_items.append(vitem)
         return versioned_items
 
@@ -1608,6 +1678,7 @@ class NativeVersionStore:
         read_options.set_set_tz(self.resolve_defaults("set_tz", proto_cfg, global_default=False, **kwargs))
         read_options.set_allow_sparse(self.resolve_defaults("allow_sparse", proto_cfg, global_default=False, **kwargs))
         read_options.set_incompletes(self.resolve_defaults("incomplete", proto_cfg, global_default=False, **kwargs))
+        read_options.set_output_format(_output_format(kwargs))
         return read_options
 
     def _get_queries(self, symbol, as_of, date_range, row_range, columns, query_builder, **kwargs):
@@ -1659,6 +1730,12 @@ class NativeVersionStore:
         query_builder: 'Optional[QueryBuilder]', default=None
             A QueryBuilder object to apply to the dataframe before it is returned.
             For more information see the documentation for the QueryBuilder class.
+        output_format: `Optional[Union[str, OutputFormat]]`, default="pandas"
+            "pandas" returns the data as it was written. "arrow" returns a pyarrow.Table, with the index as leading
+            columns and dynamic strings dictionary encoded. See Library.read for more details.
+        profile: `bool`, default=False
+            If True, the profile attribute of the returned VersionedItem describes where the time of the read went.
+            See Library.read for more details.
 
 
         Returns
@@ -1682,8 +1759,242 @@ class NativeVersionStore:
             query_builder=query_builder,
             **kwargs,
         )
+        if not _assume_false("profile", kwargs):
+            read_result = self._read_dataframe(symbol, version_query, read_query, read_options)
+            return self._post_process_dataframe(read_result, read_query, query_builder, read_options.output_format)
+
+        query_profile = _QueryProfile()
+        read_options.set_query_profile(query_profile)
+        start = time.perf_counter()
         read_result = self._read_dataframe(symbol, version_query, read_query, read_options)
-        return self._post_process_dataframe(read_result, read_query, query_builder)
+        read_end = time.perf_counter()
+        vitem = self._post_process_dataframe(read_result, read_query, query_builder, read_options.output_format)
+        end = time.perf_counter()
+        profile = query_profile.to_dict()
+        profile.update(total_time=end - start, read_time=read_end - start, denormalise_time=end - read_end)
+        return attr.evolve(vitem, profile=profile)
+
+    def explain(
+        self,
+        symbol: str,
+        as_of: Optional[VersionQueryInput] = None,
+        date_range: Optional[DateRangeInput] = None,
+        row_range: Optional[Tuple[int, int]] = None,
+        columns: Optional[List[str]] = None,
+        query_builder: Optional[QueryBuilder] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Describe what reading the named symbol with the given arguments would do, without reading any of its data.
+
+        Parameters
+        ----------
+        See documentation of `read` method.
+
+        Returns
+        -------
+        Dict[str, Any]
+            See Library.explain for the contents.
+        """
+        if date_range is not None and query_builder is not None:
+            q = QueryBuilder()
+            query_builder = q.date_range(date_range).then(query_builder)
+
+        if row_range is not None and query_builder is not None:
+            q = QueryBuilder()
+            query_builder = q._row_range(row_range).then(query_builder)
+
+        version_query, read_options, read_query = self._get_queries(
+            symbol=symbol,
+            as_of=as_of,
+            date_range=date_range,
+            row_range=row_range,
+            columns=columns,
+            query_builder=query_builder,
+            **kwargs,
+        )
+        plan = self.version_store.explain(symbol, version_query, read_query, read_options).to_dict()
+        plan["segments"] = pd.DataFrame(
+            plan["segments"], columns=["start_row", "end_row", "start_col", "end_col", "estimated_bytes"]
+        )
+        return plan
+
+    def create_view(self, name: str, symbol: str, query_builder: QueryBuilder) -> VersionedItem:
+        """
+        Create, or replace, a view named name of the results of query_builder over the latest version of symbol.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of the symbol the view is stored in.
+        symbol : `str`
+            Symbol the view is of.
+        query_builder : `QueryBuilder`
+            Groupby and aggregation, optionally preceded by filters and projections.
+
+        Returns
+        -------
+        VersionedItem
+            See read_view.
+        """
+        check(name != symbol, "A view cannot be stored in the symbol {} it is of", symbol)
+        _views.view_aggregations(query_builder)
+        definition = {"symbol": symbol, "query_builder": pickle.dumps(query_builder)}
+        return self._refresh_view(name, definition, None)
+
+    def read_view(self, name: str) -> VersionedItem:
+        """
+        Read the view named name, first folding in any rows appended to the symbol it is of since it was last read. If
+        the symbol has been modified other than by appends, the view is recomputed from scratch.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of the view.
+
+        Returns
+        -------
+        VersionedItem
+            The data is the result of the view, with a row for each group. The metadata is a dictionary of the symbol
+            the view is of, and the version and number of rows of it the result is for.
+        """
+        stored = self.read(name)
+        definition = stored.metadata.get(_views.VIEW_METADATA_KEY) if isinstance(stored.metadata, dict) else None
+        check(definition is not None, "Symbol {} is not a view", name)
+        return self._refresh_view(name, definition, stored)
+
+    def _refresh_view(
+        self, name: str, definition: Dict[str, Any], stored: Optional[VersionedItem]
+    ) -> VersionedItem:
+        symbol = definition["symbol"]
+        query_builder = pickle.loads(definition["query_builder"])
+        aggregations = _views.view_aggregations(query_builder)
+        ret = self.version_store.read_index(symbol, self._get_version_query(None))
+        source_version = ReadResult(*ret).version.version
+        index = denormalize_dataframe(ret)
+        num_entries = 0 if index is None else len(index)
+        rows = int(index["end_row"].max()) if num_entries > 0 else 0
+
+        state = None if stored is None else stored.data
+        if state is not None and definition["source_version"] == source_version:
+            vitem = stored
+        else:
+            state_query_builder = _views.state_query_builder(query_builder, aggregations)
+            appended_only = (
+                state is not None
+                and definition["index_entries"] <= num_entries
+                and definition["index_digest"] == _views.index_digest(index, definition["index_entries"])
+            )
+            if appended_only:
+                if rows > definition["rows"]:
+                    update = self.read(
+                        symbol, as_of=source_version, row_range=(definition["rows"], rows), query_builder=state_query_builder
+                    ).data
+                    state = _views.merge_states(state, update, aggregations)
+            else:
+                state = self.read(symbol, as_of=source_version, query_builder=state_query_builder).data
+            definition = dict(
+                definition,
+                source_version=source_version,
+                rows=rows,
+                index_entries=num_entries,
+                index_digest=_views.index_digest(index, num_entries),
+            )
+            vitem = self.write(
+                name, state, metadata={_views.VIEW_METADATA_KEY: definition}, prune_previous_version=True
+            )
+        return attr.evolve(
+            vitem,
+            data=_views.view_result(state, aggregations),
+            metadata={"symbol": symbol, "version": definition["source_version"], "rows": definition["rows"]},
+        )
+
+    def iter_read(
+        self,
+        symbol: str,
+        as_of: Optional[VersionQueryInput] = None,
+        date_range: Optional[DateRangeInput] = None,
+        columns: Optional[List[str]] = None,
+        query_builder: Optional[QueryBuilder] = None,
+        rows_per_batch: int = 100_000,
+        prefetch: int = 1,
+        **kwargs,
+    ) -> Iterator[VersionedItem]:
+        """
+        Read data for the named symbol in batches of consecutive rows, so that the whole symbol is never held in memory.
+
+        Batches are made up of whole row-slices, as many as fit within rows_per_batch, or a single row-slice if it is
+        larger than that. While the caller processes one batch, up to prefetch further batches are read in the
+        background. All batches are read from the version of the symbol resolved when iter_read is called.
+
+        Parameters
+        ----------
+        symbol : `str`
+            Symbol name.
+        as_of : `Optional[VersionQueryInput]`, default=None
+            See documentation of `read` method for more details.
+        date_range: `Optional[DateRangeInput]`, default=None
+            See documentation of `read` method for more details.
+        columns: `Optional[List[str]]`, default=None
+            See documentation of `read` method for more details.
+        query_builder: 'Optional[QueryBuilder]', default=None
+            A QueryBuilder object to apply to each batch before it is returned. Only filters and projections, which do
+            not depend on rows in other batches, are supported.
+        rows_per_batch: `int`, default=100000
+            Maximum number of rows to read in each batch, subject to the row-slicing described above.
+        prefetch: `int`, default=1
+            Number of batches to read ahead of the one being processed. Memory usage is bounded by prefetch + 1 batches.
+
+        Returns
+        -------
+        Iterator[VersionedItem]
+        """
+        check(rows_per_batch > 0, "rows_per_batch must be positive, received {}", rows_per_batch)
+        check(prefetch >= 0, "prefetch must not be negative, received {}", prefetch)
+        check(
+            query_builder is None or query_builder.processes_rows_independently(),
+            "iter_read only supports QueryBuilder objects containing filters and projections",
+        )
+        ret = self.version_store.read_index(symbol, self._get_version_query(as_of, **kwargs))
+        # Pin the version so that concurrent writes do not change the data between batches
+        version = ReadResult(*ret).version.version
+        index = denormalize_dataframe(ret).reset_index()
+        batches = _iter_read_batches(index, rows_per_batch, date_range) or [{"date_range": date_range}]
+        # Arguments are checked and the version resolved above, rather than on the first call to next
+        return self._iter_read(symbol, version, batches, columns, query_builder, prefetch, **kwargs)
+
+    def _iter_read(
+        self,
+        symbol: str,
+        version: int,
+        batches: List[Dict[str, Any]],
+        columns: Optional[List[str]],
+        query_builder: Optional[QueryBuilder],
+        prefetch: int,
+        **kwargs,
+    ) -> Iterator[VersionedItem]:
+        def read_batch(batch):
+            return self.read(symbol, as_of=version, columns=columns, query_builder=query_builder, **batch, **kwargs)
+
+        if prefetch == 0:
+            for batch in batches:
+                yield read_batch(batch)
+            return
+
+        remaining = iter(batches)
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            while True:
+                for batch in itertools.islice(remaining, prefetch + 1 - len(pending)):
+                    pending.append(executor.submit(read_batch, batch))
+                if not pending:
+                    return
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
 
     def head(
         self,
@@ -1719,7 +2030,7 @@ class NativeVersionStore:
             symbol=symbol, as_of=as_of, date_range=None, row_range=None, columns=columns, query_builder=q, **kwargs
         )
         read_result = self._read_dataframe(symbol, version_query, read_query, read_options)
-        return self._post_process_dataframe(read_result, read_query, q)
+        return self._post_process_dataframe(read_result, read_query, q, read_options.output_format)
 
     def tail(
         self, symbol: str, n: int = 5, as_of: VersionQueryInput = None, columns: Optional[List[str]] = None, **kwargs
@@ -1750,12 +2061,98 @@ class NativeVersionStore:
             symbol=symbol, as_of=as_of, date_range=None, row_range=None, columns=columns, query_builder=q, **kwargs
         )
         read_result = self._read_dataframe(symbol, version_query, read_query, read_options)
-        return self._post_process_dataframe(read_result, read_query, q)
+        return self._post_process_dataframe(read_result, read_query, q, read_options.output_format)
+
+    def read_asof_join(
+        self,
+        left_symbol: str,
+        right_symbol: str,
+        by: Optional[str] = None,
+        tolerance: Optional[int] = None,
+        left_as_of: Optional[VersionQueryInput] = None,
+        right_as_of: Optional[VersionQueryInput] = None,
+        date_range: Optional[DateRangeInput] = None,
+        columns: Optional[List[str]] = None,
+        right_columns: Optional[List[str]] = None,
+        query_builder: Optional[QueryBuilder] = None,
+        **kwargs,
+    ) -> VersionedItem:
+        """
+        Read the left symbol with the columns of the last row of the right symbol at or before each of its index values
+        joined to it, in the same way as pd.merge_asof(left, right, left_index=True, right_index=True, by=by,
+        tolerance=tolerance). Only the parts of the right symbol that can be joined to the rows read are fetched. Each is
+        read as the row-slices of the left symbol that can be joined to it are, and released once they have all been.
+
+        Parameters
+        ----------
+        left_symbol : `str`
+            Symbol to read. Must have a timestamp index.
+        right_symbol : `str`
+            Symbol to join to the rows of left_symbol. Must have a timestamp index and be sorted.
+        by : `Optional[str]`, default=None
+            String or integer column of both symbols. If provided, rows are only joined to rows of the right symbol with
+            the same value in this column.
+        tolerance : `Optional[int]`, default=None
+            Maximum number of nanoseconds by which a joined row of the right symbol may precede the row it is joined to.
+        left_as_of : `Optional[VersionQueryInput]`, default=None
+            Version of left_symbol to read. See documentation of `read` method for more details.
+        right_as_of : `Optional[VersionQueryInput]`, default=None
+            Version of right_symbol to join. See documentation of `read` method for more details.
+        date_range: `Optional[DateRangeInput]`, default=None
+            DateRange of left_symbol to read. See documentation of `read` method for more details.
+        columns: `Optional[List[str]]`, default=None
+            Columns of left_symbol to return.
+        right_columns: `Optional[List[str]]`, default=None
+            Columns of right_symbol to join. Defaults to all of them, other than the by column.
+        query_builder: 'Optional[QueryBuilder]', default=None
+            Filters and projections to apply to left_symbol before the join.
+
+        Returns
+        -------
+        VersionedItem
+            The version of left_symbol that was read, with the joined data.
+        """
+        check(
+            query_builder is None or query_builder.processes_rows_independently(),
+            "read_asof_join only supports QueryBuilder objects containing filters and projections",
+        )
+        if date_range is not None and query_builder is not None:
+            q = QueryBuilder()
+            query_builder = q.date_range(date_range).then(query_builder)
+
+        version_query, read_options, read_query = self._get_queries(
+            symbol=left_symbol,
+            as_of=left_as_of,
+            date_range=date_range,
+            row_range=None,
+            columns=columns,
+            query_builder=query_builder,
+            **kwargs,
+        )
+        right_version_query = self._get_version_query(right_as_of, **kwargs)
+        read_result = ReadResult(
+            *self.version_store.read_asof_join(
+                left_symbol,
+                version_query,
+                read_query,
+                right_symbol,
+                right_version_query,
+                None if right_columns is None else list(right_columns),
+                by,
+                tolerance,
+                read_options,
+            )
+        )
+        return self._post_process_dataframe(read_result, read_query, query_builder, read_options.output_format)
 
     def _read_dataframe(self, symbol, version_query, read_query, read_options):
         return ReadResult(*self.version_store.read_dataframe_version(symbol, version_query, read_query, read_options))
 
-    def _post_process_dataframe(self, read_result, read_query, query_builder):
+    def _post_process_dataframe(self, read_result, read_query, query_builder, output_format=OutputFormat.PANDAS):
+        # Taken before any post filtering below replaces the C++ frame with a FrameData
+        string_dictionaries = (
+            read_result.frame_data.string_dictionaries if output_format == OutputFormat.ARROW else None
+        )
         if read_query.row_filter is not None and (query_builder is None or query_builder.needs_post_processing()):
             # post filter
             start_idx = end_idx = None
@@ -1774,6 +2171,9 @@ class NativeVersionStore:
                 data.append(c[start_idx:end_idx])
             read_result.frame_data = FrameData(data, read_result.frame_data.names, read_result.frame_data.index_columns)
 
+        if output_format == OutputFormat.ARROW:
+            return self._adapt_read_res_to_arrow(read_result, string_dictionaries)
+
         vitem = self._adapt_read_res(read_result)
 
         # Handle custom normalized data
@@ -1963,6 +2363,25 @@ class NativeVersionStore:
             timestamp=read_result.version.timestamp
         )
 
+    def _adapt_read_res_to_arrow(self, read_result: ReadResult, string_dictionaries) -> VersionedItem:
+        norm = read_result.norm
+        if norm.HasField("msg_pack_frame") or norm.HasField("custom") or len(read_result.keys) > 0:
+            raise ArcticNativeException(
+                f"Symbol {read_result.version.symbol} cannot be read with output_format='arrow' as it was not written "
+                "as a DataFrame, Series or numpy array"
+            )
+        frame_data = FrameData.from_cpp(read_result.frame_data)
+
+        return VersionedItem(
+            symbol=read_result.version.symbol,
+            library=self._library.library_path,
+            data=arrow_table_from_frame(frame_data, string_dictionaries),
+            version=read_result.version.version,
+            metadata=denormalize_user_metadata(read_result.udm, self._normalizer),
+            host=self.env,
+            timestamp=read_result.version.timestamp
+        )
+
     def list_versions(
         self,
         symbol: Optional[str] = None,
@@ -2813,6 +3232,50 @@ class NativeVersionStore:
             timestamp=result.timestamp
         )
 
+    def coalesce_symbol_data(
+        self, symbol: str, object_bytes: Optional[int] = None, prune_previous_version: bool = False
+    ) -> VersionedItem:
+        """
+        Packs the data segments of the latest version of the symbol into multi-segment storage objects, and writes a new
+        version referencing them. The data of the symbol is unchanged. Segments are packed in index order, so reading
+        a date range fetches one object per block of time rather than one object per segment, which reduces the number
+        of requests made to object stores for symbols built up from many small appends. Each segment is read from its
+        object with a ranged read, which is supported by S3, LMDB and in-memory storages.
+
+        Segments already packed are left as they are, so only the segments appended since the last call are packed.
+
+        This changes the storage format of the symbol. Versions of ArcticDB that predate coalescing cannot read the
+        version written, nor later versions of the symbol that still reference its packed segments. Only coalesce
+        symbols that are read solely by clients that support it. Segments of 4GB or more cannot be packed.
+
+        Parameters
+        ----------
+        symbol: `str`
+            Symbol name.
+        object_bytes: `Optional[int]`, default=None
+            Maximum size of each object in bytes. If not provided, the runtime config option
+            SymbolDataCoalesce.ObjectBytes is used, which defaults to 64MB.
+        prune_previous_version: `bool`, default=False
+            Removes previous (non-snapshotted) versions from the database, deleting the objects of the segments that
+            were packed.
+
+        Returns
+        -------
+        VersionedItem
+            Structure containing metadata and version number of the coalesced symbol in the store. If there were fewer
+            than two segments to pack, no version is written and the latest version is returned.
+        """
+        result = self.version_store.coalesce_symbol_data(symbol, object_bytes, prune_previous_version)
+        return VersionedItem(
+            symbol=result.symbol,
+            library=self._library.library_path,
+            version=result.version,
+            metadata=None,
+            data=None,
+            host=self.env,
+            timestamp=result.timestamp
+        )
+
     def library(self):
         return self._library
 
@@ -0,0 +1,124 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import copy
+import hashlib
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from arcticdb.preconditions import check
+from arcticdb.version_store.processing import (
+    QueryBuilder,
+    PythonAggregationClause,
+    PythonFilterClause,
+    PythonGroupByClause,
+    PythonProjectionClause,
+)
+
+# Key of the view definition in the user metadata of the symbol a view is stored in
+VIEW_METADATA_KEY = "__arcticdb_view__"
+
+# Aggregations whose results over two sets of rows can be combined into the result over both
+MERGEABLE_AGGREGATIONS = ("sum", "min", "max", "count", "mean")
+
+# Prefix of the stored columns counting the values behind each mean, which are needed to combine means
+_MEAN_COUNT_PREFIX = "__arcticdb_view_count__"
+
+# Columns of the index of a symbol identifying the data segments it is made up of
+_INDEX_IDENTITY_COLUMNS = ["version_id", "content_hash", "start_row", "end_row", "start_col", "end_col"]
+
+
+def view_aggregations(query_builder: QueryBuilder) -> Dict[str, Tuple[str, str]]:
+    """
+    Check that the results of query_builder can be refreshed incrementally, and return its aggregations as a mapping
+    from output column to input column and aggregation operator.
+    """
+    clauses = query_builder._python_clauses
+    check(
+        len(clauses) >= 2
+        and isinstance(clauses[-2], PythonGroupByClause)
+        and isinstance(clauses[-1], PythonAggregationClause),
+        "The QueryBuilder of a view must end with a groupby and aggregation",
+    )
+    check(
+        all(isinstance(clause, (PythonFilterClause, PythonProjectionClause)) for clause in clauses[:-2]),
+        "Only filters and projections can precede the groupby of a view, as the results of other clauses depend on "
+        "rows other than those appended",
+    )
+    aggregations = {}
+    for output, aggregation in clauses[-1].aggregations.items():
+        column, operator = (output, aggregation) if isinstance(aggregation, str) else aggregation
+        check(
+            operator in MERGEABLE_AGGREGATIONS,
+            "Aggregation {} of column {} cannot be refreshed incrementally in a view, supported aggregations are {}",
+            operator,
+            column,
+            ", ".join(MERGEABLE_AGGREGATIONS),
+        )
+        aggregations[output] = (column, operator)
+    return aggregations
+
+
+def state_query_builder(query_builder: QueryBuilder, aggregations: Dict[str, Tuple[str, str]]) -> QueryBuilder:
+    """
+    The QueryBuilder computing the state stored for a view, which additionally counts the values behind each mean.
+    """
+    state_aggregations = {}
+    for output, (column, operator) in aggregations.items():
+        state_aggregations[output] = (column, operator)
+        if operator == "mean":
+            state_aggregations[_MEAN_COUNT_PREFIX + output] = (column, "count")
+    q = copy.deepcopy(query_builder)
+    q.clauses.pop()
+    q._python_clauses.pop()
+    return q.agg(state_aggregations)
+
+
+def merge_states(state: pd.DataFrame, update: pd.DataFrame, aggregations: Dict[str, Tuple[str, str]]) -> pd.DataFrame:
+    """
+    Combine the states of a view computed over two disjoint sets of rows into the state over both.
+    """
+    if len(update) == 0:
+        return state
+    if len(state) == 0:
+        return update
+    combined = pd.concat([state, update])
+    grouped = combined.groupby(level=0, sort=False, dropna=False)
+    merged = {}
+    for output, (_, operator) in aggregations.items():
+        if operator == "mean":
+            count_column = _MEAN_COUNT_PREFIX + output
+            counts = grouped[count_column].sum()
+            totals = (combined[output] * combined[count_column]).fillna(0).groupby(level=0, sort=False, dropna=False).sum()
+            merged[output] = totals / counts.where(counts > 0).astype(np.float64)
+            merged[count_column] = counts
+        elif operator == "count":
+            merged[output] = grouped[output].sum()
+        else:
+            merged[output] = getattr(grouped[output], operator)()
+    return pd.DataFrame(merged)[list(state.columns)]
+
+
+def view_result(state: pd.DataFrame, aggregations: Dict[str, Tuple[str, str]]) -> pd.DataFrame:
+    """
+    The result of a view from its stored state, without the columns only needed to refresh it.
+    """
+    return state[list(aggregations)]
+
+
+def index_digest(index: Optional[pd.DataFrame], num_entries: int) -> str:
+    """
+    A digest of the data segments referenced by the first num_entries entries of the index of a symbol. Appending to a
+    symbol leaves the existing entries of its index unchanged, so it is used to recognise versions created by appends.
+    """
+    digest = hashlib.sha256()
+    if index is not None and num_entries > 0:
+        entries = index[_INDEX_IDENTITY_COLUMNS].iloc[:num_entries].to_numpy(dtype=np.uint64)
+        digest.update(np.ascontiguousarray(entries).tobytes())
+    return digest.hexdigest()
@@ -0,0 +1,230 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from arcticdb.supported_types import Timestamp
+from arcticdb.version_store.processing import QueryBuilder
+from arcticdb.version_store._store import VersionedItem
+from arcticdb.version_store.library import (
+    AsOf,
+    Library,
+    NormalizableType,
+    ReadRequest,
+    SymbolVersion,
+    VersionInfo,
+)
+from arcticdb_ext.version_store import DataError
+
+
+class AsyncLibrary:
+    """
+    An asyncio interface to a `Library`. The methods mirror those of `Library` of the same name, but return awaitables.
+
+    All operations run on a single background thread owned by this object, with the GIL released while data is read
+    from or written to storage, so the event loop stays responsive for the whole operation. Calls to `read` that are
+    awaited concurrently are coalesced into a single `Library.read_batch`, in which the storage IO for every symbol
+    runs in parallel, so one process can keep thousands of symbol reads in flight without a thread per read.
+
+    As operations on a `Library` are executed one at a time, a read awaited concurrently with a write to the same
+    symbol may see the data from before or after the write. Await the write first where this matters.
+
+    Examples
+    --------
+
+    >>> async_lib = AsyncLibrary(lib)
+    >>> await async_lib.write("symbol", pd.DataFrame({"column": [1, 2, 3]}))
+    >>> items = await asyncio.gather(*(async_lib.read("symbol", as_of=0) for _ in range(1000)))
+    >>> async_lib.close()
+    """
+
+    def __init__(self, library: Library, max_read_batch_size: int = 1000):
+        """
+        Parameters
+        ----------
+        library
+            The library to perform operations on.
+        max_read_batch_size: int, default=1000
+            Maximum number of concurrent `read` calls coalesced into a single `Library.read_batch`.
+        """
+        if max_read_batch_size < 1:
+            raise ValueError(f"max_read_batch_size must be positive, but was {max_read_batch_size}")
+
+        self._library = library
+        self._max_read_batch_size = max_read_batch_size
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="arcticdb_async")
+        # Reads waiting to be submitted, per event loop and output format
+        self._pending_reads: Dict[Tuple[asyncio.AbstractEventLoop, str], List[Tuple[ReadRequest, asyncio.Future]]] = {}
+
+    def __repr__(self):
+        return "AsyncLibrary(%s)" % repr(self._library)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def library(self) -> Library:
+        """The synchronous library that operations are performed on."""
+        return self._library
+
+    def close(self):
+        """Stop the background thread once the operations already started have completed."""
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def write(
+        self,
+        symbol: str,
+        data: NormalizableType,
+        metadata: Any = None,
+        prune_previous_versions: bool = False,
+        staged=False,
+        validate_index=True,
+    ) -> VersionedItem:
+        """See `Library.write`."""
+        return await self._run(
+            self._library.write,
+            symbol,
+            data,
+            metadata=metadata,
+            prune_previous_versions=prune_previous_versions,
+            staged=staged,
+            validate_index=validate_index,
+        )
+
+    async def append(
+        self,
+        symbol: str,
+        data: NormalizableType,
+        metadata: Any = None,
+        prune_previous_versions: bool = False,
+        validate_index: bool = True,
+    ) -> Optional[VersionedItem]:
+        """See `Library.append`."""
+        return await self._run(
+            self._library.append,
+            symbol,
+            data,
+            metadata=metadata,
+            prune_previous_versions=prune_previous_versions,
+            validate_index=validate_index,
+        )
+
+    async def read(
+        self,
+        symbol: str,
+        as_of: Optional[AsOf] = None,
+        date_range: Optional[Tuple[Optional[Timestamp], Optional[Timestamp]]] = None,
+        row_range: Optional[Tuple[int, int]] = None,
+        columns: Optional[List[str]] = None,
+        query_builder: Optional[QueryBuilder] = None,
+        output_format: str = "pandas",
+    ) -> VersionedItem:
+        """
+        See `Library.read`. Reads issued before control returns to the event loop are performed together in a single
+        `Library.read_batch`.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        request = ReadRequest(
+            symbol,
+            as_of=as_of,
+            date_range=date_range,
+            row_range=row_range,
+            columns=columns,
+            query_builder=query_builder,
+        )
+        key = (loop, output_format)
+        pending = self._pending_reads.get(key)
+        if pending is None:
+            pending = self._pending_reads[key] = []
+            loop.call_soon(self._submit_reads, key)
+        pending.append((request, future))
+        if len(pending) >= self._max_read_batch_size:
+            self._submit_reads(key)
+        return await future
+
+    def _submit_reads(self, key):
+        pending = self._pending_reads.pop(key, None)
+        if not pending:
+            return
+
+        loop, output_format = key
+        requests = [request for request, _ in pending]
+        futures = [future for _, future in pending]
+        submitted = loop.run_in_executor(self._executor, self._read_batch, requests, output_format)
+        submitted.add_done_callback(functools.partial(self._resolve_reads, futures))
+
+    def _read_batch(self, requests: List[ReadRequest], output_format: str) -> List[Tuple[bool, Any]]:
+        results = []
+        for request, item in zip(requests, self._library.read_batch(requests, output_format=output_format)):
+            if isinstance(item, DataError):
+                # Repeat the read on its own so that the caller sees the same exception as from Library.read
+                try:
+                    item = self._library.read(**request._asdict(), output_format=output_format)
+                except Exception as e:
+                    results.append((False, e))
+                    continue
+            results.append((True, item))
+        return results
+
+    @staticmethod
+    def _resolve_reads(futures: List[asyncio.Future], submitted: asyncio.Future):
+        if submitted.cancelled() or submitted.exception() is not None:
+            for future in futures:
+                if not future.done():
+                    if submitted.cancelled():
+                        future.cancel()
+                    else:
+                        future.set_exception(submitted.exception())
+            return
+
+        for future, (succeeded, result) in zip(futures, submitted.result()):
+            # Cancelled by the caller while the batch was in flight
+            if future.done():
+                continue
+            if succeeded:
+                future.set_result(result)
+            else:
+                future.set_exception(result)
+
+    async def read_batch(
+        self,
+        symbols: List[Union[str, ReadRequest]],
+        query_builder: Optional[QueryBuilder] = None,
+        output_format: str = "pandas",
+    ) -> List[Union[VersionedItem, DataError]]:
+        """See `Library.read_batch`."""
+        return await self._run(
+            self._library.read_batch, symbols, query_builder=query_builder, output_format=output_format
+        )
+
+    async def list_versions(
+        self,
+        symbol: Optional[str] = None,
+        snapshot: Optional[str] = None,
+        latest_only: bool = False,
+        skip_snapshots: bool = False,
+    ) -> Dict[SymbolVersion, VersionInfo]:
+        """See `Library.list_versions`."""
+        return await self._run(
+            self._library.list_versions,
+            symbol=symbol,
+            snapshot=snapshot,
+            latest_only=latest_only,
+            skip_snapshots=skip_snapshots,
+        )
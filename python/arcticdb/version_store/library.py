@@ -10,7 +10,7 @@ import datetime
 
 import pytz
 from enum import Enum, auto
-from typing import Optional, Any, Tuple, Dict, Union, List, Iterable, NamedTuple
+from typing import Optional, Any, Tuple, Dict, Union, List, Iterable, Iterator, NamedTuple
 from numpy import datetime64
 
 from arcticdb.options import \
@@ -20,6 +20,7 @@ from arcticdb.util._versions import IS_PANDAS_TWO
 
 from arcticdb.version_store.processing import QueryBuilder
 from arcticdb.version_store._store import NativeVersionStore, VersionedItem, VersionQueryInput
+from arcticdb.version_store._arrow import concat_tables_with_symbol_column
 from arcticdb_ext.exceptions import ArcticException
 from arcticdb_ext.version_store import DataError
 import pandas as pd
@@ -291,6 +292,37 @@ class StagedDataFinalizeMethod(Enum):
     APPEND = auto()
 
 
+def _concat_with_symbol_column(versioned_items: List[VersionedItem], symbol_column: str, output_format: str):
+    symbols = [item.symbol for item in versioned_items]
+    if isinstance(output_format, str) and output_format.lower() == "arrow":
+        tables = [item.data for item in versioned_items]
+        for table in tables:
+            if symbol_column in table.column_names:
+                raise ArcticInvalidApiUsageException(
+                    f"symbol_column {symbol_column} is already the name of a column in the data"
+                )
+        return concat_tables_with_symbol_column(tables, symbols, symbol_column)
+
+    frames = []
+    for symbol, item in zip(symbols, versioned_items):
+        data = item.data
+        if isinstance(data, pd.Series):
+            data = data.to_frame()
+        if not isinstance(data, pd.DataFrame):
+            raise ArcticInvalidApiUsageException(
+                f"symbol_column is only supported for symbols holding DataFrames or Series, but {symbol} holds"
+                f" {type(data)}"
+            )
+        if symbol_column in data.columns:
+            raise ArcticInvalidApiUsageException(
+                f"symbol_column {symbol_column} is already the name of a column in the data of {symbol}"
+            )
+        frames.append(data.assign(**{symbol_column: symbol}))
+    if not frames:
+        return pd.DataFrame({symbol_column: pd.Series(dtype=object)})
+    return pd.concat(frames)
+
+
 class Library:
     """
     The main interface exposing read/write functionality within a given Arctic instance.
@@ -965,6 +997,8 @@ class Library:
         row_range: Optional[Tuple[int, int]] = None,
         columns: Optional[List[str]] = None,
         query_builder: Optional[QueryBuilder] = None,
+        output_format: str = "pandas",
+        profile: bool = False,
     ) -> VersionedItem:
         """
         Read data for the named symbol.  Returns a VersionedItem object with a data and metadata element (as passed into
@@ -1009,6 +1043,33 @@ class Library:
             A QueryBuilder object to apply to the dataframe before it is returned. For more information see the
             documentation for the QueryBuilder class (``from arcticdb import QueryBuilder; help(QueryBuilder)``).
 
+        output_format: str, default="pandas"
+            ``"pandas"`` returns the data as the Pandas or numpy object it was written as.
+
+            ``"arrow"`` returns a ``pyarrow.Table``, which requires pyarrow to be installed. The index is returned as
+            the leading column(s), named as stored. Numeric and timestamp columns share their memory with the decoded
+            data rather than being copied. Dynamic string columns are returned as dictionary arrays built directly from
+            the stored strings, without creating a Python object per value. Pickled data cannot be read in this format.
+
+        profile: bool, default=False
+            If True, the ``profile`` attribute of the returned VersionedItem is a dictionary describing where the time
+            of the read went:
+
+            - ``total_time``, ``read_time``, ``denormalise_time``: seconds spent in the whole read, in reading and
+              processing the data, and in converting it to the output format.
+            - ``segments_in_index``, ``segments_pruned``: the number of segments of the version, and how many of them
+              were skipped using the index, for example because they are outside the date_range.
+            - ``segments_read``, ``bytes_fetched``, ``bytes_decoded``: the segments read, their compressed size, and
+              the size of the columns decoded from them.
+            - ``fetch_time``, ``decode_time``, ``queue_wait_time``: seconds spent fetching and decoding segments, and
+              waiting for a CPU thread to run the query_builder clauses on them.
+            - ``clauses``: a list with, for each clause of the query_builder, its description, the seconds spent in it,
+              its input and output row counts, and the number of processing units it ran on.
+
+            Times other than ``total_time``, ``read_time`` and ``denormalise_time`` are summed over all threads, so can
+            exceed the elapsed time of the read. Segment, byte, and clause statistics are only gathered for reads with a
+            query_builder.
+
         Returns
         -------
         VersionedItem object that contains a .data and .metadata element
@@ -1039,14 +1100,320 @@ class Library:
             row_range=row_range,
             columns=columns,
             query_builder=query_builder,
+            output_format=output_format,
+            profile=profile,
+        )
+
+    def explain(
+        self,
+        symbol: str,
+        query_builder: Optional[QueryBuilder] = None,
+        as_of: Optional[AsOf] = None,
+        date_range: Optional[Tuple[Optional[Timestamp], Optional[Timestamp]]] = None,
+        row_range: Optional[Tuple[int, int]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Describe how `read` would process the named symbol with the given arguments, without reading any of its data.
+        Only the version and index keys of the symbol are read.
+
+        Parameters
+        ----------
+        symbol : str
+            Symbol name.
+
+        query_builder: Optional[QueryBuilder], default=None
+            See documentation on `read`.
+
+        as_of : AsOf, default=None
+            See documentation on `read`.
+
+        date_range: Tuple[Optional[Timestamp], Optional[Timestamp]], default=None
+            See documentation on `read`.
+
+        row_range: `Optional[Tuple[int, int]]`, default=None
+            See documentation on `read`.
+
+        columns: List[str], default=None
+            See documentation on `read`.
+
+        Returns
+        -------
+        Dict[str, Any]
+            - ``clauses``: for each clause that would be run, a dictionary of its description and whether it needs the
+              results of all the segments before the next clause can run (``requires_repartition``), as for a groupby.
+            - ``segments_in_index``: the number of segments of the version.
+            - ``segments``: a DataFrame with a row for each segment that would be read, giving its row and column
+              ranges and the estimated number of bytes decoded from it. Estimates are from the types of the columns
+              read, and exclude the contents of string pools.
+            - ``processing_units``: the number of groups of segments the first clause would be run on in parallel.
+
+        Examples
+        --------
+
+        >>> lib.write("symbol", pd.DataFrame({"a": np.arange(10), "b": np.arange(10.0)}))
+        >>> q = QueryBuilder()
+        >>> q = q[q["a"] > 5].groupby("a").agg({"b": "sum"})
+        >>> plan = lib.explain("symbol", q)
+        >>> [clause["requires_repartition"] for clause in plan["clauses"]]
+        [False, True, False]
+        >>> plan["segments_in_index"], len(plan["segments"])
+        (1, 1)
+        """
+        return self._nvs.explain(
+            symbol=symbol,
+            as_of=as_of,
+            date_range=date_range,
+            row_range=row_range,
+            columns=columns,
+            query_builder=query_builder,
+        )
+
+    def create_view(self, name: str, symbol: str, query_builder: QueryBuilder) -> VersionedItem:
+        """
+        Create a named view of the results of a groupby and aggregation over a symbol that is appended to. Reading the
+        view with `read_view` aggregates only the rows appended to the symbol since the view was last read, and combines
+        them with the stored results, so its cost is proportional to the new data rather than to the whole symbol.
+
+        The view is stored in the symbol ``name`` of this library, replacing any existing data there, along with the
+        version of ``symbol`` and the number of its rows it is up to date with. It can be deleted with `delete`.
+
+        Parameters
+        ----------
+        name : str
+            Name of the view. Must not be the same as ``symbol``.
+
+        symbol : str
+            Symbol to aggregate. The view is computed from its latest version.
+
+        query_builder : QueryBuilder
+            A groupby followed by an aggregation, optionally preceded by filters and projections. Only the ``sum``,
+            ``min``, ``max``, ``count``, and ``mean`` aggregations are supported, as the results of the others cannot
+            be combined from those of separate sets of rows.
+
+        Returns
+        -------
+        VersionedItem
+            See `read_view`.
+
+        Raises
+        ------
+        ArcticNativeException
+            If query_builder cannot be refreshed incrementally.
+
+        Examples
+        --------
+
+        >>> lib.write("trades", pd.DataFrame({"ticker": ["A", "B", "A"], "quantity": [1, 2, 3]}))
+        >>> q = QueryBuilder().groupby("ticker").agg({"quantity": "sum"})
+        >>> lib.create_view("quantity_by_ticker", "trades", q).data
+                quantity
+        ticker
+        A              4
+        B              2
+        >>> lib.append("trades", pd.DataFrame({"ticker": ["B"], "quantity": [5]}, index=pd.RangeIndex(3, 4)))
+        >>> lib.read_view("quantity_by_ticker").data
+                quantity
+        ticker
+        A              4
+        B              7
+        """
+        return self._nvs.create_view(name, symbol, query_builder)
+
+    def read_view(self, name: str) -> VersionedItem:
+        """
+        Read a view created with `create_view`, first bringing it up to date with the latest version of the symbol it
+        is of.
+
+        If the symbol has only been appended to since the view was last read, only the appended rows are read and
+        aggregated. If it has been modified in any other way, for example by an update or a write, the view is
+        recomputed from the whole symbol. Either way the stored view is replaced with the refreshed results.
+
+        Parameters
+        ----------
+        name : str
+            Name of the view.
+
+        Returns
+        -------
+        VersionedItem
+            The data is a DataFrame with a row for each group, and a column for each aggregation. The metadata is a
+            dictionary giving the ``symbol`` the view is of, and the ``version`` and number of ``rows`` of it the data
+            reflects.
+        """
+        return self._nvs.read_view(name)
+
+    def iter_read(
+        self,
+        symbol: str,
+        as_of: Optional[AsOf] = None,
+        date_range: Optional[Tuple[Optional[Timestamp], Optional[Timestamp]]] = None,
+        columns: Optional[List[str]] = None,
+        query_builder: Optional[QueryBuilder] = None,
+        rows_per_batch: int = 100_000,
+        prefetch: int = 1,
+    ) -> Iterator[VersionedItem]:
+        """
+        Read data for the named symbol in batches of consecutive rows. Unlike `read`, the whole symbol is never held in
+        memory at once, which allows processing symbols larger than the available memory.
+
+        Parameters
+        ----------
+        symbol : str
+            Symbol name.
+
+        as_of : AsOf, default=None
+            See documentation on `read`.
+
+        date_range: Tuple[Optional[Timestamp], Optional[Timestamp]], default=None
+            See documentation on `read`.
+
+        columns: List[str], default=None
+            See documentation on `read`.
+
+        query_builder: Optional[QueryBuilder], default=None
+            A QueryBuilder object to apply to each batch before it is returned. Only filters and projections are
+            supported, as groupby, resample, and row range operations depend on rows in other batches.
+
+        rows_per_batch: int, default=100000
+            Maximum number of rows in each batch. Batches are made up of whole row-slices as written (see
+            ``LibraryOptions.rows_per_segment``), so a batch contains a single row-slice if it has more rows than this.
+
+        prefetch: int, default=1
+            Number of batches read in the background while the caller processes the current one. At most
+            ``prefetch + 1`` batches are held in memory at once. Zero reads each batch only when it is requested.
+
+        Returns
+        -------
+        Iterator[VersionedItem]
+            One VersionedItem per batch, all from the version of the symbol resolved when iter_read is called. The
+            arguments are checked, and an exception raised for a missing symbol or version, by the call itself.
+
+        Examples
+        --------
+
+        >>> lib.write("symbol", pd.DataFrame({"column": np.arange(250_000)}))
+        >>> [len(item.data) for item in lib.iter_read("symbol", rows_per_batch=100_000)]
+        [100000, 100000, 50000]
+        """
+        return self._nvs.iter_read(
+            symbol=symbol,
+            as_of=as_of,
+            date_range=date_range,
+            columns=columns,
+            query_builder=query_builder,
+            rows_per_batch=rows_per_batch,
+            prefetch=prefetch,
+        )
+
+    def read_asof_join(
+        self,
+        left_symbol: str,
+        right_symbol: str,
+        by: Optional[str] = None,
+        tolerance: Optional[Union[pd.Timedelta, str]] = None,
+        left_as_of: Optional[AsOf] = None,
+        right_as_of: Optional[AsOf] = None,
+        date_range: Optional[Tuple[Optional[Timestamp], Optional[Timestamp]]] = None,
+        columns: Optional[List[str]] = None,
+        right_columns: Optional[List[str]] = None,
+        query_builder: Optional[QueryBuilder] = None,
+    ) -> VersionedItem:
+        """
+        Read a symbol with the columns of another symbol joined to each row as of its index value. Each row of
+        ``left_symbol`` is joined to the last row of ``right_symbol`` with an index value at or before its own, as with
+        ``pd.merge_asof(left, right, left_index=True, right_index=True, by=by, tolerance=tolerance)``.
+
+        The join is performed as the row-slices of ``left_symbol`` are read, and only the row-slices of
+        ``right_symbol`` that can be joined to the rows being read are fetched from storage, so joining a short
+        date range of the left symbol to a long history does not read the whole history. Each row-slice of
+        ``right_symbol`` is read when the first row-slice of ``left_symbol`` that can be joined to it is processed, and
+        released once all of them have been, so only the part of ``right_symbol`` spanned by the row-slices of
+        ``left_symbol`` being processed is held in memory. With ``by`` and no ``tolerance``, a row can be joined to
+        any earlier row of ``right_symbol``, so all of the row-slices before those being processed are held. Use
+        ``tolerance`` and ``right_columns`` to limit it.
+
+        As some rows may have no match, numeric and bool columns of ``right_symbol`` are returned as float64 columns
+        holding NaN for unmatched rows, timestamp columns hold NaT, and string columns hold None.
+
+        Parameters
+        ----------
+        left_symbol : str
+            Symbol to read. Must have a timestamp index.
+
+        right_symbol : str
+            Symbol whose columns are joined. Must have a timestamp index and be sorted.
+
+        by : Optional[str], default=None
+            String or integer column present in both symbols. If provided, rows are only joined to rows of
+            ``right_symbol`` with the same value in this column.
+
+        tolerance : Optional[Union[pd.Timedelta, str]], default=None
+            Maximum time by which the joined row of ``right_symbol`` may precede the row it is joined to.
+
+        left_as_of : AsOf, default=None
+            Version of ``left_symbol`` to read. See documentation on `read`.
+
+        right_as_of : AsOf, default=None
+            Version of ``right_symbol`` to join. See documentation on `read`.
+
+        date_range: Tuple[Optional[Timestamp], Optional[Timestamp]], default=None
+            Date range of ``left_symbol`` to read. See documentation on `read`.
+
+        columns: List[str], default=None
+            Columns of ``left_symbol`` to return.
+
+        right_columns: List[str], default=None
+            Columns of ``right_symbol`` to join. Defaults to all of its columns other than ``by``. The joined columns
+            must not also be columns of ``left_symbol``.
+
+        query_builder: Optional[QueryBuilder], default=None
+            Filters and projections to apply to ``left_symbol`` before the join.
+
+        Returns
+        -------
+        VersionedItem
+            The version of ``left_symbol`` that was read, with the joined data.
+
+        Examples
+        --------
+
+        >>> trades = pd.DataFrame({"ticker": ["A", "B"], "quantity": [10, 20]}, index=pd.to_datetime(["2024-01-01 10:00:01", "2024-01-01 10:00:03"]))
+        >>> quotes = pd.DataFrame({"ticker": ["A", "B", "A"], "bid": [1.0, 2.0, 1.5]}, index=pd.to_datetime(["2024-01-01 10:00:00", "2024-01-01 10:00:01", "2024-01-01 10:00:02"]))
+        >>> lib.write("trades", trades)
+        >>> lib.write("quotes", quotes)
+        >>> lib.read_asof_join("trades", "quotes", by="ticker").data
+                            ticker  quantity  bid
+        2024-01-01 10:00:01      A        10  1.0
+        2024-01-01 10:00:03      B        20  2.0
+        """
+        return self._nvs.read_asof_join(
+            left_symbol=left_symbol,
+            right_symbol=right_symbol,
+            by=by,
+            tolerance=None if tolerance is None else pd.Timedelta(tolerance).value,
+            left_as_of=left_as_of,
+            right_as_of=right_as_of,
+            date_range=date_range,
+            columns=columns,
+            right_columns=right_columns,
+            query_builder=query_builder,
         )
 
     def read_batch(
-        self, symbols: List[Union[str, ReadRequest]], query_builder: Optional[QueryBuilder] = None
-    ) -> List[Union[VersionedItem, DataError]]:
+        self,
+        symbols: List[Union[str, ReadRequest]],
+        query_builder: Optional[QueryBuilder] = None,
+        output_format: str = "pandas",
+        symbol_column: Optional[str] = None,
+    ) -> Union[List[Union[VersionedItem, DataError]], Any]:
         """
         Reads multiple symbols.
 
+        The symbols are read concurrently. When a ``query_builder`` is given, the processing pipelines of all the
+        symbols run together on the same thread pools, so reading many small symbols is not dominated by per-symbol
+        overheads.
+
         Parameters
         ----------
         symbols : List[Union[str, ReadRequest]]
@@ -1056,6 +1423,15 @@ class Library:
             A single QueryBuilder to apply to all the dataframes before they are returned. If this argument is passed
             then none of the ``symbols`` may have their own query_builder specified in their request.
 
+        output_format: str, default="pandas"
+            Format of the returned data, applied to all the symbols. See `read` for the supported formats.
+
+        symbol_column: Optional[str], default=None
+            If given, return the data of all the symbols concatenated into a single DataFrame (or Arrow table), with
+            a column of this name holding the symbol each row was read from, rather than a list of results. The rows
+            of each symbol appear in the order of the ``symbols`` parameter. Useful with a ``query_builder`` that
+            screens a large universe of symbols down to a few rows each.
+
         Returns
         -------
         List[Union[VersionedItem, DataError]]
@@ -1063,11 +1439,15 @@ class Library:
             If the specified version does not exist, a DataError object is returned, with symbol, version_request_type,
             version_request_data properties, error_code, error_category, and exception_string properties. If a key error or
             any other internal exception occurs, the same DataError object is also returned.
+            If ``symbol_column`` is given, the concatenated data is returned instead.
 
         Raises
         ------
         ArcticInvalidApiUsageException
-            If kwarg query_builder and per-symbol query builders both used.
+            If kwarg query_builder and per-symbol query builders both used, or if ``symbol_column`` is the name of a
+            column in the data.
+        NoDataFoundException
+            If ``symbol_column`` is given and any of the reads fails.
 
         Examples
         --------
@@ -1136,10 +1516,21 @@ class Library:
                     f"Unsupported item in the symbols argument s=[{s}] type(s)=[{type(s)}]. Only [str] and"
                     " [ReadRequest] are supported."
                 )
-        throw_on_error = False
-        return self._nvs._batch_read_to_versioned_items(
-            symbol_strings, as_ofs, date_ranges, row_ranges, columns, query_builder or query_builders, throw_on_error
+        # Errors cannot be represented in the concatenated data, so are raised instead
+        throw_on_error = symbol_column is not None
+        versioned_items = self._nvs._batch_read_to_versioned_items(
+            symbol_strings,
+            as_ofs,
+            date_ranges,
+            row_ranges,
+            columns,
+            query_builder or query_builders,
+            throw_on_error,
+            kwargs={"output_format": output_format},
         )
+        if symbol_column is None:
+            return versioned_items
+        return _concat_with_symbol_column(versioned_items, symbol_column, output_format)
 
     def read_metadata(self, symbol: str, as_of: Optional[AsOf] = None) -> VersionedItem:
         """
@@ -1765,6 +2156,54 @@ class Library:
         """
         return self._nvs.defragment_symbol_data(symbol, segment_size)
 
+    def coalesce(
+        self, symbols: List[str], object_bytes: Optional[int] = None, prune_previous_versions: bool = False
+    ) -> List[VersionedItem]:
+        """
+        Packs the data segments of each symbol into fewer, larger storage objects, without changing its data.
+
+        Symbols built up from many small appends are stored as many small objects, and reading them takes one request
+        to the storage per object. Coalescing packs the segments of the latest version of each symbol, in index order,
+        into objects of up to `object_bytes` bytes, and writes a new version referencing them. Each segment is then
+        read with a ranged read of its object, so reading a date range fetches one object per block of time. Ranged
+        reads are supported by S3, LMDB and in-memory storages.
+
+        Segments already packed are left as they are, so coalescing a symbol regularly only packs the segments
+        appended since it was last coalesced.
+
+        Coalescing changes the storage format of the symbol. Versions of ArcticDB that predate it cannot read the
+        versions written, nor later versions of the symbol that still reference the packed segments, so only
+        coalesce symbols that are read solely by clients that support it. Segments of 4GB or more cannot be packed.
+
+        Parameters
+        ----------
+        symbols: `List[str]`
+            Symbols to coalesce.
+        object_bytes: `Optional[int]`, default=None
+            Maximum size of each object in bytes. If not provided, the runtime config option
+            SymbolDataCoalesce.ObjectBytes is used, which defaults to 64MB.
+        prune_previous_versions: `bool`, default=False
+            Removes previous (non-snapshotted) versions from the database, deleting the objects of the segments that
+            were packed.
+
+        Returns
+        -------
+        List[VersionedItem]
+            The version of each symbol referencing the packed segments, in the order of `symbols`. Symbols with fewer
+            than two segments to pack are left unchanged, and their latest version is returned.
+
+        Examples
+        --------
+        >>> for i in range(100):
+        ...     lib.append("ticks", pd.DataFrame({"price": [float(i)]}, index=[pd.Timestamp(i)]))
+        >>> lib.coalesce(["ticks"], prune_previous_versions=True)
+        >>> lib.read("ticks").data  # The same data, read from one object rather than 100
+        """
+        return [
+            self._nvs.coalesce_symbol_data(symbol, object_bytes, prune_previous_version=prune_previous_versions)
+            for symbol in symbols
+        ]
+
     @property
     def name(self):
         """The name of this library."""
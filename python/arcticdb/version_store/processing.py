@@ -12,7 +12,7 @@ from math import inf
 import numpy as np
 import pandas as pd
 
-from typing import Dict, NamedTuple, Tuple, Union
+from typing import Dict, NamedTuple, Optional, Tuple, Union
 
 from arcticdb.exceptions import ArcticNativeException, UserInputException
 from arcticdb.version_store._normalization import normalize_dt_range_to_ts
@@ -25,6 +25,11 @@ from arcticdb_ext.version_store import FilterClause as _FilterClause
 from arcticdb_ext.version_store import ProjectClause as _ProjectClause
 from arcticdb_ext.version_store import GroupByClause as _GroupByClause
 from arcticdb_ext.version_store import AggregationClause as _AggregationClause
+from arcticdb_ext.version_store import ResampleClause as _ResampleClause
+from arcticdb_ext.version_store import WindowClause as _WindowClause
+from arcticdb_ext.version_store import WindowType as _WindowType
+from arcticdb_ext.version_store import SortValuesClause as _SortValuesClause
+from arcticdb_ext.version_store import MergeSortedValuesClause as _MergeSortedValuesClause
 from arcticdb_ext.version_store import RowRangeClause as _RowRangeClause
 from arcticdb_ext.version_store import DateRangeClause as _DateRangeClause
 from arcticdb_ext.version_store import RowRangeType as _RowRangeType
@@ -216,6 +221,14 @@ class ExpressionNode:
     def notnull(self):
         return ExpressionNode.compose(self, _OperationType.NOTNULL, None)
 
+    @property
+    def str(self):
+        """
+        String functions, applied to the column or expression with the same syntax as the Pandas ``Series.str``
+        accessor. See `StringMethods`.
+        """
+        return StringMethods(self)
+
     def __str__(self):
         return self.get_name()
 
@@ -223,7 +236,13 @@ class ExpressionNode:
         if not self.name:
             if self.operator == COLUMN:
                 self.name = 'Column["{}"]'.format(self.left)
-            elif self.operator in [_OperationType.ABS, _OperationType.NEG, _OperationType.NOT]:
+            elif self.operator in [
+                _OperationType.ABS,
+                _OperationType.NEG,
+                _OperationType.NOT,
+                _OperationType.STRLEN,
+                _OperationType.LOWER,
+            ]:
                 self.name = "{}({})".format(self.operator.name, self.left)
             else:
                 if isinstance(self.left, ExpressionNode):
@@ -238,6 +257,55 @@ class ExpressionNode:
         return self.name
 
 
+class StringMethods:
+    """
+    String functions usable in filters and projections, for example:
+
+        >>> q = adb.QueryBuilder()
+        >>> q = q[q["ticker"].str.startswith("EUR") & ~q["venue"].str.lower().str.contains("dark")]
+        >>> q = q.apply("ticker_length", q["ticker"].str.len())
+
+    Each function is evaluated once per distinct string in a segment rather than once per row, so string columns with
+    few distinct values are processed quickly however many rows they have. None and NaN values never match the
+    predicates, and are preserved by len (as NaN) and lower.
+
+    Fixed-width string columns, as written with ``dynamic_strings=False``, are supported too. Their strings are
+    converted to UTF-8 once per distinct string before the function is applied, and lower returns a dynamic string
+    column.
+    """
+
+    def __init__(self, node: "ExpressionNode"):
+        self._node = node
+
+    def _predicate(self, pattern, operator):
+        check(isinstance(pattern, str), f"String function argument must be a string, received {type(pattern)}")
+        return self._node._apply(pattern, operator)
+
+    def startswith(self, prefix: str) -> "ExpressionNode":
+        """Whether each string starts with prefix."""
+        return self._predicate(prefix, _OperationType.STARTSWITH)
+
+    def contains(self, pat: str, regex: bool = True) -> "ExpressionNode":
+        """
+        Whether each string contains pat. As in Pandas, pat is a regular expression, searched for anywhere in the
+        string, unless regex is False, in which case it is a literal substring. Regular expressions are matched with
+        PCRE, whose syntax is close to that of the Python re module.
+        """
+        return self._predicate(pat, _OperationType.REGEX_SEARCH if regex else _OperationType.CONTAINS)
+
+    def match(self, pat: str) -> "ExpressionNode":
+        """Whether each string matches the regular expression pat at its start, as re.match does."""
+        return self._predicate(pat, _OperationType.REGEX_MATCH)
+
+    def len(self) -> "ExpressionNode":
+        """The number of characters in each string, as a float64 column with NaN for None and NaN values."""
+        return ExpressionNode.compose(self._node, _OperationType.STRLEN, None)
+
+    def lower(self) -> "ExpressionNode":
+        """Each string with its ASCII characters converted to lowercase, leaving other characters unchanged."""
+        return ExpressionNode.compose(self._node, _OperationType.LOWER, None)
+
+
 def is_supported_sequence(obj):
     return isinstance(obj, (list, set, frozenset, tuple, np.ndarray))
 
@@ -300,6 +368,60 @@ class PythonRowRangeClause(NamedTuple):
     end: int = None
 
 
+class PythonResampleClause(NamedTuple):
+    rule: str = None
+    bucket_size: int = None
+    aggregations: Dict[str, Union[str, Tuple[str, str]]] = None
+    date_range: Tuple[int, int] = None
+
+
+def _resample_clause_from_python(python_clause: PythonResampleClause):
+    clause = _ResampleClause(python_clause.rule, python_clause.bucket_size)
+    if python_clause.date_range is not None:
+        clause.set_date_range(*python_clause.date_range)
+    if python_clause.aggregations is not None:
+        clause.set_aggregations(python_clause.aggregations)
+    return clause
+
+
+class PythonWindowClause(NamedTuple):
+    window: str = None
+    window_type: _WindowType = None
+    size: int = 0
+    min_periods: int = 1
+    aggregations: Dict[str, Union[str, Tuple[str, str]]] = None
+    date_range: Tuple[int, int] = None
+
+
+def _window_clause_from_python(python_clause: PythonWindowClause):
+    clause = _WindowClause(python_clause.window, python_clause.window_type, python_clause.size, python_clause.min_periods)
+    if python_clause.date_range is not None:
+        clause.set_date_range(*python_clause.date_range)
+    if python_clause.aggregations is not None:
+        clause.set_aggregations(python_clause.aggregations)
+    return clause
+
+
+def _date_ranged_clause_from_python(python_clause: Union[PythonResampleClause, PythonWindowClause]):
+    if isinstance(python_clause, PythonWindowClause):
+        return _window_clause_from_python(python_clause)
+    return _resample_clause_from_python(python_clause)
+
+
+class PythonSortValuesClause(NamedTuple):
+    by: str = None
+    ascending: bool = True
+    limit: Optional[int] = None
+
+
+def _sort_values_clauses_from_python(python_clause: PythonSortValuesClause):
+    # Each row-slice is sorted, and truncated to the limit, before the sorted row-slices are merged
+    return [
+        _SortValuesClause(python_clause.by, python_clause.ascending, python_clause.limit),
+        _MergeSortedValuesClause(python_clause.by, python_clause.ascending, python_clause.limit),
+    ]
+
+
 class QueryBuilder:
     """
     Build a query to process read results with. Syntax is designed to be similar to Pandas:
@@ -341,6 +463,11 @@ class QueryBuilder:
 
         >>> q.isin(1, 2, 3)
 
+    * String functions: str.startswith, str.contains, str.match, str.len, and str.lower, as on Pandas Series. See
+    `StringMethods` for details.
+
+        >>> q = q[q["ticker"].str.startswith("EUR")]
+
     Boolean columns can be filtered on directly:
 
         >>> q = adb.QueryBuilder()
@@ -434,13 +561,19 @@ class QueryBuilder:
 
     def groupby(self, name: str):
         """
-        Group symbol by column name. GroupBy operations must be followed by an aggregation operator. Currently the following five aggregation
+        Group symbol by column name. GroupBy operations must be followed by an aggregation operator. Currently the following aggregation
         operators are supported:
             * "mean" - compute the mean of the group
             * "sum" - compute the sum of the group
             * "min" - compute the min of the group
             * "max" - compute the max of the group
             * "count" - compute the count of group
+            * "count_distinct" or "nunique" - compute the number of distinct values in the group. This is exact for groups
+              with up to 1024 distinct values, and estimated with a HyperLogLog sketch, to within about 1%, above that
+            * "quantile(q)" - compute the q-th quantile of the group for q between 0 and 1, e.g. "quantile(0.99)", with
+              linear interpolation as in Pandas. This is exact for groups with up to about a hundred values, and estimated
+              with a t-digest above that, with the accuracy best towards the extremes
+            * "median" - equivalent to "quantile(0.5)"
 
         For usage examples, see below.
 
@@ -528,10 +661,14 @@ class QueryBuilder:
         return self
 
     def agg(self, aggregations: Dict[str, Union[str, Tuple[str, str]]]):
-        # Only makes sense if previous stage is a group-by
+        # Only makes sense if previous stage is a group-by, a resample, or a window
+        check(
+            len(self.clauses) and isinstance(self.clauses[-1], (_GroupByClause, _ResampleClause, _WindowClause)),
+            f"Aggregation only makes sense after groupby, resample, rolling, or expanding",
+        )
         check(
-            len(self.clauses) and isinstance(self.clauses[-1], _GroupByClause),
-            f"Aggregation only makes sense after groupby",
+            not isinstance(self.clauses[-1], (_ResampleClause, _WindowClause)) or self._python_clauses[-1].aggregations is None,
+            "Aggregations have already been set for this resample, rolling, or expanding, pass them all to a single agg call",
         )
         for k, v in aggregations.items():
             check(isinstance(v, (str, tuple)), f"Values in agg dict expected to be strings or tuples, received {v} of type {type(v)}")
@@ -544,10 +681,296 @@ class QueryBuilder:
                 )
                 aggregations[k] = (v[0], v[1].lower())
 
-        self.clauses.append(_AggregationClause(self.clauses[-1].grouping_column, aggregations))
-        self._python_clauses.append(PythonAggregationClause(aggregations))
+        if isinstance(self.clauses[-1], (_ResampleClause, _WindowClause)):
+            self._python_clauses[-1] = self._python_clauses[-1]._replace(aggregations=aggregations)
+            self.clauses[-1] = _date_ranged_clause_from_python(self._python_clauses[-1])
+        else:
+            self.clauses.append(_AggregationClause(self.clauses[-1].grouping_column, aggregations))
+            self._python_clauses.append(PythonAggregationClause(aggregations))
         return self
 
+    def resample(self, rule: str):
+        """
+        Resample a symbol with a timestamp index into fixed-width time buckets. Resample operations must be followed by
+        an aggregation operator, with the same syntax as for `groupby`. In addition to the aggregation operators
+        supported by `groupby`, resampling supports:
+            * "first" - the first value in the bucket
+            * "last" - the last value in the bucket
+
+        Buckets are aligned to the Unix epoch, are closed on the left, and are labelled with their left boundary. This
+        is equivalent to Pandas resample with closed="left", label="left", and origin="epoch". Buckets containing no
+        rows are not included in the output. Aggregations over string columns are not supported.
+
+        Must be the first clause in the QueryBuilder object, or follow a date_range clause.
+
+        Parameters
+        ----------
+        rule: `str`
+            A fixed frequency Pandas offset alias, such as "5min", "1h", or "1D". Calendar dependent frequencies such
+            as "M" (month end) are not supported.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+            {
+                "price": [1.0, 2.0, 3.0, 4.0],
+            },
+            index=pd.date_range("2024-01-01 09:00", periods=4, freq="30s"),
+        )
+        >>> lib.write("symbol", df)
+        >>> q = adb.QueryBuilder()
+        >>> q = q.resample("1min").agg({"open": ("price", "first"), "high": ("price", "max"), "close": ("price", "last")})
+        >>> lib.read("symbol", query_builder=q).data
+                             open  high  close
+        2024-01-01 09:00:00   1.0   2.0    2.0
+        2024-01-01 09:01:00   3.0   4.0    4.0
+
+        Returns
+        -------
+        QueryBuilder
+            Modified QueryBuilder object.
+        """
+        check(
+            self._can_start_resample(),
+            "Resample only supported as first clause in the pipeline, or directly after a date range",
+        )
+        try:
+            bucket_size = pd.tseries.frequencies.to_offset(rule).nanos
+        except ValueError:
+            raise UserInputException(f"Resample only supports fixed frequency rules such as '1min' or '1h', received {rule}")
+        python_clause = PythonResampleClause(rule=rule, bucket_size=bucket_size, date_range=self._pop_date_range())
+        self.clauses.append(_resample_clause_from_python(python_clause))
+        self._python_clauses.append(python_clause)
+        return self
+
+    def rolling(self, window: Union[int, str], min_periods: Optional[int] = None):
+        """
+        Aggregate each row of a symbol together with the rows preceding it in a rolling window. Rolling operations must
+        be followed by an aggregation operator, with the same syntax as for `groupby`. The supported aggregation
+        operators are "sum", "mean", "min", "max", and "count", and the output contains one row per input row, with the
+        same index, and a float64 column per aggregation.
+
+        This is equivalent to Pandas rolling with the default closed argument. NaN values are skipped, and the output
+        is NaN for rows whose window contains fewer than min_periods non-NaN values. Windows span row-slice boundaries,
+        and row-slices are still processed in parallel. Aggregations over string columns are not supported.
+
+        Must be the first clause in the QueryBuilder object, or follow a date_range clause, in which case only rows in
+        the date range are included in the windows.
+
+        Parameters
+        ----------
+        window: `Union[int, str]`
+            Either a positive number of rows, or a fixed frequency Pandas offset alias, such as "5min" or "1h", for
+            windows covering the duration ending at (and including) each row. Time based windows are only supported on
+            symbols with a sorted timestamp index.
+        min_periods: `Optional[int]`, default=None
+            Minimum number of non-NaN values in a window for its output not to be NaN. Defaults to the window size for
+            windows of a number of rows, and to 1 for time based windows.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+            {
+                "price": [1.0, 2.0, 3.0, 4.0],
+            },
+            index=pd.date_range("2024-01-01 09:00", periods=4, freq="30s"),
+        )
+        >>> lib.write("symbol", df)
+        >>> q = adb.QueryBuilder()
+        >>> q = q.rolling("1min").agg({"total": ("price", "sum"), "high": ("price", "max")})
+        >>> lib.read("symbol", query_builder=q).data
+                             total  high
+        2024-01-01 09:00:00    1.0   1.0
+        2024-01-01 09:00:30    3.0   2.0
+        2024-01-01 09:01:00    5.0   3.0
+        2024-01-01 09:01:30    7.0   4.0
+
+        Returns
+        -------
+        QueryBuilder
+            Modified QueryBuilder object.
+        """
+        check(
+            self._can_start_resample(),
+            "Rolling only supported as first clause in the pipeline, or directly after a date range",
+        )
+        if isinstance(window, (int, np.integer)):
+            check(window > 0, f"Rolling window must be a positive number of rows, received {window}")
+            python_clause = PythonWindowClause(
+                window=str(window),
+                window_type=_WindowType.ROWS,
+                size=int(window),
+                min_periods=int(window) if min_periods is None else min_periods,
+            )
+        else:
+            try:
+                size = pd.tseries.frequencies.to_offset(window).nanos
+            except ValueError:
+                raise UserInputException(
+                    f"Rolling only supports a number of rows or fixed frequency windows such as '5min' or '1h', received {window}"
+                )
+            python_clause = PythonWindowClause(
+                window=window,
+                window_type=_WindowType.TIME,
+                size=size,
+                min_periods=1 if min_periods is None else min_periods,
+            )
+        check(python_clause.min_periods >= 0, f"min_periods must not be negative, received {python_clause.min_periods}")
+        python_clause = python_clause._replace(date_range=self._pop_date_range())
+        self.clauses.append(_window_clause_from_python(python_clause))
+        self._python_clauses.append(python_clause)
+        return self
+
+    def expanding(self, min_periods: int = 1):
+        """
+        Aggregate each row of a symbol together with all of the rows preceding it. Expanding operations must be
+        followed by an aggregation operator, with the same syntax and supported operators as for `rolling`.
+
+        This is equivalent to Pandas expanding. As the output for each row depends on every row before it, the
+        row-slices of the symbol are processed in order rather than in parallel.
+
+        Must be the first clause in the QueryBuilder object, or follow a date_range clause, in which case the windows
+        start from the beginning of the date range.
+
+        Parameters
+        ----------
+        min_periods: `int`, default=1
+            Minimum number of non-NaN values in a window for its output not to be NaN.
+
+        Examples
+        --------
+        >>> q = adb.QueryBuilder()
+        >>> q = q.expanding().agg({"cumulative_volume": ("volume", "sum")})
+
+        Returns
+        -------
+        QueryBuilder
+            Modified QueryBuilder object.
+        """
+        check(
+            self._can_start_resample(),
+            "Expanding only supported as first clause in the pipeline, or directly after a date range",
+        )
+        check(min_periods >= 0, f"min_periods must not be negative, received {min_periods}")
+        python_clause = PythonWindowClause(
+            window="expanding",
+            window_type=_WindowType.EXPANDING,
+            min_periods=min_periods,
+            date_range=self._pop_date_range(),
+        )
+        self.clauses.append(_window_clause_from_python(python_clause))
+        self._python_clauses.append(python_clause)
+        return self
+
+    def sort(self, by: str, ascending: bool = True, limit: Optional[int] = None):
+        """
+        Sort the rows of a symbol by the values of a numeric or timestamp column, optionally keeping only the first
+        limit rows. Rows keep their index values, and rows with equal values keep their order in the symbol. NaN and
+        missing values are ordered last whatever the sort order. Sorting by string columns is not supported.
+
+        Each row-slice is sorted, and truncated to the limit, in parallel before the sorted row-slices are merged. With
+        a limit, each row-slice is reduced with a heap bounded by the limit, so memory usage depends on the limit and
+        the number of row-slices rather than the number of rows in the symbol.
+
+        Parameters
+        ----------
+        by: `str`
+            Name of the column to sort by.
+        ascending: `bool`, default=True
+            Sort in ascending order if True, and descending order otherwise.
+        limit: `Optional[int]`, default=None
+            Maximum number of rows to return, from the start of the sorted rows.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({"price": [3.0, 1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=3))
+        >>> lib.write("symbol", df)
+        >>> q = adb.QueryBuilder()
+        >>> q = q.sort("price", limit=2)
+        >>> lib.read("symbol", query_builder=q).data
+                    price
+        2024-01-02    1.0
+        2024-01-03    2.0
+
+        Returns
+        -------
+        QueryBuilder
+            Modified QueryBuilder object.
+        """
+        check(isinstance(by, str), f"Sort column must be a string, received {by} of type {type(by)}")
+        if limit is not None:
+            check(
+                isinstance(limit, (int, np.integer)) and limit >= 0,
+                f"Sort limit must be a non-negative integer, received {limit}",
+            )
+            limit = int(limit)
+        python_clause = PythonSortValuesClause(by=by, ascending=bool(ascending), limit=limit)
+        self.clauses.extend(_sort_values_clauses_from_python(python_clause))
+        self._python_clauses.append(python_clause)
+        return self
+
+    def nlargest(self, n: int, column: str):
+        """
+        Return the n rows with the largest values in a column, in descending order. Equivalent to
+        `sort(column, ascending=False, limit=n)`, see `sort` for details.
+
+        Unlike Pandas, rows with NaN values are returned after all other rows if there are fewer than n rows without
+        NaN values in the column.
+
+        Parameters
+        ----------
+        n: `int`
+            Number of rows to return.
+        column: `str`
+            Name of the column to order by.
+
+        Examples
+        --------
+        >>> q = adb.QueryBuilder()
+        >>> q = q.nlargest(100, "trade_size")
+
+        Returns
+        -------
+        QueryBuilder
+            Modified QueryBuilder object.
+        """
+        return self.sort(column, ascending=False, limit=n)
+
+    def nsmallest(self, n: int, column: str):
+        """
+        Return the n rows with the smallest values in a column, in ascending order. Equivalent to
+        `sort(column, ascending=True, limit=n)`, see `sort` for details.
+
+        Unlike Pandas, rows with NaN values are returned after all other rows if there are fewer than n rows without
+        NaN values in the column.
+
+        Parameters
+        ----------
+        n: `int`
+            Number of rows to return.
+        column: `str`
+            Name of the column to order by.
+
+        Returns
+        -------
+        QueryBuilder
+            Modified QueryBuilder object.
+        """
+        return self.sort(column, ascending=True, limit=n)
+
+    def _can_start_resample(self):
+        return not len(self.clauses) or (len(self.clauses) == 1 and isinstance(self.clauses[0], _DateRangeClause))
+
+    def _pop_date_range(self):
+        # Date ranges preceding a resample or window are applied by that clause itself, as it needs to structure the
+        # processing of the data
+        if len(self.clauses) and isinstance(self.clauses[0], _DateRangeClause):
+            date_range = (self.clauses[0].start, self.clauses[0].end)
+            self.clauses = []
+            self._python_clauses = []
+            return date_range
+        return None
+
     # TODO: specify type of other must be QueryBuilder with from __future__ import annotations once only Python 3.7+
     # supported
     def then(self, other):
@@ -568,6 +991,19 @@ class QueryBuilder:
             not len(other.clauses) or not isinstance(other.clauses[0], _DateRangeClause),
             "In QueryBuilder.then: Date range only supported as first clause in the pipeline",
         )
+        if len(other.clauses) and isinstance(other.clauses[0], (_ResampleClause, _WindowClause)):
+            check(
+                self._can_start_resample(),
+                "In QueryBuilder.then: Resample, rolling, and expanding only supported as first clause in the pipeline, or directly after a date range",
+            )
+            date_range = self._pop_date_range()
+            if date_range is not None:
+                python_clause = other._python_clauses[0]._replace(date_range=date_range)
+                self.clauses.append(_date_ranged_clause_from_python(python_clause))
+                self._python_clauses.append(python_clause)
+                self.clauses.extend(other.clauses[1:])
+                self._python_clauses.extend(other._python_clauses[1:])
+                return self
         self.clauses.extend(other.clauses)
         self._python_clauses.extend(other._python_clauses)
         return self
@@ -669,6 +1105,12 @@ class QueryBuilder:
                     self.clauses.append(_RowRangeClause(python_clause.row_range_type, python_clause.n))
             elif isinstance(python_clause, PythonDateRangeClause):
                 self.clauses.append(_DateRangeClause(python_clause.start, python_clause.end))
+            elif isinstance(python_clause, PythonResampleClause):
+                self.clauses.append(_resample_clause_from_python(python_clause))
+            elif isinstance(python_clause, PythonWindowClause):
+                self.clauses.append(_window_clause_from_python(python_clause))
+            elif isinstance(python_clause, PythonSortValuesClause):
+                self.clauses.extend(_sort_values_clauses_from_python(python_clause))
             else:
                 raise ArcticNativeException(
                     f"Unrecognised clause type {type(python_clause)} when unpickling QueryBuilder"
@@ -701,7 +1143,14 @@ class QueryBuilder:
                 clause.set_pipeline_optimisation(_Optimisation.MEMORY)
 
     def needs_post_processing(self):
-        return not any(isinstance(clause, (_RowRangeClause, _DateRangeClause)) for clause in self.clauses)
+        return not any(
+            isinstance(clause, (_RowRangeClause, _DateRangeClause, _ResampleClause, _WindowClause)) for clause in self.clauses
+        )
+
+    def processes_rows_independently(self):
+        # True if applying this QueryBuilder to consecutive row ranges and concatenating the results is equivalent to
+        # applying it to the whole symbol
+        return all(isinstance(clause, (_FilterClause, _ProjectClause)) for clause in self.clauses)
 
 
 CONSTRUCTOR_MAP = {
@@ -0,0 +1,65 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+from arcticdb.options import LibraryOptions
+from arcticdb.storage_fixtures.s3 import MotoS3StorageFixtureFactory
+from arcticdb.version_store.library import ReadRequest
+from arcticdb_ext import set_config_int, unset_config_int
+
+from .common import *
+
+
+class S3ColumnReads:
+    """
+    Reads a few columns of wide row slices from a Moto S3 server, with whole segments read (prefix of 0 bytes) or only
+    the encoded fields of the columns read with ranged requests (see S3Storage.ColumnReadPrefixBytes).
+    """
+
+    number = 3
+    timeout = 6000
+
+    ROWS = 20_000
+    COLS = 500
+    NUM_SYMBOLS = 2
+
+    params = ([0, 1 << 20], [3, 50, 500])
+    param_names = ["prefix_bytes", "num_columns"]
+
+    def setup(self, prefix_bytes, num_columns):
+        self.factory = MotoS3StorageFixtureFactory(use_ssl=False)
+        self.factory.__enter__()
+        self.storage = self.factory.create_fixture()
+        self.ac = self.storage.create_arctic()
+        # A single column slice, so that each segment holds all the columns of its rows
+        self.lib = self.ac.create_library(
+            "s3_column_reads", library_options=LibraryOptions(columns_per_segment=S3ColumnReads.COLS)
+        )
+
+        df = generate_random_floats_dataframe_with_index(S3ColumnReads.ROWS, S3ColumnReads.COLS)
+        for sym in range(S3ColumnReads.NUM_SYMBOLS):
+            self.lib.write(f"{sym}_sym", df)
+
+        self.columns = list(df.columns[:num_columns])
+        set_config_int("S3Storage.ColumnReadPrefixBytes", prefix_bytes)
+
+    def teardown(self, prefix_bytes, num_columns):
+        unset_config_int("S3Storage.ColumnReadPrefixBytes")
+        del self.lib
+        del self.ac
+        self.storage.__exit__(None, None, None)
+        self.factory.__exit__(None, None, None)
+
+    def time_read_columns(self, prefix_bytes, num_columns):
+        self.lib.read("0_sym", columns=self.columns).data
+
+    def peakmem_read_columns(self, prefix_bytes, num_columns):
+        self.lib.read("0_sym", columns=self.columns).data
+
+    def time_read_batch_columns(self, prefix_bytes, num_columns):
+        self.lib.read_batch(
+            [ReadRequest(f"{sym}_sym", columns=self.columns) for sym in range(S3ColumnReads.NUM_SYMBOLS)]
+        )
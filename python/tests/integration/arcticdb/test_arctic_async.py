@@ -0,0 +1,89 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from arcticdb import AsyncLibrary, QueryBuilder, ReadRequest
+from arcticdb_ext.storage import NoDataFoundException
+from arcticdb.util.test import assert_frame_equal
+from arcticdb_ext.version_store import DataError
+
+
+def test_async_write_read_append(arctic_library):
+    df = pd.DataFrame({"col": np.arange(10)}, index=pd.date_range("2024-01-01", periods=10))
+
+    async def run():
+        async with AsyncLibrary(arctic_library) as lib:
+            await lib.write("sym", df[:5], metadata="meta")
+            await lib.append("sym", df[5:])
+            return await lib.read("sym"), await lib.read("sym", as_of=0), await lib.list_versions("sym")
+
+    latest, first, versions = asyncio.run(run())
+    assert_frame_equal(df, latest.data)
+    assert latest.version == 1
+    assert_frame_equal(df[:5], first.data)
+    assert first.metadata == "meta"
+    assert sorted(version.version for version in versions) == [0, 1]
+
+
+@pytest.mark.parametrize("max_read_batch_size", (1, 7, 1000))
+def test_async_concurrent_reads(arctic_library, max_read_batch_size):
+    num_symbols = 20
+    for i in range(num_symbols):
+        arctic_library.write(f"sym_{i}", pd.DataFrame({"col": np.arange(i + 1)}))
+
+    q = QueryBuilder()
+    q = q[q["col"] > 0]
+
+    async def run():
+        async with AsyncLibrary(arctic_library, max_read_batch_size=max_read_batch_size) as lib:
+            reads = [lib.read(f"sym_{i}") for i in range(num_symbols)]
+            reads += [lib.read(f"sym_{i}", query_builder=q, columns=["col"]) for i in range(num_symbols)]
+            return await asyncio.gather(*reads)
+
+    items = asyncio.run(run())
+    for i in range(num_symbols):
+        assert items[i].symbol == f"sym_{i}"
+        assert_frame_equal(pd.DataFrame({"col": np.arange(i + 1)}), items[i].data)
+        filtered = items[num_symbols + i].data
+        assert filtered["col"].tolist() == list(range(1, i + 1))
+
+
+def test_async_read_errors_match_sync_read(arctic_library):
+    arctic_library.write("sym", pd.DataFrame({"col": [1, 2, 3]}))
+
+    async def run():
+        async with AsyncLibrary(arctic_library) as lib:
+            return await asyncio.gather(
+                lib.read("sym"), lib.read("sym", as_of=10), lib.read("missing"), return_exceptions=True
+            )
+
+    found, wrong_version, missing = asyncio.run(run())
+    assert_frame_equal(pd.DataFrame({"col": [1, 2, 3]}), found.data)
+    assert isinstance(wrong_version, NoDataFoundException)
+    assert isinstance(missing, NoDataFoundException)
+
+
+def test_async_read_batch(arctic_library):
+    arctic_library.write("sym", pd.DataFrame({"col": [1, 2, 3]}))
+
+    async def run():
+        async with AsyncLibrary(arctic_library) as lib:
+            return await lib.read_batch(["sym", ReadRequest("sym", as_of=10)])
+
+    item, error = asyncio.run(run())
+    assert_frame_equal(pd.DataFrame({"col": [1, 2, 3]}), item.data)
+    assert isinstance(error, DataError)
+
+
+def test_async_invalid_batch_size(arctic_library):
+    with pytest.raises(ValueError):
+        AsyncLibrary(arctic_library, max_read_batch_size=0)
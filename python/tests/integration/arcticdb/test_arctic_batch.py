@@ -9,7 +9,7 @@ import pytz
 from arcticdb_ext.exceptions import ErrorCode, ErrorCategory
 
 from arcticdb.version_store import VersionedItem as PythonVersionedItem
-from arcticdb_ext.storage import KeyType
+from arcticdb_ext.storage import KeyType, NoDataFoundException
 from arcticdb_ext.version_store import VersionRequestType
 
 from arcticdb.options import LibraryOptions
@@ -23,12 +23,12 @@ from datetime import datetime, date, timezone, timedelta
 import numpy as np
 from arcticdb.util.test import (
     assert_frame_equal,
+    config_context,
     distinct_timestamps,
     random_strings_of_length,
     random_floats,
 )
 from arcticdb.util._versions import IS_PANDAS_TWO
-from arcticdb_ext import set_config_int
 
 import random
 import threading
@@ -716,6 +716,59 @@ def test_read_batch_date_ranges_dates_not_times(arctic_library):
     )
 
 
+@pytest.mark.parametrize("shared_pipeline", (0, 1))
+def test_read_batch_query_builder_many_symbols(arctic_library, shared_pipeline):
+    lib = arctic_library
+    num_symbols = 50
+    lib.write_batch(
+        [
+            WritePayload(f"s{i}", pd.DataFrame({"a": np.arange(i, i + 10), "b": np.ones(10, dtype=np.int64)}))
+            for i in range(num_symbols)
+        ]
+    )
+    q = QueryBuilder()
+    q = q[q["a"] >= 20].groupby("a").agg({"b": "sum"})
+    with config_context("VersionStore.SharedBatchPipeline", shared_pipeline):
+        batch = lib.read_batch([f"s{i}" for i in range(num_symbols)] + ["missing"], query_builder=q)
+
+    for i in range(num_symbols):
+        expected = [value for value in range(i, i + 10) if value >= 20]
+        assert batch[i].symbol == f"s{i}"
+        if expected:
+            assert sorted(batch[i].data.index.tolist()) == expected
+            assert (batch[i].data["b"] == 1).all()
+        else:
+            assert batch[i].data.empty
+    assert isinstance(batch[num_symbols], DataError)
+    assert batch[num_symbols].error_code == ErrorCode.E_NO_SUCH_VERSION
+
+
+def test_read_batch_symbol_column(arctic_library):
+    lib = arctic_library
+    lib.write("s1", pd.DataFrame({"a": [3, 5, 7]}, index=pd.date_range("2024-01-01", periods=3)))
+    lib.write("s2", pd.DataFrame({"a": [4, 6, 8]}, index=pd.date_range("2024-01-02", periods=3)))
+    q = QueryBuilder()
+    q = q[q["a"] > 4]
+
+    result = lib.read_batch(["s1", "s2"], query_builder=q, symbol_column="symbol")
+
+    expected = pd.DataFrame(
+        {"a": [5, 7, 6, 8], "symbol": ["s1", "s1", "s2", "s2"]},
+        index=pd.DatetimeIndex(["2024-01-02", "2024-01-03", "2024-01-03", "2024-01-04"]),
+    )
+    assert_frame_equal(expected, result, check_freq=False)
+
+
+def test_read_batch_symbol_column_errors(arctic_library):
+    lib = arctic_library
+    lib.write("s1", pd.DataFrame({"a": [3, 5, 7]}))
+
+    with pytest.raises(ArcticInvalidApiUsageException):
+        lib.read_batch(["s1"], symbol_column="a")
+    with pytest.raises(NoDataFoundException):
+        lib.read_batch(["s1", "s2"], symbol_column="symbol")
+
+
 def test_read_batch_overall_query_builder_and_per_request_query_builder_raises(arctic_library):
     lib = arctic_library
 
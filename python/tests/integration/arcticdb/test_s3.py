@@ -47,4 +47,26 @@ def test_s3_running_on_aws_fast_check(lib_name, s3_storage_factory, run_on_aws):
     if run_on_aws:
         assert lib_tool.inspect_env_variable("AWS_EC2_METADATA_DISABLED") == None
     else:
-        assert lib_tool.inspect_env_variable("AWS_EC2_METADATA_DISABLED") == "true"
\ No newline at end of file
+        assert lib_tool.inspect_env_variable("AWS_EC2_METADATA_DISABLED") == "true"
+
+
+def test_s3_local_cache(s3_storage, lib_name, tmp_path):
+    ac = s3_storage.create_arctic()
+    ac.create_library(lib_name)
+    df = pd.DataFrame({"a": list(range(100))})
+    ac[lib_name].write("sym", df)
+
+    cache_path = tmp_path / "local_cache"
+    cached_lib = Arctic(f"{s3_storage.arctic_uri}&local_cache={cache_path}:1GB")[lib_name]
+    pd.testing.assert_frame_equal(cached_lib.read("sym").data, df)
+    assert any(path.is_file() for path in cache_path.rglob("*"))
+    pd.testing.assert_frame_equal(cached_lib.read("sym").data, df)
+
+    # Versions are always resolved against S3, so new writes are visible through the cache
+    ac[lib_name].write("sym", df * 2)
+    pd.testing.assert_frame_equal(cached_lib.read("sym").data, df * 2)
+
+
+def test_s3_local_cache_invalid(s3_storage, lib_name):
+    with pytest.raises(ValueError):
+        Arctic(f"{s3_storage.arctic_uri}&local_cache=/tmp/no_size").get_library(lib_name, create_if_missing=True)
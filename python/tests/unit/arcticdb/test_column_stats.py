@@ -2,6 +2,8 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from arcticdb.util.test import config_context
+from arcticdb.version_store.processing import QueryBuilder
 from arcticdb_ext.exceptions import SchemaException, StorageException, UserInputException
 from arcticdb_ext.storage import KeyType, NoDataFoundException
 from arcticdb_ext.version_store import NoSuchVersionException
@@ -289,6 +291,130 @@ def test_column_stats_string_column_minmax(lmdb_version_store_tiny_segment):
         lib.create_column_stats(sym, column_stats_dict)
 
 
+def test_column_stats_bloom_and_distinct(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_column_stats_bloom_and_distinct"
+    generate_symbol(lib, sym)
+
+    column_stats_dict = {"col_0": {"BLOOM", "DISTINCT"}, "col_1": {"BLOOM"}}
+    lib.create_column_stats(sym, column_stats_dict)
+    assert lib.get_column_stats_info(sym) == column_stats_dict
+
+    column_stats = lib.read_column_stats(sym)
+    assert len(column_stats) == 2
+    assert {f"v1.0_BLOOM{word}(col_0)" for word in range(16)}.issubset(column_stats.columns)
+    assert {f"v1.0_DISTINCT{word}(col_0)" for word in range(16)}.issubset(column_stats.columns)
+    assert {f"v1.0_BLOOM{word}(col_1)" for word in range(16)}.issubset(column_stats.columns)
+
+    lib.drop_column_stats(sym, {"col_0": {"BLOOM"}})
+    assert lib.get_column_stats_info(sym) == {"col_0": {"DISTINCT"}, "col_1": {"BLOOM"}}
+
+
+@pytest.fixture
+def prune_on_read():
+    with config_context("ColumnStats.PruneOnRead", 1):
+        yield
+
+
+def test_column_stats_prune_equality_and_isin(lmdb_version_store_tiny_segment, prune_on_read):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_column_stats_prune_equality_and_isin"
+    df = pd.DataFrame(
+        {"col_0": ["a", "a", "b", "c", "d", "d"], "col_1": [1, 2, 3, 4, 5, 6]},
+        index=pd.date_range("2000-01-01", periods=6),
+    )
+    lib.write(sym, df)
+    lib.create_column_stats(sym, {"col_0": {"DISTINCT"}, "col_1": {"BLOOM"}})
+
+    # Delete all but the middle row slice, so that the reads below fail if the column stats do not prune the others
+    lib_tool = lib.library_tool()
+    for key in lib_tool.find_keys_for_id(KeyType.TABLE_DATA, sym):
+        if key.start_index != pd.Timestamp("2000-01-03").value:
+            lib_tool.remove(key)
+
+    q = QueryBuilder()
+    q = q[q["col_0"] == "b"]
+    pd.testing.assert_frame_equal(lib.read(sym, query_builder=q).data, df.iloc[[2]])
+
+    q = QueryBuilder()
+    q = q[q["col_0"].isin(["b", "c", "e"])]
+    pd.testing.assert_frame_equal(lib.read(sym, query_builder=q).data, df.iloc[[2, 3]])
+
+    q = QueryBuilder()
+    q = q[(q["col_1"] == 3) | (q["col_0"] == "c")]
+    pd.testing.assert_frame_equal(lib.read(sym, query_builder=q).data, df.iloc[[2, 3]])
+
+    q = QueryBuilder()
+    q = q[(q["col_1"] == 4.0) & (q["col_0"] != "a")]
+    pd.testing.assert_frame_equal(lib.read(sym, query_builder=q).data, df.iloc[[3]])
+
+    # Predicates the stats cannot answer read every row slice
+    q = QueryBuilder()
+    q = q[q["col_1"] > 2]
+    with pytest.raises((NoDataFoundException, StorageException)):
+        lib.read(sym, query_builder=q)
+
+    # Column stats are only used to prune reads when enabled
+    q = QueryBuilder()
+    q = q[q["col_0"] == "b"]
+    with config_context("ColumnStats.PruneOnRead", 0):
+        with pytest.raises((NoDataFoundException, StorageException)):
+            lib.read(sym, query_builder=q)
+
+
+def test_column_stats_prune_minmax(lmdb_version_store_tiny_segment, prune_on_read):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_column_stats_prune_minmax"
+    df = pd.DataFrame(
+        {"col_1": [1, 2, 3, 4, 5, 6], "col_2": [0.5, 1.5, 2.5, 3.5, np.nan, 5.5]},
+        index=pd.date_range("2000-01-01", periods=6),
+    )
+    lib.write(sym, df)
+    lib.create_column_stats(sym, {"col_1": {"MINMAX"}, "col_2": {"MINMAX"}})
+
+    # Delete the first row slice, so that the reads below fail if the column stats do not prune it
+    lib_tool = lib.library_tool()
+    for key in lib_tool.find_keys_for_id(KeyType.TABLE_DATA, sym):
+        if key.start_index == pd.Timestamp("2000-01-01").value:
+            lib_tool.remove(key)
+
+    q = QueryBuilder()
+    q = q[q["col_1"] > 2]
+    pd.testing.assert_frame_equal(lib.read(sym, query_builder=q).data, df.iloc[2:])
+
+    q = QueryBuilder()
+    q = q[q["col_1"] >= 2.5]
+    pd.testing.assert_frame_equal(lib.read(sym, query_builder=q).data, df.iloc[2:])
+
+    q = QueryBuilder()
+    q = q[(2 < q["col_1"]) & (q["col_1"] <= 4)]
+    pd.testing.assert_frame_equal(lib.read(sym, query_builder=q).data, df.iloc[2:4])
+
+    q = QueryBuilder()
+    q = q[(q["col_1"] == 5) | (q["col_2"] > 3.0)]
+    pd.testing.assert_frame_equal(lib.read(sym, query_builder=q).data, df.iloc[[3, 4, 5]])
+
+    # The first row slice can match these, so they fail
+    q = QueryBuilder()
+    q = q[q["col_1"] < 3]
+    with pytest.raises((NoDataFoundException, StorageException)):
+        lib.read(sym, query_builder=q)
+
+    q = QueryBuilder()
+    q = q[q["col_1"] != 3]
+    with pytest.raises((NoDataFoundException, StorageException)):
+        lib.read(sym, query_builder=q)
+
+
+def test_column_stats_bloom_fixed_width_string_column(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_column_stats_bloom_fixed_width_string_column"
+    lib.write(sym, pd.DataFrame({"col_0": ["a", "b"]}, index=pd.date_range("2000-01-01", periods=2)), dynamic_strings=False)
+
+    with pytest.raises(SchemaException):
+        lib.create_column_stats(sym, {"col_0": {"BLOOM"}})
+
+
 def test_column_stats_duplicated_primary_index(lmdb_version_store_tiny_segment):
     lib = lmdb_version_store_tiny_segment
     sym = "test_column_stats_duplicated_primary_index"
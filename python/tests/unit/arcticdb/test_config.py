@@ -5,8 +5,10 @@ Use of this software is governed by the Business Source License 1.1 included in
 
 As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
 """
+import pandas as pd
 from pickle import loads, dumps
 from arcticdb.config import save_runtime_config, load_runtime_config
+from arcticdb.tools import io_concurrency_stats
 from arcticc.pb2.config_pb2 import RuntimeConfig
 from arcticdb_ext import read_runtime_config, get_config_int, set_config_int
 
@@ -46,3 +48,13 @@ def test_load_runtime_config():
 def test_set_config_int():
     set_config_int("my_value", 25)
     assert get_config_int("my_value") == 25
+
+
+def test_io_concurrency_stats(lmdb_version_store):
+    lmdb_version_store.write("sym", pd.DataFrame({"col": [1, 2, 3]}))
+    lmdb_version_store.read("sym")
+    stats = io_concurrency_stats()
+    assert stats["min_concurrency"] <= stats["concurrency"] <= stats["max_concurrency"]
+    assert stats["concurrency"] > 0
+    assert stats["in_flight"] >= 0
+    assert stats["queue_depth"] >= 0
@@ -10,9 +10,10 @@ import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+from arcticdb.exceptions import UserInputException
 from arcticdb.version_store.processing import QueryBuilder
 from arcticdb_ext.exceptions import InternalException, SchemaException
-from arcticdb.util.test import assert_frame_equal
+from arcticdb.util.test import assert_frame_equal, config_context
 from arcticdb.util.hypothesis import (
     use_of_function_scoped_fixtures_in_hypothesis_checked,
     numeric_type_strategies,
@@ -667,3 +668,119 @@ def test_docstring_example_query_builder_groupby_max_and_mean(lmdb_version_store
     df = pd.DataFrame({"to_mean": (1.1 + 1.4 + 2.5) / 3, "to_max": [2.5]}, index=["group_1"])
     df.index.rename("grouping_column", inplace=True)
     assert_frame_equal(res.data, df)
+
+
+@pytest.mark.parametrize("partial_aggregation", (0, 1))
+def test_partial_aggregation(lmdb_version_store_tiny_segment, partial_aggregation):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_partial_aggregation"
+    # Groups recur across row-slices, and some row-slices only contain NaNs for a group
+    df = DataFrame(
+        {
+            "grouping_column": ["a", "b", "c", "a", "b", "a", "c", "d", "a", "b", "d", "a"],
+            "int_col": np.arange(12, dtype=np.int64),
+            "float_col": [1.5, np.nan, 2.0, np.nan, np.nan, 3.0, -1.0, np.nan, 0.5, 4.0, np.nan, 2.5],
+        }
+    )
+    lib.write(symbol, df)
+    aggregations = {
+        "int_sum": ("int_col", "sum"),
+        "int_mean": ("int_col", "mean"),
+        "float_sum": ("float_col", "sum"),
+        "float_mean": ("float_col", "mean"),
+        "float_min": ("float_col", "min"),
+        "float_max": ("float_col", "max"),
+        "float_count": ("float_col", "count"),
+    }
+    q = QueryBuilder()
+    q = q.groupby("grouping_column").agg(aggregations)
+    with config_context("GroupBy.PartialAggregation", partial_aggregation):
+        received = lib.read(symbol, query_builder=q).data
+    received.sort_index(inplace=True)
+    expected = df.groupby("grouping_column").agg(**aggregations)
+    expected["float_count"] = expected["float_count"].astype(np.uint64)
+    assert_frame_equal(expected, received, check_like=True)
+
+
+@pytest.mark.parametrize("partial_aggregation", (0, 1))
+def test_count_distinct_and_quantile(lmdb_version_store_tiny_segment, partial_aggregation):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_count_distinct_and_quantile"
+    # Values recur within and across row-slices. These groups are small enough for the results to be exact
+    df = DataFrame(
+        {
+            "grouping_column": ["a", "b", "c", "a", "b", "a", "c", "d", "a", "b", "d", "a"],
+            "int_col": [1, 2, 3, 1, 5, 2, 3, 4, 1, 2, 4, 7],
+            "float_col": [1.5, np.nan, 2.0, np.nan, np.nan, 3.0, -1.0, np.nan, 1.5, 4.0, np.nan, 2.5],
+            "string_col": ["x", "y", None, "x", "y", "z", "x", None, "z", "w", None, "x"],
+        }
+    )
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    # Partial aggregation falls back to repartitioning rows when any of the aggregations cannot be partially aggregated
+    q = q.groupby("grouping_column").agg(
+        {
+            "int_nunique": ("int_col", "nunique"),
+            "float_count_distinct": ("float_col", "count_distinct"),
+            "string_nunique": ("string_col", "nunique"),
+            "int_median": ("int_col", "median"),
+            "float_p90": ("float_col", "quantile(0.9)"),
+            "float_p0": ("float_col", "quantile(0)"),
+            "int_sum": ("int_col", "sum"),
+        }
+    )
+    with config_context("GroupBy.PartialAggregation", partial_aggregation):
+        received = lib.read(symbol, query_builder=q).data
+    received.sort_index(inplace=True)
+    grouped = df.groupby("grouping_column")
+    expected = DataFrame(
+        {
+            "int_nunique": grouped["int_col"].nunique().astype(np.uint64),
+            "float_count_distinct": grouped["float_col"].nunique().astype(np.uint64),
+            "string_nunique": grouped["string_col"].nunique().astype(np.uint64),
+            "int_median": grouped["int_col"].median(),
+            "float_p90": grouped["float_col"].quantile(0.9),
+            "float_p0": grouped["float_col"].quantile(0),
+            "int_sum": grouped["int_col"].sum(),
+        }
+    )
+    assert_frame_equal(expected, received, check_like=True)
+
+
+def test_count_distinct_and_quantile_large_groups(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_count_distinct_and_quantile_large_groups"
+    rng = np.random.default_rng(42)
+    num_rows = 20_000
+    # Enough distinct values per group for the distinct counts and quantiles to be estimated
+    df = DataFrame(
+        {
+            "venue": rng.choice(["venue_0", "venue_1"], num_rows),
+            "trader": rng.integers(0, 5_000, num_rows),
+            "latency": rng.lognormal(0, 1, num_rows),
+        }
+    )
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    q = q.groupby("venue").agg({"traders": ("trader", "nunique"), "p50": ("latency", "median"), "p99": ("latency", "quantile(0.99)")})
+    received = lib.read(symbol, query_builder=q).data
+    for venue, group in df.groupby("venue"):
+        num_traders = group["trader"].nunique()
+        assert abs(int(received.loc[venue, "traders"]) - num_traders) <= 0.03 * num_traders
+        # Compare the quantiles of the estimates, as their accuracy depends on the density of values around them
+        for column, quantile in (("p50", 0.5), ("p99", 0.99)):
+            rank = (group["latency"] < received.loc[venue, column]).mean()
+            assert rank == pytest.approx(quantile, abs=0.005)
+
+
+def test_quantile_invalid_usage(lmdb_version_store):
+    lib = lmdb_version_store
+    symbol = "test_quantile_invalid_usage"
+    lib.write(symbol, DataFrame({"grouping_column": ["a", "b"], "col": [1.0, 2.0], "string_col": ["x", "y"]}))
+    for operator in ("quantile(1.5)", "quantile(-0.1)", "quantile(x)", "quantile()", "quantile(0.5"):
+        with pytest.raises(UserInputException):
+            QueryBuilder().groupby("grouping_column").agg({"col": operator})
+    q = QueryBuilder()
+    q = q.groupby("grouping_column").agg({"string_col": "median"})
+    with pytest.raises(SchemaException):
+        lib.read(symbol, query_builder=q)
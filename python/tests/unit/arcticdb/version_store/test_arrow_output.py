@@ -0,0 +1,102 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import pytest
+import numpy as np
+import pandas as pd
+
+from arcticdb.exceptions import ArcticNativeException
+from arcticdb.util.test import assert_frame_equal
+
+pa = pytest.importorskip("pyarrow")
+
+
+def arrow_to_pandas(table, index_column="index"):
+    df = table.to_pandas()
+    for name, column_type in zip(table.column_names, table.schema.types):
+        if pa.types.is_dictionary(column_type):
+            df[name] = df[name].astype(object).where(df[name].notna(), None)
+    return df.set_index(index_column).rename_axis(None)
+
+
+def test_arrow_output_numeric(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_arrow_output_numeric"
+    df = pd.DataFrame(
+        {"int": np.arange(10, dtype=np.int64), "float": np.arange(10, dtype=np.float64), "uint": np.arange(10, dtype=np.uint8)},
+        index=pd.date_range("2024-01-01", periods=10),
+    )
+    lib.write(sym, df)
+    table = lib.read(sym, output_format="arrow").data
+    assert isinstance(table, pa.Table)
+    assert table.column_names == ["index", "int", "float", "uint"]
+    assert table.schema.field("index").type == pa.timestamp("ns")
+    assert table.schema.field("uint").type == pa.uint8()
+    assert_frame_equal(df, arrow_to_pandas(table))
+
+
+def test_arrow_output_strings(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_arrow_output_strings"
+    df = pd.DataFrame(
+        {"str": ["a", "bb", None, "a", np.nan, "ccc", "bb", "", "a"], "int": np.arange(9, dtype=np.int64)},
+        index=pd.date_range("2024-01-01", periods=9),
+    )
+    lib.write(sym, df)
+    table = lib.read(sym, output_format="arrow").data
+    column = table.column("str").combine_chunks()
+    assert pa.types.is_dictionary(column.type)
+    assert column.type.value_type == pa.large_string()
+    # Each distinct string is stored once, however many segments it appears in
+    assert column.dictionary.to_pylist() == ["a", "bb", "ccc", ""]
+    assert column.to_pylist() == ["a", "bb", None, "a", None, "ccc", "bb", "", "a"]
+
+
+def test_arrow_output_with_filters(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_arrow_output_with_filters"
+    df = pd.DataFrame(
+        {"str": [f"s{i % 3}" for i in range(20)], "int": np.arange(20, dtype=np.int64)},
+        index=pd.date_range("2024-01-01", periods=20),
+    )
+    lib.write(sym, df)
+    date_range = (pd.Timestamp("2024-01-04"), pd.Timestamp("2024-01-12"))
+    table = lib.read(sym, date_range=date_range, output_format="arrow").data
+    assert_frame_equal(df.loc[date_range[0]:date_range[1]], arrow_to_pandas(table))
+
+    table = lib.read(sym, row_range=(3, 7), columns=["str"], output_format="arrow").data
+    assert_frame_equal(df[["str"]].iloc[3:7], arrow_to_pandas(table))
+
+
+def test_arrow_output_dynamic_schema_missing_string_column(lmdb_version_store_dynamic_schema):
+    lib = lmdb_version_store_dynamic_schema
+    sym = "test_arrow_output_dynamic_schema_missing_string_column"
+    lib.write(sym, pd.DataFrame({"int": [1, 2]}, index=pd.date_range("2024-01-01", periods=2)))
+    lib.append(sym, pd.DataFrame({"int": [3], "str": ["x"]}, index=pd.date_range("2024-01-03", periods=1)))
+    table = lib.read(sym, output_format="arrow").data
+    assert table.column("str").to_pylist() == [None, None, "x"]
+
+
+def test_arrow_output_batch(lmdb_version_store):
+    lib = lmdb_version_store
+    df_0 = pd.DataFrame({"str": ["a", "b"]}, index=pd.date_range("2024-01-01", periods=2))
+    df_1 = pd.DataFrame({"float": [1.5, np.nan]}, index=pd.date_range("2024-01-01", periods=2))
+    lib.write("sym_0", df_0)
+    lib.write("sym_1", df_1)
+    result = lib.batch_read(["sym_0", "sym_1"], output_format="arrow")
+    assert_frame_equal(df_0, arrow_to_pandas(result["sym_0"].data))
+    assert_frame_equal(df_1, arrow_to_pandas(result["sym_1"].data))
+
+
+def test_arrow_output_invalid(lmdb_version_store):
+    lib = lmdb_version_store
+    sym = "test_arrow_output_invalid"
+    lib.write(sym, {"a": 1}, pickle_on_failure=True)
+    with pytest.raises(ArcticNativeException):
+        lib.read(sym, output_format="arrow")
+    with pytest.raises(ArcticNativeException):
+        lib.read(sym, output_format="polars")
@@ -0,0 +1,148 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import pytest
+import numpy as np
+import pandas as pd
+
+from arcticdb_ext.exceptions import SchemaException, UserInputException
+from arcticdb.exceptions import ArcticNativeException
+from arcticdb.version_store.processing import QueryBuilder
+from arcticdb.util.test import assert_frame_equal
+
+
+def expected_asof_join(left, right, by=None, tolerance=None, right_columns=None):
+    if right_columns is not None:
+        right = right[right_columns + ([by] if by is not None else [])]
+    expected = pd.merge_asof(
+        left,
+        right,
+        left_index=True,
+        right_index=True,
+        by=by,
+        tolerance=None if tolerance is None else pd.Timedelta(tolerance),
+    )
+    # Joined columns can represent unmatched rows
+    for column in right.columns:
+        if column != by and (pd.api.types.is_numeric_dtype(right[column]) or pd.api.types.is_bool_dtype(right[column])):
+            expected[column] = expected[column].astype(np.float64)
+    return expected
+
+
+@pytest.fixture
+def trades_and_quotes():
+    trades = pd.DataFrame(
+        {"ticker": ["A", "B", "A", "C", "B", "A", "B"], "quantity": np.arange(7, dtype=np.int64)},
+        index=pd.to_datetime(["2024-01-01 10:00:01", "2024-01-01 10:00:03", "2024-01-01 10:00:05",
+                              "2024-01-01 10:00:06", "2024-01-01 10:00:09", "2024-01-01 10:00:12",
+                              "2024-01-01 10:00:20"]),
+    )
+    quotes = pd.DataFrame(
+        {
+            "ticker": ["A", "B", "A", "B", "A", "B", "A", "A"],
+            "bid": np.arange(8, dtype=np.float64),
+            "size": np.arange(8, dtype=np.int32),
+            "venue": ["x", "y", None, "y", "z", "x", "y", "z"],
+            "flag": [True, False, True, True, False, False, True, False],
+        },
+        index=pd.to_datetime(["2024-01-01 10:00:00", "2024-01-01 10:00:00", "2024-01-01 10:00:02",
+                              "2024-01-01 10:00:04", "2024-01-01 10:00:05", "2024-01-01 10:00:08",
+                              "2024-01-01 10:00:11", "2024-01-01 10:00:30"]),
+    )
+    return trades, quotes
+
+
+@pytest.mark.parametrize("by", (None, "ticker"))
+@pytest.mark.parametrize("tolerance", (None, 0, 2_000_000_000))
+def test_asof_join(lmdb_version_store_tiny_segment, trades_and_quotes, by, tolerance):
+    lib = lmdb_version_store_tiny_segment
+    trades, quotes = trades_and_quotes
+    lib.write("trades", trades)
+    lib.write("quotes", quotes)
+    right_columns = None if by is not None else ["bid", "size", "venue", "flag"]
+    received = lib.read_asof_join("trades", "quotes", by=by, tolerance=tolerance, right_columns=right_columns).data
+    expected = expected_asof_join(trades, quotes, by, tolerance, right_columns)
+    assert_frame_equal(expected, received)
+
+
+def test_asof_join_integer_by_column(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    left = pd.DataFrame({"id": np.array([1, 2, 1, 3], dtype=np.int64), "a": np.arange(4, dtype=np.float64)},
+                        index=pd.date_range("2024-01-02", periods=4))
+    # The by column may have different integer types in the two symbols
+    right = pd.DataFrame({"id": np.array([2, 1, 2, 1, 3], dtype=np.uint16), "b": np.arange(5, dtype=np.int64)},
+                         index=pd.date_range("2024-01-01", periods=5))
+    lib.write("left", left)
+    lib.write("right", right)
+    received = lib.read_asof_join("left", "right", by="id").data
+    expected = expected_asof_join(left, right.astype({"id": np.int64}), by="id")
+    assert_frame_equal(expected, received)
+
+
+@pytest.mark.parametrize("by", (None, "ticker"))
+@pytest.mark.parametrize("tolerance", (None, 3_000_000_000))
+def test_asof_join_date_range(lmdb_version_store_tiny_segment, trades_and_quotes, by, tolerance):
+    lib = lmdb_version_store_tiny_segment
+    trades, quotes = trades_and_quotes
+    lib.write("trades", trades)
+    lib.write("quotes", quotes)
+    # Only some of the row-slices of quotes are needed, but the prevailing rows may be before the date range
+    date_range = (pd.Timestamp("2024-01-01 10:00:09"), pd.Timestamp("2024-01-01 10:00:12"))
+    right_columns = ["bid", "venue"]
+    received = lib.read_asof_join(
+        "trades", "quotes", by=by, tolerance=tolerance, date_range=date_range, right_columns=right_columns
+    ).data
+    expected = expected_asof_join(trades, quotes, by, tolerance, right_columns)
+    expected = expected[(expected.index >= date_range[0]) & (expected.index <= date_range[1])]
+    assert_frame_equal(expected, received)
+
+
+def test_asof_join_no_overlap(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    left = pd.DataFrame({"a": np.arange(3, dtype=np.int64)}, index=pd.date_range("2024-01-01", periods=3))
+    right = pd.DataFrame({"b": np.arange(3, dtype=np.int64)}, index=pd.date_range("2024-02-01", periods=3))
+    lib.write("left", left)
+    lib.write("right", right)
+    received = lib.read_asof_join("left", "right").data
+    assert_frame_equal(expected_asof_join(left, right), received)
+
+
+def test_asof_join_query_builder_and_versions(lmdb_version_store_tiny_segment, trades_and_quotes):
+    lib = lmdb_version_store_tiny_segment
+    trades, quotes = trades_and_quotes
+    lib.write("trades", trades)
+    lib.write("quotes", quotes)
+    lib.write("quotes", quotes.iloc[:0])
+    q = QueryBuilder()
+    q = q[q["quantity"] > 1]
+    q = q.apply("double", q["quantity"] * 2)
+    received = lib.read_asof_join("trades", "quotes", by="ticker", right_as_of=0, query_builder=q).data
+    expected = trades[trades["quantity"] > 1].copy()
+    expected["double"] = expected["quantity"] * 2
+    expected = expected_asof_join(expected, quotes, by="ticker")
+    assert_frame_equal(expected, received)
+
+
+def test_asof_join_errors(lmdb_version_store_tiny_segment, trades_and_quotes):
+    lib = lmdb_version_store_tiny_segment
+    trades, quotes = trades_and_quotes
+    lib.write("trades", trades)
+    lib.write("quotes", quotes)
+    lib.write("row_indexed", pd.DataFrame({"c": np.arange(3)}))
+    # ticker is in both symbols, so must be the by column or not be joined
+    with pytest.raises(UserInputException):
+        lib.read_asof_join("trades", "quotes")
+    with pytest.raises(SchemaException):
+        lib.read_asof_join("trades", "quotes", right_columns=["missing"])
+    with pytest.raises(SchemaException):
+        lib.read_asof_join("trades", "row_indexed")
+    with pytest.raises(SchemaException):
+        lib.read_asof_join("trades", "quotes", by="quantity")
+    with pytest.raises(UserInputException):
+        lib.read_asof_join("trades", "quotes", by="ticker", tolerance=-1)
+    with pytest.raises(ArcticNativeException):
+        lib.read_asof_join("trades", "quotes", by="ticker", query_builder=QueryBuilder().groupby("ticker").agg({"quantity": "sum"}))
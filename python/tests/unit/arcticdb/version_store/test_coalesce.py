@@ -0,0 +1,100 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import numpy as np
+import pandas as pd
+
+from arcticdb_ext.storage import KeyType
+from arcticdb.util.test import assert_frame_equal
+
+
+def _write_with_appends(lib, sym, num_appends, rows_per_append=3):
+    dfs = []
+    for i in range(num_appends):
+        index = pd.date_range(pd.Timestamp("2024-01-01") + pd.Timedelta(days=i * rows_per_append), periods=rows_per_append)
+        df = pd.DataFrame(
+            {"a": np.arange(rows_per_append, dtype=np.int64) + i, "b": [f"s{i}_{j}" for j in range(rows_per_append)]},
+            index=index,
+        )
+        if i == 0:
+            lib.write(sym, df)
+        else:
+            lib.append(sym, df)
+        dfs.append(df)
+    return pd.concat(dfs)
+
+
+def _coalesced_objects(lib, sym):
+    return [key for key in lib.library_tool().find_keys_for_symbol(KeyType.MULTI_SEGMENT, sym) if key.content_hash == 0]
+
+
+def test_coalesce_read(lmdb_or_in_memory_version_store_tiny_segment):
+    lib = lmdb_or_in_memory_version_store_tiny_segment
+    sym = "test_coalesce_read"
+    expected = _write_with_appends(lib, sym, 10)
+
+    item = lib.coalesce_symbol_data(sym)
+    assert item.version == 10
+    assert len(_coalesced_objects(lib, sym)) == 1
+    assert (lib.read_index(sym)["key_type"] == KeyType.MULTI_SEGMENT.value).all()
+
+    assert_frame_equal(lib.read(sym).data, expected)
+    assert_frame_equal(lib.read(sym, as_of=9).data, expected)
+    date_range = (pd.Timestamp("2024-01-05"), pd.Timestamp("2024-01-14"))
+    assert_frame_equal(lib.read(sym, date_range=date_range).data, expected.loc[date_range[0]:date_range[1]])
+    assert_frame_equal(lib.read(sym, columns=["b"]).data, expected[["b"]])
+
+
+def test_coalesce_then_append(lmdb_or_in_memory_version_store_tiny_segment):
+    lib = lmdb_or_in_memory_version_store_tiny_segment
+    sym = "test_coalesce_then_append"
+    expected = _write_with_appends(lib, sym, 5)
+    lib.coalesce_symbol_data(sym)
+
+    df = pd.DataFrame({"a": [100, 101], "b": ["x", "y"]}, index=pd.date_range("2025-01-01", periods=2))
+    lib.append(sym, df)
+    expected = pd.concat([expected, df])
+    assert_frame_equal(lib.read(sym).data, expected)
+
+    # Only the segments written since the last coalesce are packed
+    lib.coalesce_symbol_data(sym)
+    assert_frame_equal(lib.read(sym).data, expected)
+
+
+def test_coalesce_object_bytes(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_coalesce_object_bytes"
+    expected = _write_with_appends(lib, sym, 20)
+
+    lib.coalesce_symbol_data(sym, object_bytes=4096)
+    assert len(_coalesced_objects(lib, sym)) > 1
+    assert_frame_equal(lib.read(sym).data, expected)
+
+
+def test_coalesce_prune_previous_version(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_coalesce_prune_previous_version"
+    expected = _write_with_appends(lib, sym, 8)
+
+    lib.coalesce_symbol_data(sym, prune_previous_version=True)
+    assert len(lib.list_versions(sym)) == 1
+    assert not lib.library_tool().find_keys_for_symbol(KeyType.TABLE_DATA, sym)
+    assert_frame_equal(lib.read(sym).data, expected)
+
+    lib.delete(sym)
+    assert not lib.library_tool().find_keys_for_symbol(KeyType.MULTI_SEGMENT, sym)
+
+
+def test_coalesce_nothing_to_do(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_coalesce_nothing_to_do"
+    df = pd.DataFrame({"a": [1]}, index=pd.date_range("2024-01-01", periods=1))
+    lib.write(sym, df)
+
+    assert lib.coalesce_symbol_data(sym).version == 0
+    assert not _coalesced_objects(lib, sym)
+    assert_frame_equal(lib.read(sym).data, df)
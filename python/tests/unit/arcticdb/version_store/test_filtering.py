@@ -28,7 +28,7 @@ from arcticdb.exceptions import ArcticNativeException
 from arcticdb_ext.storage import KeyType, NoDataFoundException
 from arcticdb.version_store.processing import QueryBuilder
 from arcticdb_ext.exceptions import InternalException, StorageException, UserInputException
-from arcticdb.util.test import assert_frame_equal, PANDAS_VERSION
+from arcticdb.util.test import assert_frame_equal, config_context, PANDAS_VERSION
 from arcticdb.util._versions import PANDAS_VERSION
 from arcticdb.util.hypothesis import (
     use_of_function_scoped_fixtures_in_hypothesis_checked,
@@ -335,6 +335,99 @@ def test_filter_bool_column_binary_boolean(lmdb_version_store):
     generic_filter_test(lmdb_version_store, "test_filter_bool_column_binary_boolean", df, q, pandas_query)
 
 
+@pytest.mark.parametrize("fused_evaluation", [0, 1])
+def test_filter_and_project_compound_expressions(lmdb_version_store_tiny_segment, fused_evaluation):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_filter_and_project_compound_expressions"
+    rng = np.random.default_rng(0)
+    num_rows = 100
+    df = DataFrame(
+        {
+            "a": rng.integers(-100, 100, num_rows, dtype=np.int64),
+            "b": rng.integers(0, 255, num_rows, dtype=np.uint8),
+            "c": rng.random(num_rows) * 100,
+            "d": rng.random(num_rows) > 0.5,
+        },
+        index=np.arange(num_rows),
+    )
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    q = q[(((q["a"] + q["b"]) * 2 > q["c"]) & q["d"]) | (50 < q["c"] - q["a"])]
+    q = q.apply("e", -(q["a"] * q["b"]) / q["c"])
+    expected = df[(((df["a"] + df["b"]) * 2 > df["c"]) & df["d"]) | (50 < df["c"] - df["a"])].copy()
+    expected["e"] = -(expected["a"] * expected["b"]) / expected["c"]
+    with config_context("Expression.FusedEvaluation", fused_evaluation):
+        received = lib.read(symbol, query_builder=q).data
+    assert_frame_equal(expected, received)
+
+
+@pytest.mark.parametrize("fused_evaluation", [0, 1])
+def test_filter_null_checks_with_fusable_expressions(lmdb_version_store_tiny_segment, fused_evaluation):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_filter_null_checks_with_fusable_expressions"
+    num_rows = 20
+    df = DataFrame(
+        {
+            "a": [np.nan if idx % 3 == 0 else float(idx) for idx in range(num_rows)],
+            "b": np.arange(num_rows, dtype=np.int64) - 5,
+            "c": np.arange(num_rows, dtype=np.float64) / 4,
+        },
+        index=np.arange(num_rows),
+    )
+    lib.write(symbol, df)
+    q = QueryBuilder()
+    q = q[q["a"].isnull() & (q["b"] + q["c"] > 1)]
+    expected = df[df["a"].isnull() & (df["b"] + df["c"] > 1)]
+    with config_context("Expression.FusedEvaluation", fused_evaluation):
+        received = lib.read(symbol, query_builder=q).data
+    assert_frame_equal(expected, received)
+
+    q = QueryBuilder()
+    q = q[(q["b"] * q["c"] < 10) | q["a"].notnull()]
+    expected = df[(df["b"] * df["c"] < 10) | df["a"].notnull()]
+    with config_context("Expression.FusedEvaluation", fused_evaluation):
+        received = lib.read(symbol, query_builder=q).data
+    assert_frame_equal(expected, received)
+
+
+@pytest.mark.parametrize("late_materialisation", (0, 1))
+def test_filter_column_sliced_late_materialisation(lmdb_version_store_tiny_segment, late_materialisation):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_filter_column_sliced_late_materialisation"
+    num_rows = 20
+    df = DataFrame(
+        {
+            "a": np.arange(num_rows, dtype=np.int64),
+            "b": np.arange(num_rows, dtype=np.float64),
+            "key": ["x" if idx in (3, 4, 11) else "y" for idx in range(num_rows)],
+            "c": [f"string_{idx}" for idx in range(num_rows)],
+            "d": np.arange(num_rows, dtype=np.uint8) % 3 == 0,
+        },
+        index=pd.date_range("2024-01-01", periods=num_rows),
+    )
+    lib.write(symbol, df)
+    # Filters on the columns of one column slice and of several, matching no rows of most row-slices
+    q = QueryBuilder()
+    q = q[q["key"] == "x"]
+    expected = df[df["key"] == "x"]
+    with config_context("Read.LateMaterialisation", late_materialisation):
+        assert_frame_equal(expected, lib.read(symbol, query_builder=q).data)
+        assert_frame_equal(expected[["a", "c"]], lib.read(symbol, columns=["a", "c"], query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q[(q["key"] == "x") | (q["d"] & (q["a"] > 15))]
+    q = q.apply("e", q["a"] * 2)
+    expected = df[(df["key"] == "x") | (df["d"] & (df["a"] > 15))].copy()
+    expected["e"] = expected["a"] * 2
+    with config_context("Read.LateMaterialisation", late_materialisation):
+        assert_frame_equal(expected, lib.read(symbol, query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q[q["a"] > 100]
+    with config_context("Read.LateMaterialisation", late_materialisation):
+        assert lib.read(symbol, query_builder=q).data.empty
+
+
 def test_filter_bool_column_comparison(lmdb_version_store):
     df = DataFrame({"a": [True, False]}, index=np.arange(2))
     comparators = ["==", "!=", "<", "<=", ">", ">="]
@@ -1095,6 +1188,74 @@ def test_filter_string_isin_empty_set(lmdb_version_store, df):
     generic_filter_test_strings(lmdb_version_store, "test_filter_string_isin_empty_set", df, q, pandas_query)
 
 
+@pytest.mark.parametrize(
+    "arctic_filter, pandas_filter",
+    [
+        (lambda c: c.str.startswith("EUR"), lambda c: c.str.startswith("EUR")),
+        (lambda c: c.str.contains("USD", regex=False), lambda c: c.str.contains("USD", regex=False)),
+        (lambda c: c.str.contains("[Ee]ur|sd$"), lambda c: c.str.contains("[Ee]ur|sd$")),
+        (lambda c: c.str.match("[A-Z]{3}"), lambda c: c.str.match("[A-Z]{3}")),
+        (lambda c: c.str.len() > 3, lambda c: c.str.len() > 3),
+        (lambda c: c.str.lower().str.startswith("eur"), lambda c: c.str.lower().str.startswith("eur")),
+        (lambda c: ~c.str.startswith("EUR"), lambda c: ~(c.str.startswith("EUR").fillna(False).astype(bool))),
+    ],
+)
+def test_filter_string_functions(lmdb_version_store_tiny_segment, arctic_filter, pandas_filter):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_filter_string_functions"
+    df = pd.DataFrame(
+        {"ticker": ["EURUSD", "GBPeur", None, "Café", "EURUSD", "usd", np.nan, "eurjpy"], "a": np.arange(8)}
+    )
+    lib.write(sym, df, dynamic_strings=True)
+    q = QueryBuilder()
+    q = q[arctic_filter(q["ticker"])]
+    # None and NaN never match, so are excluded by all of the predicates, but included by their negations
+    expected = df[pandas_filter(df["ticker"]).fillna(False).astype(bool)]
+    received = lib.read(sym, query_builder=q).data
+    assert_frame_equal(expected, received)
+
+
+def test_filter_string_functions_fixed_width(lmdb_version_store):
+    lib = lmdb_version_store
+    sym = "test_filter_string_functions_fixed_width"
+    # Fixed-width unicode strings are stored as UTF-32, and the functions see them as UTF-8
+    df = pd.DataFrame({"ticker": ["Café", "EURUSD", "Ünïcødé", "eurjpy"], "a": np.arange(4)})
+    lib.write(sym, df, dynamic_strings=False)
+    q = QueryBuilder()
+    q = q[(q["ticker"].str.len() == 4) | q["ticker"].str.contains("^.n.c")]
+    received = lib.read(sym, query_builder=q).data
+    assert_frame_equal(df.iloc[[0, 2]], received)
+
+
+def test_project_string_functions_fixed_width(lmdb_version_store):
+    lib = lmdb_version_store
+    sym = "test_project_string_functions_fixed_width"
+    df = pd.DataFrame({"ticker": ["Café", "EURUSD", "Ünïcødé", "eurjpy"], "a": np.arange(4)})
+    lib.write(sym, df, dynamic_strings=False)
+    q = QueryBuilder()
+    q = q[q["ticker"].str.lower().str.startswith("eur") | q["ticker"].str.match("Caf")]
+    q = q.apply("lowered", q["ticker"].str.lower())
+    q = q.apply("length", q["ticker"].str.len())
+    expected = df.iloc[[0, 1, 3]].copy()
+    # Only ASCII characters are lowered
+    expected["lowered"] = ["café", "eurusd", "eurjpy"]
+    expected["length"] = expected["ticker"].str.len().astype(np.float64)
+    received = lib.read(sym, query_builder=q).data
+    assert_frame_equal(expected, received)
+
+
+def test_filter_string_functions_errors(lmdb_version_store):
+    lib = lmdb_version_store
+    sym = "test_filter_string_functions_errors"
+    lib.write(sym, pd.DataFrame({"ticker": ["EURUSD"], "a": [1]}))
+    q = QueryBuilder()
+    q = q[q["a"].str.startswith("1")]
+    with pytest.raises(UserInputException):
+        lib.read(sym, query_builder=q)
+    with pytest.raises(ArcticNativeException):
+        QueryBuilder()["ticker"].str.startswith(1)
+
+
 @use_of_function_scoped_fixtures_in_hypothesis_checked
 @settings(deadline=None)
 @given(
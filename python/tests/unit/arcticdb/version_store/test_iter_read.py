@@ -0,0 +1,130 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import pytest
+import numpy as np
+import pandas as pd
+
+from arcticdb.exceptions import ArcticNativeException, NoDataFoundException
+from arcticdb.version_store.processing import QueryBuilder
+from arcticdb.util.test import assert_frame_equal
+
+
+def concat_batches(items):
+    return pd.concat([item.data for item in items])
+
+
+@pytest.mark.parametrize("rows_per_batch", (1, 2, 3, 4, 100))
+@pytest.mark.parametrize("prefetch", (0, 1, 3))
+def test_iter_read(lmdb_version_store_tiny_segment, rows_per_batch, prefetch):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_iter_read"
+    df = pd.DataFrame(
+        {"a": np.arange(11, dtype=np.int64), "b": np.arange(11, dtype=np.float64), "c": [str(i) for i in range(11)]},
+        index=pd.date_range("2024-01-01", periods=11),
+    )
+    lib.write(sym, df)
+    items = list(lib.iter_read(sym, rows_per_batch=rows_per_batch, prefetch=prefetch))
+    # Row-slices hold 2 rows each
+    assert all(len(item.data) <= max(rows_per_batch, 2) for item in items)
+    assert all(item.version == 0 for item in items)
+    assert_frame_equal(df, concat_batches(items))
+
+
+def test_iter_read_columns_and_query_builder(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_iter_read_columns_and_query_builder"
+    df = pd.DataFrame(
+        {"a": np.arange(20, dtype=np.int64), "b": np.arange(20, dtype=np.float64), "c": np.arange(20, dtype=np.uint8)},
+        index=pd.date_range("2024-01-01", periods=20),
+    )
+    lib.write(sym, df)
+    q = QueryBuilder()
+    q = q[q["a"] % 3 == 0]
+    q = q.apply("d", q["a"] * 2)
+    expected = df[df["a"] % 3 == 0][["a", "b"]]
+    expected["d"] = expected["a"] * 2
+    received = concat_batches(lib.iter_read(sym, columns=["a", "b"], query_builder=q, rows_per_batch=5))
+    assert_frame_equal(expected, received, check_dtype=False)
+
+
+def test_iter_read_date_range(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_iter_read_date_range"
+    # Repeated index values straddle row-slice boundaries, so batches must not be split there
+    index = pd.DatetimeIndex(["2024-01-01", "2024-01-02", "2024-01-02", "2024-01-02", "2024-01-03", "2024-01-04",
+                              "2024-01-05", "2024-01-05", "2024-01-06", "2024-01-07"])
+    df = pd.DataFrame({"a": np.arange(len(index), dtype=np.int64)}, index=index)
+    lib.write(sym, df)
+    for date_range in [
+        (pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-05")),
+        (None, pd.Timestamp("2024-01-03")),
+        (pd.Timestamp("2024-01-05 12:00"), None),
+    ]:
+        for rows_per_batch in (1, 3):
+            received = concat_batches(lib.iter_read(sym, date_range=date_range, rows_per_batch=rows_per_batch))
+            assert_frame_equal(df.loc[date_range[0]:date_range[1]], received)
+
+
+def test_iter_read_pins_version(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_iter_read_pins_version"
+    df = pd.DataFrame({"a": np.arange(10, dtype=np.int64)})
+    lib.write(sym, df)
+    batches = lib.iter_read(sym, rows_per_batch=2, prefetch=0)
+    first = next(batches)
+    lib.write(sym, df * 2)
+    received = pd.concat([first.data] + [item.data for item in batches])
+    assert_frame_equal(df, received)
+
+
+def test_iter_read_pins_version_when_called(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_iter_read_pins_version_when_called"
+    df = pd.DataFrame({"a": np.arange(10, dtype=np.int64)})
+    lib.write(sym, df)
+    batches = lib.iter_read(sym, rows_per_batch=2, prefetch=0)
+    # Written before the first batch is requested
+    lib.write(sym, df * 2)
+    items = list(batches)
+    assert all(item.version == 0 for item in items)
+    assert_frame_equal(df, concat_batches(items))
+
+
+def test_iter_read_pins_version_after_append(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_iter_read_pins_version_after_append"
+    df_0 = pd.DataFrame({"a": np.arange(6, dtype=np.int64)}, index=pd.date_range("2024-01-01", periods=6))
+    df_1 = pd.DataFrame({"a": np.arange(6, 12, dtype=np.int64)}, index=pd.date_range("2024-01-07", periods=6))
+    lib.write(sym, df_0)
+    lib.append(sym, df_1)
+    expected = pd.concat([df_0, df_1])
+    batches = lib.iter_read(sym, rows_per_batch=2, prefetch=0)
+    first = next(batches)
+    assert first.version == 1
+    lib.append(sym, pd.DataFrame({"a": [100]}, index=[pd.Timestamp("2024-02-01")]))
+    items = [first] + list(batches)
+    assert all(item.version == 1 for item in items)
+    assert_frame_equal(expected, pd.concat([item.data for item in items]))
+
+    received = concat_batches(lib.iter_read(sym, as_of=0, rows_per_batch=4))
+    assert_frame_equal(df_0, received)
+
+
+def test_iter_read_invalid(lmdb_version_store):
+    lib = lmdb_version_store
+    sym = "test_iter_read_invalid"
+    lib.write(sym, pd.DataFrame({"a": [1, 2]}))
+    q = QueryBuilder()
+    q = q.groupby("a").agg({"a": "sum"})
+    # Raised by the call rather than on the first batch
+    with pytest.raises(ArcticNativeException):
+        lib.iter_read(sym, query_builder=q)
+    with pytest.raises(ArcticNativeException):
+        lib.iter_read(sym, rows_per_batch=0)
+    with pytest.raises(NoDataFoundException):
+        lib.iter_read("non_existent_symbol")
@@ -39,6 +39,22 @@ def test_project(local_object_version_store):
     assert_frame_equal(df, vit.data)
 
 
+def test_project_string_functions(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    symbol = "test_project_string_functions"
+    df = pd.DataFrame({"ticker": ["EURUSD", "GBPeur", None, "Café", "EURUSD"], "a": np.arange(5)})
+    lib.write(symbol, df, dynamic_strings=True)
+
+    q = QueryBuilder()
+    q = q.apply("length", q["ticker"].str.len())
+    q = q.apply("lowered", q["ticker"].str.lower())
+    received = lib.read(symbol, query_builder=q).data
+
+    df["length"] = df["ticker"].str.len()
+    df["lowered"] = df["ticker"].str.lower()
+    assert_frame_equal(df, received)
+
+
 @use_of_function_scoped_fixtures_in_hypothesis_checked
 @settings(deadline=None)
 @given(
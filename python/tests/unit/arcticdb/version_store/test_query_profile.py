@@ -0,0 +1,65 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import numpy as np
+import pandas as pd
+
+from arcticdb.version_store.processing import QueryBuilder
+from arcticdb.util.test import assert_frame_equal
+
+
+def test_explain(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    # tiny segments hold 2 rows and 2 columns
+    df = pd.DataFrame(
+        {"a": np.arange(10, dtype=np.int64), "b": np.arange(10, dtype=np.float64), "c": np.arange(10, dtype=np.int32)},
+        index=pd.date_range("2024-01-01", periods=10),
+    )
+    lib.write("sym", df)
+    q = QueryBuilder()
+    q = q[q["a"] > 5].groupby("a").agg({"b": "sum"})
+    plan = lib.explain("sym", query_builder=q)
+    assert [clause["requires_repartition"] for clause in plan["clauses"]] == [False, True, False]
+    assert plan["clauses"][0]["clause"].startswith("WHERE")
+    assert plan["segments_in_index"] == 10
+    assert len(plan["segments"]) == 10
+
+    # Only the column-slices containing a and b are needed
+    plan = lib.explain("sym", query_builder=q, columns=["a", "b"])
+    assert len(plan["segments"]) == 5
+    assert plan["processing_units"] == 5
+    assert (plan["segments"]["estimated_bytes"] > 0).all()
+
+    plan = lib.explain("sym", date_range=(pd.Timestamp("2024-01-03"), pd.Timestamp("2024-01-04")))
+    assert plan["clauses"] == []
+    assert len(plan["segments"]) == 2
+    assert plan["segments"]["start_row"].tolist() == [2, 2]
+
+
+def test_read_profile(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    df = pd.DataFrame({"a": np.arange(10, dtype=np.int64)}, index=pd.date_range("2024-01-01", periods=10))
+    lib.write("sym", df)
+    q = QueryBuilder()
+    q = q[q["a"] > 5]
+    vit = lib.read("sym", date_range=(pd.Timestamp("2024-01-03"), None), query_builder=q, profile=True)
+    assert_frame_equal(df[df["a"] > 5], vit.data)
+    profile = vit.profile
+    assert profile["segments_in_index"] == 5
+    assert profile["segments_pruned"] == 1
+    assert profile["segments_read"] == 4
+    assert profile["bytes_fetched"] > 0
+    assert profile["bytes_decoded"] > 0
+    assert profile["total_time"] >= profile["read_time"]
+    date_range_clause, filter_clause = profile["clauses"]
+    assert date_range_clause["rows_in"] == 8
+    assert date_range_clause["rows_out"] == 8
+    assert filter_clause["rows_in"] == 8
+    assert filter_clause["rows_out"] == 4
+    assert filter_clause["processing_units"] == 4
+
+    assert lib.read("sym").profile is None
@@ -0,0 +1,137 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import pickle
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from arcticdb.exceptions import ArcticNativeException, UserInputException
+from arcticdb.version_store.processing import QueryBuilder
+from arcticdb.util.test import assert_frame_equal
+
+
+def expected_resample(df, rule, aggregations):
+    # Pandas includes empty buckets, whereas resampling in ArcticDB omits them
+    resampler = df.resample(rule, closed="left", label="left", origin="epoch")
+    expected = resampler.agg(**{output: (column, operator) for output, (column, operator) in aggregations.items()})
+    expected = expected[resampler.size() > 0]
+    # Empty buckets also force Pandas to upcast integer columns to float for some aggregators
+    for output, (column, operator) in aggregations.items():
+        if operator in ("count", "nunique"):
+            expected[output] = expected[output].astype(np.uint64)
+        elif operator not in ("mean", "median"):
+            expected[output] = expected[output].astype(df[column].dtype)
+    return expected
+
+
+@pytest.mark.parametrize("aggregator", ("sum", "min", "max", "mean", "count", "first", "last", "nunique", "median"))
+def test_resample_numeric(lmdb_version_store_tiny_segment, aggregator):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_resample_numeric"
+    # Irregular index so that buckets straddle, and are contained within, row-slices
+    index = pd.DatetimeIndex(["2024-01-01 00:00:00", "2024-01-01 00:00:30", "2024-01-01 00:00:45", "2024-01-01 00:00:50",
+                              "2024-01-01 00:01:10", "2024-01-01 00:03:00", "2024-01-01 00:03:01", "2024-01-01 00:05:59"])
+    df = pd.DataFrame({"col": np.arange(len(index), dtype=np.int64), "other": np.arange(len(index), dtype=np.float64)}, index=index)
+    lib.write(sym, df)
+    aggregations = {"col": ("col", aggregator)}
+
+    q = QueryBuilder()
+    q = q.resample("1min").agg({"col": aggregator})
+    received = lib.read(sym, query_builder=q).data
+    assert_frame_equal(expected_resample(df, "1min", aggregations), received)
+
+
+def test_resample_multiple_aggregations(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_resample_multiple_aggregations"
+    df = pd.DataFrame(
+        {"price": np.arange(100, dtype=np.float64), "volume": np.arange(100, dtype=np.int64)},
+        index=pd.date_range("2024-01-01 09:00", periods=100, freq="7s"),
+    )
+    lib.write(sym, df)
+    aggregations = {
+        "open": ("price", "first"),
+        "high": ("price", "max"),
+        "low": ("price", "min"),
+        "close": ("price", "last"),
+        "volume": ("volume", "sum"),
+    }
+
+    q = QueryBuilder()
+    q = q.resample("1min").agg(aggregations)
+    received = lib.read(sym, query_builder=q).data
+    assert_frame_equal(expected_resample(df, "1min", aggregations), received, check_like=True)
+
+
+def test_resample_float_column_with_nans(lmdb_version_store):
+    lib = lmdb_version_store
+    sym = "test_resample_float_column_with_nans"
+    df = pd.DataFrame(
+        {"col": [np.nan, 1.0, np.nan, 2.0, np.nan, np.nan]},
+        index=pd.date_range("2024-01-01", periods=6, freq="1min"),
+    )
+    lib.write(sym, df)
+    for aggregator in ("sum", "mean", "count", "first", "last"):
+        aggregations = {"col": ("col", aggregator)}
+        q = QueryBuilder()
+        q = q.resample("2min").agg({"col": aggregator})
+        received = lib.read(sym, query_builder=q).data
+        assert_frame_equal(expected_resample(df, "2min", aggregations), received)
+
+
+def test_resample_with_date_range(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_resample_with_date_range"
+    df = pd.DataFrame({"col": np.arange(50, dtype=np.int64)}, index=pd.date_range("2024-01-01", periods=50, freq="10s"))
+    lib.write(sym, df)
+    date_range = (pd.Timestamp("2024-01-01 00:01:15"), pd.Timestamp("2024-01-01 00:05:05"))
+    expected = expected_resample(df.loc[date_range[0]:date_range[1]], "1min", {"col": ("col", "sum")})
+
+    q = QueryBuilder()
+    q = q.date_range(date_range).resample("1min").agg({"col": "sum"})
+    assert_frame_equal(expected, lib.read(sym, query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q.resample("1min").agg({"col": "sum"})
+    assert_frame_equal(expected, lib.read(sym, date_range=date_range, query_builder=q).data)
+
+
+def test_resample_then_filter(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_resample_then_filter"
+    df = pd.DataFrame({"col": np.arange(50, dtype=np.int64)}, index=pd.date_range("2024-01-01", periods=50, freq="10s"))
+    lib.write(sym, df)
+    expected = expected_resample(df, "1min", {"col": ("col", "sum")})
+    expected = expected[expected["col"] > 100]
+
+    q = QueryBuilder()
+    q = q.resample("1min").agg({"col": "sum"})
+    q = q[q["col"] > 100]
+    assert_frame_equal(expected, lib.read(sym, query_builder=q).data)
+
+
+def test_resample_pickling():
+    q = QueryBuilder()
+    q = q.date_range((pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-02"))).resample("1h").agg({"col": "sum"})
+    assert q == pickle.loads(pickle.dumps(q))
+    assert str(q) == str(pickle.loads(pickle.dumps(q)))
+
+
+def test_resample_invalid_usage():
+    with pytest.raises(UserInputException):
+        QueryBuilder().resample("M")
+    q = QueryBuilder()
+    q = q[q["col"] > 0]
+    with pytest.raises(ArcticNativeException):
+        q.resample("1min")
+    with pytest.raises(ArcticNativeException):
+        QueryBuilder()._head(5).then(QueryBuilder().resample("1min").agg({"col": "sum"}))
+    q = QueryBuilder().resample("1min").agg({"col": "sum"})
+    with pytest.raises(ArcticNativeException):
+        q.agg({"col": "max"})
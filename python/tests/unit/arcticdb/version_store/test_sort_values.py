@@ -0,0 +1,139 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import pickle
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from arcticdb.exceptions import ArcticNativeException
+from arcticdb.version_store.processing import QueryBuilder
+from arcticdb.util.test import assert_frame_equal
+from arcticdb_ext.exceptions import SchemaException
+
+
+def trades_df():
+    # Repeated values, so that ties must keep their order across row-slices, and several columns so that the rows are
+    # spread over several column-slices
+    rng = np.random.default_rng(42)
+    num_rows = 37
+    return pd.DataFrame(
+        {
+            "size": rng.integers(0, 10, num_rows),
+            "price": rng.normal(100, 5, num_rows),
+            "venue": [f"venue_{i % 4}" for i in range(num_rows)],
+            "flag": rng.integers(0, 2, num_rows).astype(bool),
+        },
+        index=pd.date_range("2024-01-01", periods=num_rows, freq="min"),
+    )
+
+
+@pytest.mark.parametrize("by", ("size", "price"))
+@pytest.mark.parametrize("ascending", (True, False))
+@pytest.mark.parametrize("limit", (None, 1, 5, 36, 37, 100))
+def test_sort(lmdb_version_store_tiny_segment, by, ascending, limit):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_sort"
+    df = trades_df()
+    lib.write(sym, df)
+
+    q = QueryBuilder()
+    q = q.sort(by, ascending=ascending, limit=limit)
+    received = lib.read(sym, query_builder=q).data
+    expected = df.sort_values(by, ascending=ascending, kind="stable")
+    if limit is not None:
+        expected = expected.head(limit)
+    assert_frame_equal(expected, received)
+
+
+def test_nlargest_nsmallest(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_nlargest_nsmallest"
+    df = trades_df()
+    lib.write(sym, df)
+
+    q = QueryBuilder()
+    q = q.nlargest(5, "price")
+    assert_frame_equal(df.nlargest(5, "price"), lib.read(sym, query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q.nsmallest(5, "size")
+    assert_frame_equal(df.nsmallest(5, "size"), lib.read(sym, query_builder=q).data)
+
+
+def test_sort_nans_last(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_sort_nans_last"
+    df = pd.DataFrame({"col": [2.0, np.nan, -1.0, np.nan, 5.0, 0.5]})
+    lib.write(sym, df)
+
+    for ascending in (True, False):
+        q = QueryBuilder()
+        q = q.sort("col", ascending=ascending)
+        received = lib.read(sym, query_builder=q).data
+        expected = df.sort_values("col", ascending=ascending, na_position="last", kind="stable").reset_index(drop=True)
+        assert_frame_equal(expected, received)
+
+
+def test_sort_after_filter_and_with_date_range(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_sort_after_filter_and_with_date_range"
+    df = trades_df()
+    lib.write(sym, df)
+    date_range = (pd.Timestamp("2024-01-01 00:05"), pd.Timestamp("2024-01-01 00:30"))
+
+    q = QueryBuilder()
+    q = q[q["venue"] != "venue_1"].nlargest(4, "price")
+    received = lib.read(sym, date_range=date_range, query_builder=q).data
+    expected = df.loc[date_range[0]:date_range[1]]
+    expected = expected[expected["venue"] != "venue_1"].nlargest(4, "price")
+    assert_frame_equal(expected, received)
+
+
+def test_sort_dynamic_schema(lmdb_version_store_tiny_segment_dynamic):
+    lib = lmdb_version_store_tiny_segment_dynamic
+    sym = "test_sort_dynamic_schema"
+    df_0 = pd.DataFrame({"col": [3.0, 1.0, 4.0]}, index=pd.date_range("2024-01-01", periods=3))
+    df_1 = pd.DataFrame({"other": [1.5, 2.5]}, index=pd.date_range("2024-01-04", periods=2))
+    df_2 = pd.DataFrame({"col": [5.0, 0.0]}, index=pd.date_range("2024-01-06", periods=2))
+    lib.write(sym, df_0)
+    lib.append(sym, df_1)
+    lib.append(sym, df_2)
+
+    q = QueryBuilder()
+    q = q.sort("col", ascending=False)
+    received = lib.read(sym, query_builder=q).data
+    expected = lib.read(sym).data.sort_values("col", ascending=False, na_position="last", kind="stable")
+    # The rows of the row-slice missing col are ordered last
+    assert_frame_equal(expected, received)
+
+
+def test_sort_string_column(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_sort_string_column"
+    lib.write(sym, pd.DataFrame({"col": ["b", "a", "c"]}))
+    q = QueryBuilder()
+    q = q.sort("col")
+    with pytest.raises(SchemaException):
+        lib.read(sym, query_builder=q)
+
+
+def test_sort_pickling():
+    q = QueryBuilder()
+    q = q[q["col"] > 0].nlargest(10, "col")
+    assert q == pickle.loads(pickle.dumps(q))
+    assert str(q) == str(pickle.loads(pickle.dumps(q)))
+
+
+def test_sort_invalid_usage():
+    with pytest.raises(ArcticNativeException):
+        QueryBuilder().sort("col", limit=-1)
+    with pytest.raises(ArcticNativeException):
+        QueryBuilder().sort(["col"])
+    with pytest.raises(ArcticNativeException):
+        QueryBuilder().nlargest(1.5, "col")
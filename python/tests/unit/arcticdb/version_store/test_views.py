@@ -0,0 +1,104 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import pytest
+import numpy as np
+import pandas as pd
+
+from arcticdb.exceptions import ArcticNativeException
+from arcticdb.version_store.processing import QueryBuilder
+from arcticdb.util.test import assert_frame_equal
+
+
+def trades(start, rows):
+    rng = np.random.default_rng(start)
+    return pd.DataFrame(
+        {
+            "ticker": rng.choice(["A", "B", "C"], rows),
+            "quantity": rng.integers(0, 100, rows).astype(np.int64),
+            "price": rng.random(rows),
+        },
+        index=pd.date_range("2024-01-01", periods=rows, freq="s") + pd.Timedelta(seconds=start),
+    )
+
+
+def view_query_builder():
+    q = QueryBuilder()
+    q = q[q["quantity"] > 10]
+    q = q.apply("notional", q["quantity"] * q["price"])
+    return q.groupby("ticker").agg(
+        {
+            "quantity": "sum",
+            "min_price": ("price", "min"),
+            "max_price": ("price", "max"),
+            "trades": ("price", "count"),
+            "notional": "mean",
+        }
+    )
+
+
+def assert_view_equal(lib, vit, symbol):
+    expected = lib.read(symbol, query_builder=view_query_builder()).data
+    assert_frame_equal(expected[vit.data.columns].sort_index(), vit.data.sort_index())
+
+
+def test_view_refreshed_on_append(lmdb_version_store_tiny_segment, monkeypatch):
+    lib = lmdb_version_store_tiny_segment
+    lib.write("trades", trades(0, 20))
+    vit = lib.create_view("view", "trades", view_query_builder())
+    assert vit.metadata == {"symbol": "trades", "version": 0, "rows": 20}
+    assert_view_equal(lib, vit, "trades")
+
+    lib.append("trades", trades(20, 7))
+    lib.append("trades", trades(27, 5))
+    row_ranges = []
+    read = lib.read
+
+    def recording_read(symbol, *args, **kwargs):
+        if symbol == "trades":
+            row_ranges.append(kwargs.get("row_range"))
+        return read(symbol, *args, **kwargs)
+
+    monkeypatch.setattr(lib, "read", recording_read)
+    vit = lib.read_view("view")
+    monkeypatch.undo()
+    # Only the appended rows are read
+    assert row_ranges == [(20, 32)]
+    assert vit.metadata == {"symbol": "trades", "version": 2, "rows": 32}
+    assert_view_equal(lib, vit, "trades")
+    # The view is unchanged while the symbol is
+    assert_frame_equal(vit.data, lib.read_view("view").data)
+
+
+def test_view_recomputed_after_update(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    lib.write("trades", trades(0, 20))
+    lib.create_view("view", "trades", view_query_builder())
+    lib.update("trades", trades(5, 3))
+    vit = lib.read_view("view")
+    assert vit.metadata["version"] == 1
+    assert_view_equal(lib, vit, "trades")
+
+    lib.write("trades", trades(100, 4))
+    assert_view_equal(lib, lib.read_view("view"), "trades")
+
+
+def test_view_errors(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    lib.write("trades", trades(0, 20))
+    with pytest.raises(ArcticNativeException):
+        lib.create_view("view", "trades", QueryBuilder().groupby("ticker").agg({"price": "median"}))
+    with pytest.raises(ArcticNativeException):
+        lib.create_view("view", "trades", QueryBuilder().resample("min").agg({"price": "sum"}))
+    q = QueryBuilder()
+    q = q[q["quantity"] > 10]
+    with pytest.raises(ArcticNativeException):
+        lib.create_view("view", "trades", q)
+    with pytest.raises(ArcticNativeException):
+        lib.create_view("trades", "trades", view_query_builder())
+    with pytest.raises(ArcticNativeException):
+        lib.read_view("trades")
@@ -0,0 +1,173 @@
+"""
+Copyright 2023 Man Group Operations Limited
+
+Use of this software is governed by the Business Source License 1.1 included in the file licenses/BSL.txt.
+
+As of the Change Date specified in that file, in accordance with the Business Source License, use of this software will be governed by the Apache License, version 2.0.
+"""
+import pickle
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from arcticdb.exceptions import ArcticNativeException, UserInputException
+from arcticdb.version_store.processing import QueryBuilder
+from arcticdb.util.test import assert_frame_equal
+from arcticdb_ext.exceptions import SchemaException
+
+
+def expected_window(window, aggregations):
+    # Window aggregations in ArcticDB always output float64 columns, as Pandas does
+    return pd.DataFrame(
+        {output: window[column].agg(operator) for output, (column, operator) in aggregations.items()}
+    ).astype(np.float64)
+
+
+def irregular_df():
+    # Irregular index and NaNs so that windows straddle, and are contained within, row-slices
+    index = pd.DatetimeIndex(["2024-01-01 00:00:00", "2024-01-01 00:00:30", "2024-01-01 00:00:45", "2024-01-01 00:00:50",
+                              "2024-01-01 00:01:10", "2024-01-01 00:03:00", "2024-01-01 00:03:01", "2024-01-01 00:05:59",
+                              "2024-01-01 00:06:00", "2024-01-01 00:06:01"])
+    return pd.DataFrame(
+        {
+            "col": np.arange(len(index), dtype=np.int64),
+            "float_col": [1.5, np.nan, -2.0, 4.0, np.nan, np.nan, 0.5, 3.0, -1.0, 2.0],
+        },
+        index=index,
+    )
+
+
+@pytest.mark.parametrize("aggregator", ("sum", "mean", "min", "max", "count"))
+@pytest.mark.parametrize("window", (1, 3, 4, "30s", "1min", "5min"))
+def test_rolling(lmdb_version_store_tiny_segment, aggregator, window):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_rolling"
+    df = irregular_df()
+    lib.write(sym, df)
+    aggregations = {"col": ("col", aggregator), "float_col": ("float_col", aggregator)}
+
+    q = QueryBuilder()
+    q = q.rolling(window).agg({"col": aggregator, "float_col": aggregator})
+    received = lib.read(sym, query_builder=q).data
+    assert_frame_equal(expected_window(df.rolling(window), aggregations), received)
+
+
+@pytest.mark.parametrize("window", (2, "1min"))
+@pytest.mark.parametrize("min_periods", (0, 1, 2))
+def test_rolling_min_periods(lmdb_version_store_tiny_segment, window, min_periods):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_rolling_min_periods"
+    df = irregular_df()
+    lib.write(sym, df)
+    aggregations = {"total": ("float_col", "sum"), "average": ("float_col", "mean"), "count": ("float_col", "count")}
+
+    q = QueryBuilder()
+    q = q.rolling(window, min_periods=min_periods).agg(aggregations)
+    received = lib.read(sym, query_builder=q).data
+    assert_frame_equal(expected_window(df.rolling(window, min_periods=min_periods), aggregations), received, check_like=True)
+
+
+@pytest.mark.parametrize("min_periods", (1, 3))
+def test_expanding(lmdb_version_store_tiny_segment, min_periods):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_expanding"
+    df = irregular_df()
+    lib.write(sym, df)
+    aggregations = {"total": ("col", "sum"), "low": ("float_col", "min"), "high": ("float_col", "max")}
+
+    q = QueryBuilder()
+    q = q.expanding(min_periods=min_periods).agg(aggregations)
+    received = lib.read(sym, query_builder=q).data
+    assert_frame_equal(expected_window(df.expanding(min_periods=min_periods), aggregations), received, check_like=True)
+
+
+def test_rolling_row_count_index(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_rolling_row_count_index"
+    df = pd.DataFrame({"col": np.arange(20, dtype=np.float64)})
+    lib.write(sym, df)
+
+    q = QueryBuilder()
+    q = q.rolling(5).agg({"col": "mean"})
+    received = lib.read(sym, query_builder=q).data
+    assert_frame_equal(df.rolling(5).mean(), received)
+
+    q = QueryBuilder()
+    q = q.rolling("1min").agg({"col": "mean"})
+    with pytest.raises(SchemaException):
+        lib.read(sym, query_builder=q)
+
+
+def test_rolling_with_date_range(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_rolling_with_date_range"
+    df = pd.DataFrame({"col": np.arange(50, dtype=np.int64)}, index=pd.date_range("2024-01-01", periods=50, freq="10s"))
+    lib.write(sym, df)
+    date_range = (pd.Timestamp("2024-01-01 00:01:15"), pd.Timestamp("2024-01-01 00:05:05"))
+    expected = expected_window(df.loc[date_range[0]:date_range[1]].rolling("1min"), {"col": ("col", "sum")})
+
+    q = QueryBuilder()
+    q = q.date_range(date_range).rolling("1min").agg({"col": "sum"})
+    assert_frame_equal(expected, lib.read(sym, query_builder=q).data)
+
+    q = QueryBuilder()
+    q = q.rolling("1min").agg({"col": "sum"})
+    assert_frame_equal(expected, lib.read(sym, date_range=date_range, query_builder=q).data)
+
+
+def test_rolling_then_filter(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_rolling_then_filter"
+    df = pd.DataFrame({"col": np.arange(50, dtype=np.int64)}, index=pd.date_range("2024-01-01", periods=50, freq="10s"))
+    lib.write(sym, df)
+    expected = expected_window(df.rolling(4), {"col": ("col", "sum")})
+    expected = expected[expected["col"] > 100]
+
+    q = QueryBuilder()
+    q = q.rolling(4).agg({"col": "sum"})
+    q = q[q["col"] > 100]
+    assert_frame_equal(expected, lib.read(sym, query_builder=q).data)
+
+
+def test_window_string_column(lmdb_version_store_tiny_segment):
+    lib = lmdb_version_store_tiny_segment
+    sym = "test_window_string_column"
+    lib.write(sym, pd.DataFrame({"col": ["a", "b", "c"]}, index=pd.date_range("2024-01-01", periods=3)))
+    q = QueryBuilder()
+    q = q.rolling(2).agg({"col": "max"})
+    with pytest.raises(SchemaException):
+        lib.read(sym, query_builder=q)
+
+
+def test_window_pickling():
+    q = QueryBuilder()
+    q = q.date_range((pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-02"))).rolling("1h").agg({"col": "sum"})
+    assert q == pickle.loads(pickle.dumps(q))
+    assert str(q) == str(pickle.loads(pickle.dumps(q)))
+    q = QueryBuilder()
+    q = q.expanding(min_periods=2).agg({"col": "mean"})
+    assert str(q) == str(pickle.loads(pickle.dumps(q)))
+
+
+def test_window_invalid_usage():
+    with pytest.raises(UserInputException):
+        QueryBuilder().rolling("M")
+    with pytest.raises(ArcticNativeException):
+        QueryBuilder().rolling(0)
+    with pytest.raises(UserInputException):
+        QueryBuilder().rolling(2, min_periods=3)
+    with pytest.raises(UserInputException):
+        QueryBuilder().rolling(2).agg({"col": "first"})
+    q = QueryBuilder()
+    q = q[q["col"] > 0]
+    with pytest.raises(ArcticNativeException):
+        q.expanding()
+    with pytest.raises(ArcticNativeException):
+        QueryBuilder()._head(5).then(QueryBuilder().rolling(3).agg({"col": "sum"}))
+    q = QueryBuilder().rolling(3).agg({"col": "sum"})
+    with pytest.raises(ArcticNativeException):
+        q.agg({"col": "max"})
+    q = QueryBuilder().expanding().agg({"col": "sum"})
+    with pytest.raises(ArcticNativeException):
+        q.agg({"col": "max"})